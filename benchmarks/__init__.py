@@ -0,0 +1,13 @@
+"""Performance benchmarks for the RoboSystems Python client.
+
+Standalone (stdlib-only) harness that measures the client's hot paths
+against a local stand-in server and compares them with the stored
+baseline in ``benchmarks/baseline.json``. Not collected by pytest — run
+it explicitly:
+
+    uv run python -m benchmarks                  # run + compare with baseline
+    uv run python -m benchmarks --save-baseline  # refresh the stored baseline
+    uv run python -m benchmarks -k sse           # only cases matching "sse"
+
+See ``just bench`` / ``just bench-baseline``.
+"""
@@ -0,0 +1,152 @@
+"""Benchmark runner: execute cases, compare with baseline, print a report.
+
+Exit status is 0 unless ``--fail-on-regression`` is set and at least one
+case regressed by more than ``--tolerance`` relative to the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from .cases import CASES, Case
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+def run_cases(selected: list[Case]) -> dict[str, Optional[float]]:
+  results: dict[str, Optional[float]] = {}
+  for bench in selected:
+    print(f"  running {bench.name} ...", file=sys.stderr, flush=True)
+    results[bench.name] = bench.fn()
+  return results
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+  if not path.exists():
+    return {}
+  return json.loads(path.read_text()).get("results", {})
+
+
+def save_baseline(path: Path, results: dict[str, Optional[float]]) -> None:
+  payload = {
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "results": {
+      name: {"value": round(value, 4), "unit": CASES[name].unit}
+      for name, value in results.items()
+      if value is not None
+    },
+  }
+  path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def compare(
+  results: dict[str, Optional[float]],
+  baseline: dict[str, Any],
+  tolerance: float,
+) -> tuple[list[list[str]], list[str]]:
+  """Build report rows and the list of regressed case names.
+
+  A case regresses when it is worse than its baseline by more than
+  ``tolerance`` (a fraction — 0.25 means 25%), in the direction given by
+  the case's ``higher_is_better`` flag.
+  """
+  rows: list[list[str]] = []
+  regressions: list[str] = []
+  for name, value in results.items():
+    bench = CASES[name]
+    base = baseline.get(name, {}).get("value")
+    if value is None:
+      rows.append([name, "skipped", _fmt(base), "", bench.unit, "skip"])
+      continue
+    if not base:
+      rows.append([name, _fmt(value), "-", "", bench.unit, "new"])
+      continue
+    delta = (value - base) / base
+    worse = -delta if bench.higher_is_better else delta
+    status = "ok"
+    if worse > tolerance:
+      status = "REGRESSED"
+      regressions.append(name)
+    elif worse < -tolerance:
+      status = "improved"
+    rows.append([name, _fmt(value), _fmt(base), f"{delta:+.1%}", bench.unit, status])
+  return rows, regressions
+
+
+def _fmt(value: Optional[float]) -> str:
+  if value is None:
+    return "-"
+  return f"{value:,.2f}"
+
+
+def print_report(rows: list[list[str]]) -> None:
+  header = ["case", "current", "baseline", "delta", "unit", "status"]
+  widths = [max(len(r[i]) for r in [header, *rows]) for i in range(len(header))]
+  for row in [header, ["-" * w for w in widths], *rows]:
+    print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+  parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+  parser.add_argument(
+    "-k", dest="pattern", default="", help="only run cases whose name contains this"
+  )
+  parser.add_argument(
+    "--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON file"
+  )
+  parser.add_argument(
+    "--save-baseline",
+    action="store_true",
+    help="write the results of this run to the baseline file",
+  )
+  parser.add_argument(
+    "--tolerance",
+    type=float,
+    default=0.25,
+    help="relative slowdown treated as a regression (default: 0.25)",
+  )
+  parser.add_argument(
+    "--fail-on-regression",
+    action="store_true",
+    help="exit non-zero if any case regressed",
+  )
+  parser.add_argument("--list", action="store_true", help="list cases and exit")
+  args = parser.parse_args(argv)
+
+  selected = [c for c in CASES.values() if args.pattern in c.name]
+  if args.list:
+    for bench in selected:
+      print(f"{bench.name:45} {bench.unit:9} {bench.description}")
+    return 0
+  if not selected:
+    print(f"No benchmark cases match {args.pattern!r}", file=sys.stderr)
+    return 2
+
+  results = run_cases(selected)
+
+  if args.save_baseline:
+    # Merge so a filtered run only refreshes the cases it measured.
+    merged = {
+      name: entry["value"] for name, entry in load_baseline(args.baseline).items()
+    }
+    merged.update({k: v for k, v in results.items() if v is not None})
+    save_baseline(args.baseline, {k: v for k, v in merged.items() if k in CASES})
+    print(f"Baseline written to {args.baseline}")
+
+  rows, regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+  print_report(rows)
+  if regressions:
+    print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+    if args.fail_on_regression:
+      return 1
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,329 @@
+"""Benchmark cases for the client hot paths.
+
+Each case is a zero-argument function registered with :func:`case` that
+returns a single number (or ``None`` to report the case as skipped, e.g.
+when an optional dependency such as pandas is missing). Timing cases take
+the best of several repeats to damp scheduler noise.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from .server import MockServer, transactions_payload
+
+
+@dataclass
+class Case:
+  """A registered benchmark case."""
+
+  name: str
+  unit: str
+  higher_is_better: bool
+  fn: Callable[[], Optional[float]]
+  description: str = ""
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, unit: str, *, higher_is_better: bool):
+  """Register a benchmark function under ``name``."""
+
+  def decorator(fn: Callable[[], Optional[float]]) -> Callable[[], Optional[float]]:
+    CASES[name] = Case(
+      name=name,
+      unit=unit,
+      higher_is_better=higher_is_better,
+      fn=fn,
+      description=(fn.__doc__ or "").strip().splitlines()[0] if fn.__doc__ else "",
+    )
+    return fn
+
+  return decorator
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+  """Best wall-clock seconds for one call of ``fn`` over ``repeat`` runs."""
+  best = float("inf")
+  for _ in range(repeat):
+    start = time.perf_counter()
+    fn()
+    best = min(best, time.perf_counter() - start)
+  return best
+
+
+def _bench_config(base_url: str) -> dict[str, Any]:
+  return {
+    "base_url": base_url,
+    "token": "rfs-benchmark-key",
+    "headers": {"X-API-Key": "rfs-benchmark-key"},
+    "timeout": 30,
+  }
+
+
+class FakeStreamResponse:
+  """Minimal stand-in for an ``httpx.Response`` in streaming mode.
+
+  Serves the same payload via ``iter_lines`` / ``iter_bytes`` so SSE
+  parsing can be measured without socket overhead.
+  """
+
+  def __init__(self, payload: bytes, chunk_size: int = 16 * 1024):
+    self._payload = payload
+    self._chunk_size = chunk_size
+
+  def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+    size = chunk_size or self._chunk_size
+    for i in range(0, len(self._payload), size):
+      yield self._payload[i : i + size]
+
+  def iter_lines(self) -> Iterator[str]:
+    yield from self._payload.decode("utf-8").splitlines()
+
+
+# ── Request throughput against the stand-in server ──────────────────
+
+
+@case("query_client.query", "req/s", higher_is_better=True)
+def bench_query_client() -> float:
+  """Requests/sec through QueryClient.query (immediate JSON response)."""
+  from robosystems_client.clients.query_client import QueryClient
+
+  requests = 200
+  with MockServer(cypher_rows=10) as server:
+    client = QueryClient(_bench_config(server.base_url))
+    client.query("bench", "MATCH (c:Company) RETURN c.name, c.revenue")  # warm-up
+
+    def run() -> None:
+      for _ in range(requests):
+        client.query("bench", "MATCH (c:Company) RETURN c.name, c.revenue")
+
+    return requests / best_of(run, repeat=3)
+
+
+@case("ledger_client.graphql_read", "req/s", higher_is_better=True)
+def bench_ledger_graphql() -> float:
+  """Requests/sec through LedgerClient.list_transactions (GraphQL read)."""
+  from robosystems_client.clients.ledger_client import LedgerClient
+
+  requests = 200
+  with MockServer(graphql_rows=10) as server:
+    client = LedgerClient(_bench_config(server.base_url))
+    client.list_transactions("bench")  # warm-up
+
+    def run() -> None:
+      for _ in range(requests):
+        client.list_transactions("bench")
+
+    return requests / best_of(run, repeat=3)
+
+
+# ── Parsing hot paths ───────────────────────────────────────────────
+
+
+def _ndjson_payload(chunks: int, rows_per_chunk: int) -> bytes:
+  lines = []
+  for c in range(chunks):
+    chunk: dict[str, Any] = {
+      "rows": [
+        {"id": c * rows_per_chunk + i, "name": f"Entity {i}", "value": i * 1.5}
+        for i in range(rows_per_chunk)
+      ],
+      "execution_time_ms": c,
+    }
+    if c == 0:
+      chunk["columns"] = ["id", "name", "value"]
+    lines.append(json.dumps(chunk))
+  return ("\n".join(lines) + "\n").encode()
+
+
+@case("query_client.ndjson_parse", "MB/s", higher_is_better=True)
+def bench_ndjson_parse() -> float:
+  """NDJSON decode throughput of QueryClient._parse_ndjson_response."""
+  from robosystems_client.clients.query_client import QueryClient
+
+  payload = _ndjson_payload(chunks=200, rows_per_chunk=500)
+
+  class _Response:
+    content = payload
+
+  client = QueryClient(_bench_config("http://localhost"))
+  seconds = best_of(lambda: client._parse_ndjson_response(_Response(), "bench"))
+  return len(payload) / seconds / 1e6
+
+
+def _bench_ndjson_decode(workers: int) -> float:
+  from concurrent.futures import ProcessPoolExecutor
+
+  from robosystems_client.clients.ndjson import decode_ndjson
+
+  payload = _ndjson_payload(chunks=2_000, rows_per_chunk=200)
+  if workers == 1:
+    seconds = best_of(lambda: decode_ndjson(payload), repeat=3)
+  else:
+    # A long-lived pool, as a client would keep: startup is not measured.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+      decode_ndjson(payload, workers=workers, executor=pool)  # warm-up
+      seconds = best_of(
+        lambda: decode_ndjson(payload, workers=workers, executor=pool), repeat=3
+      )
+  return len(payload) / seconds / 1e6
+
+
+@case("ndjson.decode_single_core", "MB/s", higher_is_better=True)
+def bench_ndjson_decode_single() -> float:
+  """In-process decode_ndjson throughput over a ~20 MB payload."""
+  return _bench_ndjson_decode(workers=1)
+
+
+@case("ndjson.decode_process_pool", "MB/s", higher_is_better=True)
+def bench_ndjson_decode_parallel() -> float:
+  """decode_ndjson throughput with a 4-process pool over the same payload."""
+  return _bench_ndjson_decode(workers=4)
+
+
+def _sse_payload(events: int) -> bytes:
+  parts = []
+  for i in range(events):
+    data = json.dumps({"rows": [{"id": i, "name": f"row {i}"}]})
+    parts.append(f"event: data_chunk\nid: {i}\ndata: {data}\n\n")
+  return "".join(parts).encode()
+
+
+@case("sse_client.process_events", "events/s", higher_is_better=True)
+def bench_sse_process_events() -> float:
+  """SSE event parse + dispatch rate of SSEClient._process_events."""
+  from robosystems_client.clients.sse_client import SSEClient, SSEConfig
+
+  events = 20_000
+  payload = _sse_payload(events)
+
+  def run() -> None:
+    client = SSEClient(SSEConfig(base_url="http://localhost"))
+    client.on("data_chunk", lambda data: None)
+    client._response = FakeStreamResponse(payload)
+    client._process_events()
+
+  return events / best_of(run)
+
+
+@case("graphql_models.decode_large_list", "ms", higher_is_better=False)
+def bench_model_decode() -> float:
+  """model_validate of a 5,000-row ListLedgerTransactions response."""
+  from robosystems_client.graphql.generated.list_ledger_transactions import (
+    ListLedgerTransactions,
+  )
+
+  data = transactions_payload(5_000)
+  return best_of(lambda: ListLedgerTransactions.model_validate(data)) * 1000
+
+
+def _read_rows(page: Any) -> float:
+  return sum(row.amount for row in page.transactions.transactions)
+
+
+@case("graphql_models.validate_and_read", "ms", higher_is_better=False)
+def bench_model_validate_and_read() -> float:
+  """model_validate of a 5,000-row response, then read one field per row."""
+  from robosystems_client.graphql.generated.list_ledger_transactions import (
+    ListLedgerTransactions,
+  )
+
+  data = transactions_payload(5_000)
+  return best_of(lambda: _read_rows(ListLedgerTransactions.model_validate(data))) * 1000
+
+
+@case("graphql_models.view_and_read", "ms", higher_is_better=False)
+def bench_model_view_and_read() -> float:
+  """Trusted-server view of the same response, then read one field per row."""
+  from robosystems_client.graphql.generated.list_ledger_transactions import (
+    ListLedgerTransactions,
+  )
+  from robosystems_client.graphql.views import model_view
+
+  data = transactions_payload(5_000)
+  return best_of(lambda: _read_rows(model_view(ListLedgerTransactions, data))) * 1000
+
+
+@case("fact_grid.to_dataframe", "ms", higher_is_better=False)
+def bench_fact_grid_to_dataframe() -> Optional[float]:
+  """FactGrid over a 100,000-fact ViewResponse to a long DataFrame."""
+  from robosystems_client.clients.dataframe_utils import HAS_PANDAS
+
+  if not HAS_PANDAS:
+    return None
+  from robosystems_client.clients.fact_grid import FactGrid
+  from robosystems_client.models.view_response import ViewResponse
+
+  facts = [
+    {
+      "element_id": f"us-gaap:Element{i % 500}",
+      "element_name": f"Element{i % 500}",
+      "period_end": f"{2000 + i % 25}-12-31",
+      "duration_type": "instant",
+      "value": i * 1.5,
+      "unit": "USD",
+      "entity_ticker": f"T{i // 500}",
+    }
+    for i in range(100_000)
+  ]
+  response = ViewResponse.from_dict(
+    {
+      "metadata": {
+        "view_id": "bench",
+        "facts_processed": len(facts),
+        "construction_time_ms": 0.0,
+        "source": "bench",
+      },
+      "facts": facts,
+    }
+  )
+  return best_of(lambda: FactGrid(response).to_dataframe()) * 1000
+
+
+# ── Process-level costs ─────────────────────────────────────────────
+
+
+@case("import.robosystems_client", "ms", higher_is_better=False)
+def bench_import_time() -> float:
+  """Cold ``import robosystems_client`` time in a fresh interpreter."""
+  code = (
+    "import time; t = time.perf_counter(); import robosystems_client; "
+    "print(time.perf_counter() - t)"
+  )
+  samples = []
+  for _ in range(5):
+    out = subprocess.run(
+      [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    samples.append(float(out.stdout.strip()))
+  return min(samples) * 1000
+
+
+@case("dataframe_utils.stream_to_dataframe", "peak MB", higher_is_better=False)
+def bench_stream_to_dataframe_memory() -> Optional[float]:
+  """Peak traced memory of stream_to_dataframe over 200k streamed rows."""
+  from robosystems_client.clients.dataframe_utils import HAS_PANDAS
+
+  if not HAS_PANDAS:
+    return None
+  from robosystems_client.clients.dataframe_utils import stream_to_dataframe
+
+  def rows() -> Iterator[dict[str, Any]]:
+    for i in range(200_000):
+      yield {"id": i, "name": f"Entity {i}", "value": i * 1.5}
+
+  tracemalloc.start()
+  try:
+    stream_to_dataframe(rows(), chunk_size=10_000)
+    _, peak = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+  return peak / 1e6
@@ -0,0 +1,126 @@
+"""Local stand-in for the RoboSystems API used by the benchmark cases.
+
+Serves canned payloads on ``127.0.0.1`` from a background thread so the
+benchmarks exercise the real client stack (generated SDK, httpx, JSON
+decode, pydantic validation) without a running backend. Payloads are
+serialized once up front — the server should never be the bottleneck.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+_CYPHER_PATH = re.compile(r"^/v1/graphs/[^/]+/query/cypher")
+_GRAPHQL_PATH = re.compile(r"^/extensions/[^/]+/graphql")
+
+
+def cypher_payload(rows: int) -> dict[str, Any]:
+  """JSON body of an immediate (non-queued) Cypher query response."""
+  return {
+    "data": [{"c.name": f"Company {i}", "c.revenue": i * 1000.0} for i in range(rows)],
+    "columns": ["c.name", "c.revenue"],
+    "row_count": rows,
+    "execution_time_ms": 3,
+    "timestamp": "2026-01-01T00:00:00Z",
+  }
+
+
+def transaction_row(i: int) -> dict[str, Any]:
+  """One ``ListLedgerTransactions`` row in GraphQL (camelCase) shape."""
+  return {
+    "id": f"txn_{i:08d}",
+    "number": f"{i}",
+    "type": "journal_entry",
+    "category": None,
+    "amount": 125.5 + i,
+    "currency": "USD",
+    "date": "2026-01-15",
+    "dueDate": None,
+    "merchantName": "Acme Supplies",
+    "referenceNumber": None,
+    "description": "Office supplies",
+    "source": "manual",
+    "status": "posted",
+  }
+
+
+def transactions_payload(rows: int) -> dict[str, Any]:
+  """GraphQL ``data`` for ``ListLedgerTransactions`` with ``rows`` items."""
+  return {
+    "transactions": {
+      "transactions": [transaction_row(i) for i in range(rows)],
+      "pagination": {
+        "total": rows,
+        "limit": rows,
+        "offset": 0,
+        "hasMore": False,
+      },
+    }
+  }
+
+
+class MockServer:
+  """Threaded HTTP server answering Cypher and GraphQL requests.
+
+  Use as a context manager; ``base_url`` is valid inside the block::
+
+      with MockServer() as server:
+        clients = RoboSystemsClients(RoboSystemsClientConfig(base_url=server.base_url))
+  """
+
+  def __init__(self, cypher_rows: int = 10, graphql_rows: int = 10):
+    self._cypher_body = json.dumps(cypher_payload(cypher_rows)).encode()
+    self._graphql_body = json.dumps(
+      {"data": transactions_payload(graphql_rows)}
+    ).encode()
+    self._httpd: ThreadingHTTPServer | None = None
+    self._thread: threading.Thread | None = None
+    self.base_url = ""
+
+  def _handler(self) -> type[BaseHTTPRequestHandler]:
+    server = self
+
+    class Handler(BaseHTTPRequestHandler):
+      protocol_version = "HTTP/1.1"
+
+      def do_POST(self) -> None:  # noqa: N802 — http.server naming
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+          self.rfile.read(length)
+        if _CYPHER_PATH.match(self.path):
+          self._send(server._cypher_body)
+        elif _GRAPHQL_PATH.match(self.path):
+          self._send(server._graphql_body)
+        else:
+          self._send(b'{"detail": "not found"}', status=404)
+
+      def _send(self, body: bytes, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+      def log_message(self, format: str, *args: Any) -> None:
+        pass  # keep benchmark output clean
+
+    return Handler
+
+  def __enter__(self) -> "MockServer":
+    self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+    self._httpd.daemon_threads = True
+    host, port = self._httpd.server_address[:2]
+    self.base_url = f"http://{host}:{port}"
+    self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+    self._thread.start()
+    return self
+
+  def __exit__(self, *exc: Any) -> None:
+    if self._httpd is not None:
+      self._httpd.shutdown()
+      self._httpd.server_close()
+      self._httpd = None
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Generate the asyncio facades from the sync Ledger/Investor/Library clients.
+
+The async facades have the same methods, signatures, docstrings and
+parsing as the sync ones; only the transport differs. Rather than keep
+three ~100-method classes in sync by hand, this script derives them from
+the sync sources:
+
+- the facade class is copied as ``Async<Name>(AsyncGraphQLFacade)``,
+  minus the transport methods the base class provides (``_get_client``,
+  ``_get_graphql_client``, ``_query``, ``_gather``);
+- every method that (transitively) calls ``self._query``, ``self._gather``
+  or an ``op_*`` REST operation becomes ``async def``, with those calls
+  awaited;
+- ``sync_detailed as op_x`` imports become ``asyncio_detailed as op_x``;
+- module-level helpers and dataclasses are imported from the sync module
+  instead of copied.
+
+Comments do not survive the round trip through ``ast``; the sync module
+stays the documented source of truth. `tests/test_async_facades.py`
+fails when a generated module is out of date.
+
+Usage: ``python bin/generate-async-facades.py [--check]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLIENTS = ROOT / "robosystems_client" / "clients"
+
+# Provided by AsyncGraphQLFacade.
+BASE_METHODS = frozenset({"_get_client", "_get_graphql_client", "_query", "_gather"})
+# Base methods that perform requests (and are coroutines in the base class).
+BASE_IO_METHODS = frozenset({"_query", "_gather"})
+
+
+@dataclass(frozen=True)
+class FacadeSpec:
+  module: str
+  class_name: str
+  # Methods not carried over — streaming file downloads and thread-pooled
+  # bulk writes have no async counterpart yet.
+  skip: frozenset[str] = field(default_factory=frozenset)
+
+  @property
+  def async_module(self) -> str:
+    return f"async_{self.module}"
+
+  @property
+  def async_class_name(self) -> str:
+    return f"Async{self.class_name}"
+
+
+SPECS = (
+  FacadeSpec(
+    "ledger_client",
+    "LedgerClient",
+    skip=frozenset(
+      {
+        "download_report_bundle",
+        "download_report_bundles",
+        "_resolve_report_download",
+        "_fetch_report_bundle",
+        "_fetch_cached_report_bundle",
+        "create_journal_entries",
+        "_post_journal_entry",
+        "ingest_event_blocks",
+        "_ingest_event_block",
+        "_retrying_op",
+      }
+    ),
+  ),
+  FacadeSpec("investor_client", "InvestorClient"),
+  FacadeSpec("library_client", "LibraryClient"),
+)
+
+HEADER = '''"""Asyncio variant of :class:`{class_name}` (``{module}``).
+
+GENERATED by ``bin/generate-async-facades.py`` from ``{module}.py`` — do
+not edit by hand; change the sync facade and regenerate.
+"""
+'''
+
+
+def _is_io_call(node: ast.Call, io_methods: set[str]) -> bool:
+  func = node.func
+  if isinstance(func, ast.Name):
+    return func.id.startswith("op_")
+  return (
+    isinstance(func, ast.Attribute)
+    and isinstance(func.value, ast.Name)
+    and func.value.id == "self"
+    and func.attr in io_methods
+  )
+
+
+def _io_methods(methods: list[ast.FunctionDef]) -> set[str]:
+  """Methods that reach the network, directly or through another method."""
+  io = set(BASE_IO_METHODS)
+  changed = True
+  while changed:
+    changed = False
+    for method in methods:
+      if method.name in io:
+        continue
+      if any(isinstance(n, ast.Call) and _is_io_call(n, io) for n in ast.walk(method)):
+        io.add(method.name)
+        changed = True
+  return io
+
+
+class _AwaitIO(ast.NodeTransformer):
+  def __init__(self, io_methods: set[str]):
+    self.io_methods = io_methods
+
+  def visit_Lambda(self, node: ast.Lambda) -> ast.Lambda:
+    if any(
+      isinstance(n, ast.Call) and _is_io_call(n, self.io_methods)
+      for n in ast.walk(node)
+    ):
+      raise ValueError(f"I/O call inside a lambda (line {node.lineno})")
+    return node
+
+  def visit_Call(self, node: ast.Call) -> ast.AST:
+    self.generic_visit(node)
+    if _is_io_call(node, self.io_methods):
+      return ast.Await(value=node)
+    return node
+
+
+def _to_async(method: ast.FunctionDef, io_methods: set[str]) -> ast.AST:
+  method = _AwaitIO(io_methods).visit(method)
+  if method.name not in io_methods:
+    return method
+  return ast.AsyncFunctionDef(
+    name=method.name,
+    args=method.args,
+    body=method.body,
+    decorator_list=method.decorator_list,
+    returns=method.returns,
+    type_comment=method.type_comment,
+    type_params=getattr(method, "type_params", []),
+  )
+
+
+def _referenced_names(node: ast.AST) -> set[str]:
+  return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _rewrite_import(node: ast.ImportFrom, used: set[str]) -> ast.ImportFrom | None:
+  names = []
+  for alias in node.names:
+    bound = alias.asname or alias.name
+    if bound not in used:
+      continue
+    if alias.name == "sync_detailed":
+      alias = ast.alias(name="asyncio_detailed", asname=alias.asname)
+    names.append(alias)
+  if not names:
+    return None
+  return ast.ImportFrom(module=node.module, names=names, level=node.level)
+
+
+def generate(spec: FacadeSpec) -> str:
+  """Return the unformatted source of the async module for ``spec``."""
+  tree = ast.parse((CLIENTS / f"{spec.module}.py").read_text())
+  cls = next(
+    n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == spec.class_name
+  )
+
+  methods = [
+    n
+    for n in cls.body
+    if isinstance(n, ast.FunctionDef)
+    and n.name not in BASE_METHODS
+    and n.name not in spec.skip
+  ]
+  io_methods = _io_methods(methods)
+  body: list[ast.stmt] = [
+    ast.Expr(
+      ast.Constant(
+        f"Asyncio variant of :class:`{spec.class_name}`.\n\n"
+        "Every method that performs a request is a coroutine; helpers stay\n"
+        "synchronous. See the sync class for per-method documentation.\n"
+      )
+    )
+  ]
+  for node in cls.body[1:] if ast.get_docstring(cls) else cls.body:
+    if isinstance(node, ast.FunctionDef):
+      if node.name in BASE_METHODS or node.name in spec.skip:
+        continue
+      body.append(_to_async(node, io_methods))
+    else:
+      body.append(node)
+
+  async_cls = ast.ClassDef(
+    name=spec.async_class_name,
+    bases=[ast.Name("AsyncGraphQLFacade")],
+    keywords=[],
+    body=body,
+    decorator_list=[],
+    type_params=[],
+  )
+  used = _referenced_names(async_cls)
+
+  imports: list[ast.stmt] = []
+  module_defs: list[str] = []
+  for node in tree.body:
+    if isinstance(node, ast.ImportFrom) and node.module != "__future__":
+      rewritten = _rewrite_import(node, used)
+      if rewritten is not None:
+        imports.append(rewritten)
+    elif isinstance(node, ast.Import):
+      kept = [a for a in node.names if (a.asname or a.name) in used]
+      if kept:
+        imports.append(ast.Import(names=kept))
+    elif isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+      if node.name != spec.class_name and node.name in used:
+        module_defs.append(node.name)
+    elif isinstance(node, ast.Assign):
+      module_defs.extend(
+        t.id for t in node.targets if isinstance(t, ast.Name) and t.id in used
+      )
+
+  imports.append(
+    ast.ImportFrom(
+      module="async_graphql_facade", names=[ast.alias("AsyncGraphQLFacade")], level=1
+    )
+  )
+  if module_defs:
+    imports.append(
+      ast.ImportFrom(
+        module=spec.module,
+        names=[ast.alias(name) for name in module_defs],
+        level=1,
+      )
+    )
+
+  absolute = [n for n in imports if getattr(n, "level", 0) == 0]
+  relative = [n for n in imports if getattr(n, "level", 0) > 0]
+  sections = [
+    HEADER.format(class_name=spec.class_name, module=spec.module),
+    "from __future__ import annotations",
+    *(_unparse(group) for group in (absolute, relative) if group),
+    _unparse([async_cls]),
+  ]
+  return "\n\n".join(sections) + "\n"
+
+
+def _unparse(nodes: list[ast.stmt]) -> str:
+  module = ast.Module(body=nodes, type_ignores=[])
+  return ast.unparse(ast.fix_missing_locations(module))
+
+
+def _format(source: str, path: Path) -> str:
+  return subprocess.run(
+    ["ruff", "format", "--stdin-filename", str(path), "-"],
+    input=source,
+    capture_output=True,
+    text=True,
+    check=True,
+    cwd=ROOT,
+  ).stdout
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument(
+    "--check", action="store_true", help="exit 1 if a module is out of date"
+  )
+  args = parser.parse_args()
+
+  stale = []
+  for spec in SPECS:
+    path = CLIENTS / f"{spec.async_module}.py"
+    source = _format(generate(spec), path)
+    if args.check:
+      if not path.exists() or path.read_text() != source:
+        stale.append(path.relative_to(ROOT))
+    else:
+      path.write_text(source)
+      print(f"wrote {path.relative_to(ROOT)}")
+
+  for path in stale:
+    print(f"out of date: {path}", file=sys.stderr)
+  return 1 if stale else 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -2,6 +2,10 @@
 
 from .client import AuthenticatedClient, Client
 from .clients import (
+  AsyncInvestorClient,
+  AsyncLedgerClient,
+  AsyncLibraryClient,
+  AsyncRoboSystemsClients,
   InvestorClient,
   LedgerClient,
   LibraryClient,
@@ -16,6 +20,10 @@ RoboSystemsClient = AuthenticatedClient
 RoboSystemsSDK = AuthenticatedClient
 
 __all__ = (
+  "AsyncInvestorClient",
+  "AsyncLedgerClient",
+  "AsyncLibraryClient",
+  "AsyncRoboSystemsClients",
   "AuthenticatedClient",
   "Client",
   "GraphQLError",
@@ -13,6 +13,8 @@ from .query_client import (
   QueryRequest,
   QueryOptions,
   QueuedQueryError,
+  GraphQueryOutcome,
+  MultiGraphQueryResult,
 )
 from .operator_client import (
   OperatorClient,
@@ -20,6 +22,7 @@ from .operator_client import (
   QueuedOperatorResponse,
   OperatorQueryRequest,
   OperatorOptions,
+  OperatorStreamEvent,
   QueuedOperatorError,
 )
 from .operation_client import (
@@ -33,10 +36,13 @@ from .file_client import (
   FileUploadOptions,
   FileUploadResult,
   FileInfo,
+  BatchUploadResult,
 )
 from .table_client import (
+  ColumnarResult,
   TableClient,
   TableInfo,
+  TableMirrorResult,
   QueryResult as TableQueryResult,
 )
 from .graph_client import (
@@ -47,9 +53,37 @@ from .graph_client import (
   InitialEntityData,
   GraphInfo,
 )
+from .backup_client import BackupClient, BackupDownloadResult
 from .investor_client import InvestorClient
-from .ledger_client import LedgerClient, ReportBundleDownload
+from .event_ingest import EventBlockOutcome, EventIngestResult, IngestCheckpoint
+from .fact_grid import FactGrid
+from .persistent_cache import SQLiteCacheBackend
+from .read_cache import (
+  CachePolicy,
+  MemoryCacheBackend,
+  ReadCache,
+  credential_scope,
+)
+from .single_flight import (
+  AsyncSingleFlight,
+  AsyncSingleFlightTransport,
+  SingleFlight,
+  SingleFlightTransport,
+)
+from .ledger_client import (
+  JournalEntryBatchResult,
+  JournalEntryOutcome,
+  LedgerClient,
+  ReportBundleDownload,
+)
+from .report_bundle_cache import CachedBundle, ReportBundleCache
+from .account_index import AccountIndex
 from .library_client import LIBRARY_GRAPH_ID, LibraryClient
+from .library_index import LibraryIndex
+from .taxonomy_graph import TaxonomyGraph
+from .async_ledger_client import AsyncLedgerClient
+from .async_investor_client import AsyncInvestorClient
+from .async_library_client import AsyncLibraryClient
 from .facade import (
   RoboSystemsClients,
   RoboSystemsClientConfig,
@@ -137,12 +171,15 @@ __all__ = [
   "QueryRequest",
   "QueryOptions",
   "QueuedQueryError",
+  "GraphQueryOutcome",
+  "MultiGraphQueryResult",
   # AI Operator Client
   "OperatorClient",
   "OperatorResult",
   "QueuedOperatorResponse",
   "OperatorQueryRequest",
   "OperatorOptions",
+  "OperatorStreamEvent",
   "QueuedOperatorError",
   # Operation Client
   "OperationClient",
@@ -154,10 +191,13 @@ __all__ = [
   "FileUploadOptions",
   "FileUploadResult",
   "FileInfo",
+  "BatchUploadResult",
   # Table Client
   "TableClient",
   "TableInfo",
   "TableQueryResult",
+  "TableMirrorResult",
+  "ColumnarResult",
   # Graph Client
   "GraphClient",
   "GraphMetadata",
@@ -165,14 +205,43 @@ __all__ = [
   "GraphInfo",
   "MaterializationOptions",
   "MaterializationResult",
+  # Backup Client
+  "BackupClient",
+  "BackupDownloadResult",
   # Ledger Client
   "LedgerClient",
   "ReportBundleDownload",
+  "JournalEntryBatchResult",
+  "JournalEntryOutcome",
+  "EventIngestResult",
+  "EventBlockOutcome",
+  "IngestCheckpoint",
+  "FactGrid",
+  "ReportBundleCache",
+  "CachedBundle",
+  "AccountIndex",
   # Investor Client
   "InvestorClient",
   # Library Client
   "LibraryClient",
   "LIBRARY_GRAPH_ID",
+  "LibraryIndex",
+  "TaxonomyGraph",
+  # Async GraphQL-backed facades
+  "AsyncLedgerClient",
+  "AsyncInvestorClient",
+  "AsyncLibraryClient",
+  # Request coalescing
+  "SingleFlight",
+  "AsyncSingleFlight",
+  "SingleFlightTransport",
+  "AsyncSingleFlightTransport",
+  # Reference-read caching
+  "ReadCache",
+  "CachePolicy",
+  "MemoryCacheBackend",
+  "credential_scope",
+  "SQLiteCacheBackend",
   # Utilities
   "QueryBuilder",
   "ResultProcessor",
@@ -0,0 +1,228 @@
+"""Indexed, flattened Chart of Accounts with local rollups.
+
+:class:`AccountIndex` lays the account hierarchy out in pre-order, so
+every account's subtree is one contiguous slice ``[start, end)`` of the
+arrays. Lookups by id or code are dict hits, ancestors follow the
+``parent`` array, and subtree balances come from one O(n) pass per
+period that adds every account into its parent in reverse pre-order, so
+each total sums only its own subtree (no cancellation against unrelated
+large balances). With NumPy installed, many periods are rolled up
+together, one depth level at a time.
+
+Build one with :meth:`AccountIndex.from_tree` (``get_account_tree``) or
+:meth:`AccountIndex.from_accounts` (``list_accounts`` pages, linked by
+``parent_id``), then feed it per-account balances such as trial balance
+``net_balance`` values for each period.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Hashable, Iterable, Mapping, Optional, Sequence
+
+try:
+  import numpy as np
+
+  HAS_NUMPY = True
+except ImportError:
+  HAS_NUMPY = False
+  np = None
+
+
+class AccountIndex:
+  """Chart of Accounts flattened into pre-order arrays.
+
+  Positions index ``ids``, ``codes``, ``accounts``, ``depth``, ``parent``
+  and ``end``; ``parent[i]`` is ``-1`` for roots and the subtree of
+  position ``i`` spans ``range(i, end[i])``.
+  """
+
+  def __init__(self, accounts: Sequence[Any], parent: Sequence[int]):
+    """Use :meth:`from_tree` or :meth:`from_accounts`.
+
+    ``accounts`` must be in pre-order with ``parent`` giving each
+    account's parent position.
+    """
+    n = len(accounts)
+    self.accounts: list[Any] = list(accounts)
+    self.ids: list[str] = [a.id for a in accounts]
+    self.codes: list[Optional[str]] = [a.code for a in accounts]
+    self.parent = array("i", parent)
+    self.depth = array("i", [0] * n)
+    self.end = array("i", range(1, n + 1))
+    for i in range(n):
+      p = self.parent[i]
+      if p >= 0:
+        self.depth[i] = self.depth[p] + 1
+    # Children follow their parent in pre-order, so walking backwards
+    # finalises every subtree before its parent reads it.
+    for i in range(n - 1, -1, -1):
+      p = self.parent[i]
+      if p >= 0 and self.end[i] > self.end[p]:
+        self.end[p] = self.end[i]
+    self._by_id = {account_id: i for i, account_id in enumerate(self.ids)}
+    self._by_code = {code: i for i, code in enumerate(self.codes) if code}
+
+  @classmethod
+  def from_tree(cls, tree: Any) -> AccountIndex:
+    """Index a ``LedgerAccountTree`` (or anything with nested ``roots``/``children``)."""
+    accounts: list[Any] = []
+    parent: list[int] = []
+    stack = [(root, -1) for root in reversed(tree.roots)]
+    while stack:
+      node, parent_pos = stack.pop()
+      pos = len(accounts)
+      accounts.append(node)
+      parent.append(parent_pos)
+      children = getattr(node, "children", None) or []
+      stack.extend((child, pos) for child in reversed(children))
+    return cls(accounts, parent)
+
+  @classmethod
+  def from_accounts(cls, accounts: Iterable[Any]) -> AccountIndex:
+    """Index flat accounts linked by ``parent_id``, keeping their input order
+    among siblings. Accounts whose parent is not in ``accounts`` are roots.
+    """
+    accounts = list(accounts)
+    known = {a.id for a in accounts}
+    children: dict[Optional[str], list[Any]] = {}
+    for account in accounts:
+      parent_id = account.parent_id if account.parent_id in known else None
+      children.setdefault(parent_id, []).append(account)
+
+    ordered: list[Any] = []
+    parent: list[int] = []
+    stack = [(a, -1) for a in reversed(children.get(None, []))]
+    while stack:
+      account, parent_pos = stack.pop()
+      pos = len(ordered)
+      ordered.append(account)
+      parent.append(parent_pos)
+      stack.extend((c, pos) for c in reversed(children.get(account.id, [])))
+    if len(ordered) != len(accounts):
+      raise ValueError("Account hierarchy contains a cycle")
+    return cls(ordered, parent)
+
+  # ── Lookup ──────────────────────────────────────────────────────────
+
+  def __len__(self) -> int:
+    return len(self.ids)
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._by_id or key in self._by_code
+
+  def position(self, key: str) -> int:
+    """Pre-order position of the account with id or code ``key``."""
+    pos = self._by_id.get(key)
+    if pos is None:
+      pos = self._by_code.get(key)
+    if pos is None:
+      raise KeyError(key)
+    return pos
+
+  def get(self, key: str) -> Any:
+    """The account node with id or code ``key``."""
+    return self.accounts[self.position(key)]
+
+  def parent_id(self, key: str) -> Optional[str]:
+    p = self.parent[self.position(key)]
+    return self.ids[p] if p >= 0 else None
+
+  def ancestors(self, key: str) -> list[str]:
+    """Ids from the parent up to the root."""
+    result = []
+    p = self.parent[self.position(key)]
+    while p >= 0:
+      result.append(self.ids[p])
+      p = self.parent[p]
+    return result
+
+  def descendants(self, key: str) -> list[str]:
+    """Ids of every account below ``key``, in pre-order."""
+    pos = self.position(key)
+    return self.ids[pos + 1 : self.end[pos]]
+
+  def subtree(self, key: str) -> range:
+    """Positions of ``key`` and all its descendants."""
+    pos = self.position(key)
+    return range(pos, self.end[pos])
+
+  # ── Rollups ─────────────────────────────────────────────────────────
+
+  def vector(self, balances: Mapping[str, float]) -> list[float]:
+    """Balances keyed by account id (or code) as a pre-order list.
+
+    Accounts without a balance are ``0.0``; keys not in the index are
+    ignored (e.g. accounts filtered out of the tree).
+    """
+    values = [0.0] * len(self.ids)
+    for key, amount in balances.items():
+      pos = self._by_id.get(key)
+      if pos is None:
+        pos = self._by_code.get(key)
+      if pos is not None:
+        values[pos] += amount
+    return values
+
+  def rollup(
+    self, balances: Mapping[str, float], keys: Optional[Sequence[str]] = None
+  ) -> dict[str, float]:
+    """Subtree totals — each account's own balance plus its descendants'.
+
+    Args:
+        balances: Per-account balances keyed by id or code
+        keys: Accounts to total (default: every account)
+
+    Returns:
+        Account id → rolled-up balance
+    """
+    return self.rollup_periods({None: balances}, keys)[None]
+
+  def rollup_periods(
+    self,
+    periods: Mapping[Hashable, Mapping[str, float]],
+    keys: Optional[Sequence[str]] = None,
+  ) -> dict[Hashable, dict[str, float]]:
+    """:meth:`rollup` for many periods at once.
+
+    Args:
+        periods: Period label → per-account balances for that period
+        keys: Accounts to total (default: every account)
+
+    Returns:
+        Period label → account id → rolled-up balance
+
+    Example:
+        >>> index = AccountIndex.from_tree(ledger.get_account_tree(graph_id))
+        >>> index.rollup_periods({
+        ...     month: {r.account_id: r.net_balance for r in tb.rows}
+        ...     for month, tb in trial_balances.items()
+        ... }, keys=["1000", "4000"])
+    """
+    positions = (
+      list(range(len(self.ids))) if keys is None else [self.position(k) for k in keys]
+    )
+    ids = [self.ids[p] for p in positions]
+    labels = list(periods)
+    vectors = [self.vector(periods[label]) for label in labels]
+
+    if HAS_NUMPY and vectors:
+      # Accounts x periods; deepest level first, so a level's totals are
+      # complete before they are added into the level above
+      matrix = np.asarray(vectors, dtype=float).T.copy()
+      parent = np.frombuffer(self.parent, dtype=np.intc)
+      depth = np.frombuffer(self.depth, dtype=np.intc)
+      for level in range(int(depth.max(initial=0)), 0, -1):
+        children = np.flatnonzero(depth == level)
+        np.add.at(matrix, parent[children], matrix[children])
+      totals = matrix[positions].T.tolist()
+    else:
+      totals = []
+      for vector in vectors:
+        for i in range(len(vector) - 1, -1, -1):
+          p = self.parent[i]
+          if p >= 0:
+            vector[p] += vector[i]
+        totals.append([vector[p] for p in positions])
+
+    return {label: dict(zip(ids, row)) for label, row in zip(labels, totals)}
@@ -0,0 +1,193 @@
+"""Shared transport for the asyncio GraphQL-backed facades.
+
+``AsyncLedgerClient``, ``AsyncInvestorClient`` and ``AsyncLibraryClient``
+are generated from their sync counterparts (see
+``bin/generate-async-facades.py``) and inherit the transport from
+:class:`AsyncGraphQLFacade`: GraphQL reads go through
+:class:`AsyncGraphQLClient`, REST writes through the generated
+``asyncio_detailed`` operations, and both run over one shared
+``httpx.AsyncClient`` so concurrent calls reuse pooled connections.
+
+Credentials stay per-request, as in the sync facades: the shared client
+carries no credential header, GraphQL requests set their own (routed by
+token type), and REST requests get ``X-API-Key`` from
+:func:`resolve_config_token` at send time, so a rotating
+``token_provider`` keeps working on a long-lived pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any, TypeVar
+
+import httpx
+
+from ..client import AuthenticatedClient
+from ..graphql.client import AsyncGraphQLClient, strip_none_vars
+from .read_cache import credential_scope, operation_name
+from .single_flight import AsyncSingleFlightTransport
+from .token_utils import resolve_config_token
+
+_CREDENTIAL_HEADERS = frozenset({"x-api-key", "authorization"})
+
+T = TypeVar("T")
+
+
+class _ConfigTokenAuth(httpx.Auth):
+  """Add ``X-API-Key`` from the facade config to requests that carry no credential."""
+
+  def __init__(self, config: dict[str, Any]):
+    self.config = config
+
+  def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, Any, None]:
+    if not _CREDENTIAL_HEADERS.intersection(request.headers.keys()):
+      token = resolve_config_token(self.config)
+      if token:
+        request.headers["X-API-Key"] = token
+    yield request
+
+
+def create_async_http_client(
+  config: dict[str, Any], **kwargs: Any
+) -> httpx.AsyncClient:
+  """Build the ``httpx.AsyncClient`` shared by the async facades.
+
+  Static credential headers are left out of the client defaults — the
+  credential is resolved per request instead. Waiting for a free pooled
+  connection is not subject to the timeout, so a burst of concurrent
+  calls queues on the pool rather than failing with ``PoolTimeout``.
+  With an ``AsyncSingleFlight`` group in ``config["single_flight"]``,
+  identical concurrent GETs share one request; ``verify``, ``cert`` and
+  ``limits`` then configure the wrapped transport, as httpx ignores them
+  on a client given a transport. Extra ``kwargs`` are passed to
+  ``httpx.AsyncClient``.
+  """
+  headers = {
+    k: v
+    for k, v in (config.get("headers") or {}).items()
+    if k.lower() not in _CREDENTIAL_HEADERS
+  }
+  timeout = config.get("timeout", 60)
+  kwargs.setdefault("timeout", httpx.Timeout(timeout, pool=None))
+  flight = config.get("single_flight")
+  if flight is not None and "transport" not in kwargs:
+    transport_args = {
+      k: kwargs.pop(k) for k in ("verify", "cert", "limits") if k in kwargs
+    }
+    kwargs["transport"] = AsyncSingleFlightTransport(
+      flight, httpx.AsyncHTTPTransport(**transport_args)
+    )
+  return httpx.AsyncClient(
+    base_url=config["base_url"],
+    headers=headers,
+    auth=_ConfigTokenAuth(config),
+    **kwargs,
+  )
+
+
+class AsyncGraphQLFacade:
+  """Base class of the async facades: shared client, auth and ``_query``.
+
+  Uses ``config["async_http_client"]`` when set (as
+  ``AsyncRoboSystemsClients`` does); otherwise the facade creates its own
+  client on first use, released by :meth:`aclose`.
+  """
+
+  config: dict[str, Any]
+  base_url: str
+  headers: dict[str, str]
+  timeout: float
+  _owned_http_client: httpx.AsyncClient | None = None
+
+  def _http_client(self) -> httpx.AsyncClient:
+    shared = self.config.get("async_http_client")
+    if shared is not None:
+      return shared
+    if self._owned_http_client is None:
+      self._owned_http_client = create_async_http_client(self.config)
+    return self._owned_http_client
+
+  def _get_client(self) -> AuthenticatedClient:
+    token = resolve_config_token(self.config)
+    if not token:
+      raise RuntimeError("No API key provided. Set X-API-Key in headers.")
+    client = AuthenticatedClient(
+      base_url=self.base_url,
+      token=token,
+      prefix="",
+      auth_header_name="X-API-Key",
+      headers=self.headers,
+    )
+    return client.set_async_httpx_client(self._http_client())
+
+  def _get_graphql_client(self) -> AsyncGraphQLClient:
+    token = resolve_config_token(self.config)
+    if not token:
+      raise RuntimeError("No API key provided. Set X-API-Key in headers.")
+    return AsyncGraphQLClient(
+      base_url=self.base_url,
+      token=token,
+      headers=self.headers,
+      timeout=self.timeout,
+      persisted_queries=self.config.get("graphql_persisted_queries", False),
+      use_get=self.config.get("graphql_use_get", False),
+      http_client=self._http_client(),
+      single_flight=self.config.get("single_flight"),
+    )
+
+  async def _query(
+    self,
+    graph_id: str,
+    query: str,
+    variables: dict[str, Any] | None = None,
+  ) -> dict[str, Any]:
+    """Execute a read against the per-graph GraphQL endpoint.
+
+    ``None`` values in ``variables`` are stripped before sending, and
+    reads go through ``config["read_cache"]`` when set, as in the sync
+    facades.
+    """
+    cleaned = strip_none_vars(variables) if variables else None
+    cache = self.config.get("read_cache")
+    if cache is not None:
+      return await cache.aget(
+        operation_name(query),
+        graph_id,
+        cleaned,
+        lambda: self._get_graphql_client().execute(graph_id, query, cleaned),
+        document=query,
+        scope=credential_scope(
+          self.base_url, resolve_config_token(self.config), self.headers
+        ),
+      )
+    return await self._get_graphql_client().execute(graph_id, query, cleaned)
+
+  async def _gather(
+    self,
+    fn: Callable[..., Awaitable[T]],
+    calls: list[dict[str, Any]],
+    concurrency: int,
+  ) -> list[T]:
+    """Await ``fn(**kwargs)`` for every entry of ``calls``, at most
+    ``concurrency`` at a time; results are returned in ``calls`` order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(kwargs: dict[str, Any]) -> T:
+      async with semaphore:
+        return await fn(**kwargs)
+
+    return list(await asyncio.gather(*(run(kwargs) for kwargs in calls)))
+
+  async def aclose(self) -> None:
+    """Close the client this facade created; a shared one is left open."""
+    if self._owned_http_client is not None:
+      await self._owned_http_client.aclose()
+      self._owned_http_client = None
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, *exc_info: Any) -> None:
+    await self.aclose()
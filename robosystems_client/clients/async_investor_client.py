@@ -0,0 +1,320 @@
+"""Asyncio variant of :class:`InvestorClient` (``investor_client``).
+
+GENERATED by ``bin/generate-async-facades.py`` from ``investor_client.py`` — do
+not edit by hand; change the sync facade and regenerate.
+"""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Any
+
+from ..api.extensions_robo_investor.create_portfolio_block import (
+  asyncio_detailed as op_create_portfolio_block,
+)
+from ..api.extensions_robo_investor.create_security import (
+  asyncio_detailed as op_create_security,
+)
+from ..api.extensions_robo_investor.delete_portfolio_block import (
+  asyncio_detailed as op_delete_portfolio_block,
+)
+from ..api.extensions_robo_investor.delete_security import (
+  asyncio_detailed as op_delete_security,
+)
+from ..api.extensions_robo_investor.update_portfolio_block import (
+  asyncio_detailed as op_update_portfolio_block,
+)
+from ..api.extensions_robo_investor.update_security import (
+  asyncio_detailed as op_update_security,
+)
+from ..graphql.views import parse_model
+from ..graphql.generated.get_investor_holdings import GetInvestorHoldings
+from ..graphql.generated.get_investor_holdings import (
+  GetInvestorHoldingsHoldings as InvestorHoldings,
+)
+from ..graphql.generated.get_investor_portfolio_block import GetInvestorPortfolioBlock
+from ..graphql.generated.get_investor_portfolio_block import (
+  GetInvestorPortfolioBlockPortfolioBlock as PortfolioBlock,
+)
+from ..graphql.generated.get_investor_position import GetInvestorPosition
+from ..graphql.generated.get_investor_position import (
+  GetInvestorPositionPosition as InvestorPosition,
+)
+from ..graphql.generated.get_investor_security import GetInvestorSecurity
+from ..graphql.generated.get_investor_security import (
+  GetInvestorSecuritySecurity as InvestorSecurity,
+)
+from ..graphql.generated.list_investor_portfolios import ListInvestorPortfolios
+from ..graphql.generated.list_investor_portfolios import (
+  ListInvestorPortfoliosPortfolios as PortfoliosPage,
+)
+from ..graphql.generated.list_investor_positions import ListInvestorPositions
+from ..graphql.generated.list_investor_positions import (
+  ListInvestorPositionsPositions as PositionsPage,
+)
+from ..graphql.generated.list_investor_securities import ListInvestorSecurities
+from ..graphql.generated.list_investor_securities import (
+  ListInvestorSecuritiesSecurities as SecuritiesPage,
+)
+from ..graphql.generated.operations import (
+  GET_INVESTOR_HOLDINGS_GQL,
+  GET_INVESTOR_PORTFOLIO_BLOCK_GQL,
+  GET_INVESTOR_POSITION_GQL,
+  GET_INVESTOR_SECURITY_GQL,
+  LIST_INVESTOR_PORTFOLIOS_GQL,
+  LIST_INVESTOR_POSITIONS_GQL,
+  LIST_INVESTOR_SECURITIES_GQL,
+)
+from ..models.create_portfolio_block_request import CreatePortfolioBlockRequest
+from ..models.create_security_request import CreateSecurityRequest
+from ..models.delete_portfolio_block_operation import DeletePortfolioBlockOperation
+from ..models.delete_portfolio_block_response import DeletePortfolioBlockResponse
+from ..models.delete_result import DeleteResult
+from ..models.delete_security_operation import DeleteSecurityOperation
+from ..models.portfolio_block_envelope import PortfolioBlockEnvelope
+from ..models.security_response import SecurityResponse
+from ..models.update_portfolio_block_operation import UpdatePortfolioBlockOperation
+from ..models.update_security_operation import UpdateSecurityOperation
+from .async_graphql_facade import AsyncGraphQLFacade
+
+
+class AsyncInvestorClient(AsyncGraphQLFacade):
+  """Asyncio variant of :class:`InvestorClient`.
+
+  Every method that performs a request is a coroutine; helpers stay
+  synchronous. See the sync class for per-method documentation.
+  """
+
+  def __init__(self, config: dict[str, Any]):
+    self.config = config
+    self.base_url = config["base_url"]
+    self.headers = config.get("headers", {})
+    self.token = config.get("token")
+    self.timeout = config.get("timeout", 60)
+    self.trusted_server = config.get("graphql_trusted_server", False)
+
+  _ENVELOPE_FIELDS = ("operation", "operation_id", "status", "result")
+
+  def _is_envelope(self, value: Any) -> bool:
+    return all((hasattr(value, f) for f in self._ENVELOPE_FIELDS))
+
+  def _call_op(self, label: str, response: Any) -> Any:
+    """Common error handling for every generated op_* REST call.
+
+    Returns the parsed envelope unchanged. Typed-envelope ops surface
+    ``envelope.result`` as the SDK's typed attrs class (e.g.
+    ``PortfolioBlockEnvelope``); untyped ops surface it as a plain dict.
+    Facade methods are responsible for casting the result to the type
+    they advertise.
+    """
+    if response.status_code not in (HTTPStatus.OK, HTTPStatus.ACCEPTED):
+      raise RuntimeError(
+        f"{label} failed: {response.status_code}: {response.content!r}"
+      )
+    envelope = response.parsed
+    if not self._is_envelope(envelope):
+      raise RuntimeError(f"{label} failed: unexpected response shape: {envelope!r}")
+    return envelope
+
+  def _typed_result(
+    self,
+    label: str,
+    envelope: Any,
+    expected: type[Any],
+    *,
+    sentinel_on_empty: bool = False,
+  ) -> Any:
+    """Return ``envelope.result`` for typed-envelope facade methods.
+
+    See :meth:`LedgerClient._typed_result` for the contract. Briefly: in
+    production the SDK gives back the typed attrs class; in tests using
+    dict mocks the result is a plain dict. ``None``/``Unset`` raises unless
+    ``sentinel_on_empty`` is set, which delete-style ops pass to preserve
+    their historical ``{"deleted": True}`` return.
+    """
+    result = envelope.result
+    if result is None or (
+      hasattr(result, "__class__") and "Unset" in result.__class__.__name__
+    ):
+      if sentinel_on_empty:
+        return {"deleted": True}
+      raise RuntimeError(f"{label}: operation envelope had no result")
+    return result
+
+  async def list_portfolios(
+    self, graph_id: str, limit: int = 100, offset: int = 0
+  ) -> PortfoliosPage | None:
+    """List portfolios with pagination."""
+    data = await self._query(
+      graph_id, LIST_INVESTOR_PORTFOLIOS_GQL, {"limit": limit, "offset": offset}
+    )
+    return parse_model(
+      ListInvestorPortfolios, data, trusted=self.trusted_server
+    ).portfolios
+
+  async def get_portfolio_block(
+    self, graph_id: str, portfolio_id: str
+  ) -> PortfolioBlock | None:
+    """Get the full portfolio block (portfolio + positions + securities). Returns None if not found."""
+    data = await self._query(
+      graph_id, GET_INVESTOR_PORTFOLIO_BLOCK_GQL, {"portfolioId": portfolio_id}
+    )
+    return parse_model(
+      GetInvestorPortfolioBlock, data, trusted=self.trusted_server
+    ).portfolio_block
+
+  async def create_portfolio_block(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> PortfolioBlockEnvelope:
+    """Create a portfolio with optional initial positions in one atomic operation."""
+    request = CreatePortfolioBlockRequest.from_dict(body)
+    response = await op_create_portfolio_block(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Create portfolio block", response)
+    return self._typed_result(
+      "Create portfolio block", envelope, PortfolioBlockEnvelope
+    )
+
+  async def update_portfolio_block(
+    self, graph_id: str, portfolio_id: str, updates: dict[str, Any]
+  ) -> PortfolioBlockEnvelope:
+    """Update portfolio metadata and/or apply position deltas (add/update/dispose)."""
+    body_dict = {**updates, "portfolio_id": portfolio_id}
+    body = UpdatePortfolioBlockOperation.from_dict(body_dict)
+    response = await op_update_portfolio_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Update portfolio block", response)
+    return self._typed_result(
+      "Update portfolio block", envelope, PortfolioBlockEnvelope
+    )
+
+  async def delete_portfolio_block(
+    self, graph_id: str, portfolio_id: str, confirm_active_positions: bool = False
+  ) -> DeletePortfolioBlockResponse:
+    """Delete a portfolio and all its positions. Requires `confirm_active_positions=True` when active positions exist."""
+    body = DeletePortfolioBlockOperation(
+      portfolio_id=portfolio_id, confirm_active_positions=confirm_active_positions
+    )
+    response = await op_delete_portfolio_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete portfolio block", response)
+    return self._typed_result(
+      "Delete portfolio block",
+      envelope,
+      DeletePortfolioBlockResponse,
+      sentinel_on_empty=True,
+    )
+
+  async def list_securities(
+    self,
+    graph_id: str,
+    entity_id: str | None = None,
+    security_type: str | None = None,
+    is_active: bool | None = None,
+    limit: int = 100,
+    offset: int = 0,
+  ) -> SecuritiesPage | None:
+    """List securities with pagination and filters."""
+    data = await self._query(
+      graph_id,
+      LIST_INVESTOR_SECURITIES_GQL,
+      {
+        "entityId": entity_id,
+        "securityType": security_type,
+        "isActive": is_active,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(
+      ListInvestorSecurities, data, trusted=self.trusted_server
+    ).securities
+
+  async def get_security(
+    self, graph_id: str, security_id: str
+  ) -> InvestorSecurity | None:
+    """Get a single security by id. Returns None if it doesn't exist."""
+    data = await self._query(
+      graph_id, GET_INVESTOR_SECURITY_GQL, {"securityId": security_id}
+    )
+    return parse_model(GetInvestorSecurity, data, trusted=self.trusted_server).security
+
+  async def create_security(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> SecurityResponse:
+    """Create a new security. Auto-links to an entity when `source_graph_id` is set."""
+    request = CreateSecurityRequest.from_dict(body)
+    response = await op_create_security(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Create security", response)
+    return self._typed_result("Create security", envelope, SecurityResponse)
+
+  async def update_security(
+    self, graph_id: str, security_id: str, updates: dict[str, Any]
+  ) -> SecurityResponse:
+    """Update a security's metadata. Only provided fields are applied."""
+    body_dict = {**updates, "security_id": security_id}
+    body = UpdateSecurityOperation.from_dict(body_dict)
+    response = await op_update_security(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Update security", response)
+    return self._typed_result("Update security", envelope, SecurityResponse)
+
+  async def delete_security(self, graph_id: str, security_id: str) -> DeleteResult:
+    """Soft-delete a security (sets is_active=False)."""
+    body = DeleteSecurityOperation(security_id=security_id)
+    response = await op_delete_security(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete security", response)
+    return self._typed_result(
+      "Delete security", envelope, DeleteResult, sentinel_on_empty=True
+    )
+
+  async def list_positions(
+    self,
+    graph_id: str,
+    portfolio_id: str | None = None,
+    security_id: str | None = None,
+    status: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+  ) -> PositionsPage | None:
+    """List positions with pagination and filters."""
+    data = await self._query(
+      graph_id,
+      LIST_INVESTOR_POSITIONS_GQL,
+      {
+        "portfolioId": portfolio_id,
+        "securityId": security_id,
+        "status": status,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(
+      ListInvestorPositions, data, trusted=self.trusted_server
+    ).positions
+
+  async def get_position(
+    self, graph_id: str, position_id: str
+  ) -> InvestorPosition | None:
+    """Get a single position by id. Returns None if it doesn't exist."""
+    data = await self._query(
+      graph_id, GET_INVESTOR_POSITION_GQL, {"positionId": position_id}
+    )
+    return parse_model(GetInvestorPosition, data, trusted=self.trusted_server).position
+
+  async def get_holdings(
+    self, graph_id: str, portfolio_id: str
+  ) -> InvestorHoldings | None:
+    """Get portfolio holdings grouped by entity."""
+    data = await self._query(
+      graph_id, GET_INVESTOR_HOLDINGS_GQL, {"portfolioId": portfolio_id}
+    )
+    return parse_model(GetInvestorHoldings, data, trusted=self.trusted_server).holdings
@@ -0,0 +1,2198 @@
+"""Asyncio variant of :class:`LedgerClient` (``ledger_client``).
+
+GENERATED by ``bin/generate-async-facades.py`` from ``ledger_client.py`` — do
+not edit by hand; change the sync facade and regenerate.
+"""
+
+from __future__ import annotations
+
+import datetime
+from http import HTTPStatus
+from typing import Any
+
+from ..api.extensions_robo_ledger.auto_map_elements import (
+  asyncio_detailed as op_auto_map_elements,
+)
+from ..api.extensions_robo_ledger.build_fact_grid import (
+  asyncio_detailed as op_build_fact_grid,
+)
+from ..api.extensions_robo_ledger.close_period import (
+  asyncio_detailed as op_close_period,
+)
+from ..api.extensions_robo_ledger.compute_metrics import (
+  asyncio_detailed as op_compute_metrics,
+)
+from ..api.extensions_robo_ledger.create_agent import (
+  asyncio_detailed as op_create_agent,
+)
+from ..api.extensions_robo_ledger.create_event_block import (
+  asyncio_detailed as op_create_event_block,
+)
+from ..api.extensions_robo_ledger.create_event_handler import (
+  asyncio_detailed as op_create_event_handler,
+)
+from ..api.extensions_robo_ledger.financial_statement_analysis import (
+  asyncio_detailed as op_financial_statement_analysis,
+)
+from ..api.extensions_robo_ledger.live_financial_statement import (
+  asyncio_detailed as op_live_financial_statement,
+)
+from ..api.extensions_robo_ledger.preview_event_block import (
+  asyncio_detailed as op_preview_event_block,
+)
+from ..api.extensions_robo_ledger.update_agent import (
+  asyncio_detailed as op_update_agent,
+)
+from ..api.extensions_robo_ledger.update_event_block import (
+  asyncio_detailed as op_update_event_block,
+)
+from ..api.extensions_robo_ledger.update_event_handler import (
+  asyncio_detailed as op_update_event_handler,
+)
+from ..api.extensions_robo_ledger.create_mapping_association import (
+  asyncio_detailed as op_create_mapping_association,
+)
+from ..api.extensions_robo_ledger.create_information_block import (
+  asyncio_detailed as op_create_information_block,
+)
+from ..api.extensions_robo_ledger.delete_mapping_association import (
+  asyncio_detailed as op_delete_mapping_association,
+)
+from ..api.extensions_robo_ledger.initialize_ledger import (
+  asyncio_detailed as op_initialize_ledger,
+)
+from ..api.extensions_robo_ledger.reopen_period import (
+  asyncio_detailed as op_reopen_period,
+)
+from ..api.extensions_robo_ledger.set_close_target import (
+  asyncio_detailed as op_set_close_target,
+)
+from ..api.extensions_robo_ledger.create_taxonomy_block import (
+  asyncio_detailed as op_create_taxonomy_block,
+)
+from ..api.extensions_robo_ledger.update_taxonomy_block import (
+  asyncio_detailed as op_update_taxonomy_block,
+)
+from ..api.extensions_robo_ledger.delete_taxonomy_block import (
+  asyncio_detailed as op_delete_taxonomy_block,
+)
+from ..api.extensions_robo_ledger.bind_text_block import (
+  asyncio_detailed as op_bind_text_block,
+)
+from ..api.extensions_robo_ledger.evaluate_rules import (
+  asyncio_detailed as op_evaluate_rules,
+)
+from ..api.extensions_robo_ledger.update_entity import (
+  asyncio_detailed as op_update_entity,
+)
+from ..api.extensions_robo_ledger.update_information_block import (
+  asyncio_detailed as op_update_information_block,
+)
+from ..api.extensions_robo_ledger.rebuild_schedule import (
+  asyncio_detailed as op_rebuild_schedule,
+)
+from ..api.extensions_robo_ledger.add_publish_list_members import (
+  asyncio_detailed as op_add_publish_list_members,
+)
+from ..api.extensions_robo_ledger.block_source_graph import (
+  asyncio_detailed as op_block_source_graph,
+)
+from ..api.extensions_robo_ledger.create_publish_list import (
+  asyncio_detailed as op_create_publish_list,
+)
+from ..api.extensions_robo_ledger.create_report import (
+  asyncio_detailed as op_create_report,
+)
+from ..api.extensions_robo_ledger.delete_publish_list import (
+  asyncio_detailed as op_delete_publish_list,
+)
+from ..api.extensions_robo_ledger.delete_report import (
+  asyncio_detailed as op_delete_report,
+)
+from ..api.extensions_robo_ledger.file_report import asyncio_detailed as op_file_report
+from ..api.extensions_robo_ledger.regenerate_report import (
+  asyncio_detailed as op_regenerate_report,
+)
+from ..api.extensions_robo_ledger.remove_publish_list_member import (
+  asyncio_detailed as op_remove_publish_list_member,
+)
+from ..api.extensions_robo_ledger.revoke_report_share import (
+  asyncio_detailed as op_revoke_report_share,
+)
+from ..api.extensions_robo_ledger.share_report import (
+  asyncio_detailed as op_share_report,
+)
+from ..api.extensions_robo_ledger.transition_filing_status import (
+  asyncio_detailed as op_transition_filing_status,
+)
+from ..api.extensions_robo_ledger.unblock_source_graph import (
+  asyncio_detailed as op_unblock_source_graph,
+)
+from ..api.extensions_robo_ledger.update_publish_list import (
+  asyncio_detailed as op_update_publish_list,
+)
+from ..api.extensions_robo_ledger.link_entity_taxonomy import (
+  asyncio_detailed as op_link_entity_taxonomy,
+)
+from ..api.extensions_robo_ledger.delete_journal_entry import (
+  asyncio_detailed as op_delete_journal_entry,
+)
+from ..api.extensions_robo_ledger.delete_information_block import (
+  asyncio_detailed as op_delete_information_block,
+)
+from ..api.extensions_robo_ledger.update_journal_entry import (
+  asyncio_detailed as op_update_journal_entry,
+)
+from ..graphql.views import parse_model
+from .account_index import AccountIndex
+from .fact_grid import FactGrid
+from .report_bundle_cache import ReportBundleCache
+from ..graphql.generated.get_information_block import GetInformationBlock
+from ..graphql.generated.get_information_block import (
+  GetInformationBlockInformationBlock as InformationBlock,
+)
+from ..graphql.generated.get_ledger_account_rollups import GetLedgerAccountRollups
+from ..graphql.generated.get_ledger_account_rollups import (
+  GetLedgerAccountRollupsAccountRollups as LedgerAccountRollups,
+)
+from ..graphql.generated.get_ledger_account_tree import GetLedgerAccountTree
+from ..graphql.generated.get_ledger_account_tree import (
+  GetLedgerAccountTreeAccountTree as LedgerAccountTree,
+)
+from ..graphql.generated.get_ledger_agent import GetLedgerAgent
+from ..graphql.generated.get_ledger_agent import GetLedgerAgentAgent as LedgerAgent
+from ..graphql.generated.get_ledger_closing_book_structures import (
+  GetLedgerClosingBookStructures,
+)
+from ..graphql.generated.get_ledger_closing_book_structures import (
+  GetLedgerClosingBookStructuresClosingBookStructures as ClosingBookStructures,
+)
+from ..graphql.generated.get_ledger_entity import GetLedgerEntity
+from ..graphql.generated.get_ledger_entity import GetLedgerEntityEntity as LedgerEntity
+from ..graphql.generated.get_ledger_event_block import GetLedgerEventBlock
+from ..graphql.generated.get_ledger_event_block import (
+  GetLedgerEventBlockEventBlock as LedgerEventBlock,
+)
+from ..graphql.generated.get_ledger_fiscal_calendar import GetLedgerFiscalCalendar
+from ..graphql.generated.get_ledger_fiscal_calendar import (
+  GetLedgerFiscalCalendarFiscalCalendar as FiscalCalendar,
+)
+from ..graphql.generated.get_ledger_mapped_trial_balance import (
+  GetLedgerMappedTrialBalance,
+)
+from ..graphql.generated.get_ledger_mapped_trial_balance import (
+  GetLedgerMappedTrialBalanceMappedTrialBalance as MappedTrialBalance,
+)
+from ..graphql.generated.get_ledger_mapping import GetLedgerMapping
+from ..graphql.generated.get_ledger_mapping import (
+  GetLedgerMappingMapping as LedgerMapping,
+)
+from ..graphql.generated.get_ledger_mapping_coverage import GetLedgerMappingCoverage
+from ..graphql.generated.get_ledger_mapping_coverage import (
+  GetLedgerMappingCoverageMappingCoverage as MappingCoverage,
+)
+from ..graphql.generated.get_ledger_period_close_status import (
+  GetLedgerPeriodCloseStatus,
+)
+from ..graphql.generated.get_ledger_period_close_status import (
+  GetLedgerPeriodCloseStatusPeriodCloseStatus as PeriodCloseStatus,
+)
+from ..graphql.generated.get_ledger_period_drafts import GetLedgerPeriodDrafts
+from ..graphql.generated.get_ledger_period_drafts import (
+  GetLedgerPeriodDraftsPeriodDrafts as PeriodDrafts,
+)
+from ..graphql.generated.get_ledger_publish_list import GetLedgerPublishList
+from ..graphql.generated.get_ledger_publish_list import (
+  GetLedgerPublishListPublishList as PublishList,
+)
+from ..graphql.generated.get_ledger_report import GetLedgerReport
+from ..graphql.generated.get_ledger_report import GetLedgerReportReport as LedgerReport
+from ..graphql.generated.get_ledger_report_package import GetLedgerReportPackage
+from ..graphql.generated.get_ledger_report_package import (
+  GetLedgerReportPackageReportPackage as ReportPackage,
+)
+from ..graphql.generated.get_ledger_reporting_taxonomy import GetLedgerReportingTaxonomy
+from ..graphql.generated.get_ledger_reporting_taxonomy import (
+  GetLedgerReportingTaxonomyReportingTaxonomy as ReportingTaxonomy,
+)
+from ..graphql.generated.get_ledger_statement import GetLedgerStatement
+from ..graphql.generated.get_ledger_statement import (
+  GetLedgerStatementStatement as LedgerStatement,
+)
+from ..graphql.generated.get_ledger_summary import GetLedgerSummary
+from ..graphql.generated.get_ledger_summary import (
+  GetLedgerSummarySummary as LedgerSummary,
+)
+from ..graphql.generated.get_ledger_transaction import GetLedgerTransaction
+from ..graphql.generated.get_ledger_transaction import (
+  GetLedgerTransactionTransaction as LedgerTransaction,
+)
+from ..graphql.generated.get_ledger_trial_balance import GetLedgerTrialBalance
+from ..graphql.generated.get_ledger_trial_balance import (
+  GetLedgerTrialBalanceTrialBalance as TrialBalance,
+)
+from ..graphql.generated.list_information_blocks import (
+  ListInformationBlocks,
+  ListInformationBlocksInformationBlocks,
+)
+from ..graphql.generated.list_ledger_accounts import ListLedgerAccounts
+from ..graphql.generated.list_ledger_accounts import (
+  ListLedgerAccountsAccounts as LedgerAccountsPage,
+)
+from ..graphql.generated.list_ledger_blocked_source_graphs import (
+  ListLedgerBlockedSourceGraphs,
+)
+from ..graphql.generated.list_ledger_blocked_source_graphs import (
+  ListLedgerBlockedSourceGraphsBlockedSourceGraphs as BlockedSourceGraphsPage,
+)
+from ..graphql.generated.list_ledger_agents import (
+  ListLedgerAgents,
+  ListLedgerAgentsAgents,
+)
+from ..graphql.generated.list_ledger_elements import ListLedgerElements
+from ..graphql.generated.list_ledger_elements import (
+  ListLedgerElementsElements as LedgerElementsPage,
+)
+from ..graphql.generated.list_ledger_entities import (
+  ListLedgerEntities,
+  ListLedgerEntitiesEntities,
+)
+from ..graphql.generated.list_ledger_event_blocks import (
+  ListLedgerEventBlocks,
+  ListLedgerEventBlocksEventBlocks,
+)
+from ..graphql.generated.list_ledger_mappings import (
+  ListLedgerMappings,
+  ListLedgerMappingsMappingsStructures,
+)
+from ..graphql.generated.list_ledger_publish_lists import ListLedgerPublishLists
+from ..graphql.generated.list_ledger_publish_lists import (
+  ListLedgerPublishListsPublishLists as PublishListsPage,
+)
+from ..graphql.generated.list_ledger_reports import (
+  ListLedgerReports,
+  ListLedgerReportsReportsReports,
+)
+from ..graphql.generated.list_ledger_structures import (
+  ListLedgerStructures,
+  ListLedgerStructuresStructuresStructures,
+)
+from ..graphql.generated.list_ledger_taxonomies import (
+  ListLedgerTaxonomies,
+  ListLedgerTaxonomiesTaxonomiesTaxonomies,
+)
+from ..graphql.generated.list_ledger_transactions import ListLedgerTransactions
+from ..graphql.generated.list_ledger_transactions import (
+  ListLedgerTransactionsTransactions as LedgerTransactionsPage,
+)
+from ..graphql.generated.list_ledger_unmapped_elements import (
+  ListLedgerUnmappedElements,
+  ListLedgerUnmappedElementsUnmappedElements,
+)
+from ..graphql.generated.mapping_candidates import (
+  MappingCandidates,
+  MappingCandidatesMappingCandidates,
+)
+from ..graphql.generated.operations import (
+  GET_INFORMATION_BLOCK_GQL,
+  GET_LEDGER_ACCOUNT_ROLLUPS_GQL,
+  GET_LEDGER_ACCOUNT_TREE_GQL,
+  GET_LEDGER_AGENT_GQL,
+  GET_LEDGER_CLOSING_BOOK_STRUCTURES_GQL,
+  GET_LEDGER_ENTITY_GQL,
+  GET_LEDGER_EVENT_BLOCK_GQL,
+  GET_LEDGER_FISCAL_CALENDAR_GQL,
+  GET_LEDGER_MAPPED_TRIAL_BALANCE_GQL,
+  GET_LEDGER_MAPPING_COVERAGE_GQL,
+  GET_LEDGER_MAPPING_GQL,
+  GET_LEDGER_PERIOD_CLOSE_STATUS_GQL,
+  GET_LEDGER_PERIOD_DRAFTS_GQL,
+  GET_LEDGER_PUBLISH_LIST_GQL,
+  GET_LEDGER_REPORT_GQL,
+  GET_LEDGER_REPORT_PACKAGE_GQL,
+  GET_LEDGER_REPORTING_TAXONOMY_GQL,
+  GET_LEDGER_STATEMENT_GQL,
+  GET_LEDGER_SUMMARY_GQL,
+  GET_LEDGER_TRANSACTION_GQL,
+  GET_LEDGER_TRIAL_BALANCE_GQL,
+  LIST_INFORMATION_BLOCKS_GQL,
+  LIST_LEDGER_ACCOUNTS_GQL,
+  LIST_LEDGER_BLOCKED_SOURCE_GRAPHS_GQL,
+  LIST_LEDGER_AGENTS_GQL,
+  LIST_LEDGER_ELEMENTS_GQL,
+  LIST_LEDGER_ENTITIES_GQL,
+  LIST_LEDGER_EVENT_BLOCKS_GQL,
+  LIST_LEDGER_MAPPINGS_GQL,
+  LIST_LEDGER_PUBLISH_LISTS_GQL,
+  LIST_LEDGER_REPORTS_GQL,
+  LIST_LEDGER_STRUCTURES_GQL,
+  LIST_LEDGER_TAXONOMIES_GQL,
+  LIST_LEDGER_TRANSACTIONS_GQL,
+  LIST_LEDGER_UNMAPPED_ELEMENTS_GQL,
+  MAPPING_CANDIDATES_GQL,
+)
+from ..models.add_publish_list_members_operation import AddPublishListMembersOperation
+from ..models.auto_map_elements_operation import AutoMapElementsOperation
+from ..models.create_agent_request import CreateAgentRequest
+from ..models.create_event_block_request import CreateEventBlockRequest
+from ..models.create_event_block_request_event_category import (
+  CreateEventBlockRequestEventCategory,
+)
+from ..models.create_event_block_request_event_class import (
+  CreateEventBlockRequestEventClass,
+)
+from ..models.create_event_block_request_metadata import CreateEventBlockRequestMetadata
+from ..models.create_event_handler_request import CreateEventHandlerRequest
+from ..models.financial_statement_analysis_request import (
+  FinancialStatementAnalysisRequest,
+)
+from ..models.live_financial_statement_request import LiveFinancialStatementRequest
+from ..models.financial_statement_analysis_response import (
+  FinancialStatementAnalysisResponse,
+)
+from ..models.live_financial_statement_response import LiveFinancialStatementResponse
+from ..models.view_response import ViewResponse
+from ..models.update_agent_request import UpdateAgentRequest
+from ..models.update_event_block_request import UpdateEventBlockRequest
+from ..models.update_event_handler_request import UpdateEventHandlerRequest
+from ..models.delete_journal_entry_request import DeleteJournalEntryRequest
+from ..models.create_legacy_arm import CreateLegacyArm
+from ..models.create_rollforward_arm import CreateRollforwardArm
+from ..models.delete_legacy_arm import DeleteLegacyArm
+from ..models.delete_rollforward_arm import DeleteRollforwardArm
+from ..models.delete_schedule_arm import DeleteScheduleArm
+from ..models.delete_schedule_request import DeleteScheduleRequest
+from ..models.rebuild_schedule_request import RebuildScheduleRequest
+from ..models.update_legacy_arm import UpdateLegacyArm
+from ..models.update_rollforward_arm import UpdateRollforwardArm
+from ..models.link_entity_taxonomy_request import LinkEntityTaxonomyRequest
+from ..models.update_journal_entry_request import UpdateJournalEntryRequest
+from ..models.update_schedule_arm import UpdateScheduleArm
+from ..models.update_schedule_request import UpdateScheduleRequest
+from ..models.close_period_operation import ClosePeriodOperation
+from ..models.compute_metrics_request import ComputeMetricsRequest
+from ..models.compute_metrics_response import ComputeMetricsResponse
+from ..models.create_view_request import CreateViewRequest
+from ..models.create_mapping_association_operation import (
+  CreateMappingAssociationOperation,
+)
+from ..models.create_schedule_arm import CreateScheduleArm
+from ..models.create_schedule_request import CreateScheduleRequest
+from ..models.delete_mapping_association_operation import (
+  DeleteMappingAssociationOperation,
+)
+from ..models.initialize_ledger_request import InitializeLedgerRequest
+from ..models.create_publish_list_request import CreatePublishListRequest
+from ..models.create_report_request import CreateReportRequest
+from ..models.delete_publish_list_operation import DeletePublishListOperation
+from ..models.delete_report_operation import DeleteReportOperation
+from ..models.file_report_request import FileReportRequest
+from ..models.regenerate_report_operation import RegenerateReportOperation
+from ..models.transition_filing_status_request import TransitionFilingStatusRequest
+from ..models.remove_publish_list_member_operation import (
+  RemovePublishListMemberOperation,
+)
+from ..models.share_report_operation import ShareReportOperation
+from ..models.block_source_graph_operation import BlockSourceGraphOperation
+from ..models.unblock_source_graph_operation import UnblockSourceGraphOperation
+from ..models.revoke_report_share_operation import RevokeReportShareOperation
+from ..models.update_publish_list_operation import UpdatePublishListOperation
+from ..models.reopen_period_operation import ReopenPeriodOperation
+from ..models.set_close_target_operation import SetCloseTargetOperation
+from ..models.bind_text_block_request import BindTextBlockRequest
+from ..models.bind_text_block_response import BindTextBlockResponse
+from ..models.create_taxonomy_block_request import CreateTaxonomyBlockRequest
+from ..models.update_taxonomy_block_request import UpdateTaxonomyBlockRequest
+from ..models.delete_taxonomy_block_request import DeleteTaxonomyBlockRequest
+from ..models.evaluate_rules_request import EvaluateRulesRequest
+from ..models.update_entity_request import UpdateEntityRequest
+from ..models.association_response import AssociationResponse
+from ..models.close_period_response import ClosePeriodResponse
+from ..models.delete_information_block_response import DeleteInformationBlockResponse
+from ..models.delete_result import DeleteResult
+from ..models.delete_taxonomy_block_response import DeleteTaxonomyBlockResponse
+from ..models.entity_taxonomy_response import EntityTaxonomyResponse
+from ..models.evaluate_rules_response import EvaluateRulesResponse
+from ..models.event_block_envelope import EventBlockEnvelope
+from ..models.event_handler_response import EventHandlerResponse
+from ..models.fiscal_calendar_response import FiscalCalendarResponse
+from ..models.information_block_envelope import InformationBlockEnvelope
+from ..models.initialize_ledger_response import InitializeLedgerResponse
+from ..models.journal_entry_response import JournalEntryResponse
+from ..models.ledger_agent_response import LedgerAgentResponse
+from ..models.ledger_entity_response import LedgerEntityResponse
+from ..models.preview_event_block_response import PreviewEventBlockResponse
+from ..models.publish_list_member_response import PublishListMemberResponse
+from ..models.publish_list_response import PublishListResponse
+from ..models.report_response import ReportResponse
+from ..models.schedule_created_response import ScheduleCreatedResponse
+from ..models.share_report_response import ShareReportResponse
+from ..models.block_source_graph_result import BlockSourceGraphResult
+from ..models.blocked_source_graph_response import BlockedSourceGraphResponse
+from ..models.revoke_report_share_response import RevokeReportShareResponse
+from ..models.taxonomy_block_envelope import TaxonomyBlockEnvelope
+from ..types import UNSET
+from .async_graphql_facade import AsyncGraphQLFacade
+
+
+class AsyncLedgerClient(AsyncGraphQLFacade):
+  """Asyncio variant of :class:`LedgerClient`.
+
+  Every method that performs a request is a coroutine; helpers stay
+  synchronous. See the sync class for per-method documentation.
+  """
+
+  def __init__(self, config: dict[str, Any]):
+    self.config = config
+    self.base_url = config["base_url"]
+    self.headers = config.get("headers", {})
+    self.token = config.get("token")
+    self.timeout = config.get("timeout", 60)
+    self.trusted_server = config.get("graphql_trusted_server", False)
+    self.bundle_cache: ReportBundleCache | None = config.get("report_bundle_cache")
+
+  def _invalidate_reads(self, graph_id: str, operation: str) -> None:
+    """Drop the cached reads a successful write ``operation`` changed."""
+    cache = self.config.get("read_cache")
+    if cache is not None:
+      cache.on_write(operation, graph_id)
+
+  _ENVELOPE_FIELDS = ("operation", "operation_id", "status", "result")
+
+  def _is_envelope(self, value: Any) -> bool:
+    return all((hasattr(value, f) for f in self._ENVELOPE_FIELDS))
+
+  def _unwrap(self, label: str, envelope: Any) -> Any:
+    """Unwrap an operation envelope and return `result` (None on failure)."""
+    if not self._is_envelope(envelope):
+      raise RuntimeError(f"{label} failed: {envelope!r}")
+    return envelope.result
+
+  def _typed_result(
+    self,
+    label: str,
+    envelope: Any,
+    expected: type[Any],
+    *,
+    sentinel_on_empty: bool = False,
+  ) -> Any:
+    """Return ``envelope.result`` for typed-envelope facade methods.
+
+    The calling facade method's return-type annotation advertises the
+    expected typed class (e.g. ``LedgerAgentResponse``); the runtime
+    return is whatever the SDK gave us:
+
+    - In production the SDK has parsed the typed envelope into the
+      generated attrs class — callers get autocomplete + ``.field``
+      access.
+    - In tests using dict mocks (or untyped envelopes), the result is
+      a plain ``dict`` — callers can use either ``result["field"]`` or
+      promote with ``ExpectedClass.from_dict(result)``.
+
+    A ``None`` result is normalized to ``{"deleted": True}`` for
+    delete-style returns to preserve the legacy sentinel behavior.
+
+    Raises :class:`RuntimeError` only when the envelope itself is
+    malformed (label included for debuggability).
+    """
+    result = envelope.result
+    if result is None or (
+      hasattr(result, "__class__") and "Unset" in result.__class__.__name__
+    ):
+      if sentinel_on_empty:
+        return {"deleted": True}
+      raise RuntimeError(f"{label}: operation envelope had no result")
+    return result
+
+  def _call_op(self, label: str, response: Any) -> Any:
+    """Common error handling for every generated op_* REST call.
+
+    Returns the parsed envelope unchanged. Typed-envelope ops surface
+    ``envelope.result`` as the SDK's typed attrs class (e.g.
+    ``ReportResponse``); untyped ops surface it as a plain dict via
+    ``OperationEnvelopeResultType0``. Facade methods are responsible
+    for asserting / casting the result to the type they advertise.
+    """
+    if response.status_code not in (HTTPStatus.OK, HTTPStatus.ACCEPTED):
+      raise RuntimeError(
+        f"{label} failed: {response.status_code}: {response.content!r}"
+      )
+    envelope = response.parsed
+    if not self._is_envelope(envelope):
+      raise RuntimeError(f"{label} failed: unexpected response shape: {envelope!r}")
+    return envelope
+
+  def _build_event_block_request(
+    self,
+    *,
+    event_type: str,
+    event_category: str,
+    occurred_at: str,
+    metadata: dict[str, Any],
+    source: str = "manual",
+    event_class: str = "economic",
+    obligated_by_event_id: str | None = None,
+    discharges_event_id: str | None = None,
+  ) -> CreateEventBlockRequest:
+    """Build a ``CreateEventBlockRequest`` for one of the registered handlers.
+
+    ``occurred_at`` accepts either a date string (``YYYY-MM-DD``) — which
+    is normalized to midnight UTC — or a full ISO-8601 timestamp.
+
+    ``source`` describes who fired the event — must match the server's
+    CHECK constraint set: ``manual`` (user-initiated, the default),
+    ``schedule`` (recurring schedule fired), ``system`` (internal
+    automation), or one of the adapter-driven values
+    (``quickbooks`` / ``xero`` / ``plaid``) for sync ingestion.
+    """
+    if "T" not in occurred_at:
+      occurred_dt = datetime.datetime.fromisoformat(f"{occurred_at}T00:00:00+00:00")
+    else:
+      occurred_dt = datetime.datetime.fromisoformat(occurred_at.replace("Z", "+00:00"))
+    return CreateEventBlockRequest(
+      event_type=event_type,
+      event_category=CreateEventBlockRequestEventCategory(event_category),
+      source=source,
+      occurred_at=occurred_dt,
+      apply_handlers=True,
+      metadata=CreateEventBlockRequestMetadata.from_dict(metadata),
+      event_class=CreateEventBlockRequestEventClass(event_class),
+      obligated_by_event_id=obligated_by_event_id
+      if obligated_by_event_id is not None
+      else UNSET,
+      discharges_event_id=discharges_event_id
+      if discharges_event_id is not None
+      else UNSET,
+    )
+
+  async def get_entity(self, graph_id: str) -> LedgerEntity | None:
+    """Get the entity (company/organization) for this graph.
+
+    Returns None when the ledger has no entity yet.
+    """
+    data = await self._query(graph_id, GET_LEDGER_ENTITY_GQL)
+    return parse_model(GetLedgerEntity, data, trusted=self.trusted_server).entity
+
+  async def list_entities(
+    self, graph_id: str, source: str | None = None
+  ) -> list[ListLedgerEntitiesEntities]:
+    """List all entities for this graph, optionally filtered by source system."""
+    data = await self._query(graph_id, LIST_LEDGER_ENTITIES_GQL, {"source": source})
+    return parse_model(ListLedgerEntities, data, trusted=self.trusted_server).entities
+
+  async def update_entity(
+    self, graph_id: str, updates: dict[str, Any]
+  ) -> LedgerEntityResponse:
+    """Update the entity for this graph. Only provided fields are applied."""
+    body = UpdateEntityRequest.from_dict(updates)
+    response = await op_update_entity(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Update entity", response)
+    return self._typed_result("Update entity", envelope, LedgerEntityResponse)
+
+  async def get_summary(self, graph_id: str) -> LedgerSummary | None:
+    """Ledger rollup counts + QB sync metadata.
+
+    Returns the codegen-typed ``LedgerSummary`` model (attribute access,
+    snake_case) rather than a dict.
+    """
+    data = await self._query(graph_id, GET_LEDGER_SUMMARY_GQL)
+    return parse_model(GetLedgerSummary, data, trusted=self.trusted_server).summary
+
+  async def list_accounts(
+    self,
+    graph_id: str,
+    classification: str | None = None,
+    is_active: bool | None = None,
+    limit: int = 100,
+    offset: int = 0,
+  ) -> LedgerAccountsPage | None:
+    """List CoA accounts with optional filters and pagination."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_ACCOUNTS_GQL,
+      {
+        "classification": classification,
+        "isActive": is_active,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(ListLedgerAccounts, data, trusted=self.trusted_server).accounts
+
+  async def get_account_tree(self, graph_id: str) -> LedgerAccountTree | None:
+    """Hierarchical Chart of Accounts (up to 4 levels deep)."""
+    data = await self._query(graph_id, GET_LEDGER_ACCOUNT_TREE_GQL)
+    return parse_model(
+      GetLedgerAccountTree, data, trusted=self.trusted_server
+    ).account_tree
+
+  async def get_account_index(self, graph_id: str) -> AccountIndex | None:
+    """Chart of Accounts as an :class:`AccountIndex` for local lookups and rollups."""
+    tree = await self.get_account_tree(graph_id)
+    return AccountIndex.from_tree(tree) if tree is not None else None
+
+  async def get_account_rollups(
+    self,
+    graph_id: str,
+    mapping_id: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+  ) -> LedgerAccountRollups | None:
+    """Accounts rolled up to reporting concepts via a mapping structure."""
+    data = await self._query(
+      graph_id,
+      GET_LEDGER_ACCOUNT_ROLLUPS_GQL,
+      {"mappingId": mapping_id, "startDate": start_date, "endDate": end_date},
+    )
+    return parse_model(
+      GetLedgerAccountRollups, data, trusted=self.trusted_server
+    ).account_rollups
+
+  async def list_transactions(
+    self,
+    graph_id: str,
+    type: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+  ) -> LedgerTransactionsPage | None:
+    """List transactions with optional type + date filters and pagination."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_TRANSACTIONS_GQL,
+      {
+        "type": type,
+        "startDate": start_date,
+        "endDate": end_date,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(
+      ListLedgerTransactions, data, trusted=self.trusted_server
+    ).transactions
+
+  async def get_transaction(
+    self, graph_id: str, transaction_id: str
+  ) -> LedgerTransaction | None:
+    """Get transaction detail with entries + line items."""
+    data = await self._query(
+      graph_id, GET_LEDGER_TRANSACTION_GQL, {"transactionId": transaction_id}
+    )
+    return parse_model(
+      GetLedgerTransaction, data, trusted=self.trusted_server
+    ).transaction
+
+  async def list_event_blocks(
+    self,
+    graph_id: str,
+    event_type: str | None = None,
+    event_category: str | None = None,
+    status: str | None = None,
+    agent_id: str | None = None,
+    source: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+  ) -> list[ListLedgerEventBlocksEventBlocks]:
+    """List captured event blocks (inbox surface)."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_EVENT_BLOCKS_GQL,
+      {
+        "eventType": event_type,
+        "eventCategory": event_category,
+        "status": status,
+        "agentId": agent_id,
+        "source": source,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(
+      ListLedgerEventBlocks, data, trusted=self.trusted_server
+    ).event_blocks
+
+  async def get_event_block(
+    self, graph_id: str, event_id: str
+  ) -> LedgerEventBlock | None:
+    """Get event block detail by id."""
+    data = await self._query(graph_id, GET_LEDGER_EVENT_BLOCK_GQL, {"id": event_id})
+    return parse_model(
+      GetLedgerEventBlock, data, trusted=self.trusted_server
+    ).event_block
+
+  async def list_agents(
+    self,
+    graph_id: str,
+    agent_type: str | None = None,
+    source: str | None = None,
+    is_active: bool | None = True,
+    limit: int = 50,
+    offset: int = 0,
+  ) -> list[ListLedgerAgentsAgents]:
+    """List agents (customers, vendors, employees)."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_AGENTS_GQL,
+      {
+        "agentType": agent_type,
+        "source": source,
+        "isActive": is_active,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(ListLedgerAgents, data, trusted=self.trusted_server).agents
+
+  async def get_agent(self, graph_id: str, agent_id: str) -> LedgerAgent | None:
+    """Get agent detail by id."""
+    data = await self._query(graph_id, GET_LEDGER_AGENT_GQL, {"id": agent_id})
+    return parse_model(GetLedgerAgent, data, trusted=self.trusted_server).agent
+
+  async def get_trial_balance(
+    self, graph_id: str, start_date: str | None = None, end_date: str | None = None
+  ) -> TrialBalance | None:
+    """Trial balance by raw CoA account."""
+    data = await self._query(
+      graph_id,
+      GET_LEDGER_TRIAL_BALANCE_GQL,
+      {"startDate": start_date, "endDate": end_date},
+    )
+    return parse_model(
+      GetLedgerTrialBalance, data, trusted=self.trusted_server
+    ).trial_balance
+
+  async def get_mapped_trial_balance(
+    self,
+    graph_id: str,
+    mapping_id: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+  ) -> MappedTrialBalance | None:
+    """Trial balance rolled up to GAAP reporting concepts via a mapping."""
+    data = await self._query(
+      graph_id,
+      GET_LEDGER_MAPPED_TRIAL_BALANCE_GQL,
+      {"mappingId": mapping_id, "startDate": start_date, "endDate": end_date},
+    )
+    return parse_model(
+      GetLedgerMappedTrialBalance, data, trusted=self.trusted_server
+    ).mapped_trial_balance
+
+  async def get_reporting_taxonomy(self, graph_id: str) -> ReportingTaxonomy | None:
+    """The locked US GAAP reporting taxonomy for this graph."""
+    data = await self._query(graph_id, GET_LEDGER_REPORTING_TAXONOMY_GQL)
+    return parse_model(
+      GetLedgerReportingTaxonomy, data, trusted=self.trusted_server
+    ).reporting_taxonomy
+
+  async def list_taxonomies(
+    self, graph_id: str, taxonomy_type: str | None = None
+  ) -> list[ListLedgerTaxonomiesTaxonomiesTaxonomies]:
+    """List active taxonomies with optional type filter."""
+    data = await self._query(
+      graph_id, LIST_LEDGER_TAXONOMIES_GQL, {"taxonomyType": taxonomy_type}
+    )
+    page = parse_model(
+      ListLedgerTaxonomies, data, trusted=self.trusted_server
+    ).taxonomies
+    return page.taxonomies if page else []
+
+  async def create_taxonomy_block(
+    self, graph_id: str, body: dict[str, Any], idempotency_key: str | None = None
+  ) -> TaxonomyBlockEnvelope:
+    """Create a taxonomy block atomically (taxonomy + structures +
+    elements + associations + rules in one envelope).
+    """
+    request = CreateTaxonomyBlockRequest.from_dict(body)
+    response = await op_create_taxonomy_block(
+      graph_id=graph_id,
+      body=request,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Create taxonomy block", response)
+    self._invalidate_reads(graph_id, "create-taxonomy-block")
+    return self._typed_result("Create taxonomy block", envelope, TaxonomyBlockEnvelope)
+
+  async def update_taxonomy_block(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> TaxonomyBlockEnvelope:
+    """Update a taxonomy block — add/update/remove elements, structures, associations, or rules."""
+    request = UpdateTaxonomyBlockRequest.from_dict(body)
+    response = await op_update_taxonomy_block(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Update taxonomy block", response)
+    self._invalidate_reads(graph_id, "update-taxonomy-block")
+    return self._typed_result("Update taxonomy block", envelope, TaxonomyBlockEnvelope)
+
+  async def delete_taxonomy_block(
+    self, graph_id: str, taxonomy_id: str, reason: str, cascade_facts: bool = False
+  ) -> DeleteTaxonomyBlockResponse:
+    """Delete a taxonomy block. Cascades through elements, structures, and associations."""
+    request = DeleteTaxonomyBlockRequest.from_dict(
+      {"taxonomy_id": taxonomy_id, "reason": reason, "cascade_facts": cascade_facts}
+    )
+    response = await op_delete_taxonomy_block(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Delete taxonomy block", response)
+    self._invalidate_reads(graph_id, "delete-taxonomy-block")
+    return self._typed_result(
+      "Delete taxonomy block",
+      envelope,
+      DeleteTaxonomyBlockResponse,
+      sentinel_on_empty=True,
+    )
+
+  async def bind_text_block(
+    self, graph_id: str, body: dict[str, Any], idempotency_key: str | None = None
+  ) -> BindTextBlockResponse:
+    """Bind a platform Document (or one section) to a disclosure element
+    as a Nonnumeric text-block fact in a standing 'disclosure' FactSet.
+
+    ``body`` mirrors BindTextBlockRequest: document_id, structure_id,
+    exactly one of element_id / element_qname, period_start, period_end,
+    plus optional section_id / entity_id. Re-binding the same element
+    and period replaces the fact (``replaced=True`` in the response).
+    """
+    request = BindTextBlockRequest.from_dict(body)
+    response = await op_bind_text_block(
+      graph_id=graph_id,
+      body=request,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Bind text block", response)
+    return self._typed_result("Bind text block", envelope, BindTextBlockResponse)
+
+  async def link_entity_taxonomy(
+    self,
+    graph_id: str,
+    taxonomy_id: str,
+    basis: str = "chart_of_accounts",
+    is_primary: bool = True,
+    adoption_context: str | None = "voluntary",
+  ) -> EntityTaxonomyResponse:
+    """Link the graph's entity to a taxonomy (ENTITY_HAS_TAXONOMY edge).
+
+    Idempotent — returns existing linkage if already present.
+    """
+    body = LinkEntityTaxonomyRequest.from_dict(
+      {
+        "taxonomy_id": taxonomy_id,
+        "basis": basis,
+        "is_primary": is_primary,
+        "adoption_context": adoption_context,
+      }
+    )
+    response = await op_link_entity_taxonomy(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Link entity taxonomy", response)
+    self._invalidate_reads(graph_id, "link-entity-taxonomy")
+    return self._typed_result("Link entity taxonomy", envelope, EntityTaxonomyResponse)
+
+  async def list_elements(
+    self,
+    graph_id: str,
+    taxonomy_id: str | None = None,
+    source: str | None = None,
+    classification: str | None = None,
+    is_abstract: bool | None = None,
+    limit: int = 100,
+    offset: int = 0,
+  ) -> LedgerElementsPage | None:
+    """List elements (CoA accounts, GAAP concepts, etc.) with filters."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_ELEMENTS_GQL,
+      {
+        "taxonomyId": taxonomy_id,
+        "source": source,
+        "classification": classification,
+        "isAbstract": is_abstract,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(ListLedgerElements, data, trusted=self.trusted_server).elements
+
+  async def list_unmapped_elements(
+    self, graph_id: str, mapping_id: str | None = None
+  ) -> list[ListLedgerUnmappedElementsUnmappedElements]:
+    """CoA elements not yet mapped to a reporting concept."""
+    data = await self._query(
+      graph_id, LIST_LEDGER_UNMAPPED_ELEMENTS_GQL, {"mappingId": mapping_id}
+    )
+    return parse_model(
+      ListLedgerUnmappedElements, data, trusted=self.trusted_server
+    ).unmapped_elements
+
+  async def list_structures(
+    self, graph_id: str, taxonomy_id: str | None = None, block_type: str | None = None
+  ) -> list[ListLedgerStructuresStructuresStructures]:
+    """List reporting structures (IS, BS, CF, schedules) with optional filters."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_STRUCTURES_GQL,
+      {"taxonomyId": taxonomy_id, "blockType": block_type},
+    )
+    page = parse_model(
+      ListLedgerStructures, data, trusted=self.trusted_server
+    ).structures
+    return page.structures if page else []
+
+  async def list_mappings(
+    self, graph_id: str
+  ) -> list[ListLedgerMappingsMappingsStructures]:
+    """List active CoA→reporting mapping structures."""
+    data = await self._query(graph_id, LIST_LEDGER_MAPPINGS_GQL)
+    page = parse_model(ListLedgerMappings, data, trusted=self.trusted_server).mappings
+    return page.structures if page else []
+
+  async def get_mapping(self, graph_id: str, mapping_id: str) -> LedgerMapping | None:
+    """Get a mapping structure with all its associations."""
+    data = await self._query(
+      graph_id, GET_LEDGER_MAPPING_GQL, {"mappingId": mapping_id}
+    )
+    return parse_model(GetLedgerMapping, data, trusted=self.trusted_server).mapping
+
+  async def get_mapping_coverage(
+    self, graph_id: str, mapping_id: str
+  ) -> MappingCoverage | None:
+    """Mapping coverage stats — how many CoA elements are mapped."""
+    data = await self._query(
+      graph_id, GET_LEDGER_MAPPING_COVERAGE_GQL, {"mappingId": mapping_id}
+    )
+    return parse_model(
+      GetLedgerMappingCoverage, data, trusted=self.trusted_server
+    ).mapping_coverage
+
+  async def get_mapping_candidates(
+    self, graph_id: str, classification: str
+  ) -> list[MappingCandidatesMappingCandidates]:
+    """rs-gaap concepts a CoA element of the given EFS ``classification``
+    (asset / liability / equity / revenue / expense) may map to — limited
+    to concepts that render under the graph's active Reporting Style,
+    with statement-level subtotals excluded. Use this to populate the
+    mapping picker so it never offers an unreachable target.
+    """
+    data = await self._query(
+      graph_id, MAPPING_CANDIDATES_GQL, {"classification": classification}
+    )
+    return parse_model(
+      MappingCandidates, data, trusted=self.trusted_server
+    ).mapping_candidates
+
+  async def create_mapping_association(
+    self,
+    graph_id: str,
+    mapping_id: str,
+    from_element_id: str,
+    to_element_id: str,
+    confidence: float = 1.0,
+  ) -> AssociationResponse:
+    """Create a manual mapping association between two elements."""
+    body = CreateMappingAssociationOperation(
+      mapping_id=mapping_id,
+      from_element_id=from_element_id,
+      to_element_id=to_element_id,
+      confidence=confidence,
+    )
+    response = await op_create_mapping_association(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Create mapping association", response)
+    return self._typed_result(
+      "Create mapping association", envelope, AssociationResponse
+    )
+
+  async def delete_mapping_association(
+    self, graph_id: str, mapping_id: str, association_id: str
+  ) -> DeleteResult:
+    """Delete a mapping association."""
+    body = DeleteMappingAssociationOperation(
+      mapping_id=mapping_id, association_id=association_id
+    )
+    response = await op_delete_mapping_association(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete mapping association", response)
+    return self._typed_result(
+      "Delete mapping association", envelope, DeleteResult, sentinel_on_empty=True
+    )
+
+  async def auto_map_elements(self, graph_id: str, mapping_id: str) -> dict[str, Any]:
+    """Trigger the AI MappingAgent (async). Returns an operation ack."""
+    body = AutoMapElementsOperation(mapping_id=mapping_id)
+    response = await op_auto_map_elements(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Auto-map elements", response)
+    return {"operation_id": envelope.operation_id, "status": envelope.status}
+
+  async def get_information_block(
+    self,
+    graph_id: str,
+    block_id: str,
+    *,
+    scenario_id: str | None = None,
+    series: bool | None = None,
+    series_history: int | None = None,
+    series_forecast: int | None = None,
+  ) -> InformationBlock | None:
+    """Fetch an Information Block envelope by id — the cross-block-type read.
+
+    Returns ``None`` when the block doesn't exist or its type isn't
+    registered. See ``information-block.md`` for the envelope contract.
+
+    ``scenario_id`` selects the FactSet slice: ``None`` = actuals; a
+    forecast block's structure id = that scenario's parallel universe
+    (statement envelopes bind its latest computed month, metric
+    envelopes extend the series with "(forecast)"-labeled columns).
+
+    ``series`` renders a statement block as its whole report-set time
+    series — one column per period; combined with ``scenario_id`` the
+    columns cross the actuals/forecast seam and forecast columns carry
+    ``periods[].forecast == True``. Non-statement block types ignore it
+    (metric envelopes are always the full series).
+
+    ``series_history`` / ``series_forecast`` window the series to its
+    seam-adjacent columns — the last N actual columns and the first N
+    forecast columns; ``None`` = unbounded.
+    """
+    data = await self._query(
+      graph_id,
+      GET_INFORMATION_BLOCK_GQL,
+      {
+        "id": block_id,
+        "scenarioId": scenario_id,
+        "series": series,
+        "seriesHistory": series_history,
+        "seriesForecast": series_forecast,
+      },
+    )
+    return parse_model(
+      GetInformationBlock, data, trusted=self.trusted_server
+    ).information_block
+
+  async def list_information_blocks(
+    self,
+    graph_id: str,
+    *,
+    block_type: str | None = None,
+    category: str | None = None,
+    limit: int | None = None,
+    offset: int | None = None,
+  ) -> list[ListInformationBlocksInformationBlocks]:
+    """List Information Block envelopes, optionally filtered.
+
+    Replaces the old ``list_schedules`` method — use
+    ``block_type='schedule'`` for the same set of blocks.
+    """
+    data = await self._query(
+      graph_id,
+      LIST_INFORMATION_BLOCKS_GQL,
+      {"blockType": block_type, "category": category, "limit": limit, "offset": offset},
+    )
+    return parse_model(
+      ListInformationBlocks, data, trusted=self.trusted_server
+    ).information_blocks
+
+  async def create_information_block(
+    self,
+    graph_id: str,
+    body: CreateLegacyArm | CreateRollforwardArm | CreateScheduleArm,
+    *,
+    idempotency_key: str | None = None,
+  ) -> InformationBlockEnvelope:
+    """Create an Information Block of any registered block_type.
+
+    Generic wrapper over ``create-information-block``. Pass a typed
+    arm body (``CreateScheduleArm``, ``CreateRollforwardArm``, or
+    ``CreateLegacyArm``) — the discriminator routes server-side to
+    the correct dispatch handler.
+
+    Convenience methods exist for specific block types — e.g.
+    ``create_schedule()`` builds + posts a ``CreateScheduleArm``.
+    For block types without a convenience method (currently
+    ``rollforward``), use this generic entry.
+    """
+    response = await op_create_information_block(
+      graph_id=graph_id,
+      body=body,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Create information block", response)
+    return self._typed_result(
+      "Create information block", envelope, InformationBlockEnvelope
+    )
+
+  async def update_information_block(
+    self,
+    graph_id: str,
+    body: UpdateLegacyArm | UpdateRollforwardArm | UpdateScheduleArm,
+  ) -> InformationBlockEnvelope:
+    """Update an Information Block. Generic wrapper over
+    ``update-information-block``."""
+    response = await op_update_information_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Update information block", response)
+    return self._typed_result(
+      "Update information block", envelope, InformationBlockEnvelope
+    )
+
+  async def delete_information_block(
+    self,
+    graph_id: str,
+    body: DeleteLegacyArm | DeleteRollforwardArm | DeleteScheduleArm,
+  ) -> DeleteInformationBlockResponse:
+    """Delete an Information Block. Generic wrapper over
+    ``delete-information-block``."""
+    response = await op_delete_information_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete information block", response)
+    return self._typed_result(
+      "Delete information block",
+      envelope,
+      DeleteInformationBlockResponse,
+      sentinel_on_empty=True,
+    )
+
+  async def create_schedule(
+    self,
+    graph_id: str,
+    *,
+    name: str,
+    element_ids: list[str],
+    period_start: str,
+    period_end: str,
+    monthly_amount: int,
+    debit_element_id: str,
+    credit_element_id: str,
+    entry_type: str = "closing",
+    memo_template: str = "",
+    taxonomy_id: str | None = None,
+    method: str | None = None,
+    original_amount: int | None = None,
+    residual_value: int | None = None,
+    useful_life_months: int | None = None,
+    asset_element_id: str | None = None,
+    auto_reverse: bool = False,
+  ) -> InformationBlockEnvelope:
+    """Create a new schedule with pre-generated monthly facts."""
+    payload_dict: dict[str, Any] = {
+      "name": name,
+      "element_ids": element_ids,
+      "period_start": period_start,
+      "period_end": period_end,
+      "monthly_amount": monthly_amount,
+      "entry_template": {
+        "debit_element_id": debit_element_id,
+        "credit_element_id": credit_element_id,
+        "entry_type": entry_type,
+        "memo_template": memo_template,
+        "auto_reverse": auto_reverse,
+      },
+    }
+    if taxonomy_id:
+      payload_dict["taxonomy_id"] = taxonomy_id
+    schedule_metadata: dict[str, Any] = {}
+    if method:
+      schedule_metadata["method"] = method
+    if original_amount is not None:
+      schedule_metadata["original_amount"] = original_amount
+    if residual_value is not None:
+      schedule_metadata["residual_value"] = residual_value
+    if useful_life_months is not None:
+      schedule_metadata["useful_life_months"] = useful_life_months
+    if asset_element_id:
+      schedule_metadata["asset_element_id"] = asset_element_id
+    if schedule_metadata:
+      payload_dict["schedule_metadata"] = schedule_metadata
+    payload = CreateScheduleRequest.from_dict(payload_dict)
+    body = CreateScheduleArm(block_type="schedule", payload=payload)
+    response = await op_create_information_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Create schedule", response)
+    return self._typed_result("Create schedule", envelope, InformationBlockEnvelope)
+
+  async def dispose_schedule(
+    self,
+    graph_id: str,
+    structure_id: str,
+    disposal_date: str,
+    memo: str,
+    reason: str,
+    sale_proceeds: int | None = None,
+    proceeds_element_id: str | None = None,
+    gain_loss_element_id: str | None = None,
+    source: str = "manual",
+  ) -> EventBlockEnvelope:
+    """Dispose of a schedule asset — atomically truncates forward facts,
+    drops the SumEquals rule, and posts a balanced disposal entry.
+
+    Routes through ``create-event-block`` with
+    ``event_type='asset_disposed'``. ``source`` defaults to ``"manual"``
+    (user-initiated disposal); sync adapters override.
+    """
+    metadata: dict[str, Any] = {
+      "schedule_id": structure_id,
+      "memo": memo,
+      "reason": reason,
+    }
+    if sale_proceeds is not None:
+      metadata["proceeds"] = sale_proceeds
+    if proceeds_element_id is not None:
+      metadata["proceeds_element_id"] = proceeds_element_id
+    if gain_loss_element_id is not None:
+      metadata["gain_loss_element_id"] = gain_loss_element_id
+    body = self._build_event_block_request(
+      event_type="asset_disposed",
+      event_category="adjustment",
+      occurred_at=disposal_date,
+      metadata=metadata,
+      source=source,
+    )
+    response = await op_create_event_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Dispose schedule", response)
+    return self._typed_result("Dispose schedule", envelope, EventBlockEnvelope)
+
+  async def evaluate_rules(
+    self,
+    graph_id: str,
+    structure_id: str,
+    fact_set_id: str | None = None,
+    period_start: str | None = None,
+    period_end: str | None = None,
+  ) -> EvaluateRulesResponse:
+    """Evaluate taxonomy rules against facts in a structure."""
+    body_dict: dict[str, Any] = {"structure_id": structure_id}
+    if fact_set_id is not None:
+      body_dict["fact_set_id"] = fact_set_id
+    if period_start is not None:
+      body_dict["period_start"] = period_start
+    if period_end is not None:
+      body_dict["period_end"] = period_end
+    request = EvaluateRulesRequest.from_dict(body_dict)
+    response = await op_evaluate_rules(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Evaluate rules", response)
+    return self._typed_result("Evaluate rules", envelope, EvaluateRulesResponse)
+
+  async def compute_metrics(
+    self, graph_id: str, body: dict[str, Any], *, idempotency_key: str | None = None
+  ) -> ComputeMetricsResponse:
+    """Compute a metric block's ``Derive`` rules for a period, upserting
+    the standing ``factset_type='metric'`` FactSet (one per structure +
+    entity + period_end; re-running a period replaces its facts).
+
+    Operands bind to the entity's most recent persisted report facts at
+    ``period_end``. Unresolvable metrics come back in ``skipped`` with a
+    reason rather than failing the run.
+
+    ``body`` accepts the fields of
+    :class:`robosystems_client.models.compute_metrics_request.ComputeMetricsRequest`:
+    ``structure_id``, ``period_end``, plus optional ``period_start``,
+    ``entity_id``, and ``scenario_id`` (pass a forecast block's structure
+    id after compute-forecast to extend the metric series into its
+    forward months).
+
+    Supply ``idempotency_key`` to make the call safe to retry — replays
+    within 24 hours return the same envelope.
+    """
+    request = ComputeMetricsRequest.from_dict(body)
+    response = await op_compute_metrics(
+      graph_id=graph_id,
+      body=request,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Compute metrics", response)
+    return self._typed_result("Compute metrics", envelope, ComputeMetricsResponse)
+
+  async def update_schedule(
+    self, graph_id: str, structure_id: str, body: dict[str, Any]
+  ) -> InformationBlockEnvelope:
+    """Update mutable fields on a schedule (name, entry_template, metadata)."""
+    payload = UpdateScheduleRequest.from_dict({"structure_id": structure_id, **body})
+    request = UpdateScheduleArm(block_type="schedule", payload=payload)
+    response = await op_update_information_block(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Update schedule", response)
+    return self._typed_result("Update schedule", envelope, InformationBlockEnvelope)
+
+  async def delete_schedule(
+    self, graph_id: str, structure_id: str
+  ) -> DeleteInformationBlockResponse:
+    """Permanently delete a schedule (cascades through facts + associations)."""
+    payload = DeleteScheduleRequest.from_dict({"structure_id": structure_id})
+    body = DeleteScheduleArm(block_type="schedule", payload=payload)
+    response = await op_delete_information_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete schedule", response)
+    return self._typed_result(
+      "Delete schedule",
+      envelope,
+      DeleteInformationBlockResponse,
+      sentinel_on_empty=True,
+    )
+
+  async def rebuild_schedule(
+    self, graph_id: str, structure_id: str, *, idempotency_key: str | None = None
+  ) -> ScheduleCreatedResponse:
+    """Rebuild a schedule in place — re-run the generator on an existing schedule.
+
+    Atomic alternative to delete-then-recreate (which orphans pending
+    obligations): preserves the structure id, element associations, and
+    taxonomy; voids the old pending obligation chain; deletes the old
+    facts + SumEquals rules; and regenerates fresh forward facts + a
+    fresh obligation chain from the schedule's stored definition
+    (``entry_template`` / ``schedule_metadata`` / ``monthly_amount`` /
+    period bounds). The historical-vs-in-scope split is re-derived from
+    the current fiscal calendar ``closed_through``, so a rebuild re-scopes
+    the schedule to today's close state. Use this to pick up a fixed
+    generator without orphaning obligations.
+
+    Supply ``idempotency_key`` to make the call safe to retry — replays
+    within 24 hours return the same envelope. Reusing the key with a
+    different body returns HTTP 409.
+    """
+    body = RebuildScheduleRequest(structure_id=structure_id)
+    response = await op_rebuild_schedule(
+      graph_id=graph_id,
+      body=body,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Rebuild schedule", response)
+    return self._typed_result("Rebuild schedule", envelope, ScheduleCreatedResponse)
+
+  async def get_period_close_status(
+    self, graph_id: str, period_start: str, period_end: str
+  ) -> PeriodCloseStatus | None:
+    """Close status for all schedules in a fiscal period."""
+    data = await self._query(
+      graph_id,
+      GET_LEDGER_PERIOD_CLOSE_STATUS_GQL,
+      {"periodStart": period_start, "periodEnd": period_end},
+    )
+    return parse_model(
+      GetLedgerPeriodCloseStatus, data, trusted=self.trusted_server
+    ).period_close_status
+
+  async def list_period_drafts(self, graph_id: str, period: str) -> PeriodDrafts | None:
+    """All draft entries in a period, fully expanded for review pre-close."""
+    data = await self._query(graph_id, GET_LEDGER_PERIOD_DRAFTS_GQL, {"period": period})
+    return parse_model(
+      GetLedgerPeriodDrafts, data, trusted=self.trusted_server
+    ).period_drafts
+
+  async def create_closing_entry(
+    self,
+    graph_id: str,
+    structure_id: str,
+    posting_date: str,
+    period_start: str,
+    period_end: str,
+    memo: str | None = None,
+  ) -> EventBlockEnvelope:
+    """Idempotently create (or refresh) a draft closing entry from a schedule.
+
+    Routes through ``create-event-block`` with
+    ``event_type='schedule_entry_due'`` — the underlying handler dispatches
+    one of created / unchanged / regenerated / removed / skipped internally.
+    Always emits ``source='schedule'`` since the event is schedule-driven
+    by definition. Returns the EventBlockEnvelope.
+    """
+    metadata: dict[str, Any] = {
+      "schedule_id": structure_id,
+      "posting_date": posting_date,
+      "period_start": period_start,
+      "period_end": period_end,
+    }
+    if memo is not None:
+      metadata["memo"] = memo
+    body = self._build_event_block_request(
+      event_type="schedule_entry_due",
+      event_category="recognition",
+      occurred_at=posting_date,
+      source="schedule",
+      metadata=metadata,
+    )
+    response = await op_create_event_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Create closing entry", response)
+    return self._typed_result("Create closing entry", envelope, EventBlockEnvelope)
+
+  async def create_journal_entry(
+    self,
+    graph_id: str,
+    *,
+    posting_date: str,
+    memo: str,
+    line_items: list[dict[str, Any]],
+    type: str = "standard",
+    status: str = "draft",
+    transaction_id: str | None = None,
+    source: str = "manual",
+    idempotency_key: str | None = None,
+  ) -> EventBlockEnvelope:
+    """Create a journal entry with balanced line items (DR=CR enforced).
+
+    Routes through ``create-event-block`` with
+    ``event_type='journal_entry_recorded'`` — the Python handler forwards
+    to the internal journal-entry command.
+
+    Defaults to ``status='draft'`` for ongoing writes. Pass
+    ``status='posted'`` for historical data import where entries
+    represent already-happened business events.
+
+    ``source`` defaults to ``"manual"`` (user-initiated). Sync adapters
+    (QuickBooks, Plaid, etc.) pass their adapter name so the underlying
+    Event row records the correct origin.
+
+    Supply ``idempotency_key`` to make the call safe to retry — replays
+    within 24 hours return the same envelope. Reusing the key with a
+    different body returns HTTP 409.
+
+    Returns the EventBlockEnvelope (event row fields).
+    """
+    body = self._journal_entry_request(
+      posting_date=posting_date,
+      memo=memo,
+      line_items=line_items,
+      type=type,
+      status=status,
+      transaction_id=transaction_id,
+      source=source,
+    )
+    response = await op_create_event_block(
+      graph_id=graph_id,
+      body=body,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Create journal entry", response)
+    return self._typed_result("Create journal entry", envelope, EventBlockEnvelope)
+
+  def _journal_entry_request(
+    self,
+    *,
+    posting_date: str,
+    memo: str,
+    line_items: list[dict[str, Any]],
+    type: str = "standard",
+    status: str = "draft",
+    transaction_id: str | None = None,
+    source: str = "manual",
+  ) -> CreateEventBlockRequest:
+    metadata: dict[str, Any] = {
+      "posting_date": posting_date,
+      "memo": memo,
+      "line_items": line_items,
+      "type": type,
+      "status": status,
+    }
+    if transaction_id is not None:
+      metadata["transaction_id"] = transaction_id
+    return self._build_event_block_request(
+      event_type="journal_entry_recorded",
+      event_category="adjustment",
+      occurred_at=posting_date,
+      metadata=metadata,
+      source=source,
+    )
+
+  async def update_journal_entry(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> JournalEntryResponse:
+    """Update a draft journal entry. Posted entries are immutable."""
+    request = UpdateJournalEntryRequest.from_dict(body)
+    response = await op_update_journal_entry(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Update journal entry", response)
+    return self._typed_result("Update journal entry", envelope, JournalEntryResponse)
+
+  async def delete_journal_entry(self, graph_id: str, entry_id: str) -> DeleteResult:
+    """Hard-delete a draft journal entry. Posted entries must be reversed."""
+    body = DeleteJournalEntryRequest(entry_id=entry_id)
+    response = await op_delete_journal_entry(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete journal entry", response)
+    return self._typed_result(
+      "Delete journal entry", envelope, DeleteResult, sentinel_on_empty=True
+    )
+
+  async def reverse_journal_entry(
+    self,
+    graph_id: str,
+    entry_id: str,
+    posting_date: str | None = None,
+    memo: str | None = None,
+    reason: str | None = None,
+    source: str = "manual",
+  ) -> EventBlockEnvelope:
+    """Reverse a posted journal entry (creates offsetting entry, marks original as reversed).
+
+    Routes through ``create-event-block`` with
+    ``event_type='journal_entry_reversed'``. Returns the EventBlockEnvelope.
+    ``source`` defaults to ``"manual"`` — sync adapters override.
+    """
+    metadata: dict[str, Any] = {"entry_id": entry_id}
+    if posting_date is not None:
+      metadata["posting_date"] = posting_date
+    if memo is not None:
+      metadata["memo"] = memo
+    if reason is not None:
+      metadata["reason"] = reason
+    occurred_at = posting_date or datetime.date.today().isoformat()
+    body = self._build_event_block_request(
+      event_type="journal_entry_reversed",
+      event_category="adjustment",
+      occurred_at=occurred_at,
+      metadata=metadata,
+      source=source,
+    )
+    response = await op_create_event_block(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Reverse journal entry", response)
+    return self._typed_result("Reverse journal entry", envelope, EventBlockEnvelope)
+
+  async def create_event_block(
+    self, graph_id: str, body: dict[str, Any], idempotency_key: str | None = None
+  ) -> EventBlockEnvelope:
+    """Create an event block directly from a dict.
+
+    Use for support-class events (``event_class='support'``) with categories
+    ``approval``, ``control``, ``reconciliation``, or ``inquiry``, which
+    are not covered by the specialized helpers. Economic events should
+    generally go through ``create_journal_entry``, ``create_closing_entry``,
+    etc., but this method works for those too.
+    """
+    request = CreateEventBlockRequest.from_dict(body)
+    response = await op_create_event_block(
+      graph_id=graph_id,
+      body=request,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Create event block", response)
+    return self._typed_result("Create event block", envelope, EventBlockEnvelope)
+
+  async def preview_event_block(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> PreviewEventBlockResponse:
+    """Dry-run an event block — resolve handler, evaluate metadata, return
+    the planned GL rows without writing anything.
+
+    Companion to ``create_journal_entry`` / ``reverse_journal_entry`` /
+    ``create_closing_entry`` / ``dispose_schedule``: pass the same body
+    those methods would build (a ``CreateEventBlockRequest`` shape) and
+    inspect what the handler would do.
+    """
+    request = CreateEventBlockRequest.from_dict(body)
+    response = await op_preview_event_block(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Preview event block", response)
+    return self._typed_result(
+      "Preview event block", envelope, PreviewEventBlockResponse
+    )
+
+  async def update_event_block(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> EventBlockEnvelope:
+    """Apply a status transition and/or field corrections to an event block.
+
+    Use for posting drafts (``classified`` → ``committed`` → ``fulfilled``),
+    voiding, superseding (correction chains), or patching ``description``,
+    ``effective_at``, ``metadata``, ``obligated_by_event_id``, or
+    ``discharges_event_id``.
+    """
+    request = UpdateEventBlockRequest.from_dict(body)
+    response = await op_update_event_block(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Update event block", response)
+    return self._typed_result("Update event block", envelope, EventBlockEnvelope)
+
+  async def create_agent(
+    self, graph_id: str, body: dict[str, Any], idempotency_key: str | None = None
+  ) -> LedgerAgentResponse:
+    """Create an agent — REA counterparty (customer, vendor, employee, etc.)
+    referenced by event blocks via ``agent_id``.
+
+    ``(source, external_id)`` is unique when ``external_id`` is provided,
+    so external-source ingestion is idempotent at the DB level.
+    """
+    request = CreateAgentRequest.from_dict(body)
+    response = await op_create_agent(
+      graph_id=graph_id,
+      body=request,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Create agent", response)
+    return self._typed_result("Create agent", envelope, LedgerAgentResponse)
+
+  async def update_agent(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> LedgerAgentResponse:
+    """Update an agent. ``metadata_patch`` is a partial merge into existing
+    metadata; all other fields replace.
+    """
+    request = UpdateAgentRequest.from_dict(body)
+    response = await op_update_agent(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Update agent", response)
+    return self._typed_result("Update agent", envelope, LedgerAgentResponse)
+
+  async def create_event_handler(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> EventHandlerResponse:
+    """Register a tenant-configurable event handler — DSL row in the
+    ``event_handlers`` table that drives ``create-event-block`` for event
+    types not covered by a Python handler.
+    """
+    request = CreateEventHandlerRequest.from_dict(body)
+    response = await op_create_event_handler(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Create event handler", response)
+    return self._typed_result("Create event handler", envelope, EventHandlerResponse)
+
+  async def update_event_handler(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> EventHandlerResponse:
+    """Update a registered event handler. Pass ``approve=True`` in the body
+    to flip an AI-suggested handler from unapproved to active.
+    """
+    request = UpdateEventHandlerRequest.from_dict(body)
+    response = await op_update_event_handler(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Update event handler", response)
+    return self._typed_result("Update event handler", envelope, EventHandlerResponse)
+
+  async def live_financial_statement(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> LiveFinancialStatementResponse:
+    """Live financial statement — pulls facts directly from the graph for
+    an explicit period window (or fiscal year) and returns the statement
+    shape without a persisted Report row. Useful for ad-hoc previews and
+    dashboards.
+    """
+    request = LiveFinancialStatementRequest.from_dict(body)
+    response = await op_live_financial_statement(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Live financial statement", response)
+    return self._typed_result(
+      "Live financial statement", envelope, LiveFinancialStatementResponse
+    )
+
+  async def financial_statement_analysis(
+    self, graph_id: str, body: dict[str, Any]
+  ) -> FinancialStatementAnalysisResponse:
+    """Run a financial statement analysis against an existing report.
+
+    On shared-repo graphs (e.g. SEC), ``ticker`` is required; on tenant
+    graphs it's ignored. Either pass an explicit ``report_id`` or let the
+    server auto-resolve via ``fiscal_year`` + ``period_type``.
+    """
+    request = FinancialStatementAnalysisRequest.from_dict(body)
+    response = await op_financial_statement_analysis(
+      graph_id=graph_id, body=request, client=self._get_client()
+    )
+    envelope = self._call_op("Financial statement analysis", response)
+    return self._typed_result(
+      "Financial statement analysis", envelope, FinancialStatementAnalysisResponse
+    )
+
+  async def build_fact_grid(
+    self, graph_id: str, request: dict[str, Any]
+  ) -> ViewResponse:
+    """Build a multi-dimensional fact grid against the graph schema.
+
+    This is a graph-database *read* dispatched through the operation
+    surface — it runs against LadybugDB (not the extensions OLTP
+    database) and returns a deduplicated pivot table of XBRL facts.
+    The same operation works for roboledger tenant graphs (after
+    materialization) and for the SEC shared repository, which uses the
+    same hypercube schema.
+
+    ``request`` accepts any fields of
+    ``robosystems_client.models.create_view_request.CreateViewRequest``:
+    ``elements`` (qnames), ``canonical_concepts``, ``periods``,
+    ``entities``, ``form``, ``fiscal_year``, ``fiscal_period``,
+    ``period_type``, ``include_summary``, ``view_config``. The legacy
+    model name ``CreateViewRequest`` is a holdover from when fact grids
+    were exposed under a ``/views`` route; the shape is unchanged.
+    """
+    body = CreateViewRequest.from_dict(request)
+    response = await op_build_fact_grid(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Build fact grid", response)
+    return self._typed_result("Build fact grid", envelope, ViewResponse)
+
+  async def get_fact_grid(self, graph_id: str, request: dict[str, Any]) -> FactGrid:
+    """:meth:`build_fact_grid`, wrapped for columnar access.
+
+    The returned :class:`FactGrid` converts the facts with
+    ``to_dataframe()`` (long, or ``pivot=True`` for element × period)
+    or ``to_arrow()``, without going through per-record ``to_dict()``.
+    """
+    return FactGrid(await self.build_fact_grid(graph_id, request))
+
+  async def get_closing_book_structures(
+    self, graph_id: str
+  ) -> ClosingBookStructures | None:
+    """Grouped closing book structures for the close-screen sidebar."""
+    data = await self._query(graph_id, GET_LEDGER_CLOSING_BOOK_STRUCTURES_GQL)
+    return parse_model(
+      GetLedgerClosingBookStructures, data, trusted=self.trusted_server
+    ).closing_book_structures
+
+  async def get_fiscal_calendar(self, graph_id: str) -> FiscalCalendar | None:
+    """Current fiscal calendar state — pointers, gap, closeable status."""
+    data = await self._query(graph_id, GET_LEDGER_FISCAL_CALENDAR_GQL)
+    return parse_model(
+      GetLedgerFiscalCalendar, data, trusted=self.trusted_server
+    ).fiscal_calendar
+
+  async def initialize_ledger(
+    self,
+    graph_id: str,
+    *,
+    closed_through: str | None = None,
+    fiscal_year_start_month: int | None = None,
+    earliest_data_period: str | None = None,
+    auto_seed_schedules: bool | None = None,
+    note: str | None = None,
+  ) -> InitializeLedgerResponse:
+    """One-time ledger initialization — seed fiscal calendar + periods."""
+    body = InitializeLedgerRequest(
+      closed_through=closed_through if closed_through is not None else UNSET,
+      fiscal_year_start_month=fiscal_year_start_month
+      if fiscal_year_start_month is not None
+      else UNSET,
+      earliest_data_period=earliest_data_period
+      if earliest_data_period is not None
+      else UNSET,
+      auto_seed_schedules=auto_seed_schedules
+      if auto_seed_schedules is not None
+      else UNSET,
+      note=note if note is not None else UNSET,
+    )
+    response = await op_initialize_ledger(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Initialize ledger", response)
+    self._invalidate_reads(graph_id, "initialize-ledger")
+    return self._typed_result("Initialize ledger", envelope, InitializeLedgerResponse)
+
+  async def set_close_target(
+    self, graph_id: str, period: str, note: str | None = None
+  ) -> FiscalCalendarResponse:
+    """Set the user-controlled close target (YYYY-MM)."""
+    body = SetCloseTargetOperation(
+      period=period, note=note if note is not None else UNSET
+    )
+    response = await op_set_close_target(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Set close target", response)
+    self._invalidate_reads(graph_id, "set-close-target")
+    return self._typed_result("Set close target", envelope, FiscalCalendarResponse)
+
+  async def close_period(
+    self,
+    graph_id: str,
+    period: str,
+    note: str | None = None,
+    allow_stale_sync: bool | None = None,
+  ) -> ClosePeriodResponse:
+    """Close a fiscal period — the final commit action."""
+    body = ClosePeriodOperation(
+      period=period,
+      note=note if note is not None else UNSET,
+      allow_stale_sync=allow_stale_sync if allow_stale_sync is not None else UNSET,
+    )
+    response = await op_close_period(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Close period", response)
+    self._invalidate_reads(graph_id, "close-period")
+    return self._typed_result("Close period", envelope, ClosePeriodResponse)
+
+  async def reopen_period(
+    self, graph_id: str, period: str, reason: str, note: str | None = None
+  ) -> FiscalCalendarResponse:
+    """Reopen a closed fiscal period. Requires a reason for the audit log."""
+    body = ReopenPeriodOperation(
+      period=period, reason=reason, note=note if note is not None else UNSET
+    )
+    response = await op_reopen_period(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Reopen period", response)
+    self._invalidate_reads(graph_id, "reopen-period")
+    return self._typed_result("Reopen period", envelope, FiscalCalendarResponse)
+
+  async def create_report(
+    self,
+    graph_id: str,
+    name: str,
+    mapping_id: str,
+    period_start: str,
+    period_end: str,
+    taxonomy_id: str = "rs-gaap",
+    period_type: str = "quarterly",
+    comparative: bool = True,
+  ) -> ReportResponse:
+    """Generate report facts from the ledger and publish a Report
+    definition. Synchronous — returns the published report header.
+
+    ``taxonomy_id`` defaults to ``"rs-gaap"``, the canonical reporting
+    vocabulary (matches the backend's ``CreateReportRequest`` default).
+    """
+    body = CreateReportRequest(
+      name=name,
+      mapping_id=mapping_id,
+      period_start=period_start,
+      period_end=period_end,
+      taxonomy_id=taxonomy_id,
+      period_type=period_type,
+      comparative=comparative,
+    )
+    response = await op_create_report(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Create report", response)
+    return self._typed_result("Create report", envelope, ReportResponse)
+
+  async def list_reports(self, graph_id: str) -> list[ListLedgerReportsReportsReports]:
+    """List all reports for a graph (includes received shared reports)."""
+    data = await self._query(graph_id, LIST_LEDGER_REPORTS_GQL)
+    page = parse_model(ListLedgerReports, data, trusted=self.trusted_server).reports
+    return page.reports if page else []
+
+  async def get_report(self, graph_id: str, report_id: str) -> LedgerReport | None:
+    """Get a single report with its period list + available structures."""
+    data = await self._query(graph_id, GET_LEDGER_REPORT_GQL, {"reportId": report_id})
+    return parse_model(GetLedgerReport, data, trusted=self.trusted_server).report
+
+  async def get_report_package(
+    self, graph_id: str, report_id: str
+  ) -> ReportPackage | None:
+    """Rehydrate a Report as a package — Report metadata + N rendered
+    `InformationBlock` envelopes (one per attached FactSet).
+
+    Single round trip: returns everything needed to render BS + IS (and any
+    other statements the Report generated) without per-section fetches.
+    Each item's ``block`` is a fully-rehydrated ``InformationBlock`` envelope
+    pinned to its specific FactSet snapshot.
+    """
+    data = await self._query(
+      graph_id, GET_LEDGER_REPORT_PACKAGE_GQL, {"reportId": report_id}
+    )
+    return parse_model(
+      GetLedgerReportPackage, data, trusted=self.trusted_server
+    ).report_package
+
+  async def get_statement(
+    self, graph_id: str, report_id: str, block_type: str
+  ) -> LedgerStatement | None:
+    """Render a financial statement — facts viewed through a structure.
+
+    `block_type`: income_statement, balance_sheet, cash_flow_statement, ...
+    """
+    data = await self._query(
+      graph_id,
+      GET_LEDGER_STATEMENT_GQL,
+      {"reportId": report_id, "blockType": block_type},
+    )
+    return parse_model(GetLedgerStatement, data, trusted=self.trusted_server).statement
+
+  async def regenerate_report(
+    self,
+    graph_id: str,
+    report_id: str,
+    period_start: str | None = None,
+    period_end: str | None = None,
+  ) -> ReportResponse:
+    """Re-run fact generation for an existing Report against the latest
+    ledger state. Synchronous — returns the regenerated report header.
+    """
+    body = RegenerateReportOperation(
+      report_id=report_id,
+      period_start=period_start if period_start is not None else UNSET,
+      period_end=period_end if period_end is not None else UNSET,
+    )
+    response = await op_regenerate_report(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Regenerate report", response)
+    return self._typed_result("Regenerate report", envelope, ReportResponse)
+
+  async def delete_report(self, graph_id: str, report_id: str) -> DeleteResult:
+    """Delete a report and its generated facts."""
+    body = DeleteReportOperation(report_id=report_id)
+    response = await op_delete_report(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete report", response)
+    return self._typed_result(
+      "Delete report", envelope, DeleteResult, sentinel_on_empty=True
+    )
+
+  async def share_report(
+    self, graph_id: str, report_id: str, publish_list_id: str
+  ) -> ShareReportResponse:
+    """Share a published report to every member of a publish list. Each
+    target receives an independent copy; per-recipient outcomes appear
+    in the response's ``results`` list.
+    """
+    body = ShareReportOperation(report_id=report_id, publish_list_id=publish_list_id)
+    response = await op_share_report(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Share report", response)
+    return self._typed_result("Share report", envelope, ShareReportResponse)
+
+  async def file_report(self, graph_id: str, report_id: str) -> ReportResponse:
+    """Transition a Report's filing_status to 'filed' — locks the package.
+
+    Allowed from 'draft' or 'under_review'. Stamps filed_at + filed_by from
+    the auth context + server clock.
+    """
+    body = FileReportRequest(report_id=report_id)
+    response = await op_file_report(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("File report", response)
+    return self._typed_result("File report", envelope, ReportResponse)
+
+  async def transition_filing_status(
+    self, graph_id: str, report_id: str, target_status: str
+  ) -> ReportResponse:
+    """Move a Report along the non-file legs of the filing lifecycle.
+
+    Use ``file_report()`` to reach 'filed' so audit fields land cleanly.
+    Other transitions (draft ↔ under_review, filed → archived) go through
+    here so the legal-transition graph stays in one place.
+    """
+    body = TransitionFilingStatusRequest(
+      report_id=report_id, target_status=target_status
+    )
+    response = await op_transition_filing_status(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Transition filing status", response)
+    return self._typed_result("Transition filing status", envelope, ReportResponse)
+
+  def is_shared_report(self, report: dict[str, Any] | Any) -> bool:
+    """Check if a report was received via sharing (vs locally created)."""
+    if isinstance(report, dict):
+      return report.get("source_graph_id") is not None
+    return getattr(report, "source_graph_id", None) is not None
+
+  async def revoke_report_share(
+    self, graph_id: str, report_id: str, target_graph_id: str
+  ) -> RevokeReportShareResponse:
+    """Withdraw a report previously shared to one recipient graph.
+
+    The sender's half of the share controls: deletes the copy from that
+    recipient's schema and marks the share revoked. Scoped to a single
+    recipient, so withdrawing a distribution to a whole publish list is
+    one call per member.
+
+    A recipient who already deleted the copy themselves is not an error —
+    the share is still marked revoked and ``copy_deleted`` comes back
+    False. The linked entity in the recipient's graph is left in place, so
+    an investor's declared holding survives the withdrawal.
+    """
+    body = RevokeReportShareOperation(
+      report_id=report_id, target_graph_id=target_graph_id
+    )
+    response = await op_revoke_report_share(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Revoke report share", response)
+    return self._typed_result(
+      "Revoke report share", envelope, RevokeReportShareResponse
+    )
+
+  async def list_blocked_source_graphs(
+    self, graph_id: str, limit: int = 100, offset: int = 0
+  ) -> BlockedSourceGraphsPage | None:
+    """List source graphs barred from sharing reports into this graph."""
+    data = await self._query(
+      graph_id,
+      LIST_LEDGER_BLOCKED_SOURCE_GRAPHS_GQL,
+      {"limit": limit, "offset": offset},
+    )
+    return parse_model(
+      ListLedgerBlockedSourceGraphs, data, trusted=self.trusted_server
+    ).blocked_source_graphs
+
+  async def block_source_graph(
+    self,
+    graph_id: str,
+    source_graph_id: str,
+    reason: str | None = None,
+    purge: bool = False,
+  ) -> BlockSourceGraphResult:
+    """Bar ``source_graph_id`` from sharing reports into ``graph_id``.
+
+    Read the sender's id off the ``source_graph_id`` provenance field of a
+    report that was shared to you. Blocking is idempotent: re-blocking
+    returns ``already_blocked=True`` and preserves the original
+    ``blocked_at``.
+
+    With ``purge``, every report already shared in from that source is
+    deleted along with its fact sets and facts; reports this graph
+    authored are never touched. ``reason`` is a note for your own records
+    and is never disclosed to the sender.
+    """
+    body = BlockSourceGraphOperation(
+      source_graph_id=source_graph_id,
+      reason=reason if reason is not None else UNSET,
+      purge=purge,
+    )
+    response = await op_block_source_graph(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Block source graph", response)
+    return self._typed_result("Block source graph", envelope, BlockSourceGraphResult)
+
+  async def unblock_source_graph(
+    self, graph_id: str, source_graph_id: str
+  ) -> BlockedSourceGraphResponse:
+    """Lift a block, allowing that source to share in again.
+
+    Reports removed by an earlier purge are not restored — unblocking
+    reopens the channel, it does not undo.
+    """
+    body = UnblockSourceGraphOperation(source_graph_id=source_graph_id)
+    response = await op_unblock_source_graph(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Unblock source graph", response)
+    return self._typed_result(
+      "Unblock source graph", envelope, BlockedSourceGraphResponse
+    )
+
+  async def list_publish_lists(
+    self, graph_id: str, limit: int = 100, offset: int = 0
+  ) -> PublishListsPage | None:
+    """List publish lists with pagination."""
+    data = await self._query(
+      graph_id, LIST_LEDGER_PUBLISH_LISTS_GQL, {"limit": limit, "offset": offset}
+    )
+    return parse_model(
+      ListLedgerPublishLists, data, trusted=self.trusted_server
+    ).publish_lists
+
+  async def get_publish_list(self, graph_id: str, list_id: str) -> PublishList | None:
+    """Get a single publish list with its full member list."""
+    data = await self._query(graph_id, GET_LEDGER_PUBLISH_LIST_GQL, {"listId": list_id})
+    return parse_model(
+      GetLedgerPublishList, data, trusted=self.trusted_server
+    ).publish_list
+
+  async def create_publish_list(
+    self, graph_id: str, name: str, description: str | None = None
+  ) -> PublishListResponse:
+    """Create a new publish list."""
+    body = CreatePublishListRequest(
+      name=name, description=description if description is not None else UNSET
+    )
+    response = await op_create_publish_list(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Create publish list", response)
+    return self._typed_result("Create publish list", envelope, PublishListResponse)
+
+  async def update_publish_list(
+    self,
+    graph_id: str,
+    list_id: str,
+    name: str | None = None,
+    description: str | None = None,
+  ) -> PublishListResponse:
+    """Update a publish list's name or description."""
+    body = UpdatePublishListOperation(
+      list_id=list_id,
+      name=name if name is not None else UNSET,
+      description=description if description is not None else UNSET,
+    )
+    response = await op_update_publish_list(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Update publish list", response)
+    return self._typed_result("Update publish list", envelope, PublishListResponse)
+
+  async def delete_publish_list(self, graph_id: str, list_id: str) -> DeleteResult:
+    """Delete a publish list."""
+    body = DeletePublishListOperation(list_id=list_id)
+    response = await op_delete_publish_list(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Delete publish list", response)
+    return self._typed_result(
+      "Delete publish list", envelope, DeleteResult, sentinel_on_empty=True
+    )
+
+  async def add_publish_list_members(
+    self, graph_id: str, list_id: str, target_graph_ids: list[str]
+  ) -> list[PublishListMemberResponse]:
+    """Add target graphs as members of a publish list. Returns the
+    membership rows that were just created."""
+    body = AddPublishListMembersOperation(
+      list_id=list_id, target_graph_ids=target_graph_ids
+    )
+    response = await op_add_publish_list_members(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Add publish list members", response)
+    result = envelope.result
+    if not isinstance(result, list):
+      raise RuntimeError(
+        f"Add publish list members: expected list result, got {type(result).__name__}: {envelope!r}"
+      )
+    return result
+
+  async def remove_publish_list_member(
+    self, graph_id: str, list_id: str, member_id: str
+  ) -> DeleteResult:
+    """Remove a single member from a publish list."""
+    body = RemovePublishListMemberOperation(list_id=list_id, member_id=member_id)
+    response = await op_remove_publish_list_member(
+      graph_id=graph_id, body=body, client=self._get_client()
+    )
+    envelope = self._call_op("Remove publish list member", response)
+    return self._typed_result(
+      "Remove publish list member", envelope, DeleteResult, sentinel_on_empty=True
+    )
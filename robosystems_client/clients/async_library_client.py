@@ -0,0 +1,393 @@
+"""Asyncio variant of :class:`LibraryClient` (``library_client``).
+
+GENERATED by ``bin/generate-async-facades.py`` from ``library_client.py`` — do
+not edit by hand; change the sync facade and regenerate.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from ..graphql.views import parse_model
+from .library_index import DEFAULT_INDEX_DIR, LibraryIndex
+from .taxonomy_graph import TaxonomyGraph
+from ..graphql.generated.get_library_element import GetLibraryElement
+from ..graphql.generated.get_library_element import (
+  GetLibraryElementLibraryElement as LibraryElement,
+)
+from ..graphql.generated.get_library_element_arcs import (
+  GetLibraryElementArcs,
+  GetLibraryElementArcsLibraryElementArcs,
+)
+from ..graphql.generated.get_library_element_classifications import (
+  GetLibraryElementClassifications,
+  GetLibraryElementClassificationsLibraryElementClassifications,
+)
+from ..graphql.generated.get_library_element_equivalents import (
+  GetLibraryElementEquivalents,
+)
+from ..graphql.generated.get_library_element_equivalents import (
+  GetLibraryElementEquivalentsLibraryElementEquivalents as LibraryElementEquivalents,
+)
+from ..graphql.generated.get_library_taxonomy import GetLibraryTaxonomy
+from ..graphql.generated.get_library_taxonomy import (
+  GetLibraryTaxonomyLibraryTaxonomy as LibraryTaxonomy,
+)
+from ..graphql.generated.list_library_elements import (
+  ListLibraryElements,
+  ListLibraryElementsLibraryElements,
+)
+from ..graphql.generated.list_library_structures import (
+  ListLibraryStructures,
+  ListLibraryStructuresLibraryStructures,
+)
+from ..graphql.generated.list_library_taxonomies import (
+  ListLibraryTaxonomies,
+  ListLibraryTaxonomiesLibraryTaxonomies,
+)
+from ..graphql.generated.list_library_taxonomy_arcs import ListLibraryTaxonomyArcs
+from ..graphql.generated.operations import (
+  GET_LIBRARY_ELEMENT_ARCS_GQL,
+  GET_LIBRARY_ELEMENT_CLASSIFICATIONS_GQL,
+  GET_LIBRARY_ELEMENT_EQUIVALENTS_GQL,
+  GET_LIBRARY_ELEMENT_GQL,
+  GET_LIBRARY_TAXONOMY_GQL,
+  LIST_LIBRARY_ELEMENTS_GQL,
+  LIST_LIBRARY_STRUCTURES_GQL,
+  LIST_LIBRARY_TAXONOMIES_GQL,
+  LIST_LIBRARY_TAXONOMY_ARCS_GQL,
+  SEARCH_LIBRARY_ELEMENTS_GQL,
+)
+from ..graphql.generated.search_library_elements import (
+  SearchLibraryElements,
+  SearchLibraryElementsSearchLibraryElements,
+)
+from .async_graphql_facade import AsyncGraphQLFacade
+from .library_client import LIBRARY_GRAPH_ID
+
+
+class AsyncLibraryClient(AsyncGraphQLFacade):
+  """Asyncio variant of :class:`LibraryClient`.
+
+  Every method that performs a request is a coroutine; helpers stay
+  synchronous. See the sync class for per-method documentation.
+  """
+
+  def __init__(self, config: dict[str, Any]):
+    self.config = config
+    self.base_url = config["base_url"]
+    self.headers = config.get("headers", {})
+    self.token = config.get("token")
+    self.timeout = config.get("timeout", 60)
+    self.trusted_server = config.get("graphql_trusted_server", False)
+    self.index_dir = Path(config.get("library_index_dir") or DEFAULT_INDEX_DIR)
+
+  async def list_library_taxonomies(
+    self,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    standard: str | None = None,
+    include_element_count: bool = False,
+  ) -> list[ListLibraryTaxonomiesLibraryTaxonomies]:
+    """List every taxonomy visible at this graph_id."""
+    data = await self._query(
+      graph_id,
+      LIST_LIBRARY_TAXONOMIES_GQL,
+      {"standard": standard, "includeElementCount": include_element_count},
+    )
+    return parse_model(
+      ListLibraryTaxonomies, data, trusted=self.trusted_server
+    ).library_taxonomies
+
+  async def get_library_taxonomy(
+    self,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    id: str | None = None,
+    standard: str | None = None,
+    version: str | None = None,
+    include_element_count: bool = False,
+  ) -> LibraryTaxonomy | None:
+    """Fetch one taxonomy by id or by (standard, version). Returns None if not found."""
+    data = await self._query(
+      graph_id,
+      GET_LIBRARY_TAXONOMY_GQL,
+      {
+        "id": id,
+        "standard": standard,
+        "version": version,
+        "includeElementCount": include_element_count,
+      },
+    )
+    return parse_model(
+      GetLibraryTaxonomy, data, trusted=self.trusted_server
+    ).library_taxonomy
+
+  async def list_library_elements(
+    self,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    taxonomy_id: str | None = None,
+    source: str | None = None,
+    classification: str | None = None,
+    activity_type: str | None = None,
+    element_type: str | None = None,
+    is_abstract: bool | None = None,
+    limit: int = 50,
+    offset: int = 0,
+    include_labels: bool = False,
+    include_references: bool = False,
+  ) -> list[ListLibraryElementsLibraryElements]:
+    """List library elements with filters and pagination."""
+    data = await self._query(
+      graph_id,
+      LIST_LIBRARY_ELEMENTS_GQL,
+      {
+        "taxonomyId": taxonomy_id,
+        "source": source,
+        "classification": classification,
+        "activityType": activity_type,
+        "elementType": element_type,
+        "isAbstract": is_abstract,
+        "limit": limit,
+        "offset": offset,
+        "includeLabels": include_labels,
+        "includeReferences": include_references,
+      },
+    )
+    return parse_model(
+      ListLibraryElements, data, trusted=self.trusted_server
+    ).library_elements
+
+  async def search_library_elements(
+    self,
+    query: str,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    source: str | None = None,
+    limit: int = 50,
+  ) -> list[SearchLibraryElementsSearchLibraryElements]:
+    """Substring search across qname, name, and standard label text."""
+    data = await self._query(
+      graph_id,
+      SEARCH_LIBRARY_ELEMENTS_GQL,
+      {"query": query, "source": source, "limit": limit},
+    )
+    return parse_model(
+      SearchLibraryElements, data, trusted=self.trusted_server
+    ).search_library_elements
+
+  async def get_library_element(
+    self,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    id: str | None = None,
+    qname: str | None = None,
+  ) -> LibraryElement | None:
+    """Get a single element by id or qname. Returns None if not found."""
+    data = await self._query(
+      graph_id, GET_LIBRARY_ELEMENT_GQL, {"id": id, "qname": qname}
+    )
+    return parse_model(
+      GetLibraryElement, data, trusted=self.trusted_server
+    ).library_element
+
+  async def list_library_taxonomy_arcs(
+    self,
+    taxonomy_id: str,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    association_type: str | None = None,
+    structure_id: str | None = None,
+    limit: int = 200,
+    offset: int = 0,
+  ) -> ListLibraryTaxonomyArcs:
+    """All arcs contributed by a taxonomy plus their total count.
+
+    Pass ``structure_id`` to scope both the page and the count to one
+    structure's arcs — pair with :meth:`list_library_structures` to
+    load a single hierarchy at a time.
+
+    Returns the typed response carrying both root fields:
+    ``library_taxonomy_arcs`` (the page of arcs) and
+    ``library_taxonomy_arc_count`` (total before pagination).
+    """
+    data = await self._query(
+      graph_id,
+      LIST_LIBRARY_TAXONOMY_ARCS_GQL,
+      {
+        "taxonomyId": taxonomy_id,
+        "associationType": association_type,
+        "structureId": structure_id,
+        "limit": limit,
+        "offset": offset,
+      },
+    )
+    return parse_model(ListLibraryTaxonomyArcs, data, trusted=self.trusted_server)
+
+  async def list_library_structures(
+    self,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    taxonomy_id: str | None = None,
+    block_type: str | None = None,
+  ) -> list[ListLibraryStructuresLibraryStructures]:
+    """List the structures (extended link roles) a taxonomy contributes —
+    the named presentation/calculation hierarchies (BS-classified,
+    IS-multistep, the calc DAG roots, …). Pair a structure's ``id`` with
+    :meth:`list_library_taxonomy_arcs` and its ``structure_id`` filter
+    to load just that hierarchy's arcs — the hierarchy view uses this to
+    scope a tree to one role at a time.
+
+    Pass ``taxonomy_id`` to scope to a single taxonomy; ``block_type``
+    to filter to one statement kind (balance_sheet, income_statement,
+    cash_flow_statement, …).
+    """
+    data = await self._query(
+      graph_id,
+      LIST_LIBRARY_STRUCTURES_GQL,
+      {"taxonomyId": taxonomy_id, "blockType": block_type},
+    )
+    return parse_model(
+      ListLibraryStructures, data, trusted=self.trusted_server
+    ).library_structures
+
+  async def get_library_element_arcs(
+    self, id: str, graph_id: str = LIBRARY_GRAPH_ID
+  ) -> list[GetLibraryElementArcsLibraryElementArcs]:
+    """All mapping arcs where this element is source or target."""
+    data = await self._query(graph_id, GET_LIBRARY_ELEMENT_ARCS_GQL, {"id": id})
+    return parse_model(
+      GetLibraryElementArcs, data, trusted=self.trusted_server
+    ).library_element_arcs
+
+  async def get_library_element_classifications(
+    self, id: str, graph_id: str = LIBRARY_GRAPH_ID
+  ) -> list[GetLibraryElementClassificationsLibraryElementClassifications]:
+    """All classification traits assigned to an element — every
+    category/identifier pair from element_classifications, sorted by
+    category then identifier.
+    """
+    data = await self._query(
+      graph_id, GET_LIBRARY_ELEMENT_CLASSIFICATIONS_GQL, {"id": id}
+    )
+    return parse_model(
+      GetLibraryElementClassifications, data, trusted=self.trusted_server
+    ).library_element_classifications
+
+  async def get_library_element_equivalents(
+    self, id: str, graph_id: str = LIBRARY_GRAPH_ID
+  ) -> LibraryElementEquivalents | None:
+    """Equivalence fan-out (FAC ↔ us-gaap collapse). Returns None if not found."""
+    data = await self._query(graph_id, GET_LIBRARY_ELEMENT_EQUIVALENTS_GQL, {"id": id})
+    return parse_model(
+      GetLibraryElementEquivalents, data, trusted=self.trusted_server
+    ).library_element_equivalents
+
+  async def get_library_index(
+    self,
+    taxonomy_id: str,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    refresh: bool = False,
+    page_size: int = 500,
+  ) -> LibraryIndex:
+    """Local searchable copy of one taxonomy (see ``library_index.py``).
+
+    One ``get_library_taxonomy`` call checks the taxonomy's version and
+    element count against the file under ``library_index_dir``; elements
+    are downloaded (with labels and references) only when the file is
+    missing, stale, or ``refresh`` is set.
+
+    Raises:
+        RuntimeError: If the taxonomy does not exist.
+    """
+    taxonomy = await self.get_library_taxonomy(
+      graph_id, id=taxonomy_id, include_element_count=True
+    )
+    if taxonomy is None:
+      raise RuntimeError(f"Library taxonomy '{taxonomy_id}' not found")
+    path = self.index_dir / graph_id / f"{taxonomy_id}.sqlite"
+    if not refresh and path.exists():
+      try:
+        index = LibraryIndex(path)
+      except sqlite3.Error:
+        pass
+      else:
+        if index.is_current(taxonomy):
+          return index
+        index.close()
+    elements = []
+    while True:
+      page = await self.list_library_elements(
+        graph_id,
+        taxonomy_id=taxonomy_id,
+        limit=page_size,
+        offset=len(elements),
+        include_labels=True,
+        include_references=True,
+      )
+      if not page:
+        break
+      elements.extend(page)
+    return LibraryIndex.build(path, taxonomy, elements)
+
+  async def get_taxonomy_graph(
+    self,
+    taxonomy_id: str,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    refresh: bool = False,
+    page_size: int = 1000,
+    concurrency: int = 4,
+  ) -> TaxonomyGraph:
+    """Every arc of a taxonomy as an in-memory graph (see
+    ``taxonomy_graph.py``) — hierarchy, calculation and equivalence
+    traversals without a request per element.
+
+    The graph is cached under ``library_index_dir`` and reused while
+    the taxonomy's version is unchanged. Otherwise the first arc page
+    gives the total count and the remaining pages are fetched
+    ``concurrency`` at a time.
+
+    Raises:
+        RuntimeError: If the taxonomy does not exist.
+    """
+    taxonomy = await self.get_library_taxonomy(graph_id, id=taxonomy_id)
+    if taxonomy is None:
+      raise RuntimeError(f"Library taxonomy '{taxonomy_id}' not found")
+    path = self.index_dir / graph_id / f"{taxonomy_id}.arcs.json"
+    if not refresh and path.exists():
+      try:
+        graph = TaxonomyGraph.load(path)
+      except (OSError, ValueError, KeyError):
+        pass
+      else:
+        if graph.is_current(taxonomy):
+          return graph
+    first = await self.list_library_taxonomy_arcs(
+      taxonomy_id, graph_id, limit=page_size
+    )
+    arcs = list(first.library_taxonomy_arcs)
+    step = len(arcs)
+    if step:
+      pages = await self._gather(
+        self.list_library_taxonomy_arcs,
+        [
+          {
+            "taxonomy_id": taxonomy_id,
+            "graph_id": graph_id,
+            "limit": step,
+            "offset": offset,
+          }
+          for offset in range(step, first.library_taxonomy_arc_count, step)
+        ],
+        concurrency,
+      )
+      for page in pages:
+        arcs.extend(page.library_taxonomy_arcs)
+    graph = TaxonomyGraph.from_arcs(arcs, taxonomy.id, taxonomy.version)
+    graph.save(path)
+    return graph
@@ -0,0 +1,152 @@
+"""Result types and checkpointing for bulk event block ingestion.
+
+``LedgerClient.ingest_event_blocks`` streams event block bodies through a
+bounded worker pool. Each event has a client-computed key (by default
+:func:`event_key`, a hash of its canonical JSON) that drops duplicates
+before anything is sent and doubles as the request's idempotency key.
+
+An :class:`IngestCheckpoint` is an append-only file of the keys already
+created. A re-run with the same checkpoint skips those events; events
+that were in flight when a run died are resent with the same idempotency
+key, so the server replays them instead of posting them twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Optional
+
+CREATED = "created"
+DUPLICATE = "duplicate"
+CHECKPOINTED = "checkpointed"
+REJECTED = "rejected"
+FAILED = "failed"
+
+
+def event_key(body: dict[str, Any]) -> str:
+  """Default dedup / idempotency key: a hash of the body's canonical JSON."""
+  canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+  return "evb-" + hashlib.sha256(canonical.encode()).hexdigest()[:40]
+
+
+class IngestCheckpoint:
+  """Append-only record of the event keys an ingestion has created.
+
+  Each created event is one JSON line (``key`` and ``event_id``),
+  flushed as soon as it is written, so the file survives the process
+  dying mid-run. A torn last line from a crash is ignored on load.
+
+  Args:
+      path: Checkpoint file; created if missing
+  """
+
+  def __init__(self, path: str | Path):
+    self.path = Path(path)
+    self._events: dict[str, Optional[str]] = {}
+    if self.path.exists():
+      with open(self.path, encoding="utf-8") as f:
+        for line in f:
+          try:
+            record = json.loads(line)
+            self._events[record["key"]] = record.get("event_id")
+          except (ValueError, KeyError, TypeError):
+            continue
+    else:
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+    self._file: Optional[IO[str]] = open(self.path, "a", encoding="utf-8")
+    self._lock = threading.Lock()
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._events
+
+  def __len__(self) -> int:
+    return len(self._events)
+
+  def event_id(self, key: str) -> Optional[str]:
+    """Id of the event created for ``key``, if recorded."""
+    return self._events.get(key)
+
+  def record(self, key: str, event_id: Optional[str]) -> None:
+    with self._lock:
+      if self._file is None:
+        raise RuntimeError("Checkpoint is closed")
+      self._events[key] = event_id
+      self._file.write(json.dumps({"key": key, "event_id": event_id}) + "\n")
+      self._file.flush()
+
+  def close(self) -> None:
+    with self._lock:
+      if self._file is not None:
+        self._file.close()
+        self._file = None
+
+  def __enter__(self) -> IngestCheckpoint:
+    return self
+
+  def __exit__(self, *exc: Any) -> None:
+    self.close()
+
+
+@dataclass
+class EventBlockOutcome:
+  """Outcome of one event of :meth:`LedgerClient.ingest_event_blocks`.
+
+  ``status`` is one of ``"created"``, ``"duplicate"`` (key already seen
+  earlier in this run), ``"checkpointed"`` (created by an earlier run),
+  ``"rejected"`` (preview reported it would fail) or ``"failed"``.
+  """
+
+  index: int
+  key: str
+  status: str
+  result: Any = None
+  preview: Any = None
+  error: Optional[str] = None
+  attempts: int = 0
+
+  @property
+  def success(self) -> bool:
+    return self.status in (CREATED, DUPLICATE, CHECKPOINTED)
+
+
+@dataclass
+class EventIngestResult:
+  """Result of :meth:`LedgerClient.ingest_event_blocks`, in input order."""
+
+  outcomes: list[EventBlockOutcome]
+  elapsed_seconds: float
+
+  def _with(self, *statuses: str) -> list[EventBlockOutcome]:
+    return [o for o in self.outcomes if o.status in statuses]
+
+  @property
+  def created(self) -> list[EventBlockOutcome]:
+    return self._with(CREATED)
+
+  @property
+  def skipped(self) -> list[EventBlockOutcome]:
+    return self._with(DUPLICATE, CHECKPOINTED)
+
+  @property
+  def rejected(self) -> list[EventBlockOutcome]:
+    return self._with(REJECTED)
+
+  @property
+  def failed(self) -> list[EventBlockOutcome]:
+    return self._with(FAILED)
+
+  @property
+  def success(self) -> bool:
+    return all(o.success for o in self.outcomes)
+
+  @property
+  def events_per_second(self) -> float:
+    """Events sent to the server (created, rejected or failed) per second."""
+    if self.elapsed_seconds <= 0:
+      return 0.0
+    sent = len(self.outcomes) - len(self.skipped)
+    return sent / self.elapsed_seconds
@@ -12,10 +12,14 @@ from .operation_client import OperationClient
 from .file_client import FileClient
 from .document_client import DocumentClient
 from .table_client import TableClient
+from .backup_client import BackupClient
 from .graph_client import GraphClient
 from .investor_client import InvestorClient
 from .ledger_client import LedgerClient
 from .library_client import LibraryClient
+from .read_cache import ReadCache
+from .report_bundle_cache import ReportBundleCache
+from .single_flight import AsyncSingleFlight, SingleFlight
 from .sse_client import SSEClient
 
 
@@ -36,6 +40,48 @@ class RoboSystemsClientConfig:
   # without rebuilding the clients. Mirrors the TypeScript client's
   # `tokenProvider`. See `token_utils.TokenProvider`.
   token_provider: Optional[Callable[[], Optional[str]]] = None
+  # Optional on-disk cache for report bundles, keyed by generation_count.
+  # Repeat `ledger.download_report_bundle` calls for an unchanged report
+  # then cost only the GraphQL URL lookup. See `ReportBundleCache`.
+  report_bundle_cache: Optional[ReportBundleCache] = None
+  # Automatic persisted queries for the GraphQL-backed facades: reads send
+  # the document's SHA-256 instead of its text and fall back to the full
+  # document once per server-side cache miss. `graphql_use_get` sends the
+  # hash-only reads as GET so HTTP caches in front of the API can serve
+  # them. Opt-in: the server must support the APQ protocol.
+  graphql_persisted_queries: bool = False
+  graphql_use_get: bool = False
+  # Trust the server's responses to match the schema: facade reads return
+  # lazy read-only views over the response instead of validating every
+  # nested object into pydantic models — much cheaper for bulk reads.
+  # See `graphql/views.py` for what a view does and does not do.
+  graphql_trusted_server: bool = False
+  # Root directory of the local staging-table mirrors built by
+  # `tables.mirror()` (default ~/.cache/robosystems/tables).
+  table_mirror_dir: Optional[str] = None
+  # Root directory of the offline taxonomy indexes and arc graphs built by
+  # `library.get_library_index()` / `get_taxonomy_graph()` (default
+  # ~/.cache/robosystems/library).
+  library_index_dir: Optional[str] = None
+  # Processes used to decode large NDJSON query responses; 1 decodes
+  # in-process (with orjson when installed). See `clients/ndjson.py`.
+  ndjson_decode_workers: int = 1
+  # Bytes of query rows held in memory before `query.query` results spill
+  # to a temporary file; NDJSON bodies are then streamed into a
+  # `RowSpool` that becomes `QueryResult.data`. None keeps results in a
+  # plain list.
+  query_memory_budget: Optional[int] = None
+  # Coalesce identical concurrent reads: GraphQL queries (same graph,
+  # document and variables) and REST GETs (same URL and params) that are
+  # in flight at the same time share one network call and its result.
+  # Shared by all facades of one clients instance. See
+  # `clients/single_flight.py`.
+  single_flight: bool = False
+  # Stale-while-revalidate cache for slow-changing reference reads (fiscal
+  # calendar, reporting taxonomy, account tree, library taxonomies, graph
+  # tiers), with per-endpoint fresh/stale windows. Facade writes
+  # invalidate the reads they change. See `ReadCache`.
+  read_cache: Optional[ReadCache] = None
 
 
 class RoboSystemsClients:
@@ -54,6 +100,16 @@ class RoboSystemsClients:
       "timeout": config.timeout,
       "s3_endpoint_url": config.s3_endpoint_url,
       "token_provider": config.token_provider,
+      "report_bundle_cache": config.report_bundle_cache,
+      "graphql_persisted_queries": config.graphql_persisted_queries,
+      "graphql_use_get": config.graphql_use_get,
+      "graphql_trusted_server": config.graphql_trusted_server,
+      "table_mirror_dir": config.table_mirror_dir,
+      "library_index_dir": config.library_index_dir,
+      "ndjson_decode_workers": config.ndjson_decode_workers,
+      "query_memory_budget": config.query_memory_budget,
+      "single_flight": SingleFlight() if config.single_flight else None,
+      "read_cache": config.read_cache,
     }
 
     # Extract token from headers if it was set by auth classes
@@ -80,6 +136,7 @@ class RoboSystemsClients:
     self.tables = TableClient(self.config)
     self.documents = DocumentClient(self.config)
     self.graphs = GraphClient(self.config)
+    self.backups = BackupClient(self.config)
     self.ledger = LedgerClient(self.config)
     self.investor = InvestorClient(self.config)
     # Library reads accept graph_id per-call — pass either the
@@ -123,6 +180,8 @@ class RoboSystemsClients:
     if hasattr(self.documents, "close"):
       self.documents.close()
     self.graphs.close()
+    if self.config.get("single_flight") is not None:
+      self.config["single_flight"].close()
 
   # Convenience methods that delegate to the appropriate clients
   def execute_query(self, graph_id: str, query: str, parameters: Dict[str, Any] = None):
@@ -161,14 +220,42 @@ class AsyncRoboSystemsClients:
       "max_retries": config.max_retries,
       "retry_delay": config.retry_delay,
       "timeout": config.timeout,
+      "s3_endpoint_url": config.s3_endpoint_url,
+      "token_provider": config.token_provider,
+      "graphql_persisted_queries": config.graphql_persisted_queries,
+      "graphql_use_get": config.graphql_use_get,
+      "graphql_trusted_server": config.graphql_trusted_server,
+      "single_flight": AsyncSingleFlight() if config.single_flight else None,
+      "read_cache": config.read_cache,
     }
 
+    token = None
+    if config.headers:
+      auth_header = config.headers.get("Authorization", "")
+      if auth_header.startswith("Bearer "):
+        token = auth_header[7:]
+      elif config.headers.get("X-API-Key"):
+        token = config.headers.get("X-API-Key")
+    if token:
+      self.config["token"] = token
+
     # Initialize async clients
+    from .async_graphql_facade import create_async_http_client
+    from .async_investor_client import AsyncInvestorClient
+    from .async_ledger_client import AsyncLedgerClient
+    from .async_library_client import AsyncLibraryClient
     from .query_client import AsyncQueryClient
     from .operation_client import AsyncOperationClient
 
     self.query = AsyncQueryClient(self.config)
     self.operations = AsyncOperationClient(self.config)
+    # The GraphQL-backed facades share one connection pool, so concurrent
+    # reads across ledger / investor / library reuse connections.
+    self.config["async_http_client"] = create_async_http_client(self.config)
+    self.ledger = AsyncLedgerClient(self.config)
+    self.investor = AsyncInvestorClient(self.config)
+    self.library = AsyncLibraryClient(self.config)
+    self.reports = self.ledger
 
   async def monitor_operation(
     self, operation_id: str, on_progress: Optional[Callable] = None
@@ -197,6 +284,7 @@ class AsyncRoboSystemsClients:
     """Clean up all active connections (async)"""
     await self.query.close()
     await self.operations.close_all()
+    await self.config["async_http_client"].aclose()
 
   async def execute_query(
     self, graph_id: str, query: str, parameters: Dict[str, Any] = None
@@ -0,0 +1,170 @@
+"""Columnar access to ``LedgerClient.build_fact_grid`` results.
+
+The fact grid operation returns a flat list of deduplicated fact records
+(a ``ViewResponse``). :class:`FactGrid` reads those records into
+per-field columns — one ``attrgetter`` sweep per field — and hands the
+columns to pandas or Arrow whole, with the repeating string fields
+(qnames, periods, units, entities) as categorical / dictionary-encoded
+columns.
+
+Fields a record carries beyond the typed ``FactRecord`` attributes
+(dimension members) become extra columns; a dict-valued field such as
+``{"dimensions": {"us-gaap:StatementBusinessSegmentsAxis": ...}}`` is
+flattened into one column per key.
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Optional
+
+from ..types import UNSET
+from .dataframe_utils import pd, require_pandas
+
+try:
+  import pyarrow as pa
+
+  HAS_PYARROW = True
+except ImportError:
+  HAS_PYARROW = False
+  pa = None
+
+FACT_FIELDS = (
+  "element_id",
+  "element_name",
+  "period_start",
+  "period_end",
+  "duration_type",
+  "unit",
+  "entity_ticker",
+  "entity_name",
+)
+
+_ENTITY_FIELDS = ("entity_ticker", "entity_name")
+
+
+def _field(obj: Any, name: str) -> Any:
+  value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+  return None if value is UNSET else value
+
+
+class FactGrid:
+  """Fact grid records as columns.
+
+  Args:
+      response: ``build_fact_grid`` result — a ``ViewResponse`` or the
+          equivalent plain dict
+  """
+
+  def __init__(self, response: Any):
+    self.response = response
+    facts = _field(response, "facts") or []
+    self.columns: dict[str, list[Any]] = {}
+    self.values: list[Optional[float]] = []
+    self.dimension_names: list[str] = []
+    self._read(facts)
+
+  @property
+  def metadata(self) -> Any:
+    return _field(self.response, "metadata")
+
+  @property
+  def dimensions(self) -> Any:
+    return _field(self.response, "dimensions")
+
+  @property
+  def summary(self) -> Any:
+    return _field(self.response, "summary")
+
+  def __len__(self) -> int:
+    return len(self.values)
+
+  def _read(self, facts: list[Any]) -> None:
+    n = len(facts)
+    if facts and not isinstance(facts[0], dict):
+      for name in FACT_FIELDS:
+        column = map(attrgetter(name), facts)
+        self.columns[name] = [None if v is UNSET else v for v in column]
+      values = map(attrgetter("value"), facts)
+      self.values = [None if v is UNSET else v for v in values]
+      extra = map(attrgetter("additional_properties"), facts)
+    else:
+      for name in FACT_FIELDS:
+        self.columns[name] = [fact.get(name) for fact in facts]
+      self.values = [fact.get("value") for fact in facts]
+      known = {*FACT_FIELDS, "value"}
+      extra = ({k: v for k, v in fact.items() if k not in known} for fact in facts)
+    extras = [(i, fields) for i, fields in enumerate(extra) if fields]
+
+    dimensions: dict[str, list[Any]] = {}
+    for i, fields in extras:
+      for key, value in fields.items():
+        members = value if isinstance(value, dict) else {key: value}
+        for name, member in members.items():
+          column = dimensions.get(name)
+          if column is None:
+            column = dimensions[name] = [None] * n
+          column[i] = member
+    self.dimension_names = list(dimensions)
+    self.columns.update(dimensions)
+
+  # ── Conversion ──────────────────────────────────────────────────────
+
+  def to_dataframe(self, pivot: bool = False, aggfunc: Any = "first") -> "pd.DataFrame":
+    """Facts as a DataFrame.
+
+    Long form (the default) has one row per fact: the string fields as
+    ``category`` columns plus a float ``value`` column. With ``pivot``
+    the values are laid out with one row per element (and entity, unit
+    and dimension members, where present) and one column per period;
+    a period is ``end`` for instants and ``start/end`` for durations.
+    Facts landing in the same cell (differing only in fields outside
+    the index, such as ``element_name``) are combined with ``aggfunc``,
+    any pandas groupby aggregation — by default the first non-null value.
+    """
+    require_pandas()
+    data: dict[str, Any] = {
+      name: pd.Categorical(column) for name, column in self.columns.items()
+    }
+    data["value"] = pd.Series(self.values, dtype="float64")
+    frame = pd.DataFrame(data, index=pd.RangeIndex(len(self)))
+    if not pivot:
+      return frame
+
+    frame["period"] = pd.Categorical(
+      [
+        end if start is None else f"{start}/{end}"
+        for start, end in zip(self.columns["period_start"], self.columns["period_end"])
+      ]
+    )
+    index = ["element_id"] + [
+      name
+      for name in (*_ENTITY_FIELDS, "unit", *self.dimension_names)
+      if any(v is not None for v in self.columns[name])
+    ]
+    grouped = frame.groupby([*index, "period"], observed=True, dropna=False)
+    return grouped["value"].agg(aggfunc).unstack("period")
+
+  def to_arrow(self) -> "pa.Table":
+    """Facts as an Arrow table.
+
+    The ``FACT_FIELDS`` string columns are dictionary-encoded; extra
+    (dimension) columns keep the type Arrow infers for them, falling
+    back to strings when their values have no common type.
+    """
+    if not HAS_PYARROW:
+      raise ImportError(
+        "PyArrow is required for Arrow tables. Install it with: pip install pyarrow"
+      )
+    arrays = {
+      name: pa.array(self.columns[name], type=pa.string()).dictionary_encode()
+      for name in FACT_FIELDS
+    }
+    for name in self.dimension_names:
+      column = self.columns[name]
+      try:
+        arrays[name] = pa.array(column)
+      except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arrays[name] = pa.array([None if v is None else str(v) for v in column])
+    arrays["value"] = pa.array(self.values, type=pa.float64())
+    return pa.table(arrays)
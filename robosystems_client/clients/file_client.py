@@ -4,13 +4,38 @@ Manages file operations as first-class resources with multi-layer status trackin
 Files are independent entities with their own lifecycle (S3 → DuckDB → Graph).
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, Union, BinaryIO
+from typing import (
+  TYPE_CHECKING,
+  Dict,
+  Any,
+  Iterator,
+  Optional,
+  Callable,
+  Sequence,
+  Union,
+  BinaryIO,
+)
 import logging
+import os
+import tempfile
+import threading
+import time
 import httpx
 
+try:
+  import pyarrow as pa
+  import pyarrow.parquet as pq
+
+  HAS_PYARROW = True
+except ImportError:
+  HAS_PYARROW = False
+  pa = None
+  pq = None
+
 from ..api.content_operations.create_file_upload import (
   sync_detailed as create_file_upload,
 )
@@ -29,9 +54,19 @@ from ..api.content_operations.delete_file import (
 from ..models.file_upload_request import FileUploadRequest
 from ..models.ingest_file_op import IngestFileOp
 from ..models.delete_file_op import DeleteFileOp
+from .token_utils import resolve_config_token
+
+if TYPE_CHECKING:
+  import pandas as pd
+
+  from .graph_client import MaterializationOptions, MaterializationResult
 
 logger = logging.getLogger(__name__)
 
+_READ_CHUNK = 1024 * 1024
+# Encoded Parquet parts larger than this spill from memory to a temp file.
+_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
 
 @dataclass
 class FileUploadOptions:
@@ -54,6 +89,63 @@ class FileUploadResult:
   error: Optional[str] = None
 
 
+class _FileBody:
+  """Request body read from a file in chunks, with a known length.
+
+  Presigned S3 PUTs need ``Content-Length`` up front; streaming the file
+  keeps it out of memory. Iterating again re-reads from the start, so a
+  retried request sends the same bytes.
+  """
+
+  def __init__(self, source: Union[Path, BinaryIO]):
+    self._source = source
+    if isinstance(source, Path):
+      self._start = 0
+      self._size = source.stat().st_size
+    else:
+      self._start = source.tell()
+      self._size = source.seek(0, os.SEEK_END) - self._start
+      source.seek(self._start)
+
+  def __len__(self) -> int:
+    return self._size
+
+  def __iter__(self) -> Iterator[bytes]:
+    if isinstance(self._source, Path):
+      with open(self._source, "rb") as f:
+        yield from iter(lambda: f.read(_READ_CHUNK), b"")
+    else:
+      self._source.seek(self._start)
+      yield from iter(lambda: self._source.read(_READ_CHUNK), b"")
+
+
+@dataclass
+class BatchUploadResult:
+  """Result from a ``FileClient.upload_many`` call"""
+
+  table_name: str
+  files: list[FileUploadResult]
+  bytes_uploaded: int
+  elapsed_seconds: float
+  materialization: Optional["MaterializationResult"] = None
+
+  @property
+  def failed(self) -> list[FileUploadResult]:
+    return [f for f in self.files if not f.success]
+
+  @property
+  def success(self) -> bool:
+    return not self.failed and (
+      self.materialization is None or self.materialization.success
+    )
+
+  @property
+  def bytes_per_second(self) -> float:
+    if self.elapsed_seconds <= 0:
+      return 0.0
+    return self.bytes_uploaded / self.elapsed_seconds
+
+
 @dataclass
 class FileInfo:
   """Information about a file"""
@@ -81,6 +173,8 @@ class FileClient:
     self.s3_endpoint_url = config.get(
       "s3_endpoint_url"
     )  # Optional S3 endpoint override
+    self.max_retries = config.get("max_retries", 3)
+    self.retry_delay = config.get("retry_delay", 1000)  # milliseconds
     self._http_client = httpx.Client(timeout=120.0)
 
   def upload(
@@ -89,6 +183,7 @@ class FileClient:
     table_name: str,
     file_or_buffer: Union[Path, str, BytesIO, BinaryIO],
     options: Optional[FileUploadOptions] = None,
+    file_name: Optional[str] = None,
   ) -> FileUploadResult:
     """
     Upload a file to a table.
@@ -98,11 +193,16 @@ class FileClient:
     2. Upload file to S3
     3. Mark file as 'uploaded' (triggers DuckDB staging)
 
+    Paths and seekable file objects are streamed to S3 rather than read
+    into memory.
+
     Args:
         graph_id: Graph database identifier
         table_name: Table to associate file with
         file_or_buffer: File path, Path object, BytesIO, or file-like object
         options: Upload options (progress callback, LocalStack URL fix, auto-ingest)
+        file_name: Name to record for the file (default: the path's or
+            file object's name)
 
     Returns:
         FileUploadResult with file metadata and status
@@ -111,17 +211,20 @@ class FileClient:
 
     try:
       # Determine file name and read content
+      file_content: Union[bytes, _FileBody]
       if isinstance(file_or_buffer, (str, Path)):
         file_path = Path(file_or_buffer)
-        file_name = file_path.name
-        with open(file_path, "rb") as f:
-          file_content = f.read()
+        file_name = file_name or file_path.name
+        file_content = _FileBody(file_path)
       elif isinstance(file_or_buffer, BytesIO):
-        file_name = "data.parquet"
+        file_name = file_name or "data.parquet"
         file_content = file_or_buffer.getvalue()
       elif hasattr(file_or_buffer, "read"):
-        file_name = getattr(file_or_buffer, "name", "data.parquet")
-        file_content = file_or_buffer.read()
+        file_name = file_name or getattr(file_or_buffer, "name", "data.parquet")
+        if getattr(file_or_buffer, "seekable", lambda: False)():
+          file_content = _FileBody(file_or_buffer)
+        else:
+          file_content = file_or_buffer.read()
       else:
         raise ValueError(f"Unsupported file type: {type(file_or_buffer)}")
 
@@ -176,23 +279,7 @@ class FileClient:
       upload_url = upload_data.get("upload_url")
       file_id = upload_data.get("file_id")
 
-      # Override S3 endpoint if configured (e.g., for LocalStack)
-      if self.s3_endpoint_url:
-        from urllib.parse import urlparse, urlunparse
-
-        parsed_url = urlparse(upload_url)
-        override_parsed = urlparse(self.s3_endpoint_url)
-        # Replace scheme, host, and port with the override endpoint
-        upload_url = urlunparse(
-          (
-            override_parsed.scheme or parsed_url.scheme,
-            override_parsed.netloc,
-            parsed_url.path,
-            parsed_url.params,
-            parsed_url.query,
-            parsed_url.fragment,
-          )
-        )
+      upload_url = self._override_s3_endpoint(upload_url)
 
       # Step 2: Upload file to S3
       if options.on_progress:
@@ -201,7 +288,10 @@ class FileClient:
       s3_response = self._http_client.put(
         upload_url,
         content=file_content,
-        headers={"Content-Type": "application/x-parquet"},
+        headers={
+          "Content-Type": "application/x-parquet",
+          "Content-Length": str(len(file_content)),
+        },
       )
 
       if s3_response.status_code not in [200, 204]:
@@ -271,11 +361,336 @@ class FileClient:
         file_size=0,
         row_count=0,
         table_name=table_name,
-        file_name=getattr(file_or_buffer, "name", "unknown"),
+        file_name=file_name or getattr(file_or_buffer, "name", "unknown"),
         success=False,
         error=str(e),
       )
 
+  def upload_dataframe(
+    self,
+    graph_id: str,
+    table_name: str,
+    data: Union["pd.DataFrame", "pa.Table"],
+    row_group_size: int = 100_000,
+    rows_per_file: int = 5_000_000,
+    options: Optional[FileUploadOptions] = None,
+  ) -> list[FileUploadResult]:
+    """
+    Upload a pandas DataFrame or Arrow table to a table as Parquet.
+
+    The data is split into staging files of at most ``rows_per_file``
+    rows. Each file is encoded with ``row_group_size`` rows per row group
+    into a spooled temporary file (kept in memory up to 64 MiB, on disk
+    beyond that) and streamed to S3 from there, so no full Parquet copy
+    of the data is held in memory. Arrow tables are sliced without
+    copying; DataFrames are converted to Arrow one file's rows at a time.
+
+    Args:
+        graph_id: Graph database identifier
+        table_name: Table to associate the files with
+        data: pandas DataFrame or pyarrow Table
+        row_group_size: Rows per Parquet row group
+        rows_per_file: Rows per staging file
+        options: Upload options applied to each file
+
+    Returns:
+        One FileUploadResult per staging file, in row order
+
+    Example:
+        >>> results = client.files.upload_dataframe(graph_id, "Fact", df)
+        >>> assert all(r.success for r in results)
+    """
+    if not HAS_PYARROW:
+      raise ImportError(
+        "PyArrow is required for DataFrame uploads. Install it with: pip install pyarrow"
+      )
+    if row_group_size <= 0 or rows_per_file <= 0:
+      raise ValueError("row_group_size and rows_per_file must be positive")
+
+    is_arrow = isinstance(data, pa.Table)
+    total_rows = data.num_rows if is_arrow else len(data)
+    parts = max(1, -(-total_rows // rows_per_file))
+    results = []
+    for index in range(parts):
+      start = index * rows_per_file
+      if is_arrow:
+        chunk = data.slice(start, rows_per_file)
+      else:
+        chunk = pa.Table.from_pandas(
+          data.iloc[start : start + rows_per_file], preserve_index=False
+        )
+      file_name = (
+        f"{table_name}.parquet" if parts == 1 else f"{table_name}-{index:05d}.parquet"
+      )
+      with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spool:
+        pq.write_table(chunk, spool, row_group_size=row_group_size)
+        spool.seek(0)
+        results.append(
+          self.upload(graph_id, table_name, spool, options, file_name=file_name)
+        )
+    return results
+
+  def upload_many(
+    self,
+    graph_id: str,
+    table_name: str,
+    paths: Sequence[Union[Path, str]],
+    concurrency: int = 8,
+    materialize: bool = True,
+    materialize_options: Optional["MaterializationOptions"] = None,
+    on_progress: Optional[Callable[[str], None]] = None,
+  ) -> BatchUploadResult:
+    """
+    Upload many files to a table in parallel, then materialize once.
+
+    Runs in three phases:
+    1. Presign and S3 PUT every file, ``concurrency`` files at a time
+    2. Once every file has landed, ingest each one into DuckDB staging
+       (without per-file graph ingestion)
+    3. Trigger a single ``GraphClient.materialize`` — skipped if any file
+       failed, so a partial load never reaches the graph
+
+    Each file is presigned once; a failed S3 PUT (transport error or
+    5xx) is retried against the same presigned URL up to ``max_retries``
+    times with exponential backoff. Presign and ingest are not retried —
+    a retry would leave an orphaned pending file record, or double-ingest
+    a file the server had already accepted.
+
+    Args:
+        graph_id: Graph database identifier
+        table_name: Table to associate the files with
+        paths: Files to upload
+        concurrency: Number of files in flight at once
+        materialize: Materialize the graph after all files are ingested
+        materialize_options: Options passed to ``GraphClient.materialize``
+        on_progress: Called with a status message as files land, including
+            aggregate throughput
+
+    Returns:
+        BatchUploadResult with per-file results (in ``paths`` order),
+        throughput, and the materialization result when one ran
+
+    Example:
+        >>> result = client.files.upload_many(
+        ...     graph_id, "Fact", sorted(Path("out").glob("*.parquet"))
+        ... )
+        >>> print(f"{result.bytes_per_second / 1e6:.1f} MB/s")
+    """
+    from ..client import AuthenticatedClient
+    from .graph_client import GraphClient
+
+    start = time.perf_counter()
+    files = [Path(p) for p in paths]
+    if not resolve_config_token(self.config):
+      error = "No API key provided. Set X-API-Key in headers."
+      logger.error(f"Batch upload failed: {error}")
+      return BatchUploadResult(
+        table_name=table_name,
+        files=[self._failed_upload(table_name, f.name, error) for f in files],
+        bytes_uploaded=0,
+        elapsed_seconds=0.0,
+      )
+
+    def api_client() -> AuthenticatedClient:
+      # Resolved per call: a rotating `token_provider` is picked up
+      # between files and phases.
+      return AuthenticatedClient(
+        base_url=self.base_url,
+        token=resolve_config_token(self.config),
+        prefix="",
+        auth_header_name="X-API-Key",
+        headers=self.headers,
+      )
+
+    workers = max(1, min(concurrency, len(files)))
+    lock = threading.Lock()
+    progress = {"files": 0, "bytes": 0}
+
+    def stage(path: Path) -> FileUploadResult:
+      result = self._stage_file(api_client(), http, graph_id, table_name, path)
+      if not result.success:
+        logger.error(f"Upload of {result.file_name} failed: {result.error}")
+      with lock:
+        progress["files"] += 1
+        if result.success:
+          progress["bytes"] += result.file_size
+        if on_progress:
+          elapsed = time.perf_counter() - start
+          rate = progress["bytes"] / elapsed / 1e6 if elapsed > 0 else 0.0
+          on_progress(
+            f"Uploaded {progress['files']}/{len(files)} files "
+            f"({progress['bytes']:,} bytes, {rate:.1f} MB/s)"
+          )
+      return result
+
+    def ingest(staged: FileUploadResult) -> FileUploadResult:
+      if not staged.success:
+        return staged
+      result = self._ingest_staged(api_client(), graph_id, staged)
+      if not result.success:
+        logger.error(f"Ingest of {result.file_name} failed: {result.error}")
+      return result
+
+    limits = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+    with ThreadPoolExecutor(
+      max_workers=workers, thread_name_prefix="file-upload"
+    ) as pool:
+      with httpx.Client(timeout=120.0, limits=limits) as http:
+        staged = list(pool.map(stage, files))
+      if on_progress:
+        on_progress(f"Ingesting {sum(f.success for f in staged)} files...")
+      results = list(pool.map(ingest, staged))
+
+    batch = BatchUploadResult(
+      table_name=table_name,
+      files=results,
+      bytes_uploaded=progress["bytes"],
+      elapsed_seconds=time.perf_counter() - start,
+    )
+    if batch.failed:
+      logger.error(
+        f"{len(batch.failed)} of {len(files)} files failed to load into "
+        f"{table_name}; skipping materialization"
+      )
+    elif materialize and results:
+      batch.materialization = GraphClient(self.config).materialize(
+        graph_id, materialize_options
+      )
+    batch.elapsed_seconds = time.perf_counter() - start
+    return batch
+
+  def _stage_file(
+    self,
+    client: Any,
+    http: httpx.Client,
+    graph_id: str,
+    table_name: str,
+    path: Path,
+  ) -> FileUploadResult:
+    """Presign and PUT one file; ``row_count`` is filled in by ingest."""
+    try:
+      content = _FileBody(path)
+      response = create_file_upload(
+        graph_id=graph_id,
+        client=client,
+        body=FileUploadRequest(
+          file_name=path.name,
+          content_type="application/x-parquet",
+          table_name=table_name,
+        ),
+      )
+      upload_data = getattr(response.parsed, "result", None) or {}
+      if response.status_code != 200 or not upload_data:
+        return self._failed_upload(
+          table_name, path.name, f"Failed to get upload URL: {response.status_code}"
+        )
+
+      file_id = upload_data.get("file_id")
+      error = self._put_with_retries(
+        http, self._override_s3_endpoint(upload_data.get("upload_url")), content
+      )
+      if error is not None:
+        return self._failed_upload(table_name, path.name, error, file_id=file_id)
+
+      return FileUploadResult(
+        file_id=file_id,
+        file_size=len(content),
+        row_count=0,
+        table_name=table_name,
+        file_name=path.name,
+      )
+    except Exception as e:
+      return self._failed_upload(table_name, path.name, str(e))
+
+  def _ingest_staged(
+    self, client: Any, graph_id: str, staged: FileUploadResult
+  ) -> FileUploadResult:
+    try:
+      response = ingest_file(
+        graph_id=graph_id,
+        client=client,
+        body=IngestFileOp(file_id=staged.file_id, ingest_to_graph=False),
+      )
+      if response.status_code not in (200, 202) or not response.parsed:
+        return replace(staged, success=False, error="Failed to complete file upload")
+
+      ingest_data = getattr(response.parsed, "result", None) or {}
+      return replace(
+        staged,
+        file_size=ingest_data.get("file_size_bytes", staged.file_size),
+        row_count=ingest_data.get("row_count", 0) or 0,
+      )
+    except Exception as e:
+      return replace(staged, success=False, error=str(e))
+
+  def _put_with_retries(
+    self, http: httpx.Client, url: str, content: "_FileBody"
+  ) -> Optional[str]:
+    """PUT ``content`` to a presigned URL; returns an error or ``None``.
+
+    Transport errors and 5xx responses are retried against the same URL
+    (a PUT of the same bytes is idempotent); other statuses are final.
+    """
+    attempts = max(1, self.max_retries)
+    error = ""
+    for n in range(attempts):
+      try:
+        response = http.put(
+          url,
+          content=content,
+          headers={
+            "Content-Type": "application/x-parquet",
+            "Content-Length": str(len(content)),
+          },
+        )
+      except httpx.TransportError as e:
+        error = f"S3 upload failed: {type(e).__name__}: {e}"
+      else:
+        if response.status_code in (200, 204):
+          return None
+        error = f"S3 upload failed: {response.status_code}"
+        if response.status_code < 500:
+          return error
+      if n + 1 < attempts:
+        logger.debug(f"S3 PUT attempt {n + 1} failed: {error}")
+        time.sleep(self.retry_delay / 1000 * 2**n)
+    return error
+
+  @staticmethod
+  def _failed_upload(
+    table_name: str, file_name: str, error: str, file_id: str = ""
+  ) -> FileUploadResult:
+    return FileUploadResult(
+      file_id=file_id,
+      file_size=0,
+      row_count=0,
+      table_name=table_name,
+      file_name=file_name,
+      success=False,
+      error=error,
+    )
+
+  def _override_s3_endpoint(self, upload_url: str) -> str:
+    """Point a presigned URL at ``s3_endpoint_url`` (e.g. LocalStack)"""
+    if not self.s3_endpoint_url:
+      return upload_url
+
+    from urllib.parse import urlparse, urlunparse
+
+    parsed_url = urlparse(upload_url)
+    override_parsed = urlparse(self.s3_endpoint_url)
+    # Replace scheme, host, and port with the override endpoint
+    return urlunparse(
+      (
+        override_parsed.scheme or parsed_url.scheme,
+        override_parsed.netloc,
+        parsed_url.path,
+        parsed_url.params,
+        parsed_url.query,
+        parsed_url.fragment,
+      )
+    )
+
   def list(
     self,
     graph_id: str,
@@ -24,6 +24,8 @@ import logging
 import httpx
 
 from .operation_client import OperationClient, OperationProgress, MonitorOptions
+from .read_cache import credential_scope
+from .single_flight import single_flight_httpx_args
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +129,7 @@ class GraphClient:
       prefix="",
       auth_header_name="X-API-Key",
       headers=self.headers,
+      httpx_args=single_flight_httpx_args(self.config),
     )
 
   # ---------------------------------------------------------------------------
@@ -303,6 +306,46 @@ class GraphClient:
         status=getattr(graph_data, "status", None),
       )
 
+  def get_available_graph_tiers(self, include_disabled: bool = False) -> Any:
+    """
+    Get the graph tiers available for new graphs.
+
+    Served from ``config["read_cache"]`` when one is configured — the
+    tier catalogue rarely changes.
+
+    Args:
+        include_disabled: Also list tiers not currently offered
+
+    Returns:
+        AvailableGraphTiersResponse
+    """
+    from ..api.graphs.get_available_graph_tiers import (
+      sync_detailed as get_available_graph_tiers,
+    )
+    from ..models.available_graph_tiers_response import AvailableGraphTiersResponse
+
+    def fetch() -> dict[str, Any]:
+      response = get_available_graph_tiers(
+        client=self._get_authenticated_client(), include_disabled=include_disabled
+      )
+      if response.status_code != 200 or response.parsed is None:
+        raise RuntimeError(f"Failed to get graph tiers: {response.status_code}")
+      return response.parsed.to_dict()
+
+    # The cache holds the JSON form, which persistent backends can store
+    cache = self.config.get("read_cache")
+    if cache is None:
+      data = fetch()
+    else:
+      data = cache.get(
+        "graphs/get_available_graph_tiers",
+        None,
+        {"include_disabled": include_disabled},
+        fetch,
+        scope=credential_scope(self.base_url, self.token, self.headers),
+      )
+    return AvailableGraphTiersResponse.from_dict(data)
+
   # ---------------------------------------------------------------------------
   # Materialize
   # ---------------------------------------------------------------------------
@@ -42,6 +42,9 @@ from ..api.extensions_robo_investor.update_security import (
 )
 from ..client import AuthenticatedClient
 from ..graphql.client import GraphQLClient, strip_none_vars
+from ..graphql.views import parse_model
+from .single_flight import single_flight_httpx_args
+from .read_cache import credential_scope, operation_name
 from .token_utils import resolve_config_token
 from ..graphql.generated.get_investor_holdings import (
   GetInvestorHoldings,
@@ -115,6 +118,9 @@ class InvestorClient:
     self.headers = config.get("headers", {})
     self.token = config.get("token")
     self.timeout = config.get("timeout", 60)
+    # Trusted server: reads return lazy views over the response instead of
+    # validating every nested object (see graphql/views.py).
+    self.trusted_server = config.get("graphql_trusted_server", False)
 
   def _get_client(self) -> AuthenticatedClient:
     # Resolved per call: a configured `token_provider` wins over the
@@ -128,6 +134,7 @@ class InvestorClient:
       prefix="",
       auth_header_name="X-API-Key",
       headers=self.headers,
+      httpx_args=single_flight_httpx_args(self.config),
     )
 
   def _get_graphql_client(self) -> GraphQLClient:
@@ -139,6 +146,9 @@ class InvestorClient:
       token=token,
       headers=self.headers,
       timeout=self.timeout,
+      persisted_queries=self.config.get("graphql_persisted_queries", False),
+      use_get=self.config.get("graphql_use_get", False),
+      single_flight=self.config.get("single_flight"),
     )
 
   def _query(
@@ -153,6 +163,18 @@ class InvestorClient:
     the ``LedgerClient._query`` docstring for the rationale.
     """
     cleaned = strip_none_vars(variables) if variables else None
+    cache = self.config.get("read_cache")
+    if cache is not None:
+      return cache.get(
+        operation_name(query),
+        graph_id,
+        cleaned,
+        lambda: self._get_graphql_client().execute(graph_id, query, cleaned),
+        document=query,
+        scope=credential_scope(
+          self.base_url, resolve_config_token(self.config), self.headers
+        ),
+      )
     return self._get_graphql_client().execute(graph_id, query, cleaned)
 
   # The backend's `OperationEnvelope` is generic on the result type
@@ -219,7 +241,9 @@ class InvestorClient:
     data = self._query(
       graph_id, LIST_INVESTOR_PORTFOLIOS_GQL, {"limit": limit, "offset": offset}
     )
-    return ListInvestorPortfolios.model_validate(data).portfolios
+    return parse_model(
+      ListInvestorPortfolios, data, trusted=self.trusted_server
+    ).portfolios
 
   def get_portfolio_block(
     self, graph_id: str, portfolio_id: str
@@ -228,7 +252,9 @@ class InvestorClient:
     data = self._query(
       graph_id, GET_INVESTOR_PORTFOLIO_BLOCK_GQL, {"portfolioId": portfolio_id}
     )
-    return GetInvestorPortfolioBlock.model_validate(data).portfolio_block
+    return parse_model(
+      GetInvestorPortfolioBlock, data, trusted=self.trusted_server
+    ).portfolio_block
 
   def create_portfolio_block(
     self, graph_id: str, body: dict[str, Any]
@@ -305,12 +331,14 @@ class InvestorClient:
         "offset": offset,
       },
     )
-    return ListInvestorSecurities.model_validate(data).securities
+    return parse_model(
+      ListInvestorSecurities, data, trusted=self.trusted_server
+    ).securities
 
   def get_security(self, graph_id: str, security_id: str) -> InvestorSecurity | None:
     """Get a single security by id. Returns None if it doesn't exist."""
     data = self._query(graph_id, GET_INVESTOR_SECURITY_GQL, {"securityId": security_id})
-    return GetInvestorSecurity.model_validate(data).security
+    return parse_model(GetInvestorSecurity, data, trusted=self.trusted_server).security
 
   def create_security(self, graph_id: str, body: dict[str, Any]) -> SecurityResponse:
     """Create a new security. Auto-links to an entity when `source_graph_id` is set."""
@@ -370,12 +398,14 @@ class InvestorClient:
         "offset": offset,
       },
     )
-    return ListInvestorPositions.model_validate(data).positions
+    return parse_model(
+      ListInvestorPositions, data, trusted=self.trusted_server
+    ).positions
 
   def get_position(self, graph_id: str, position_id: str) -> InvestorPosition | None:
     """Get a single position by id. Returns None if it doesn't exist."""
     data = self._query(graph_id, GET_INVESTOR_POSITION_GQL, {"positionId": position_id})
-    return GetInvestorPosition.model_validate(data).position
+    return parse_model(GetInvestorPosition, data, trusted=self.trusted_server).position
 
   # ── Holdings (aggregation) ─────────────────────────────────────────
 
@@ -384,4 +414,4 @@ class InvestorClient:
     data = self._query(
       graph_id, GET_INVESTOR_HOLDINGS_GQL, {"portfolioId": portfolio_id}
     )
-    return GetInvestorHoldings.model_validate(data).holdings
+    return parse_model(GetInvestorHoldings, data, trusted=self.trusted_server).holdings
@@ -22,10 +22,20 @@ same backend surface as the ledger operations.
 
 from __future__ import annotations
 
+import contextlib
 import datetime
+import hashlib
+import json
+import os
 import re
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from http import HTTPStatus
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -168,6 +178,23 @@ from ..api.extensions_robo_ledger.update_journal_entry import (
 )
 from ..client import AuthenticatedClient
 from ..graphql.client import GraphQLClient, strip_none_vars
+from ..graphql.views import parse_model
+from .account_index import AccountIndex
+from .event_ingest import (
+  CHECKPOINTED,
+  CREATED,
+  DUPLICATE,
+  FAILED,
+  REJECTED,
+  EventBlockOutcome,
+  EventIngestResult,
+  IngestCheckpoint,
+  event_key,
+)
+from .fact_grid import FactGrid
+from .report_bundle_cache import CachedBundle, ReportBundleCache
+from .single_flight import single_flight_httpx_args
+from .read_cache import credential_scope, operation_name
 from .token_utils import resolve_config_token
 from ..graphql.generated.get_information_block import (
   GetInformationBlock,
@@ -545,19 +572,209 @@ def _parse_filename(content_disposition: str) -> str | None:
 class ReportBundleDownload:
   """Result of downloading a Report's serialization bundle.
 
-  ``content`` is the raw artifact bytes. ``filename`` is the
-  server-suggested name (``{report_id}-g{generation}.{ext}``).
-  ``path`` is populated when the caller passed a ``to=`` argument to
+  ``content`` is the raw artifact bytes, or ``None`` when the bundle was
+  streamed to disk. ``filename`` is the server-suggested name
+  (``{report_id}-g{generation}.{ext}``). ``path`` is populated when the
+  caller passed a ``to=`` argument to
   :meth:`LedgerClient.download_report_bundle` — points at the file
-  the SDK wrote to disk.
+  the SDK wrote to disk — and ``sha256`` is the hex digest of that file.
+  ``from_cache`` is True when the bytes came from the configured
+  :class:`ReportBundleCache` instead of a transfer.
   """
 
-  content: bytes
+  content: bytes | None
   filename: str
   format: str
   content_type: str
   generation_count: int | None
   path: Path | None = None
+  sha256: str | None = None
+  from_cache: bool = False
+
+
+@dataclass
+class JournalEntryOutcome:
+  """Outcome of one entry of :meth:`LedgerClient.create_journal_entries`.
+
+  ``index`` is the entry's position in the input; ``result`` is the
+  created :class:`EventBlockEnvelope` (``None`` on failure) and
+  ``attempts`` counts the requests sent, retries included.
+  """
+
+  index: int
+  idempotency_key: str
+  result: EventBlockEnvelope | None = None
+  error: str | None = None
+  attempts: int = 0
+
+  @property
+  def success(self) -> bool:
+    return self.error is None and self.result is not None
+
+
+@dataclass
+class JournalEntryBatchResult:
+  """Result of :meth:`LedgerClient.create_journal_entries`."""
+
+  outcomes: list[JournalEntryOutcome]
+  elapsed_seconds: float
+
+  @property
+  def failed(self) -> list[JournalEntryOutcome]:
+    return [o for o in self.outcomes if not o.success]
+
+  @property
+  def success(self) -> bool:
+    return not self.failed
+
+  @property
+  def entries_per_second(self) -> float:
+    if self.elapsed_seconds <= 0:
+      return 0.0
+    return len(self.outcomes) / self.elapsed_seconds
+
+
+class _ConfigTokenAuth(httpx.Auth):
+  """Set ``X-API-Key`` from the facade config on every request.
+
+  Lets one pooled client serve a long bulk run while a rotating
+  ``token_provider`` credential is re-resolved per request.
+  """
+
+  def __init__(self, config: dict[str, Any]):
+    self.config = config
+
+  def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, Any, None]:
+    token = resolve_config_token(self.config)
+    if token:
+      request.headers["X-API-Key"] = token
+    yield request
+
+
+class _RateLimiter:
+  """Request pacing shared by the workers of one bulk call.
+
+  Starts are spaced ``1 / rate`` seconds apart (no spacing without a
+  rate), and :meth:`pause` holds every worker back until a 429's
+  ``Retry-After`` has passed.
+  """
+
+  def __init__(self, rate: float | None):
+    self.interval = 1.0 / rate if rate else 0.0
+    self._next = 0.0
+    self._lock = threading.Lock()
+
+  def wait(self) -> None:
+    with self._lock:
+      now = time.monotonic()
+      start = max(now, self._next)
+      self._next = start + self.interval
+    if start > now:
+      time.sleep(start - now)
+
+  def pause(self, seconds: float) -> None:
+    with self._lock:
+      self._next = max(self._next, time.monotonic() + seconds)
+
+
+def _journal_entry_key(
+  graph_id: str, entry: dict[str, Any], occurrences: dict[str, int]
+) -> str:
+  """Deterministic idempotency key for an entry without one.
+
+  Hashes the graph and the entry's canonical JSON, plus the number of
+  identical entries already seen in this call — so genuine duplicates in
+  a GL export stay distinct while re-running the same input reproduces
+  the same keys, whatever the order.
+  """
+  canonical = json.dumps(
+    [graph_id, entry], sort_keys=True, separators=(",", ":"), default=str
+  )
+  digest = hashlib.sha256(canonical.encode()).hexdigest()
+  seen = occurrences.get(digest, 0)
+  occurrences[digest] = seen + 1
+  return f"je-{digest[:40]}-{seen}"
+
+
+def _result_field(result: Any, name: str) -> Any:
+  """``result.name`` for typed results, ``result[name]`` for plain dicts."""
+  if isinstance(result, dict):
+    return result.get(name)
+  return getattr(result, name, None)
+
+
+def _retry_after(response: Any) -> float | None:
+  """Seconds from a ``Retry-After`` header, when given as a number."""
+  try:
+    return max(0.0, float(response.headers.get("retry-after")))
+  except (AttributeError, TypeError, ValueError):
+    return None
+
+
+_COPY_CHUNK = 1024 * 1024
+
+
+def _stream_to_file(
+  chunks: Iterable[bytes], path: Path, *, expected_sha256: str | None = None
+) -> str:
+  """Write ``chunks`` to ``path`` via a temp file + atomic rename.
+
+  Returns the SHA-256 hex digest of the bytes written. The temp file
+  lives in the target directory so the final ``os.replace`` never
+  crosses a filesystem; on any failure (including a digest mismatch) it
+  is removed and ``path`` is left untouched.
+  """
+  path.parent.mkdir(parents=True, exist_ok=True)
+  digest = hashlib.sha256()
+  fd, tmp_name = tempfile.mkstemp(
+    prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+  )
+  try:
+    with os.fdopen(fd, "wb") as f:
+      for chunk in chunks:
+        f.write(chunk)
+        digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    if expected_sha256 is not None and hexdigest != expected_sha256.lower():
+      raise RuntimeError(
+        f"Checksum mismatch for {path.name}: expected {expected_sha256}, "
+        f"got {hexdigest}"
+      )
+    os.replace(tmp_name, path)
+  except BaseException:
+    with contextlib.suppress(OSError):
+      os.unlink(tmp_name)
+    raise
+  return hexdigest
+
+
+def _copy_cached_bundle(
+  entry: CachedBundle,
+  info: Any,
+  hit: bool,
+  *,
+  to: Path | None,
+  to_dir: Path | None,
+) -> ReportBundleDownload:
+  """The caller's copy of a cached blob: ``content``, or a file at
+  ``to`` / in ``to_dir``."""
+  result = ReportBundleDownload(
+    content=None,
+    filename=entry.filename,
+    format=info.format,
+    content_type=info.content_type,
+    generation_count=entry.generation_count,
+    sha256=entry.sha256,
+    from_cache=hit,
+  )
+  if to is None and to_dir is None:
+    result.content = entry.path.read_bytes()
+    return result
+  path = to if to is not None else to_dir / Path(entry.filename).name
+  with open(entry.path, "rb") as f:
+    _stream_to_file(iter(lambda: f.read(_COPY_CHUNK), b""), path)
+  result.path = path
+  return result
 
 
 class LedgerClient:
@@ -578,6 +795,11 @@ class LedgerClient:
     self.headers = config.get("headers", {})
     self.token = config.get("token")
     self.timeout = config.get("timeout", 60)
+    # Trusted server: reads return lazy views over the response instead of
+    # validating every nested object (see graphql/views.py).
+    self.trusted_server = config.get("graphql_trusted_server", False)
+    # Optional on-disk bundle cache consulted by download_report_bundle(s).
+    self.bundle_cache: ReportBundleCache | None = config.get("report_bundle_cache")
 
   def _get_client(self) -> AuthenticatedClient:
     # Resolved per call: a configured `token_provider` wins over the
@@ -591,6 +813,7 @@ class LedgerClient:
       prefix="",
       auth_header_name="X-API-Key",
       headers=self.headers,
+      httpx_args=single_flight_httpx_args(self.config),
     )
 
   def _get_graphql_client(self) -> GraphQLClient:
@@ -609,6 +832,9 @@ class LedgerClient:
       token=token,
       headers=self.headers,
       timeout=self.timeout,
+      persisted_queries=self.config.get("graphql_persisted_queries", False),
+      use_get=self.config.get("graphql_use_get", False),
+      single_flight=self.config.get("single_flight"),
     )
 
   # ── Helpers ─────────────────────────────────────────────────────────
@@ -624,11 +850,31 @@ class LedgerClient:
     ``None`` values in ``variables`` are stripped before sending — the
     facade takes ``None`` to mean "not provided", and some Strawberry
     resolvers treat an explicit ``null`` differently from an unset arg.
-    See ``strip_none_vars`` in ``graphql/client.py``.
+    See ``strip_none_vars`` in ``graphql/client.py``. With a
+    ``read_cache`` configured, reads of the endpoints it has a policy
+    for are served from it (see ``read_cache.py``).
     """
     cleaned = strip_none_vars(variables) if variables else None
+    cache = self.config.get("read_cache")
+    if cache is not None:
+      return cache.get(
+        operation_name(query),
+        graph_id,
+        cleaned,
+        lambda: self._get_graphql_client().execute(graph_id, query, cleaned),
+        document=query,
+        scope=credential_scope(
+          self.base_url, resolve_config_token(self.config), self.headers
+        ),
+      )
     return self._get_graphql_client().execute(graph_id, query, cleaned)
 
+  def _invalidate_reads(self, graph_id: str, operation: str) -> None:
+    """Drop the cached reads a successful write ``operation`` changed."""
+    cache = self.config.get("read_cache")
+    if cache is not None:
+      cache.on_write(operation, graph_id)
+
   # The backend's `OperationEnvelope` is generic on the result type
   # (`OperationEnvelope[T]`). Each typed op generates a separate
   # `OperationEnvelope<ResultType>` attrs class in the SDK, with no
@@ -759,14 +1005,14 @@ class LedgerClient:
     Returns None when the ledger has no entity yet.
     """
     data = self._query(graph_id, GET_LEDGER_ENTITY_GQL)
-    return GetLedgerEntity.model_validate(data).entity
+    return parse_model(GetLedgerEntity, data, trusted=self.trusted_server).entity
 
   def list_entities(
     self, graph_id: str, source: str | None = None
   ) -> list[ListLedgerEntitiesEntities]:
     """List all entities for this graph, optionally filtered by source system."""
     data = self._query(graph_id, LIST_LEDGER_ENTITIES_GQL, {"source": source})
-    return ListLedgerEntities.model_validate(data).entities
+    return parse_model(ListLedgerEntities, data, trusted=self.trusted_server).entities
 
   def update_entity(
     self, graph_id: str, updates: dict[str, Any]
@@ -786,7 +1032,7 @@ class LedgerClient:
     snake_case) rather than a dict.
     """
     data = self._query(graph_id, GET_LEDGER_SUMMARY_GQL)
-    return GetLedgerSummary.model_validate(data).summary
+    return parse_model(GetLedgerSummary, data, trusted=self.trusted_server).summary
 
   # ── Accounts ────────────────────────────────────────────────────────
 
@@ -809,12 +1055,19 @@ class LedgerClient:
         "offset": offset,
       },
     )
-    return ListLedgerAccounts.model_validate(data).accounts
+    return parse_model(ListLedgerAccounts, data, trusted=self.trusted_server).accounts
 
   def get_account_tree(self, graph_id: str) -> LedgerAccountTree | None:
     """Hierarchical Chart of Accounts (up to 4 levels deep)."""
     data = self._query(graph_id, GET_LEDGER_ACCOUNT_TREE_GQL)
-    return GetLedgerAccountTree.model_validate(data).account_tree
+    return parse_model(
+      GetLedgerAccountTree, data, trusted=self.trusted_server
+    ).account_tree
+
+  def get_account_index(self, graph_id: str) -> AccountIndex | None:
+    """Chart of Accounts as an :class:`AccountIndex` for local lookups and rollups."""
+    tree = self.get_account_tree(graph_id)
+    return AccountIndex.from_tree(tree) if tree is not None else None
 
   def get_account_rollups(
     self,
@@ -829,7 +1082,9 @@ class LedgerClient:
       GET_LEDGER_ACCOUNT_ROLLUPS_GQL,
       {"mappingId": mapping_id, "startDate": start_date, "endDate": end_date},
     )
-    return GetLedgerAccountRollups.model_validate(data).account_rollups
+    return parse_model(
+      GetLedgerAccountRollups, data, trusted=self.trusted_server
+    ).account_rollups
 
   # ── Transactions ────────────────────────────────────────────────────
 
@@ -854,7 +1109,9 @@ class LedgerClient:
         "offset": offset,
       },
     )
-    return ListLedgerTransactions.model_validate(data).transactions
+    return parse_model(
+      ListLedgerTransactions, data, trusted=self.trusted_server
+    ).transactions
 
   def get_transaction(
     self, graph_id: str, transaction_id: str
@@ -863,7 +1120,9 @@ class LedgerClient:
     data = self._query(
       graph_id, GET_LEDGER_TRANSACTION_GQL, {"transactionId": transaction_id}
     )
-    return GetLedgerTransaction.model_validate(data).transaction
+    return parse_model(
+      GetLedgerTransaction, data, trusted=self.trusted_server
+    ).transaction
 
   # ── Event blocks (inbox surface) ───────────────────────────────────
 
@@ -892,12 +1151,16 @@ class LedgerClient:
         "offset": offset,
       },
     )
-    return ListLedgerEventBlocks.model_validate(data).event_blocks
+    return parse_model(
+      ListLedgerEventBlocks, data, trusted=self.trusted_server
+    ).event_blocks
 
   def get_event_block(self, graph_id: str, event_id: str) -> LedgerEventBlock | None:
     """Get event block detail by id."""
     data = self._query(graph_id, GET_LEDGER_EVENT_BLOCK_GQL, {"id": event_id})
-    return GetLedgerEventBlock.model_validate(data).event_block
+    return parse_model(
+      GetLedgerEventBlock, data, trusted=self.trusted_server
+    ).event_block
 
   # ── Agents (REA counterparties) ────────────────────────────────────
 
@@ -922,12 +1185,12 @@ class LedgerClient:
         "offset": offset,
       },
     )
-    return ListLedgerAgents.model_validate(data).agents
+    return parse_model(ListLedgerAgents, data, trusted=self.trusted_server).agents
 
   def get_agent(self, graph_id: str, agent_id: str) -> LedgerAgent | None:
     """Get agent detail by id."""
     data = self._query(graph_id, GET_LEDGER_AGENT_GQL, {"id": agent_id})
-    return GetLedgerAgent.model_validate(data).agent
+    return parse_model(GetLedgerAgent, data, trusted=self.trusted_server).agent
 
   # ── Trial balance ──────────────────────────────────────────────────
 
@@ -943,7 +1206,9 @@ class LedgerClient:
       GET_LEDGER_TRIAL_BALANCE_GQL,
       {"startDate": start_date, "endDate": end_date},
     )
-    return GetLedgerTrialBalance.model_validate(data).trial_balance
+    return parse_model(
+      GetLedgerTrialBalance, data, trusted=self.trusted_server
+    ).trial_balance
 
   def get_mapped_trial_balance(
     self,
@@ -958,14 +1223,18 @@ class LedgerClient:
       GET_LEDGER_MAPPED_TRIAL_BALANCE_GQL,
       {"mappingId": mapping_id, "startDate": start_date, "endDate": end_date},
     )
-    return GetLedgerMappedTrialBalance.model_validate(data).mapped_trial_balance
+    return parse_model(
+      GetLedgerMappedTrialBalance, data, trusted=self.trusted_server
+    ).mapped_trial_balance
 
   # ── Taxonomy ────────────────────────────────────────────────────────
 
   def get_reporting_taxonomy(self, graph_id: str) -> ReportingTaxonomy | None:
     """The locked US GAAP reporting taxonomy for this graph."""
     data = self._query(graph_id, GET_LEDGER_REPORTING_TAXONOMY_GQL)
-    return GetLedgerReportingTaxonomy.model_validate(data).reporting_taxonomy
+    return parse_model(
+      GetLedgerReportingTaxonomy, data, trusted=self.trusted_server
+    ).reporting_taxonomy
 
   def list_taxonomies(
     self, graph_id: str, taxonomy_type: str | None = None
@@ -974,7 +1243,9 @@ class LedgerClient:
     data = self._query(
       graph_id, LIST_LEDGER_TAXONOMIES_GQL, {"taxonomyType": taxonomy_type}
     )
-    page = ListLedgerTaxonomies.model_validate(data).taxonomies
+    page = parse_model(
+      ListLedgerTaxonomies, data, trusted=self.trusted_server
+    ).taxonomies
     return page.taxonomies if page else []
 
   def create_taxonomy_block(
@@ -991,6 +1262,7 @@ class LedgerClient:
       idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
     )
     envelope = self._call_op("Create taxonomy block", response)
+    self._invalidate_reads(graph_id, "create-taxonomy-block")
     return self._typed_result("Create taxonomy block", envelope, TaxonomyBlockEnvelope)
 
   def update_taxonomy_block(
@@ -1002,6 +1274,7 @@ class LedgerClient:
       graph_id=graph_id, body=request, client=self._get_client()
     )
     envelope = self._call_op("Update taxonomy block", response)
+    self._invalidate_reads(graph_id, "update-taxonomy-block")
     return self._typed_result("Update taxonomy block", envelope, TaxonomyBlockEnvelope)
 
   def delete_taxonomy_block(
@@ -1015,6 +1288,7 @@ class LedgerClient:
       graph_id=graph_id, body=request, client=self._get_client()
     )
     envelope = self._call_op("Delete taxonomy block", response)
+    self._invalidate_reads(graph_id, "delete-taxonomy-block")
     return self._typed_result(
       "Delete taxonomy block",
       envelope,
@@ -1067,6 +1341,7 @@ class LedgerClient:
       graph_id=graph_id, body=body, client=self._get_client()
     )
     envelope = self._call_op("Link entity taxonomy", response)
+    self._invalidate_reads(graph_id, "link-entity-taxonomy")
     return self._typed_result("Link entity taxonomy", envelope, EntityTaxonomyResponse)
 
   def list_elements(
@@ -1092,7 +1367,7 @@ class LedgerClient:
         "offset": offset,
       },
     )
-    return ListLedgerElements.model_validate(data).elements
+    return parse_model(ListLedgerElements, data, trusted=self.trusted_server).elements
 
   def list_unmapped_elements(
     self, graph_id: str, mapping_id: str | None = None
@@ -1101,7 +1376,9 @@ class LedgerClient:
     data = self._query(
       graph_id, LIST_LEDGER_UNMAPPED_ELEMENTS_GQL, {"mappingId": mapping_id}
     )
-    return ListLedgerUnmappedElements.model_validate(data).unmapped_elements
+    return parse_model(
+      ListLedgerUnmappedElements, data, trusted=self.trusted_server
+    ).unmapped_elements
 
   # ── Structures / mappings ──────────────────────────────────────────
 
@@ -1117,19 +1394,21 @@ class LedgerClient:
       LIST_LEDGER_STRUCTURES_GQL,
       {"taxonomyId": taxonomy_id, "blockType": block_type},
     )
-    page = ListLedgerStructures.model_validate(data).structures
+    page = parse_model(
+      ListLedgerStructures, data, trusted=self.trusted_server
+    ).structures
     return page.structures if page else []
 
   def list_mappings(self, graph_id: str) -> list[ListLedgerMappingsMappingsStructures]:
     """List active CoA→reporting mapping structures."""
     data = self._query(graph_id, LIST_LEDGER_MAPPINGS_GQL)
-    page = ListLedgerMappings.model_validate(data).mappings
+    page = parse_model(ListLedgerMappings, data, trusted=self.trusted_server).mappings
     return page.structures if page else []
 
   def get_mapping(self, graph_id: str, mapping_id: str) -> LedgerMapping | None:
     """Get a mapping structure with all its associations."""
     data = self._query(graph_id, GET_LEDGER_MAPPING_GQL, {"mappingId": mapping_id})
-    return GetLedgerMapping.model_validate(data).mapping
+    return parse_model(GetLedgerMapping, data, trusted=self.trusted_server).mapping
 
   def get_mapping_coverage(
     self, graph_id: str, mapping_id: str
@@ -1138,7 +1417,9 @@ class LedgerClient:
     data = self._query(
       graph_id, GET_LEDGER_MAPPING_COVERAGE_GQL, {"mappingId": mapping_id}
     )
-    return GetLedgerMappingCoverage.model_validate(data).mapping_coverage
+    return parse_model(
+      GetLedgerMappingCoverage, data, trusted=self.trusted_server
+    ).mapping_coverage
 
   def get_mapping_candidates(
     self, graph_id: str, classification: str
@@ -1152,7 +1433,9 @@ class LedgerClient:
     data = self._query(
       graph_id, MAPPING_CANDIDATES_GQL, {"classification": classification}
     )
-    return MappingCandidates.model_validate(data).mapping_candidates
+    return parse_model(
+      MappingCandidates, data, trusted=self.trusted_server
+    ).mapping_candidates
 
   def create_mapping_association(
     self,
@@ -1244,7 +1527,9 @@ class LedgerClient:
         "seriesForecast": series_forecast,
       },
     )
-    return GetInformationBlock.model_validate(data).information_block
+    return parse_model(
+      GetInformationBlock, data, trusted=self.trusted_server
+    ).information_block
 
   def list_information_blocks(
     self,
@@ -1270,7 +1555,9 @@ class LedgerClient:
         "offset": offset,
       },
     )
-    return ListInformationBlocks.model_validate(data).information_blocks
+    return parse_model(
+      ListInformationBlocks, data, trusted=self.trusted_server
+    ).information_blocks
 
   def create_information_block(
     self,
@@ -1575,12 +1862,16 @@ class LedgerClient:
       GET_LEDGER_PERIOD_CLOSE_STATUS_GQL,
       {"periodStart": period_start, "periodEnd": period_end},
     )
-    return GetLedgerPeriodCloseStatus.model_validate(data).period_close_status
+    return parse_model(
+      GetLedgerPeriodCloseStatus, data, trusted=self.trusted_server
+    ).period_close_status
 
   def list_period_drafts(self, graph_id: str, period: str) -> PeriodDrafts | None:
     """All draft entries in a period, fully expanded for review pre-close."""
     data = self._query(graph_id, GET_LEDGER_PERIOD_DRAFTS_GQL, {"period": period})
-    return GetLedgerPeriodDrafts.model_validate(data).period_drafts
+    return parse_model(
+      GetLedgerPeriodDrafts, data, trusted=self.trusted_server
+    ).period_drafts
 
   def create_closing_entry(
     self,
@@ -1655,6 +1946,35 @@ class LedgerClient:
 
     Returns the EventBlockEnvelope (event row fields).
     """
+    body = self._journal_entry_request(
+      posting_date=posting_date,
+      memo=memo,
+      line_items=line_items,
+      type=type,
+      status=status,
+      transaction_id=transaction_id,
+      source=source,
+    )
+    response = op_create_event_block(
+      graph_id=graph_id,
+      body=body,
+      client=self._get_client(),
+      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+    )
+    envelope = self._call_op("Create journal entry", response)
+    return self._typed_result("Create journal entry", envelope, EventBlockEnvelope)
+
+  def _journal_entry_request(
+    self,
+    *,
+    posting_date: str,
+    memo: str,
+    line_items: list[dict[str, Any]],
+    type: str = "standard",  # noqa: A002
+    status: str = "draft",
+    transaction_id: str | None = None,
+    source: str = "manual",
+  ) -> CreateEventBlockRequest:
     metadata: dict[str, Any] = {
       "posting_date": posting_date,
       "memo": memo,
@@ -1664,21 +1984,180 @@ class LedgerClient:
     }
     if transaction_id is not None:
       metadata["transaction_id"] = transaction_id
-    body = self._build_event_block_request(
+    return self._build_event_block_request(
       event_type="journal_entry_recorded",
       event_category="adjustment",
       occurred_at=posting_date,
       metadata=metadata,
       source=source,
     )
-    response = op_create_event_block(
-      graph_id=graph_id,
-      body=body,
-      client=self._get_client(),
-      idempotency_key=idempotency_key if idempotency_key is not None else UNSET,
+
+  def create_journal_entries(
+    self,
+    graph_id: str,
+    entries: Iterable[dict[str, Any]],
+    *,
+    concurrency: int = 8,
+    chunk: int = 500,
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    requests_per_second: float | None = None,
+    on_progress: Callable[[int], None] | None = None,
+  ) -> JournalEntryBatchResult:
+    """Create many journal entries on a bounded worker pool.
+
+    Each entry is a dict of :meth:`create_journal_entry` keyword
+    arguments. Every request carries an idempotency key — the entry's
+    own ``idempotency_key`` if present, otherwise one derived from the
+    graph, the entry's content and how many identical entries preceded
+    it — so a failed or interrupted import can be re-run with the same
+    input and replays return the original envelopes instead of
+    duplicating entries (within the server's 24-hour replay window).
+
+    Entries are read from ``entries`` ``chunk`` at a time, so a
+    generator over a large GL export is never materialized. Transport
+    errors, 5xx and 429 responses are retried up to ``max_retries``
+    times with exponential backoff from ``retry_delay`` seconds; a 429's
+    ``Retry-After`` pauses every worker, and ``requests_per_second``
+    caps the request rate across workers. Other errors (validation, 409
+    conflicts) fail the entry without aborting the import.
+
+    The server has no bulk journal-entry operation, so each entry is
+    still one ``create-event-block`` request.
+
+    Args:
+        graph_id: Target graph
+        entries: ``create_journal_entry`` keyword arguments per entry
+        concurrency: Requests in flight at once
+        chunk: Entries read and dispatched per round
+        max_retries: Retries per entry for retryable failures
+        retry_delay: Initial backoff in seconds, doubled per retry
+        requests_per_second: Optional cap on the overall request rate
+        on_progress: Called with the number of entries finished after
+            each chunk
+
+    Returns:
+        :class:`JournalEntryBatchResult` with one outcome per entry, in
+        input order
+    """
+    limiter = _RateLimiter(requests_per_second)
+    occurrences: dict[str, int] = {}
+    outcomes: list[JournalEntryOutcome] = []
+    start = time.monotonic()
+    iterator = iter(entries)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+      while batch := list(islice(iterator, max(1, chunk))):
+        # One client per chunk: connections are pooled across the chunk's
+        # requests, and a rotating token is re-resolved between chunks.
+        client = self._get_client()
+        http = client.get_httpx_client()
+        try:
+          futures = []
+          for entry in batch:
+            index = len(outcomes) + len(futures)
+            key = entry.get("idempotency_key") or _journal_entry_key(
+              graph_id, entry, occurrences
+            )
+            futures.append(
+              pool.submit(
+                self._post_journal_entry,
+                client,
+                graph_id,
+                index,
+                entry,
+                key,
+                limiter,
+                max_retries,
+                retry_delay,
+              )
+            )
+          outcomes.extend(future.result() for future in futures)
+        finally:
+          http.close()
+        if on_progress is not None:
+          on_progress(len(outcomes))
+    return JournalEntryBatchResult(
+      outcomes=outcomes, elapsed_seconds=time.monotonic() - start
+    )
+
+  def _post_journal_entry(
+    self,
+    client: AuthenticatedClient,
+    graph_id: str,
+    index: int,
+    entry: dict[str, Any],
+    idempotency_key: str,
+    limiter: _RateLimiter,
+    max_retries: int,
+    retry_delay: float,
+  ) -> JournalEntryOutcome:
+    outcome = JournalEntryOutcome(index=index, idempotency_key=idempotency_key)
+    try:
+      body = self._journal_entry_request(
+        **{k: v for k, v in entry.items() if k != "idempotency_key"}
+      )
+    except (TypeError, ValueError) as e:
+      outcome.error = f"Invalid entry: {e}"
+      return outcome
+
+    outcome.result, outcome.error, outcome.attempts = self._retrying_op(
+      "Create journal entry",
+      lambda: op_create_event_block(
+        graph_id=graph_id,
+        body=body,
+        client=client,
+        idempotency_key=idempotency_key,
+      ),
+      EventBlockEnvelope,
+      limiter,
+      max_retries,
+      retry_delay,
     )
-    envelope = self._call_op("Create journal entry", response)
-    return self._typed_result("Create journal entry", envelope, EventBlockEnvelope)
+    return outcome
+
+  def _retrying_op(
+    self,
+    label: str,
+    send: Callable[[], Any],
+    expected: type[Any],
+    limiter: _RateLimiter,
+    max_retries: int,
+    retry_delay: float,
+  ) -> tuple[Any, str | None, int]:
+    """Run one op for a bulk method: ``(result, error, attempts)``.
+
+    Transport errors, 5xx and 429 are retried with exponential backoff
+    (or the response's ``Retry-After``); a 429 also pauses ``limiter``
+    for every worker. Other failures return immediately. Never raises
+    for a failed request.
+    """
+    error: str | None = None
+    attempts = 0
+    for attempt in range(max(0, max_retries) + 1):
+      attempts = attempt + 1
+      limiter.wait()
+      retry_after = None
+      try:
+        response = send()
+      except httpx.TransportError as e:
+        error = f"{label} failed: {type(e).__name__}: {e}"
+      else:
+        status = response.status_code
+        if status in (HTTPStatus.OK, HTTPStatus.ACCEPTED):
+          try:
+            envelope = self._call_op(label, response)
+            return self._typed_result(label, envelope, expected), None, attempts
+          except RuntimeError as e:
+            return None, str(e), attempts
+        error = f"{label} failed: {status}: {response.content!r}"
+        if status != HTTPStatus.TOO_MANY_REQUESTS and status < 500:
+          return None, error, attempts
+        retry_after = _retry_after(response)
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+          limiter.pause(retry_after if retry_after is not None else retry_delay)
+      if attempt < max_retries:
+        time.sleep(retry_after if retry_after is not None else retry_delay * 2**attempt)
+    return None, error, attempts
 
   def update_journal_entry(
     self, graph_id: str, body: dict[str, Any]
@@ -1786,6 +2265,174 @@ class LedgerClient:
       "Preview event block", envelope, PreviewEventBlockResponse
     )
 
+  def ingest_event_blocks(
+    self,
+    graph_id: str,
+    events: Iterable[dict[str, Any]],
+    *,
+    key: Callable[[dict[str, Any]], str] | None = None,
+    checkpoint: str | Path | IngestCheckpoint | None = None,
+    preview: bool = False,
+    concurrency: int = 8,
+    max_pending: int | None = None,
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    requests_per_second: float | None = None,
+    on_progress: Callable[[int], None] | None = None,
+  ) -> EventIngestResult:
+    """Create many event blocks through a bounded, resumable pipeline.
+
+    ``events`` (``create_event_block`` bodies) is consumed lazily: at
+    most ``max_pending`` events (default ``4 * concurrency``) are in
+    flight, and reading stops while the workers catch up. Each event's
+    ``key`` (default :func:`~.event_ingest.event_key`, a hash of the
+    body) drops repeats of an earlier event before anything is sent and
+    is sent as the idempotency key.
+
+    With ``checkpoint`` (a path or an :class:`IngestCheckpoint`), every
+    created event's key is appended to the checkpoint as it completes and
+    keys already there are skipped, so re-running a crashed ingestion
+    with the same input and checkpoint resumes where it stopped. Events
+    in flight during the crash are resent with the same idempotency key
+    and replayed by the server rather than posted twice.
+
+    With ``preview=True`` each event is dry-run through
+    ``preview-event-block`` on the same workers first and created only
+    if the preview reports it would succeed. Failed requests are retried
+    as in :meth:`create_journal_entries`; no single event aborts the run.
+
+    Args:
+        graph_id: Target graph
+        events: ``CreateEventBlockRequest``-shaped dicts
+        key: Dedup / idempotency key for an event body
+        checkpoint: Checkpoint file or object for resumable runs
+        preview: Preview every event before creating it
+        concurrency: Worker threads
+        max_pending: Events submitted but not finished, at most
+        max_retries: Retries per request for retryable failures
+        retry_delay: Initial backoff in seconds, doubled per retry
+        requests_per_second: Optional cap on the overall request rate
+        on_progress: Called with the number of finished events as
+            they complete
+
+    Returns:
+        :class:`EventIngestResult` with one outcome per input event
+    """
+    key_for = key or event_key
+    owned = checkpoint is not None and not isinstance(checkpoint, IngestCheckpoint)
+    journal = IngestCheckpoint(checkpoint) if owned else checkpoint
+    limiter = _RateLimiter(requests_per_second)
+    workers = max(1, concurrency)
+    limit = max(1, max_pending or 4 * workers)
+    outcomes: list[EventBlockOutcome] = []
+    seen: set[str] = set()
+    pending: set[Future[EventBlockOutcome]] = set()
+    start = time.monotonic()
+
+    def finish(done: Iterable[Future[EventBlockOutcome]]) -> None:
+      outcomes.extend(future.result() for future in done)
+      if on_progress is not None:
+        on_progress(len(outcomes))
+
+    # One pooled client for the run. The credential is resolved per
+    # request, so a rotating `token_provider` is picked up mid-run.
+    client = self._get_client()
+    http = client.get_httpx_client()
+    http.auth = _ConfigTokenAuth(self.config)
+    try:
+      with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, body in enumerate(events):
+          event = key_for(body)
+          if event in seen:
+            outcomes.append(EventBlockOutcome(index, event, DUPLICATE))
+            continue
+          seen.add(event)
+          if journal is not None and event in journal:
+            outcomes.append(EventBlockOutcome(index, event, CHECKPOINTED))
+            continue
+          while len(pending) >= limit:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            finish(done)
+          pending.add(
+            pool.submit(
+              self._ingest_event_block,
+              client,
+              graph_id,
+              index,
+              body,
+              event,
+              journal,
+              preview,
+              limiter,
+              max_retries,
+              retry_delay,
+            )
+          )
+        finish(wait(pending).done)
+    finally:
+      http.close()
+      if owned:
+        journal.close()
+    outcomes.sort(key=lambda o: o.index)
+    return EventIngestResult(
+      outcomes=outcomes, elapsed_seconds=time.monotonic() - start
+    )
+
+  def _ingest_event_block(
+    self,
+    client: AuthenticatedClient,
+    graph_id: str,
+    index: int,
+    body: dict[str, Any],
+    key: str,
+    journal: IngestCheckpoint | None,
+    preview: bool,
+    limiter: _RateLimiter,
+    max_retries: int,
+    retry_delay: float,
+  ) -> EventBlockOutcome:
+    outcome = EventBlockOutcome(index, key, FAILED)
+    try:
+      request = CreateEventBlockRequest.from_dict(body)
+    except (KeyError, TypeError, ValueError) as e:
+      outcome.error = f"Invalid event block: {e}"
+      return outcome
+
+    if preview:
+      outcome.preview, outcome.error, outcome.attempts = self._retrying_op(
+        "Preview event block",
+        lambda: op_preview_event_block(graph_id=graph_id, body=request, client=client),
+        PreviewEventBlockResponse,
+        limiter,
+        max_retries,
+        retry_delay,
+      )
+      if outcome.error is not None:
+        return outcome
+      if not _result_field(outcome.preview, "would_succeed"):
+        outcome.status = REJECTED
+        errors = _result_field(outcome.preview, "validation_errors")
+        outcome.error = "; ".join(errors) if isinstance(errors, list) else None
+        return outcome
+
+    result, outcome.error, attempts = self._retrying_op(
+      "Create event block",
+      lambda: op_create_event_block(
+        graph_id=graph_id, body=request, client=client, idempotency_key=key
+      ),
+      EventBlockEnvelope,
+      limiter,
+      max_retries,
+      retry_delay,
+    )
+    outcome.attempts += attempts
+    if outcome.error is None:
+      outcome.status = CREATED
+      outcome.result = result
+      if journal is not None:
+        journal.record(key, _result_field(result, "id"))
+    return outcome
+
   def update_event_block(
     self,
     graph_id: str,
@@ -1945,19 +2592,32 @@ class LedgerClient:
     envelope = self._call_op("Build fact grid", response)
     return self._typed_result("Build fact grid", envelope, ViewResponse)
 
+  def get_fact_grid(self, graph_id: str, request: dict[str, Any]) -> FactGrid:
+    """:meth:`build_fact_grid`, wrapped for columnar access.
+
+    The returned :class:`FactGrid` converts the facts with
+    ``to_dataframe()`` (long, or ``pivot=True`` for element × period)
+    or ``to_arrow()``, without going through per-record ``to_dict()``.
+    """
+    return FactGrid(self.build_fact_grid(graph_id, request))
+
   # ── Closing book ───────────────────────────────────────────────────
 
   def get_closing_book_structures(self, graph_id: str) -> ClosingBookStructures | None:
     """Grouped closing book structures for the close-screen sidebar."""
     data = self._query(graph_id, GET_LEDGER_CLOSING_BOOK_STRUCTURES_GQL)
-    return GetLedgerClosingBookStructures.model_validate(data).closing_book_structures
+    return parse_model(
+      GetLedgerClosingBookStructures, data, trusted=self.trusted_server
+    ).closing_book_structures
 
   # ── Fiscal Calendar ────────────────────────────────────────────────
 
   def get_fiscal_calendar(self, graph_id: str) -> FiscalCalendar | None:
     """Current fiscal calendar state — pointers, gap, closeable status."""
     data = self._query(graph_id, GET_LEDGER_FISCAL_CALENDAR_GQL)
-    return GetLedgerFiscalCalendar.model_validate(data).fiscal_calendar
+    return parse_model(
+      GetLedgerFiscalCalendar, data, trusted=self.trusted_server
+    ).fiscal_calendar
 
   def initialize_ledger(
     self,
@@ -1987,6 +2647,7 @@ class LedgerClient:
       graph_id=graph_id, body=body, client=self._get_client()
     )
     envelope = self._call_op("Initialize ledger", response)
+    self._invalidate_reads(graph_id, "initialize-ledger")
     return self._typed_result("Initialize ledger", envelope, InitializeLedgerResponse)
 
   def set_close_target(
@@ -2004,6 +2665,7 @@ class LedgerClient:
       graph_id=graph_id, body=body, client=self._get_client()
     )
     envelope = self._call_op("Set close target", response)
+    self._invalidate_reads(graph_id, "set-close-target")
     return self._typed_result("Set close target", envelope, FiscalCalendarResponse)
 
   def close_period(
@@ -2021,6 +2683,7 @@ class LedgerClient:
     )
     response = op_close_period(graph_id=graph_id, body=body, client=self._get_client())
     envelope = self._call_op("Close period", response)
+    self._invalidate_reads(graph_id, "close-period")
     return self._typed_result("Close period", envelope, ClosePeriodResponse)
 
   def reopen_period(
@@ -2038,6 +2701,7 @@ class LedgerClient:
     )
     response = op_reopen_period(graph_id=graph_id, body=body, client=self._get_client())
     envelope = self._call_op("Reopen period", response)
+    self._invalidate_reads(graph_id, "reopen-period")
     return self._typed_result("Reopen period", envelope, FiscalCalendarResponse)
 
   # ── Reports ─────────────────────────────────────────────────────────
@@ -2075,13 +2739,13 @@ class LedgerClient:
   def list_reports(self, graph_id: str) -> list[ListLedgerReportsReportsReports]:
     """List all reports for a graph (includes received shared reports)."""
     data = self._query(graph_id, LIST_LEDGER_REPORTS_GQL)
-    page = ListLedgerReports.model_validate(data).reports
+    page = parse_model(ListLedgerReports, data, trusted=self.trusted_server).reports
     return page.reports if page else []
 
   def get_report(self, graph_id: str, report_id: str) -> LedgerReport | None:
     """Get a single report with its period list + available structures."""
     data = self._query(graph_id, GET_LEDGER_REPORT_GQL, {"reportId": report_id})
-    return GetLedgerReport.model_validate(data).report
+    return parse_model(GetLedgerReport, data, trusted=self.trusted_server).report
 
   def get_report_package(self, graph_id: str, report_id: str) -> ReportPackage | None:
     """Rehydrate a Report as a package — Report metadata + N rendered
@@ -2093,7 +2757,9 @@ class LedgerClient:
     pinned to its specific FactSet snapshot.
     """
     data = self._query(graph_id, GET_LEDGER_REPORT_PACKAGE_GQL, {"reportId": report_id})
-    return GetLedgerReportPackage.model_validate(data).report_package
+    return parse_model(
+      GetLedgerReportPackage, data, trusted=self.trusted_server
+    ).report_package
 
   def get_statement(
     self, graph_id: str, report_id: str, block_type: str
@@ -2107,7 +2773,7 @@ class LedgerClient:
       GET_LEDGER_STATEMENT_GQL,
       {"reportId": report_id, "blockType": block_type},
     )
-    return GetLedgerStatement.model_validate(data).statement
+    return parse_model(GetLedgerStatement, data, trusted=self.trusted_server).statement
 
   def regenerate_report(
     self,
@@ -2159,6 +2825,7 @@ class LedgerClient:
     format: str = "jsonld",
     to: str | Path | None = None,
     expires_in: int = 300,
+    expected_sha256: str | None = None,
   ) -> ReportBundleDownload:
     """Download a published Report's serialization bundle (JSON-LD or XBRL 2.1).
 
@@ -2168,6 +2835,13 @@ class LedgerClient:
     JSON-LD is stamped at publish time; XBRL is materialized + cached on
     first request. The client follows the URL and pulls the bytes.
 
+    Without ``to`` the artifact is returned in memory (``content``).
+    With ``to`` the body is streamed to a temp file beside the target and
+    atomically renamed into place once complete, so large XBRL zips are
+    never held in RAM and a failed transfer never leaves a truncated
+    file behind; ``content`` is ``None`` and ``sha256`` carries the
+    digest computed while streaming.
+
     Args:
         graph_id: Graph identifier owning the Report.
         report_id: Report identifier (``rpt_``-prefixed ULID).
@@ -2176,19 +2850,21 @@ class LedgerClient:
             scene/boundary/projection holon), or ``"xbrl-2.1"``. The enum
             names ``"JSONLD"`` / ``"HOLON_JSONLD"`` / ``"XBRL_2_1"`` are
             also accepted.
-        to: Optional file path to write the bytes to. When set, the
+        to: Optional file path to stream the bytes to. When set, the
             returned ``ReportBundleDownload.path`` points at the
             written file.
         expires_in: Presigned URL lifetime in seconds (60–3600).
+        expected_sha256: Optional hex digest the streamed file must
+            match (requires ``to``). On mismatch nothing is written.
 
     Returns:
-        :class:`ReportBundleDownload` with the artifact bytes,
-        server-suggested filename, content type, generation count,
-        and (when ``to`` is set) the path written.
+        :class:`ReportBundleDownload` with the artifact bytes (or the
+        written path), server-suggested filename, content type,
+        generation count, and SHA-256 digest when streamed.
 
     Raises:
-        RuntimeError: the report doesn't exist, or the presigned URL
-            could not be followed.
+        RuntimeError: the report doesn't exist, the presigned URL
+            could not be followed, or the digest didn't match.
         GraphQLError: the report exists but has no published bundle
             (``REPORT_BUNDLE_NOT_AVAILABLE``), or another GraphQL error.
         httpx.TimeoutException: following the presigned URL exceeded
@@ -2199,47 +2875,209 @@ class LedgerClient:
             connection refused, TLS); not wrapped so the original
             networking context surfaces in tracebacks.
     """
+    if expected_sha256 is not None and to is None:
+      raise ValueError("expected_sha256 requires to=")
+    gql_format, info = self._resolve_report_download(
+      graph_id, report_id, format, expires_in
+    )
+    with httpx.Client(timeout=self.timeout) as client:
+      return self._fetch_report_bundle(
+        client,
+        graph_id,
+        report_id,
+        gql_format,
+        info,
+        to=Path(to) if to is not None else None,
+        expected_sha256=expected_sha256,
+      )
+
+  def download_report_bundles(
+    self,
+    graph_id: str,
+    report_ids: list[str],
+    *,
+    format: str = "jsonld",
+    to_dir: str | Path | None = None,
+    concurrency: int = 4,
+    expires_in: int = 300,
+  ) -> dict[str, ReportBundleDownload | Exception]:
+    """Download the bundles of many Reports concurrently.
+
+    Each report resolves its own presigned URL and is fetched on one of
+    ``concurrency`` worker threads sharing a single connection pool.
+    With ``to_dir`` every bundle is streamed to
+    ``to_dir/<server filename>`` exactly like
+    :meth:`download_report_bundle` with ``to=``; without it the bytes
+    are returned in memory.
+
+    One failing report doesn't abort the export: the result maps every
+    ``report_id`` to either its :class:`ReportBundleDownload` or the
+    exception raised while downloading it, in input order.
+    """
+    directory = Path(to_dir) if to_dir is not None else None
+    if directory is not None:
+      directory.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(concurrency, len(report_ids)))
+    limits = httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+
+    def download(client: httpx.Client, report_id: str) -> ReportBundleDownload:
+      gql_format, info = self._resolve_report_download(
+        graph_id, report_id, format, expires_in
+      )
+      return self._fetch_report_bundle(
+        client, graph_id, report_id, gql_format, info, to_dir=directory
+      )
+
+    results: dict[str, ReportBundleDownload | Exception] = {}
+    with (
+      httpx.Client(timeout=self.timeout, limits=limits) as client,
+      ThreadPoolExecutor(max_workers=workers) as pool,
+    ):
+      futures = {rid: pool.submit(download, client, rid) for rid in report_ids}
+      for report_id, future in futures.items():
+        try:
+          results[report_id] = future.result()
+        except Exception as e:
+          results[report_id] = e
+    return results
+
+  def _resolve_report_download(
+    self, graph_id: str, report_id: str, format: str, expires_in: int
+  ) -> tuple[str, Any]:
+    """Resolve ``(gql_format, reportDownloadUrl info)`` for a report."""
     gql_format = _DOWNLOAD_FORMAT_ALIASES.get(format.lower(), format)
     data = self._query(
       graph_id,
       GET_LEDGER_REPORT_DOWNLOAD_URL_GQL,
       {"reportId": report_id, "format": gql_format, "expiresIn": expires_in},
     )
-    info = GetLedgerReportDownloadUrl.model_validate(data).report_download_url
+    info = parse_model(
+      GetLedgerReportDownloadUrl, data, trusted=self.trusted_server
+    ).report_download_url
     if info is None:
       raise RuntimeError(f"Report '{report_id}' not found.")
+    return gql_format, info
 
-    download_url = info.download_url
-    with httpx.Client(timeout=self.timeout) as client:
-      # Presigned URL is pre-authorized — no auth headers attached.
-      artifact = client.get(download_url)
-    if artifact.status_code != 200:
-      raise RuntimeError(
-        f"Failed to follow presigned URL ({artifact.status_code}): {artifact.text}"
-      )
-
+  def _fetch_report_bundle(
+    self,
+    client: httpx.Client,
+    graph_id: str,
+    report_id: str,
+    gql_format: str,
+    info: Any,
+    *,
+    to: Path | None = None,
+    to_dir: Path | None = None,
+    expected_sha256: str | None = None,
+  ) -> ReportBundleDownload:
+    """Follow a resolved presigned URL — into memory, or streamed to disk
+    at ``to`` (or ``to_dir/<filename>``)."""
     generation_count = info.generation_count
     default_ext = {"XBRL_2_1": "zip", "HOLON_JSONLD": "holon.jsonld"}.get(
       gql_format, "jsonld"
     )
-    filename = (
-      _parse_filename(artifact.headers.get("content-disposition", ""))
-      or f"{report_id}-g{generation_count or 1}.{default_ext}"
-    )
-    result = ReportBundleDownload(
-      content=artifact.content,
-      filename=filename,
-      format=info.format,
-      content_type=info.content_type,
-      generation_count=generation_count,
-    )
-    if to is not None:
-      path = Path(to)
-      path.parent.mkdir(parents=True, exist_ok=True)
-      path.write_bytes(result.content)
-      result.path = path
+
+    def result_for(headers: Any, content: bytes | None) -> ReportBundleDownload:
+      filename = (
+        _parse_filename(headers.get("content-disposition", ""))
+        or f"{report_id}-g{generation_count or 1}.{default_ext}"
+      )
+      return ReportBundleDownload(
+        content=content,
+        filename=filename,
+        format=info.format,
+        content_type=info.content_type,
+        generation_count=generation_count,
+      )
+
+    if self.bundle_cache is not None and generation_count is not None:
+      return self._fetch_cached_report_bundle(
+        client,
+        self.bundle_cache,
+        (graph_id, report_id, info.format, generation_count),
+        info,
+        result_for,
+        to=to,
+        to_dir=to_dir,
+        expected_sha256=expected_sha256,
+      )
+
+    # Presigned URL is pre-authorized — no auth headers attached.
+    if to is None and to_dir is None:
+      artifact = client.get(info.download_url)
+      if artifact.status_code != 200:
+        raise RuntimeError(
+          f"Failed to follow presigned URL ({artifact.status_code}): {artifact.text}"
+        )
+      return result_for(artifact.headers, artifact.content)
+
+    with client.stream("GET", info.download_url) as artifact:
+      if artifact.status_code != 200:
+        artifact.read()
+        raise RuntimeError(
+          f"Failed to follow presigned URL ({artifact.status_code}): {artifact.text}"
+        )
+      result = result_for(artifact.headers, None)
+      # Server filenames are untrusted — never let them escape to_dir.
+      path = to if to is not None else to_dir / Path(result.filename).name
+      result.sha256 = _stream_to_file(
+        artifact.iter_bytes(), path, expected_sha256=expected_sha256
+      )
+    result.path = path
     return result
 
+  def _fetch_cached_report_bundle(
+    self,
+    client: httpx.Client,
+    cache: ReportBundleCache,
+    key: tuple[str, str, str, int],
+    info: Any,
+    result_for: Callable[[Any, bytes | None], ReportBundleDownload],
+    *,
+    to: Path | None,
+    to_dir: Path | None,
+    expected_sha256: str | None,
+  ) -> ReportBundleDownload:
+    """Serve a bundle through the generation-keyed cache.
+
+    A hit skips the presigned-URL transfer entirely; a miss streams the
+    artifact into the cache first. Either way the caller's copy (``to``,
+    ``to_dir`` or in-memory ``content``) is produced from the cached blob.
+    An entry failing ``expected_sha256`` is evicted, and a hit that fails
+    it — or whose blob another process evicts before it is read — is
+    downloaded again, once.
+    """
+    for _ in range(2):
+      entry = cache.get(*key)
+      hit = entry is not None
+      if entry is None:
+        with client.stream("GET", info.download_url) as artifact:
+          if artifact.status_code != 200:
+            artifact.read()
+            raise RuntimeError(
+              f"Failed to follow presigned URL ({artifact.status_code}): {artifact.text}"
+            )
+          filename = result_for(artifact.headers, None).filename
+          digest = _stream_to_file(artifact.iter_bytes(), cache.blob_path(*key))
+        entry = cache.put(
+          *key, filename=filename, content_type=info.content_type, sha256=digest
+        )
+      if expected_sha256 is not None and entry.sha256 != expected_sha256.lower():
+        cache.discard(*key)
+        if not hit:
+          raise RuntimeError(
+            f"Checksum mismatch for {entry.filename}: expected {expected_sha256}, "
+            f"got {entry.sha256}"
+          )
+        continue  # a stale or corrupt hit: try once more, now as a miss
+      try:
+        return _copy_cached_bundle(entry, info, hit, to=to, to_dir=to_dir)
+      except FileNotFoundError:
+        if not hit:
+          raise
+        # Evicted by another process sharing the cache since the lookup
+    raise RuntimeError(f"Report bundle {key[1]} could not be served from the cache")
+
   def file_report(self, graph_id: str, report_id: str) -> ReportResponse:
     """Transition a Report's filing_status to 'filed' — locks the package.
 
@@ -2315,7 +3153,9 @@ class LedgerClient:
       LIST_LEDGER_BLOCKED_SOURCE_GRAPHS_GQL,
       {"limit": limit, "offset": offset},
     )
-    return ListLedgerBlockedSourceGraphs.model_validate(data).blocked_source_graphs
+    return parse_model(
+      ListLedgerBlockedSourceGraphs, data, trusted=self.trusted_server
+    ).blocked_source_graphs
 
   def block_source_graph(
     self,
@@ -2373,12 +3213,16 @@ class LedgerClient:
     data = self._query(
       graph_id, LIST_LEDGER_PUBLISH_LISTS_GQL, {"limit": limit, "offset": offset}
     )
-    return ListLedgerPublishLists.model_validate(data).publish_lists
+    return parse_model(
+      ListLedgerPublishLists, data, trusted=self.trusted_server
+    ).publish_lists
 
   def get_publish_list(self, graph_id: str, list_id: str) -> PublishList | None:
     """Get a single publish list with its full member list."""
     data = self._query(graph_id, GET_LEDGER_PUBLISH_LIST_GQL, {"listId": list_id})
-    return GetLedgerPublishList.model_validate(data).publish_list
+    return parse_model(
+      GetLedgerPublishList, data, trusted=self.trusted_server
+    ).publish_list
 
   def create_publish_list(
     self, graph_id: str, name: str, description: str | None = None
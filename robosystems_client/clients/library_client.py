@@ -19,9 +19,16 @@ no write surface here. Tenant-scope writes go through ``LedgerClient``.
 
 from __future__ import annotations
 
-from typing import Any
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, TypeVar
 
 from ..graphql.client import GraphQLClient, strip_none_vars
+from ..graphql.views import parse_model
+from .library_index import DEFAULT_INDEX_DIR, LibraryIndex
+from .taxonomy_graph import TaxonomyGraph
+from .read_cache import credential_scope, operation_name
 from .token_utils import resolve_config_token
 from ..graphql.generated.get_library_element import (
   GetLibraryElement,
@@ -81,6 +88,8 @@ from ..graphql.generated.search_library_elements import (
   SearchLibraryElementsSearchLibraryElements,
 )
 
+T = TypeVar("T")
+
 LIBRARY_GRAPH_ID = "library"
 """Sentinel graph_id for the canonical library read surface.
 
@@ -98,6 +107,10 @@ class LibraryClient:
     self.headers = config.get("headers", {})
     self.token = config.get("token")
     self.timeout = config.get("timeout", 60)
+    # Trusted server: reads return lazy views over the response instead of
+    # validating every nested object (see graphql/views.py).
+    self.trusted_server = config.get("graphql_trusted_server", False)
+    self.index_dir = Path(config.get("library_index_dir") or DEFAULT_INDEX_DIR)
 
   def _get_graphql_client(self) -> GraphQLClient:
     # Resolved per call: a configured `token_provider` wins over the
@@ -110,6 +123,9 @@ class LibraryClient:
       token=token,
       headers=self.headers,
       timeout=self.timeout,
+      persisted_queries=self.config.get("graphql_persisted_queries", False),
+      use_get=self.config.get("graphql_use_get", False),
+      single_flight=self.config.get("single_flight"),
     )
 
   def _query(
@@ -119,8 +135,31 @@ class LibraryClient:
     variables: dict[str, Any] | None = None,
   ) -> dict[str, Any]:
     cleaned = strip_none_vars(variables) if variables else None
+    cache = self.config.get("read_cache")
+    if cache is not None:
+      return cache.get(
+        operation_name(query),
+        graph_id,
+        cleaned,
+        lambda: self._get_graphql_client().execute(graph_id, query, cleaned),
+        document=query,
+        scope=credential_scope(
+          self.base_url, resolve_config_token(self.config), self.headers
+        ),
+      )
     return self._get_graphql_client().execute(graph_id, query, cleaned)
 
+  def _gather(
+    self,
+    fn: Callable[..., T],
+    calls: list[dict[str, Any]],
+    concurrency: int,
+  ) -> list[T]:
+    # Independent reads in parallel; each call builds its own GraphQL
+    # client, so the worker threads share no connection state.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+      return list(pool.map(lambda kwargs: fn(**kwargs), calls))
+
   # ── Taxonomies ──────────────────────────────────────────────────────
 
   def list_library_taxonomies(
@@ -136,7 +175,9 @@ class LibraryClient:
       LIST_LIBRARY_TAXONOMIES_GQL,
       {"standard": standard, "includeElementCount": include_element_count},
     )
-    return ListLibraryTaxonomies.model_validate(data).library_taxonomies
+    return parse_model(
+      ListLibraryTaxonomies, data, trusted=self.trusted_server
+    ).library_taxonomies
 
   def get_library_taxonomy(
     self,
@@ -158,7 +199,9 @@ class LibraryClient:
         "includeElementCount": include_element_count,
       },
     )
-    return GetLibraryTaxonomy.model_validate(data).library_taxonomy
+    return parse_model(
+      GetLibraryTaxonomy, data, trusted=self.trusted_server
+    ).library_taxonomy
 
   # ── Elements ────────────────────────────────────────────────────────
 
@@ -194,7 +237,9 @@ class LibraryClient:
         "includeReferences": include_references,
       },
     )
-    return ListLibraryElements.model_validate(data).library_elements
+    return parse_model(
+      ListLibraryElements, data, trusted=self.trusted_server
+    ).library_elements
 
   def search_library_elements(
     self,
@@ -210,7 +255,9 @@ class LibraryClient:
       SEARCH_LIBRARY_ELEMENTS_GQL,
       {"query": query, "source": source, "limit": limit},
     )
-    return SearchLibraryElements.model_validate(data).search_library_elements
+    return parse_model(
+      SearchLibraryElements, data, trusted=self.trusted_server
+    ).search_library_elements
 
   def get_library_element(
     self,
@@ -225,7 +272,9 @@ class LibraryClient:
       GET_LIBRARY_ELEMENT_GQL,
       {"id": id, "qname": qname},
     )
-    return GetLibraryElement.model_validate(data).library_element
+    return parse_model(
+      GetLibraryElement, data, trusted=self.trusted_server
+    ).library_element
 
   # ── Arcs / Equivalence ──────────────────────────────────────────────
 
@@ -260,7 +309,7 @@ class LibraryClient:
         "offset": offset,
       },
     )
-    return ListLibraryTaxonomyArcs.model_validate(data)
+    return parse_model(ListLibraryTaxonomyArcs, data, trusted=self.trusted_server)
 
   # ── Structures ──────────────────────────────────────────────────────
 
@@ -287,7 +336,9 @@ class LibraryClient:
       LIST_LIBRARY_STRUCTURES_GQL,
       {"taxonomyId": taxonomy_id, "blockType": block_type},
     )
-    return ListLibraryStructures.model_validate(data).library_structures
+    return parse_model(
+      ListLibraryStructures, data, trusted=self.trusted_server
+    ).library_structures
 
   def get_library_element_arcs(
     self,
@@ -296,7 +347,9 @@ class LibraryClient:
   ) -> list[GetLibraryElementArcsLibraryElementArcs]:
     """All mapping arcs where this element is source or target."""
     data = self._query(graph_id, GET_LIBRARY_ELEMENT_ARCS_GQL, {"id": id})
-    return GetLibraryElementArcs.model_validate(data).library_element_arcs
+    return parse_model(
+      GetLibraryElementArcs, data, trusted=self.trusted_server
+    ).library_element_arcs
 
   def get_library_element_classifications(
     self,
@@ -308,8 +361,8 @@ class LibraryClient:
     category then identifier.
     """
     data = self._query(graph_id, GET_LIBRARY_ELEMENT_CLASSIFICATIONS_GQL, {"id": id})
-    return GetLibraryElementClassifications.model_validate(
-      data
+    return parse_model(
+      GetLibraryElementClassifications, data, trusted=self.trusted_server
     ).library_element_classifications
 
   def get_library_element_equivalents(
@@ -319,4 +372,118 @@ class LibraryClient:
   ) -> LibraryElementEquivalents | None:
     """Equivalence fan-out (FAC ↔ us-gaap collapse). Returns None if not found."""
     data = self._query(graph_id, GET_LIBRARY_ELEMENT_EQUIVALENTS_GQL, {"id": id})
-    return GetLibraryElementEquivalents.model_validate(data).library_element_equivalents
+    return parse_model(
+      GetLibraryElementEquivalents, data, trusted=self.trusted_server
+    ).library_element_equivalents
+
+  # ── Offline index ───────────────────────────────────────────────────
+
+  def get_library_index(
+    self,
+    taxonomy_id: str,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    refresh: bool = False,
+    page_size: int = 500,
+  ) -> LibraryIndex:
+    """Local searchable copy of one taxonomy (see ``library_index.py``).
+
+    One ``get_library_taxonomy`` call checks the taxonomy's version and
+    element count against the file under ``library_index_dir``; elements
+    are downloaded (with labels and references) only when the file is
+    missing, stale, or ``refresh`` is set.
+
+    Raises:
+        RuntimeError: If the taxonomy does not exist.
+    """
+    taxonomy = self.get_library_taxonomy(
+      graph_id, id=taxonomy_id, include_element_count=True
+    )
+    if taxonomy is None:
+      raise RuntimeError(f"Library taxonomy '{taxonomy_id}' not found")
+
+    path = self.index_dir / graph_id / f"{taxonomy_id}.sqlite"
+    if not refresh and path.exists():
+      try:
+        index = LibraryIndex(path)
+      except sqlite3.Error:
+        pass  # unreadable or partial file — rebuild it
+      else:
+        if index.is_current(taxonomy):
+          return index
+        index.close()
+
+    elements = []
+    while True:
+      page = self.list_library_elements(
+        graph_id,
+        taxonomy_id=taxonomy_id,
+        limit=page_size,
+        offset=len(elements),
+        include_labels=True,
+        include_references=True,
+      )
+      if not page:
+        break
+      elements.extend(page)
+    return LibraryIndex.build(path, taxonomy, elements)
+
+  def get_taxonomy_graph(
+    self,
+    taxonomy_id: str,
+    graph_id: str = LIBRARY_GRAPH_ID,
+    *,
+    refresh: bool = False,
+    page_size: int = 1000,
+    concurrency: int = 4,
+  ) -> TaxonomyGraph:
+    """Every arc of a taxonomy as an in-memory graph (see
+    ``taxonomy_graph.py``) — hierarchy, calculation and equivalence
+    traversals without a request per element.
+
+    The graph is cached under ``library_index_dir`` and reused while
+    the taxonomy's version is unchanged. Otherwise the first arc page
+    gives the total count and the remaining pages are fetched
+    ``concurrency`` at a time.
+
+    Raises:
+        RuntimeError: If the taxonomy does not exist.
+    """
+    taxonomy = self.get_library_taxonomy(graph_id, id=taxonomy_id)
+    if taxonomy is None:
+      raise RuntimeError(f"Library taxonomy '{taxonomy_id}' not found")
+
+    path = self.index_dir / graph_id / f"{taxonomy_id}.arcs.json"
+    if not refresh and path.exists():
+      try:
+        graph = TaxonomyGraph.load(path)
+      except (OSError, ValueError, KeyError):
+        pass  # unreadable or from an older layout — rebuild it
+      else:
+        if graph.is_current(taxonomy):
+          return graph
+
+    first = self.list_library_taxonomy_arcs(taxonomy_id, graph_id, limit=page_size)
+    arcs = list(first.library_taxonomy_arcs)
+    # Step by the page the server actually returned, in case it caps limit.
+    step = len(arcs)
+    if step:
+      pages = self._gather(
+        self.list_library_taxonomy_arcs,
+        [
+          {
+            "taxonomy_id": taxonomy_id,
+            "graph_id": graph_id,
+            "limit": step,
+            "offset": offset,
+          }
+          for offset in range(step, first.library_taxonomy_arc_count, step)
+        ],
+        concurrency,
+      )
+      for page in pages:
+        arcs.extend(page.library_taxonomy_arcs)
+
+    graph = TaxonomyGraph.from_arcs(arcs, taxonomy.id, taxonomy.version)
+    graph.save(path)
+    return graph
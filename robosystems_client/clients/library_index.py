@@ -0,0 +1,283 @@
+"""Offline, searchable copy of one library taxonomy.
+
+A :class:`LibraryIndex` is a single SQLite file holding a taxonomy's
+elements with their labels and references. Search runs against an FTS5
+trigram index over qname, name and label text, so substring matches —
+the same semantics as ``search_library_elements`` — are index lookups
+rather than scans, and the file is memory-mapped when opened. Queries
+shorter than three characters (below trigram length) fall back to a
+prefix match on qname and name, served by indexes on their lower-cased
+forms.
+
+``LibraryClient.get_library_index`` builds the file on first use and
+rebuilds it when the taxonomy's version or element count changes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from ..graphql.generated.list_library_elements import (
+  ListLibraryElementsLibraryElements,
+)
+from ..graphql.views import ModelView, model_view
+
+DEFAULT_INDEX_DIR = Path.home() / ".cache" / "robosystems" / "library"
+
+# Bump when the file layout changes; older files are rebuilt.
+SCHEMA_VERSION = 2
+
+_MMAP_BYTES = 256 * 1024 * 1024
+
+_FILTER_COLUMNS = frozenset(
+  {"element_type", "trait", "source", "period_type", "balance_type", "is_abstract"}
+)
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE elements (
+  id TEXT PRIMARY KEY,
+  qname TEXT NOT NULL,
+  name TEXT NOT NULL,
+  element_type TEXT,
+  trait TEXT,
+  source TEXT,
+  period_type TEXT,
+  balance_type TEXT,
+  is_abstract INTEGER,
+  data TEXT NOT NULL,
+  qname_lower TEXT NOT NULL,
+  name_lower TEXT NOT NULL
+);
+CREATE INDEX elements_qname ON elements (qname);
+CREATE INDEX elements_qname_lower ON elements (qname_lower);
+CREATE INDEX elements_name_lower ON elements (name_lower);
+CREATE VIRTUAL TABLE element_search USING fts5(
+  qname, name, labels, content='', tokenize='trigram'
+);
+"""
+
+
+def fingerprint(taxonomy: Any) -> str:
+  """Freshness key for a taxonomy: its version and element count."""
+  return f"{taxonomy.version or ''}|{taxonomy.element_count or 0}"
+
+
+class LibraryIndex:
+  """Read-only handle on a taxonomy index file.
+
+  Args:
+      path: Index file written by :meth:`build`
+  """
+
+  def __init__(self, path: str | Path):
+    self.path = Path(path)
+    self._conn = sqlite3.connect(
+      f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+    )
+    self._conn.execute(f"PRAGMA mmap_size = {_MMAP_BYTES}")
+    self.meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+
+  @classmethod
+  def build(
+    cls,
+    path: str | Path,
+    taxonomy: Any,
+    elements: Iterable[Any],
+  ) -> LibraryIndex:
+    """Write ``elements`` of ``taxonomy`` to a new index file at ``path``.
+
+    ``elements`` are ``list_library_elements`` results fetched with
+    labels and references, as models or trusted-server views. The file is written beside ``path`` and
+    renamed into place, so readers never see a partial index.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".sqlite.tmp")
+    os.close(fd)
+    try:
+      conn = sqlite3.connect(tmp)
+      try:
+        conn.executescript(_SCHEMA)
+        count = 0
+        for element in elements:
+          count += 1
+          if isinstance(element, ModelView):
+            # Trusted results are raw server JSON; don't validate them here
+            data = dict(element._data)
+          else:
+            data = element.model_dump(by_alias=True, mode="json")
+          labels = " ".join(label["text"] for label in data.get("labels") or [])
+          cursor = conn.execute(
+            "INSERT INTO elements VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+              element.id,
+              element.qname,
+              element.name,
+              element.element_type,
+              element.trait,
+              element.source,
+              element.period_type,
+              element.balance_type,
+              int(element.is_abstract or 0),
+              json.dumps(data, separators=(",", ":")),
+              element.qname.lower(),
+              element.name.lower(),
+            ),
+          )
+          conn.execute(
+            "INSERT INTO element_search (rowid, qname, name, labels) "
+            "VALUES (?, ?, ?, ?)",
+            (cursor.lastrowid, element.qname, element.name, labels),
+          )
+        conn.executemany(
+          "INSERT INTO meta VALUES (?, ?)",
+          [
+            ("schema_version", str(SCHEMA_VERSION)),
+            ("taxonomy_id", taxonomy.id),
+            ("version", taxonomy.version or ""),
+            ("fingerprint", fingerprint(taxonomy)),
+            ("element_count", str(count)),
+            ("built_at", str(time.time())),
+          ],
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+      finally:
+        conn.close()
+      os.replace(tmp, path)
+    finally:
+      with contextlib.suppress(OSError):
+        os.unlink(tmp)
+    return cls(path)
+
+  # ── Metadata ────────────────────────────────────────────────────────
+
+  @property
+  def taxonomy_id(self) -> str:
+    return self.meta["taxonomy_id"]
+
+  @property
+  def version(self) -> Optional[str]:
+    return self.meta.get("version") or None
+
+  def is_current(self, taxonomy: Any) -> bool:
+    """True when this file was built from ``taxonomy`` as it is now."""
+    return (
+      self.meta.get("schema_version") == str(SCHEMA_VERSION)
+      and self.meta.get("taxonomy_id") == taxonomy.id
+      and self.meta.get("fingerprint") == fingerprint(taxonomy)
+    )
+
+  def __len__(self) -> int:
+    return int(self.meta.get("element_count", 0))
+
+  # ── Queries ─────────────────────────────────────────────────────────
+
+  def search(
+    self,
+    query: str,
+    limit: int = 50,
+    **filters: Any,
+  ) -> list[ListLibraryElementsLibraryElements]:
+    """Case-insensitive substring search over qname, name and label text.
+
+    Exact qname/name matches rank first, then prefix matches, then other
+    substring matches; ties go to the shorter name.
+
+    Args:
+        query: Text to find
+        limit: Maximum number of results
+        **filters: Equality filters on ``element_type``, ``trait``,
+            ``source``, ``period_type``, ``balance_type`` or
+            ``is_abstract``
+
+    Returns:
+        Elements as read-only views of ``list_library_elements`` results
+    """
+    needle = query.strip()
+    if not needle:
+      return []
+    where, params = self._filters(filters)
+    lowered = needle.lower()
+    if len(needle) >= 3:
+      source = (
+        "element_search JOIN elements e ON e.rowid = element_search.rowid "
+        "WHERE element_search MATCH ?"
+      )
+      params = ['"' + needle.replace('"', '""') + '"', *params]
+    else:
+      source = (
+        "elements e WHERE ((e.qname_lower >= ? AND e.qname_lower < ?) "
+        "OR (e.name_lower >= ? AND e.name_lower < ?))"
+      )
+      bounds = [lowered, _prefix_end(lowered)]
+      params = [*bounds, *bounds, *params]
+    sql = (
+      f"SELECT e.data FROM {source}{where} ORDER BY "
+      "CASE WHEN e.name_lower = ? OR e.qname_lower = ? THEN 0 "
+      "WHEN substr(e.name_lower, 1, ?) = ? THEN 1 ELSE 2 END, "
+      "length(e.name), e.name LIMIT ?"
+    )
+    params += [lowered, lowered, len(lowered), lowered, limit]
+    return [self._element(row[0]) for row in self._conn.execute(sql, params)]
+
+  def elements(self, **filters: Any) -> Iterator[ListLibraryElementsLibraryElements]:
+    """Every element matching the equality ``filters``, ordered by qname."""
+    where, params = self._filters(filters)
+    sql = f"SELECT e.data FROM elements e WHERE 1{where} ORDER BY e.qname"
+    for row in self._conn.execute(sql, params):
+      yield self._element(row[0])
+
+  def get(
+    self, *, id: str | None = None, qname: str | None = None
+  ) -> ListLibraryElementsLibraryElements | None:
+    """One element by id or qname, or None."""
+    if id is not None:
+      row = self._conn.execute(
+        "SELECT data FROM elements WHERE id = ?", (id,)
+      ).fetchone()
+    elif qname is not None:
+      row = self._conn.execute(
+        "SELECT data FROM elements WHERE qname = ?", (qname,)
+      ).fetchone()
+    else:
+      raise ValueError("Pass id or qname")
+    return self._element(row[0]) if row else None
+
+  @staticmethod
+  def _filters(filters: dict[str, Any]) -> tuple[str, list[Any]]:
+    clauses, params = [], []
+    for name, value in filters.items():
+      if name not in _FILTER_COLUMNS:
+        raise TypeError(f"Unknown filter: {name}")
+      if value is None:
+        continue
+      clauses.append(f" AND e.{name} = ?")
+      params.append(int(value) if isinstance(value, bool) else value)
+    return "".join(clauses), params
+
+  @staticmethod
+  def _element(data: str) -> ListLibraryElementsLibraryElements:
+    return model_view(ListLibraryElementsLibraryElements, json.loads(data))
+
+  def close(self) -> None:
+    self._conn.close()
+
+  def __enter__(self) -> LibraryIndex:
+    return self
+
+  def __exit__(self, *exc: Any) -> None:
+    self.close()
+
+
+def _prefix_end(prefix: str) -> str:
+  """Smallest string greater than every string starting with ``prefix``."""
+  return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -0,0 +1,115 @@
+"""NDJSON decoding for large query results.
+
+Lines are decoded with ``orjson`` when it is installed (``pip install
+robosystems-client[orjson]``; several times faster than the standard
+library), otherwise with ``json``. Results never depend on which is
+installed: lines orjson rejects (``NaN``, ``Infinity``) or could decode
+lossily (integers past 64 bits) are decoded with ``json``. For
+multi-megabyte payloads :func:`decode_ndjson` can also split the bytes
+at newline boundaries and decode the pieces across a process pool,
+returning records in their original order.
+
+Process-pool decoding pays for pickling every decoded record back to
+the parent, so it only helps with several idle cores and payloads in
+the tens of megabytes; below ``min_parallel_bytes`` it always decodes
+in-process.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Iterator, Optional
+
+try:
+  import orjson
+
+  HAS_ORJSON = True
+except ImportError:
+  HAS_ORJSON = False
+  orjson = None
+
+# orjson turns integers past 64 bits into floats; any run of 19+ digits
+# sends the line to json instead
+_LONG_DIGITS = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+
+
+def _orjson_loads(line: bytes | str) -> Any:
+  pattern = _LONG_DIGITS if isinstance(line, bytes) else _LONG_DIGITS_STR
+  if pattern.search(line) is None:
+    try:
+      return orjson.loads(line)
+    except orjson.JSONDecodeError:
+      pass  # NaN / Infinity, which json accepts; invalid lines raise below
+  return json.loads(line)
+
+
+loads: Callable[[bytes | str], Any] = _orjson_loads if HAS_ORJSON else json.loads
+
+DEFAULT_MIN_PARALLEL_BYTES = 8 * 1024 * 1024
+
+
+def split_lines(payload: bytes, parts: int) -> list[bytes]:
+  """Split ``payload`` into at most ``parts`` pieces, each ending at a newline."""
+  size = len(payload)
+  if parts <= 1 or size == 0:
+    return [payload]
+  target = -(-size // parts)
+  pieces = []
+  start = 0
+  while start < size:
+    end = payload.find(b"\n", min(start + target, size) - 1)
+    end = size if end == -1 else end + 1
+    pieces.append(payload[start:end])
+    start = end
+  return pieces
+
+
+def decode_lines(payload: bytes) -> list[Any]:
+  """Decode every non-blank line of ``payload``."""
+  return [loads(line) for line in payload.split(b"\n") if line.strip()]
+
+
+def iter_ndjson(payload: bytes) -> Iterator[Any]:
+  """Decode ``payload`` one line at a time, without building a list."""
+  for line in payload.split(b"\n"):
+    if line.strip():
+      yield loads(line)
+
+
+def decode_ndjson(
+  payload: bytes,
+  workers: int = 1,
+  executor: Optional[Executor] = None,
+  min_parallel_bytes: int = DEFAULT_MIN_PARALLEL_BYTES,
+) -> list[Any]:
+  """Decode an NDJSON payload into a list of records, in order.
+
+  Args:
+      payload: Raw NDJSON bytes
+      workers: Number of processes to decode with; ``1`` decodes in-process
+      executor: Pool to submit chunks to (default: a temporary
+          ``ProcessPoolExecutor`` with ``workers`` processes)
+      min_parallel_bytes: Payloads smaller than this are decoded
+          in-process regardless of ``workers``
+
+  Raises:
+      ValueError: A line is not valid JSON
+  """
+  if workers <= 1 or len(payload) < min_parallel_bytes:
+    return decode_lines(payload)
+
+  pieces = split_lines(payload, workers * 4)
+  if executor is not None:
+    return _flatten(executor.map(decode_lines, pieces))
+  with ProcessPoolExecutor(max_workers=workers) as pool:
+    return _flatten(pool.map(decode_lines, pieces))
+
+
+def _flatten(chunks: Any) -> list[Any]:
+  records: list[Any] = []
+  for chunk in chunks:
+    records.extend(chunk)
+  return records
@@ -3,8 +3,21 @@
 Provides intelligent operator execution with automatic strategy selection.
 """
 
+import asyncio
+import queue
+import threading
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, Callable
+from typing import (
+  Any,
+  AsyncIterator,
+  Callable,
+  Dict,
+  Iterator,
+  List,
+  Optional,
+  Tuple,
+  Union,
+)
 from datetime import datetime
 
 from ..api.operator.auto_select_operator import sync_detailed as auto_select_operator
@@ -13,7 +26,8 @@ from ..api.operator.execute_specific_operator import (
 )
 from ..models.operator_request import OperatorRequest
 from ..models.operator_message import OperatorMessage
-from .sse_client import SSEClient, SSEConfig, EventType
+from ..models.response_mode import ResponseMode
+from .sse_client import AsyncSSEClient, SSEClient, SSEConfig, EventType
 
 
 @dataclass
@@ -51,6 +65,22 @@ class OperatorResult:
   timestamp: Optional[str] = None
 
 
+@dataclass
+class OperatorStreamEvent:
+  """One item yielded by :meth:`OperatorClient.stream_operator`.
+
+  ``type`` is ``"delta"`` (``delta`` holds newly generated content),
+  ``"progress"`` (``message`` / ``percentage``) or ``"completed"``
+  (``result`` holds the final :class:`OperatorResult`).
+  """
+
+  type: str
+  delta: str = ""
+  message: Optional[str] = None
+  percentage: Optional[int] = None
+  result: Optional["OperatorResult"] = None
+
+
 @dataclass
 class QueuedOperatorResponse:
   """Response when operator execution is queued"""
@@ -86,167 +116,53 @@ class OperatorClient:
     options: OperatorOptions = None,
   ) -> OperatorResult:
     """Execute operator query with automatic operator selection"""
-    if options is None:
-      options = OperatorOptions()
-
-    # Build request data
-    operator_request = OperatorRequest(
-      message=request.message,
-      history=[
-        OperatorMessage(role=msg["role"], content=msg["content"])
-        for msg in (request.history or [])
-      ],
-      context=request.context,
-      mode=request.mode,
-      enable_rag=request.enable_rag,
-      force_extended_analysis=request.force_extended_analysis,
-    )
-
-    # Execute through the generated client
-    from ..client import AuthenticatedClient
-
-    if not self.token:
-      raise Exception("No API key provided. Set X-API-Key in headers.")
-
-    client = AuthenticatedClient(
-      base_url=self.base_url,
-      token=self.token,
-      prefix="",
-      auth_header_name="X-API-Key",
-      headers=self.headers,
-    )
-
-    try:
-      response = auto_select_operator(
-        graph_id=graph_id,
-        client=client,
-        body=operator_request,
-      )
-
-      # Check response type and handle accordingly
-      if hasattr(response, "parsed") and response.parsed:
-        response_data = response.parsed
+    return self._execute(graph_id, None, request, options or OperatorOptions())
 
-        # Handle both dict and attrs object responses
-        if isinstance(response_data, dict):
-          data = response_data
-        else:
-          # Response is an attrs object
-          data = response_data
+  def execute_operator(
+    self,
+    graph_id: str,
+    operator_type: str,
+    request: OperatorQueryRequest,
+    options: OperatorOptions = None,
+  ) -> OperatorResult:
+    """Execute specific operator type"""
+    return self._execute(graph_id, operator_type, request, options or OperatorOptions())
 
-        # Check if this is an immediate response (sync or SSE execution)
-        has_content = False
-        if isinstance(data, dict):
-          has_content = "content" in data and "operator_used" in data
-        else:
-          has_content = hasattr(data, "content") and hasattr(data, "operator_used")
-
-        if has_content:
-          # Extract data from either dict or attrs object
-          if isinstance(data, dict):
-            return OperatorResult(
-              content=data["content"],
-              operator_used=data["operator_used"],
-              mode_used=data["mode_used"],
-              metadata=data.get("metadata"),
-              tokens_used=data.get("tokens_used"),
-              confidence_score=data.get("confidence_score"),
-              execution_time=data.get("execution_time"),
-              timestamp=data.get("timestamp", datetime.now().isoformat()),
-            )
-          else:
-            # attrs object - access attributes directly
-            from ..types import UNSET
-
-            return OperatorResult(
-              content=data.content if data.content is not UNSET else "",
-              operator_used=data.operator_used
-              if data.operator_used is not UNSET
-              else "unknown",
-              mode_used=data.mode_used.value
-              if hasattr(data.mode_used, "value")
-              else data.mode_used
-              if data.mode_used is not UNSET
-              else "standard",
-              metadata=data.metadata if data.metadata is not UNSET else None,
-              tokens_used=data.tokens_used if data.tokens_used is not UNSET else None,
-              confidence_score=data.confidence_score
-              if data.confidence_score is not UNSET
-              else None,
-              execution_time=data.execution_time
-              if data.execution_time is not UNSET
-              else None,
-              timestamp=data.timestamp
-              if hasattr(data, "timestamp") and data.timestamp is not UNSET
-              else datetime.now().isoformat(),
-            )
-
-        # Check if this is a queued response (async background task execution)
-        is_queued = False
-        queued_response = None
+  def _execute(
+    self,
+    graph_id: str,
+    operator_type: Optional[str],
+    request: OperatorQueryRequest,
+    options: OperatorOptions,
+  ) -> OperatorResult:
+    parsed = self._submit(graph_id, operator_type, request)
 
-        if isinstance(data, dict):
-          is_queued = "operation_id" in data
-          if is_queued:
-            queued_response = QueuedOperatorResponse(
-              status=data.get("status", "queued"),
-              operation_id=data["operation_id"],
-              message=data.get("message", "Operator execution queued"),
-              sse_endpoint=data.get("sse_endpoint"),
-            )
-        else:
-          is_queued = hasattr(data, "operation_id")
-          if is_queued:
-            from ..types import UNSET
-
-            queued_response = QueuedOperatorResponse(
-              status=data.status if hasattr(data, "status") else "queued",
-              operation_id=data.operation_id,
-              message=data.message
-              if hasattr(data, "message") and data.message is not UNSET
-              else "Operator execution queued",
-              sse_endpoint=data.sse_endpoint
-              if hasattr(data, "sse_endpoint") and data.sse_endpoint is not UNSET
-              else None,
-            )
-
-        if is_queued and queued_response:
-          # If user doesn't want to wait, raise with queue info
-          if options.max_wait == 0:
-            raise QueuedOperatorError(queued_response)
-
-          # Use SSE to monitor the operation
-          return self._wait_for_operator_completion(
-            queued_response.operation_id, options
-          )
+    if isinstance(parsed, OperatorResult):
+      return parsed
 
-    except Exception as e:
-      if isinstance(e, QueuedOperatorError):
-        raise
+    if isinstance(parsed, QueuedOperatorResponse):
+      # If user doesn't want to wait, raise with queue info
+      if options.max_wait == 0:
+        raise QueuedOperatorError(parsed)
 
-      error_msg = str(e)
-      # Check for authentication errors
-      if (
-        "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg.lower()
-      ):
-        raise Exception(f"Authentication failed during operator execution: {error_msg}")
-      else:
-        raise Exception(f"Operator execution failed: {error_msg}")
+      # Use SSE to monitor the operation
+      try:
+        return self._wait_for_operator_completion(parsed.operation_id, options)
+      except Exception as e:
+        raise Exception(f"Operator execution failed: {e}")
 
     # Unexpected response format
     raise Exception("Unexpected response format from operator endpoint")
 
-  def execute_operator(
+  def _submit(
     self,
     graph_id: str,
-    operator_type: str,
+    operator_type: Optional[str],
     request: OperatorQueryRequest,
-    options: OperatorOptions = None,
-  ) -> OperatorResult:
-    """Execute specific operator type"""
-    if options is None:
-      options = OperatorOptions()
-
+    mode: Optional[ResponseMode] = None,
+  ) -> Union[OperatorResult, QueuedOperatorResponse, None]:
+    """POST the operator request (auto-selected when ``operator_type`` is
+    None) and parse the immediate or queued response."""
     # Build request data
     operator_request = OperatorRequest(
       message=request.message,
@@ -262,6 +178,7 @@ class OperatorClient:
 
     # Execute through the generated client
     from ..client import AuthenticatedClient
+    from ..types import UNSET
 
     if not self.token:
       raise Exception("No API key provided. Set X-API-Key in headers.")
@@ -275,114 +192,92 @@ class OperatorClient:
     )
 
     try:
-      response = execute_specific_operator(
-        graph_id=graph_id,
-        operator_type=operator_type,
-        client=client,
-        body=operator_request,
-      )
+      kwargs: Dict[str, Any] = {
+        "graph_id": graph_id,
+        "client": client,
+        "body": operator_request,
+      }
+      if mode is not None:
+        kwargs["mode"] = mode
+      if operator_type is None:
+        response = auto_select_operator(**kwargs)
+      else:
+        response = execute_specific_operator(operator_type=operator_type, **kwargs)
 
-      # Check response type and handle accordingly
-      if hasattr(response, "parsed") and response.parsed:
-        response_data = response.parsed
+      if not (hasattr(response, "parsed") and response.parsed):
+        return None
 
-        # Handle both dict and attrs object responses
-        if isinstance(response_data, dict):
-          data = response_data
-        else:
-          data = response_data
+      # Response is either a dict or an attrs object
+      data = response.parsed
 
-        # Check if this is an immediate response
-        has_content = False
-        if isinstance(data, dict):
-          has_content = "content" in data and "operator_used" in data
-        else:
-          has_content = hasattr(data, "content") and hasattr(data, "operator_used")
-
-        if has_content:
-          # Extract data from either dict or attrs object
-          if isinstance(data, dict):
-            return OperatorResult(
-              content=data["content"],
-              operator_used=data["operator_used"],
-              mode_used=data["mode_used"],
-              metadata=data.get("metadata"),
-              tokens_used=data.get("tokens_used"),
-              confidence_score=data.get("confidence_score"),
-              execution_time=data.get("execution_time"),
-              timestamp=data.get("timestamp", datetime.now().isoformat()),
-            )
-          else:
-            # attrs object
-            from ..types import UNSET
-
-            return OperatorResult(
-              content=data.content if data.content is not UNSET else "",
-              operator_used=data.operator_used
-              if data.operator_used is not UNSET
-              else "unknown",
-              mode_used=data.mode_used.value
-              if hasattr(data.mode_used, "value")
-              else data.mode_used
-              if data.mode_used is not UNSET
-              else "standard",
-              metadata=data.metadata if data.metadata is not UNSET else None,
-              tokens_used=data.tokens_used if data.tokens_used is not UNSET else None,
-              confidence_score=data.confidence_score
-              if data.confidence_score is not UNSET
-              else None,
-              execution_time=data.execution_time
-              if data.execution_time is not UNSET
-              else None,
-              timestamp=data.timestamp
-              if hasattr(data, "timestamp") and data.timestamp is not UNSET
-              else datetime.now().isoformat(),
-            )
-
-        # Check if this is a queued response
-        is_queued = False
-        queued_response = None
+      # Check if this is an immediate response (sync or SSE execution)
+      if isinstance(data, dict):
+        has_content = "content" in data and "operator_used" in data
+      else:
+        has_content = hasattr(data, "content") and hasattr(data, "operator_used")
 
+      if has_content:
+        # Extract data from either dict or attrs object
         if isinstance(data, dict):
-          is_queued = "operation_id" in data
-          if is_queued:
-            queued_response = QueuedOperatorResponse(
-              status=data.get("status", "queued"),
-              operation_id=data["operation_id"],
-              message=data.get("message", "Operator execution queued"),
-              sse_endpoint=data.get("sse_endpoint"),
-            )
-        else:
-          is_queued = hasattr(data, "operation_id")
-          if is_queued:
-            from ..types import UNSET
-
-            queued_response = QueuedOperatorResponse(
-              status=data.status if hasattr(data, "status") else "queued",
-              operation_id=data.operation_id,
-              message=data.message
-              if hasattr(data, "message") and data.message is not UNSET
-              else "Operator execution queued",
-              sse_endpoint=data.sse_endpoint
-              if hasattr(data, "sse_endpoint") and data.sse_endpoint is not UNSET
-              else None,
-            )
-
-        if is_queued and queued_response:
-          # If user doesn't want to wait, raise with queue info
-          if options.max_wait == 0:
-            raise QueuedOperatorError(queued_response)
-
-          # Use SSE to monitor the operation
-          return self._wait_for_operator_completion(
-            queued_response.operation_id, options
+          return OperatorResult(
+            content=data["content"],
+            operator_used=data["operator_used"],
+            mode_used=data["mode_used"],
+            metadata=data.get("metadata"),
+            tokens_used=data.get("tokens_used"),
+            confidence_score=data.get("confidence_score"),
+            execution_time=data.get("execution_time"),
+            timestamp=data.get("timestamp", datetime.now().isoformat()),
           )
+        # attrs object - access attributes directly
+        return OperatorResult(
+          content=data.content if data.content is not UNSET else "",
+          operator_used=data.operator_used
+          if data.operator_used is not UNSET
+          else "unknown",
+          mode_used=data.mode_used.value
+          if hasattr(data.mode_used, "value")
+          else data.mode_used
+          if data.mode_used is not UNSET
+          else "standard",
+          metadata=data.metadata if data.metadata is not UNSET else None,
+          tokens_used=data.tokens_used if data.tokens_used is not UNSET else None,
+          confidence_score=data.confidence_score
+          if data.confidence_score is not UNSET
+          else None,
+          execution_time=data.execution_time
+          if data.execution_time is not UNSET
+          else None,
+          timestamp=data.timestamp
+          if hasattr(data, "timestamp") and data.timestamp is not UNSET
+          else datetime.now().isoformat(),
+        )
 
-    except Exception as e:
-      if isinstance(e, QueuedOperatorError):
-        raise
+      # Check if this is a queued response (async background task execution)
+      if isinstance(data, dict):
+        if "operation_id" in data:
+          return QueuedOperatorResponse(
+            status=data.get("status", "queued"),
+            operation_id=data["operation_id"],
+            message=data.get("message", "Operator execution queued"),
+            sse_endpoint=data.get("sse_endpoint"),
+          )
+      elif hasattr(data, "operation_id"):
+        return QueuedOperatorResponse(
+          status=data.status if hasattr(data, "status") else "queued",
+          operation_id=data.operation_id,
+          message=data.message
+          if hasattr(data, "message") and data.message is not UNSET
+          else "Operator execution queued",
+          sse_endpoint=data.sse_endpoint
+          if hasattr(data, "sse_endpoint") and data.sse_endpoint is not UNSET
+          else None,
+        )
+      return None
 
+    except Exception as e:
       error_msg = str(e)
+      # Check for authentication errors
       if (
         "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg.lower()
       ):
@@ -390,9 +285,6 @@ class OperatorClient:
       else:
         raise Exception(f"Operator execution failed: {error_msg}")
 
-    # Unexpected response format
-    raise Exception("Unexpected response format from operator endpoint")
-
   def _wait_for_operator_completion(
     self, operation_id: str, options: OperatorOptions
   ) -> OperatorResult:
@@ -486,6 +378,131 @@ class OperatorClient:
     sse_client.close()
     return result
 
+  def stream_operator(
+    self,
+    graph_id: str,
+    request: Union[OperatorQueryRequest, str],
+    operator_type: Optional[str] = None,
+  ) -> Iterator[OperatorStreamEvent]:
+    """Run an operator and yield its output as it is produced.
+
+    The request is submitted in async mode so the agent runs behind an
+    operation stream; the SSE connection is read on a background thread
+    and every content delta and progress update is yielded the moment it
+    arrives. The last event has ``type == "completed"`` and carries the
+    full :class:`OperatorResult`. If the server answers synchronously
+    anyway, the whole content is yielded as one delta.
+
+    Closing the generator early (e.g. ``break``) closes the stream and
+    waits (briefly) for the reader thread to finish.
+
+    Args:
+        graph_id: Graph database identifier
+        request: Request object, or just the message text
+        operator_type: Specific operator (``"financial"``, ``"research"``,
+            ``"rag"``, ...); auto-selected when omitted
+
+    Raises:
+        Exception: the operator failed, was cancelled, or the stream
+            ended before completion.
+    """
+    if isinstance(request, str):
+      request = OperatorQueryRequest(message=request)
+    immediate, operation_id = self._start_stream(graph_id, operator_type, request)
+    if immediate is not None:
+      yield from immediate
+      return
+
+    events: "queue.Queue[Any]" = queue.Queue()
+    stopped = threading.Event()
+
+    def put(item: Any) -> None:
+      # Nothing is queued once the consumer has stopped reading
+      if not stopped.is_set():
+        events.put(item)
+
+    sse_client = SSEClient(SSEConfig(base_url=self.base_url, headers=self.headers))
+    _register_stream_listeners(sse_client, put)
+
+    def run() -> None:
+      try:
+        sse_client.connect(operation_id)
+      finally:
+        put(_STREAM_END)
+
+    reader = threading.Thread(target=run, name="operator-stream", daemon=True)
+    reader.start()
+    try:
+      while True:
+        event = _unwrap_stream_item(events.get())
+        yield event
+        if event.type == "completed":
+          return
+    finally:
+      stopped.set()
+      sse_client.close()  # makes a blocked connect() return
+      reader.join(_STREAM_CLOSE_TIMEOUT)
+
+  async def stream_operator_async(
+    self,
+    graph_id: str,
+    request: Union[OperatorQueryRequest, str],
+    operator_type: Optional[str] = None,
+  ) -> AsyncIterator[OperatorStreamEvent]:
+    """Async iterator version of :meth:`stream_operator`.
+
+    The submit call runs in a worker thread; the operation stream is
+    consumed with :class:`AsyncSSEClient` on the running event loop.
+    """
+    if isinstance(request, str):
+      request = OperatorQueryRequest(message=request)
+    immediate, operation_id = await asyncio.to_thread(
+      self._start_stream, graph_id, operator_type, request
+    )
+    if immediate is not None:
+      for event in immediate:
+        yield event
+      return
+
+    events: "asyncio.Queue[Any]" = asyncio.Queue()
+    sse_client = AsyncSSEClient(SSEConfig(base_url=self.base_url, headers=self.headers))
+    _register_stream_listeners(sse_client, events.put_nowait)
+
+    async def run() -> None:
+      try:
+        await sse_client.connect(operation_id)
+      finally:
+        events.put_nowait(_STREAM_END)
+
+    task = asyncio.create_task(run())
+    try:
+      while True:
+        event = _unwrap_stream_item(await events.get())
+        yield event
+        if event.type == "completed":
+          return
+    finally:
+      await sse_client.close()
+      task.cancel()
+
+  def _start_stream(
+    self,
+    graph_id: str,
+    operator_type: Optional[str],
+    request: OperatorQueryRequest,
+  ) -> Tuple[Optional[List[OperatorStreamEvent]], str]:
+    """Submit in async mode; returns ``(events, "")`` when the server
+    answered immediately, else ``(None, operation_id)``."""
+    parsed = self._submit(graph_id, operator_type, request, mode=ResponseMode.ASYNC)
+    if isinstance(parsed, OperatorResult):
+      events = [OperatorStreamEvent(type="completed", result=parsed)]
+      if parsed.content:
+        events.insert(0, OperatorStreamEvent(type="delta", delta=parsed.content))
+      return events, ""
+    if isinstance(parsed, QueuedOperatorResponse):
+      return None, parsed.operation_id
+    raise Exception("Unexpected response format from operator endpoint")
+
   def query(
     self, graph_id: str, message: str, context: Dict[str, Any] = None
   ) -> OperatorResult:
@@ -534,3 +551,148 @@ class OperatorClient:
     if self.sse_client:
       self.sse_client.close()
       self.sse_client = None
+
+
+# ── Operator streaming ──────────────────────────────────────────────
+
+# Events whose payload is a slice of generated content. The operation
+# stream relays agent output as data chunks; the explicit delta names are
+# accepted as well so newer backends can label them more precisely.
+_DELTA_EVENTS = (
+  EventType.DATA_CHUNK.value,
+  "operator_delta",
+  "content_delta",
+)
+
+# Sentinel pushed when the SSE connection returns, so a stream that ends
+# without a completion event fails instead of blocking forever.
+_STREAM_END = object()
+
+# Seconds stream_operator waits for its reader thread after closing the stream
+_STREAM_CLOSE_TIMEOUT = 5.0
+
+
+def _delta_text(data: Any) -> str:
+  if isinstance(data, str):
+    return data
+  if isinstance(data, dict):
+    for key in ("delta", "content", "text", "token"):
+      value = data.get(key)
+      if isinstance(value, str):
+        return value
+  return ""
+
+
+def _result_from_payload(data: Dict[str, Any], content: str) -> OperatorResult:
+  return OperatorResult(
+    content=data.get("content") or content,
+    operator_used=data.get("operator_used", "unknown"),
+    mode_used=data.get("mode_used", "standard"),
+    metadata=data.get("metadata"),
+    tokens_used=data.get("tokens_used"),
+    confidence_score=data.get("confidence_score"),
+    execution_time=data.get("execution_time"),
+    timestamp=data.get("timestamp", datetime.now().isoformat()),
+  )
+
+
+def _register_stream_listeners(
+  sse_client: Union[SSEClient, AsyncSSEClient], put: Callable[[Any], None]
+) -> None:
+  """Translate operation-stream events into :class:`OperatorStreamEvent`
+  items (or an ``Exception``) handed to ``put``."""
+  content: List[str] = []
+  done = False
+
+  def finish(item: Any) -> None:
+    nonlocal done
+    if not done:
+      done = True
+      put(item)
+
+  def on_delta(data: Any) -> None:
+    text = _delta_text(data)
+    if text and not done:
+      content.append(text)
+      put(OperatorStreamEvent(type="delta", delta=text))
+
+  def on_progress(data: Any) -> None:
+    data = data if isinstance(data, dict) else {}
+    put(
+      OperatorStreamEvent(
+        type="progress",
+        message=data.get("message", "Processing..."),
+        percentage=data.get("percentage"),
+      )
+    )
+
+  def on_operator_started(data: Any) -> None:
+    data = data if isinstance(data, dict) else {}
+    put(
+      OperatorStreamEvent(
+        type="progress",
+        message=f"Agent {data.get('operator_type')} started",
+        percentage=0,
+      )
+    )
+
+  def on_operator_initialized(data: Any) -> None:
+    data = data if isinstance(data, dict) else {}
+    put(
+      OperatorStreamEvent(
+        type="progress",
+        message=f"{data.get('operator_name')} initialized",
+        percentage=10,
+      )
+    )
+
+  def on_operator_completed(data: Any) -> None:
+    data = data if isinstance(data, dict) else {}
+    finish(
+      OperatorStreamEvent(
+        type="completed", result=_result_from_payload(data, "".join(content))
+      )
+    )
+
+  def on_completed(data: Any) -> None:
+    # Fallback to generic completion event
+    data = data if isinstance(data, dict) else {}
+    payload = data.get("result", data)
+    if not isinstance(payload, dict):
+      payload = {}
+    finish(
+      OperatorStreamEvent(
+        type="completed", result=_result_from_payload(payload, "".join(content))
+      )
+    )
+
+  def on_error(err: Any) -> None:
+    if isinstance(err, Exception):
+      finish(err)
+    else:
+      err = err if isinstance(err, dict) else {}
+      finish(Exception(err.get("message", err.get("error", "Unknown error"))))
+
+  def on_cancelled(data: Any = None) -> None:
+    finish(Exception("Operator execution cancelled"))
+
+  for event_type in _DELTA_EVENTS:
+    sse_client.on(event_type, on_delta)
+  sse_client.on(EventType.OPERATION_PROGRESS.value, on_progress)
+  sse_client.on("progress", on_progress)
+  sse_client.on("operator_started", on_operator_started)
+  sse_client.on("operator_initialized", on_operator_initialized)
+  sse_client.on("operator_completed", on_operator_completed)
+  sse_client.on(EventType.OPERATION_COMPLETED.value, on_completed)
+  sse_client.on(EventType.OPERATION_ERROR.value, on_error)
+  sse_client.on("error", on_error)
+  sse_client.on("max_retries_exceeded", on_error)
+  sse_client.on(EventType.OPERATION_CANCELLED.value, on_cancelled)
+
+
+def _unwrap_stream_item(item: Any) -> OperatorStreamEvent:
+  if item is _STREAM_END:
+    raise Exception("Operator stream ended before completion")
+  if isinstance(item, Exception):
+    raise item
+  return item
@@ -0,0 +1,228 @@
+"""SQLite backend for :class:`ReadCache`, shared by a user's processes on one host.
+
+With the default in-memory backend every worker process warms its own
+copy of the fiscal calendars, taxonomies and tier catalogue, and loses it
+on restart. A :class:`SQLiteCacheBackend` keeps the entries in one SQLite
+file instead, so a user's processes on a host share them::
+
+    cache = ReadCache(backend=SQLiteCacheBackend())
+    clients = RoboSystemsClients(RoboSystemsClientConfig(read_cache=cache))
+
+Entries are zlib-compressed JSON, keyed by endpoint, graph, variables,
+a hash of the GraphQL document and the credential scope, and carry the
+wall-clock times their fresh and stale windows end. The file runs in WAL
+mode, so readers never wait on a writer. Facade writes delete their invalidated rows for every
+process; background refreshes are still per process. Once total payload
+size exceeds ``max_bytes`` the least recently read entries are dropped.
+
+Cached responses are tenant data: the file is created owner-only
+(``0600``, in a ``0700`` directory when the directory is new), and
+entries of different credentials never share a key.
+
+A locked or unreadable file degrades to cache misses (logged), never to
+failed reads.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from .read_cache import CacheEntry, CacheKey
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "robosystems" / "reads.sqlite"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB
+
+# Bump when the table layout or payload encoding changes; older files
+# are emptied on open.
+SCHEMA_VERSION = 2
+
+# accessed_at is only rewritten when older than this, so hot reads stay
+# read-only transactions.
+_TOUCH_SECONDS = 60.0
+
+# Size pruning runs on the first write and every this many after.
+_PRUNE_EVERY = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+  key TEXT PRIMARY KEY,
+  endpoint TEXT NOT NULL,
+  graph_id TEXT,
+  payload BLOB NOT NULL,
+  size INTEGER NOT NULL,
+  fresh_until REAL NOT NULL,
+  stale_until REAL NOT NULL,
+  accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_graph ON entries (graph_id, endpoint);
+"""
+
+# Expired rows, then the least recently read rows past the size bound
+_PRUNE = """
+DELETE FROM entries WHERE stale_until <= :now OR key IN (
+  SELECT key FROM (
+    SELECT key, SUM(size) OVER (
+      ORDER BY accessed_at DESC ROWS UNBOUNDED PRECEDING
+    ) AS running
+    FROM entries
+  ) WHERE running > :max_bytes
+)
+"""
+
+
+class SQLiteCacheBackend:
+  """:class:`~robosystems_client.clients.read_cache.CacheBackend` on a SQLite file.
+
+  Values must be JSON-serializable; others are not cached (they are
+  still returned to the caller).
+
+  Args:
+      path: Cache file, created with its directory if missing
+      max_bytes: Compressed payload bytes kept in the file
+      timeout: Seconds to wait on another process's write lock
+      compress_level: zlib level for payloads
+  """
+
+  def __init__(
+    self,
+    path: str | Path = DEFAULT_CACHE_PATH,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    timeout: float = 5.0,
+    compress_level: int = 6,
+  ):
+    self.path = Path(path)
+    self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Owner-only before SQLite opens it; its -wal/-shm files copy the mode
+    os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+    with contextlib.suppress(OSError):
+      os.chmod(self.path, 0o600)
+    self.max_bytes = max_bytes
+    self.compress_level = compress_level
+    self._lock = threading.Lock()
+    self._writes = 0
+    self._conn = sqlite3.connect(
+      self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+    )
+    self._conn.execute("PRAGMA journal_mode = WAL")
+    self._conn.execute("PRAGMA synchronous = NORMAL")
+    with self._conn:
+      self._conn.execute("BEGIN IMMEDIATE")
+      version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+      if version != SCHEMA_VERSION:
+        self._conn.execute("DROP TABLE IF EXISTS entries")
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+      for statement in _SCHEMA.split(";"):
+        if statement.strip():
+          self._conn.execute(statement)
+
+  @staticmethod
+  def _row_key(key: CacheKey) -> str:
+    return json.dumps(key, separators=(",", ":"))
+
+  def get(self, key: CacheKey) -> Optional[CacheEntry]:
+    row_key = self._row_key(key)
+    now = time.time()
+    try:
+      with self._lock:
+        row = self._conn.execute(
+          "SELECT payload, fresh_until, stale_until, accessed_at FROM entries "
+          "WHERE key = ? AND stale_until > ?",
+          (row_key, now),
+        ).fetchone()
+        if row is None:
+          return None
+        payload, fresh_until, stale_until, accessed_at = row
+        if now - accessed_at > _TOUCH_SECONDS:
+          self._conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, row_key)
+          )
+      value = json.loads(zlib.decompress(payload))
+    except (sqlite3.Error, zlib.error, ValueError):
+      logger.warning("Read cache lookup of %s failed", key[0], exc_info=True)
+      return None
+    return CacheEntry(value, fresh_until, stale_until)
+
+  def set(self, key: CacheKey, entry: CacheEntry) -> None:
+    try:
+      payload = zlib.compress(
+        json.dumps(entry.value, separators=(",", ":")).encode(), self.compress_level
+      )
+    except (TypeError, ValueError):
+      logger.debug("Not caching %s: value is not JSON-serializable", key[0])
+      return
+    try:
+      with self._lock:
+        self._conn.execute(
+          "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+          (
+            self._row_key(key),
+            key[0],
+            key[1],
+            payload,
+            len(payload),
+            entry.fresh_until,
+            entry.stale_until,
+            time.time(),
+          ),
+        )
+        prune = self._writes % _PRUNE_EVERY == 0
+        self._writes += 1
+      if prune:
+        self.prune()
+    except sqlite3.Error:
+      logger.warning("Read cache store of %s failed", key[0], exc_info=True)
+
+  def prune(self) -> int:
+    """Drop expired entries and those past ``max_bytes``; returns the count."""
+    with self._lock:
+      cursor = self._conn.execute(
+        _PRUNE, {"now": time.time(), "max_bytes": self.max_bytes}
+      )
+    return cursor.rowcount
+
+  def invalidate(
+    self, graph_id: Optional[str], endpoints: Optional[tuple[str, ...]]
+  ) -> int:
+    clauses, params = [], []
+    if graph_id is not None:
+      clauses.append("graph_id = ?")
+      params.append(graph_id)
+    if endpoints is not None:
+      clauses.append(f"endpoint IN ({', '.join('?' * len(endpoints))})")
+      params.extend(endpoints)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    try:
+      with self._lock:
+        cursor = self._conn.execute(f"DELETE FROM entries{where}", params)
+    except sqlite3.Error:
+      # Runs after a write already succeeded; don't fail it over the cache
+      logger.warning("Read cache invalidation of %s failed", graph_id, exc_info=True)
+      return 0
+    return cursor.rowcount
+
+  def size_bytes(self) -> int:
+    """Compressed payload bytes currently stored."""
+    with self._lock:
+      return self._conn.execute(
+        "SELECT COALESCE(SUM(size), 0) FROM entries"
+      ).fetchone()[0]
+
+  def __len__(self) -> int:
+    with self._lock:
+      return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+  def close(self) -> None:
+    with self._lock:
+      self._conn.close()
@@ -3,6 +3,10 @@
 Provides intelligent query execution with automatic strategy selection.
 """
 
+import time
+from http import HTTPStatus
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import (
   Dict,
@@ -13,12 +17,16 @@ from typing import (
   Iterator,
   Union,
   Generator,
+  Iterable,
   List,
 )
 from datetime import datetime
 
 from ..api.query.execute_cypher import sync_detailed as execute_cypher_query
 from ..models.cypher_statement_request import CypherStatementRequest
+from ..types import Response
+from .ndjson import decode_ndjson, iter_ndjson, loads
+from .row_spool import RowSpool
 from .sse_client import SSEClient, AsyncSSEClient, SSEConfig, EventType
 
 
@@ -66,6 +74,92 @@ class QueuedQueryResponse:
   message: str
 
 
+@dataclass
+class GraphQueryOutcome:
+  """One graph's result (or error) from a multi-graph query"""
+
+  graph_id: str
+  result: Optional[QueryResult] = None
+  error: Optional[str] = None
+
+  @property
+  def success(self) -> bool:
+    return self.error is None
+
+
+@dataclass
+class MultiGraphQueryResult:
+  """Results of :meth:`QueryClient.query_many_graphs`, in graph order"""
+
+  outcomes: List[GraphQueryOutcome]
+  elapsed_seconds: float
+
+  @property
+  def results(self) -> Dict[str, QueryResult]:
+    return {o.graph_id: o.result for o in self.outcomes if o.result is not None}
+
+  @property
+  def errors(self) -> Dict[str, str]:
+    return {o.graph_id: o.error for o in self.outcomes if o.error is not None}
+
+  @property
+  def success(self) -> bool:
+    return all(o.success for o in self.outcomes)
+
+  @property
+  def columns(self) -> List[str]:
+    """Union of the result columns, in first-seen order"""
+    seen: Dict[str, None] = {}
+    for result in self.results.values():
+      names = result.columns
+      if not names and result.data and isinstance(result.data[0], dict):
+        names = list(result.data[0])
+      seen.update(dict.fromkeys(names))
+    return list(seen)
+
+  def rows(self) -> Iterator[Dict[str, Any]]:
+    """Every row as a dict tagged with its ``graph_id``"""
+    for graph_id, result in self.results.items():
+      for row in result.data:
+        if isinstance(row, dict):
+          yield {"graph_id": graph_id, **row}
+        else:
+          yield {"graph_id": graph_id, **dict(zip(result.columns, row))}
+
+  def to_columns(self) -> Dict[str, list]:
+    """Merge all graphs' rows into one column-oriented dict
+
+    The first column is ``graph_id``; a column missing from a graph's
+    result is filled with ``None`` for that graph's rows.
+    """
+    names = self.columns
+    merged: Dict[str, list] = {"graph_id": [], **{name: [] for name in names}}
+    for graph_id, result in self.results.items():
+      rows = result.data
+      merged["graph_id"].extend([graph_id] * len(rows))
+      if rows and isinstance(rows[0], dict):
+        for name in names:
+          merged[name].extend([row.get(name) for row in rows])
+      else:
+        positions = {name: i for i, name in enumerate(result.columns)}
+        for name in names:
+          i = positions.get(name)
+          if i is None:
+            merged[name].extend([None] * len(rows))
+          else:
+            merged[name].extend([row[i] for row in rows])
+    return merged
+
+  def to_dataframe(self) -> Any:
+    """Merged rows as a DataFrame with a categorical ``graph_id`` column"""
+    from .dataframe_utils import pd, require_pandas
+
+    require_pandas()
+    df = pd.DataFrame(self.to_columns())
+    df["graph_id"] = df["graph_id"].astype("category")
+    return df
+
+
 class QueuedQueryError(Exception):
   """Exception thrown when query is queued and maxWait is 0"""
 
@@ -74,6 +168,32 @@ class QueuedQueryError(Exception):
     self.queue_info = queue_info
 
 
+def _cypher_request(
+  graph_id: str,
+  *,
+  body: CypherStatementRequest,
+  mode: Optional[str] = None,
+  chunk_size: Optional[int] = None,
+  test_mode: bool = False,
+) -> Dict[str, Any]:
+  """Request arguments for the execute-cypher endpoint
+
+  Used to stream the response body, which the generated
+  ``execute_cypher.sync_detailed`` always reads in full.
+  """
+  params = {
+    "mode": getattr(mode, "value", mode),
+    "chunk_size": chunk_size,
+    "test_mode": test_mode,
+  }
+  return {
+    "method": "post",
+    "url": f"/v1/graphs/{quote(str(graph_id), safe='')}/query/cypher",
+    "params": {k: v for k, v in params.items() if v is not None},
+    "json": body.to_dict(),
+  }
+
+
 class QueryClient:
   """Enhanced query client with SSE streaming support"""
 
@@ -84,6 +204,12 @@ class QueryClient:
     # Get token from config if passed by parent
     self.token = config.get("token")
     self.sse_client: Optional[SSEClient] = None
+    # Processes used to decode large NDJSON responses (1 = in-process)
+    self.ndjson_decode_workers = config.get("ndjson_decode_workers", 1)
+    # Bytes of rows held in memory before a result spills to disk; when
+    # set, NDJSON responses are streamed and QueryResult.data is a
+    # RowSpool instead of a list
+    self.query_memory_budget = config.get("query_memory_budget")
 
   def execute_query(
     self, graph_id: str, request: QueryRequest, options: QueryOptions = None
@@ -121,7 +247,12 @@ class QueryClient:
         "chunk_size": options.chunk_size if options.chunk_size else 1000,
         "test_mode": options.test_mode if options.test_mode else False,
       }
-      response = execute_cypher_query(**kwargs)
+      if self.query_memory_budget is None:
+        response = execute_cypher_query(**kwargs)
+      else:
+        response = self._execute_spooled(**kwargs)
+        if isinstance(response, QueryResult):
+          return response
 
       # Check if this is an NDJSON streaming response (parsed will be None for NDJSON)
       if (
@@ -286,29 +417,61 @@ class QueryClient:
     # Unexpected response format
     raise Exception("Unexpected response format from query endpoint")
 
-  def _parse_ndjson_response(self, response, graph_id: str) -> QueryResult:
-    """Parse NDJSON streaming response and aggregate into QueryResult"""
-    import json
+  def _new_rows(self) -> Union[list, RowSpool]:
+    if self.query_memory_budget is None:
+      return []
+    return RowSpool(memory_budget=self.query_memory_budget)
 
-    all_data = []
-    columns = None
-    total_rows = 0
-    execution_time_ms = 0
+  def _execute_spooled(self, client, graph_id: str, **kwargs):
+    """Run the query with a streamed body, spooling NDJSON line by line
 
-    # Parse NDJSON line by line
+    An NDJSON response is decoded as it arrives, so neither the raw body
+    nor the decoded rows are ever held whole in memory. Any other
+    response is read in full and returned as the generated client's
+    ``Response`` for the usual handling.
+    """
+    request = _cypher_request(graph_id, **kwargs)
+    with client.get_httpx_client().stream(**request) as response:
+      content_type = response.headers.get("content-type", "")
+      if response.status_code == 200 and (
+        "application/x-ndjson" in content_type
+        or response.headers.get("x-stream-format") == "ndjson"
+      ):
+        lines = (line for line in response.iter_lines() if line.strip())
+        return self._aggregate_ndjson(map(loads, lines), graph_id)
+      response.read()
+    return Response(
+      status_code=HTTPStatus(response.status_code),
+      content=response.content,
+      headers=response.headers,
+      parsed=response.json() if response.status_code == 200 else None,
+    )
+
+  def _parse_ndjson_response(self, response, graph_id: str) -> QueryResult:
+    """Parse a buffered NDJSON response and aggregate into QueryResult"""
     content = (
-      response.content.decode("utf-8")
+      response.content
       if isinstance(response.content, bytes)
-      else response.content
+      else response.content.encode("utf-8")
     )
+    if self.query_memory_budget is not None:
+      # Decode lazily so decoded rows never exceed the memory budget
+      return self._aggregate_ndjson(iter_ndjson(content), graph_id)
+    try:
+      chunks = decode_ndjson(content, workers=self.ndjson_decode_workers)
+    except ValueError as e:
+      raise Exception(f"Failed to parse NDJSON line: {e}")
+    return self._aggregate_ndjson(chunks, graph_id)
+
+  def _aggregate_ndjson(self, chunks: Iterable[Any], graph_id: str) -> QueryResult:
+    """Collect decoded NDJSON chunks into a QueryResult"""
+    all_data = self._new_rows()
+    columns = None
+    total_rows = 0
+    execution_time_ms = 0
 
-    for line in content.strip().split("\n"):
-      if not line.strip():
-        continue
-
-      try:
-        chunk = json.loads(line)
-
+    try:
+      for chunk in chunks:
         # Extract columns from first chunk
         if columns is None and "columns" in chunk:
           columns = chunk["columns"]
@@ -324,9 +487,8 @@ class QueryClient:
         # Track execution time (use max from all chunks)
         if "execution_time_ms" in chunk:
           execution_time_ms = max(execution_time_ms, chunk["execution_time_ms"])
-
-      except json.JSONDecodeError as e:
-        raise Exception(f"Failed to parse NDJSON line: {e}")
+    except ValueError as e:
+      raise Exception(f"Failed to parse NDJSON line: {e}")
 
     # Return aggregated result
     return QueryResult(
@@ -346,8 +508,11 @@ class QueryClient:
     completed = False
     error = None
 
-    # Set up SSE connection
-    sse_config = SSEConfig(base_url=self.base_url, headers=self.headers)
+    # Set up SSE connection. on_data_chunk only extends the buffer, so
+    # consecutive chunks can be merged into one dispatch.
+    sse_config = SSEConfig(
+      base_url=self.base_url, headers=self.headers, coalesce_data_chunks=True
+    )
     self.sse_client = SSEClient(sse_config)
 
     # Set up event handlers
@@ -490,7 +655,8 @@ class QueryClient:
       return result
     else:
       # If it's an iterator, collect all results
-      data = list(result)
+      data = self._new_rows()
+      data.extend(result)
       return QueryResult(
         data=data,
         columns=[],  # Would need to extract from first chunk
@@ -594,6 +760,87 @@ class QueryClient:
 
     return results
 
+  def iter_query_many_graphs(
+    self,
+    graph_ids: List[str],
+    cypher: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    concurrency: int = 8,
+  ) -> Iterator[GraphQueryOutcome]:
+    """Run one query against many graphs, yielding results as they finish
+
+    At most ``concurrency`` graphs are queried at once. A graph whose
+    query fails yields an outcome with ``error`` set rather than
+    stopping the sweep. Closing the iterator early cancels the graphs
+    not yet started.
+
+    Example:
+        >>> for outcome in query_client.iter_query_many_graphs(
+        ...     graph_ids, 'MATCH (e:Entity) RETURN e.name AS name'
+        ... ):
+        ...     print(outcome.graph_id, outcome.result.row_count)
+    """
+    graph_ids = list(dict.fromkeys(graph_ids))
+    if not graph_ids:
+      return
+    pool = ThreadPoolExecutor(
+      max_workers=max(1, min(concurrency, len(graph_ids))),
+      thread_name_prefix="query-many",
+    )
+    try:
+      futures = {
+        pool.submit(self.query, graph_id, cypher, parameters): graph_id
+        for graph_id in graph_ids
+      }
+      for future in as_completed(futures):
+        graph_id = futures[future]
+        try:
+          yield GraphQueryOutcome(graph_id=graph_id, result=future.result())
+        except Exception as e:
+          yield GraphQueryOutcome(graph_id=graph_id, error=str(e))
+    finally:
+      pool.shutdown(wait=True, cancel_futures=True)
+
+  def query_many_graphs(
+    self,
+    graph_ids: List[str],
+    cypher: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    concurrency: int = 8,
+    on_result: Optional[Callable[[GraphQueryOutcome], None]] = None,
+  ) -> MultiGraphQueryResult:
+    """Run one query against many graphs in parallel and collect the results
+
+    Args:
+        graph_ids: Graphs to query (duplicates are queried once)
+        cypher: Cypher query string
+        parameters: Query parameters, shared by every graph
+        concurrency: Maximum number of graphs queried at once
+        on_result: Called with each graph's outcome as it completes
+
+    Returns:
+        MultiGraphQueryResult in ``graph_ids`` order; ``to_columns()`` and
+        ``to_dataframe()`` merge the rows, tagged with ``graph_id``
+
+    Example:
+        >>> merged = query_client.query_many_graphs(
+        ...     graph_ids, 'MATCH (e:Entity) RETURN e.name AS name', concurrency=16
+        ... )
+        >>> df = merged.to_dataframe()
+    """
+    start = time.perf_counter()
+    by_graph: Dict[str, GraphQueryOutcome] = {}
+    for outcome in self.iter_query_many_graphs(
+      graph_ids, cypher, parameters, concurrency
+    ):
+      by_graph[outcome.graph_id] = outcome
+      if on_result:
+        on_result(outcome)
+    return MultiGraphQueryResult(
+      outcomes=[by_graph[g] for g in dict.fromkeys(graph_ids)],
+      elapsed_seconds=time.perf_counter() - start,
+    )
+
   def close(self):
     """Cancel any active SSE connections"""
     if self.sse_client:
@@ -0,0 +1,419 @@
+"""Stale-while-revalidate cache for slow-changing reference reads.
+
+Fiscal calendars, reporting taxonomies, account trees, library taxonomies
+and the graph tier catalogue change rarely but are read on nearly every
+request. A :class:`ReadCache` passed to the facades (the ``read_cache``
+config key) serves those reads locally under a per-endpoint
+:class:`CachePolicy`:
+
+- younger than ``fresh_seconds``: returned without a request;
+- younger than ``fresh_seconds + stale_seconds``: returned immediately,
+  while one background refresh replaces it;
+- older, or not cached: fetched inline.
+
+Endpoints are GraphQL operation names (``GetLedgerFiscalCalendar``) or,
+for REST reads, ``<tag>/<operation>`` (``graphs/get_available_graph_tiers``).
+Reads of endpoints without a policy are never cached.
+
+Writes made through the facades invalidate what they change for their
+graph — ``create_taxonomy_block`` drops the cached reporting taxonomy,
+``close_period`` the fiscal calendar, and so on (see
+:data:`INVALIDATED_BY`). Writes made elsewhere are picked up once the
+fresh window passes, or call :meth:`ReadCache.invalidate` directly.
+
+Entries are scoped to the credential that fetched them (see
+:func:`credential_scope`), so a cache shared by clients acting for
+different users never serves one caller's data to another. With a
+rotating ``token_provider`` each new token starts a new scope; older
+entries age out.
+
+Entries live in a :class:`CacheBackend`: :class:`MemoryCacheBackend`
+(the default) per process, or ``SQLiteCacheBackend`` (see
+``persistent_cache.py``) on local disk, shared by every process on the
+host and surviving restarts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+  """How long an endpoint's results are fresh, then servable while stale."""
+
+  fresh_seconds: float
+  stale_seconds: float = 0.0
+
+
+DEFAULT_POLICIES: dict[str, CachePolicy] = {
+  # Ledger — per graph; the writes below invalidate them
+  "GetLedgerFiscalCalendar": CachePolicy(30, 300),
+  "GetLedgerReportingTaxonomy": CachePolicy(300, 3600),
+  "ListLedgerTaxonomies": CachePolicy(300, 3600),
+  "GetLedgerAccountTree": CachePolicy(60, 600),
+  # Library — shared reference data, changed only by releases
+  "ListLibraryTaxonomies": CachePolicy(3600, 86400),
+  "GetLibraryTaxonomy": CachePolicy(3600, 86400),
+  "ListLibraryStructures": CachePolicy(3600, 86400),
+  # REST
+  "graphs/get_available_graph_tiers": CachePolicy(3600, 86400),
+}
+
+_TAXONOMY_READS = (
+  "GetLedgerReportingTaxonomy",
+  "ListLedgerTaxonomies",
+  "GetLedgerAccountTree",
+)
+
+# Write operation -> endpoints it invalidates for the graph it wrote to
+INVALIDATED_BY: dict[str, tuple[str, ...]] = {
+  "create-taxonomy-block": _TAXONOMY_READS,
+  "update-taxonomy-block": _TAXONOMY_READS,
+  "delete-taxonomy-block": _TAXONOMY_READS,
+  "link-entity-taxonomy": ("GetLedgerReportingTaxonomy", "ListLedgerTaxonomies"),
+  "initialize-ledger": ("GetLedgerFiscalCalendar",),
+  "set-close-target": ("GetLedgerFiscalCalendar",),
+  "close-period": ("GetLedgerFiscalCalendar",),
+  "reopen-period": ("GetLedgerFiscalCalendar",),
+}
+
+_OPERATION_NAME = re.compile(r"^\s*(?:query|mutation|subscription)\s+(\w+)", re.M)
+
+
+@functools.lru_cache(maxsize=None)
+def operation_name(document: str) -> Optional[str]:
+  """Name of the first operation in a GraphQL document, if it has one."""
+  match = _OPERATION_NAME.search(document)
+  return match.group(1) if match else None
+
+
+def credential_scope(
+  base_url: str, token: Optional[str], headers: Optional[dict[str, str]] = None
+) -> str:
+  """Opaque hash of the server and credentials a read was made with.
+
+  Part of every cache key, so entries never cross users; the raw token
+  is not stored.
+  """
+  material = json.dumps(
+    [base_url, token, sorted((headers or {}).items())], default=str
+  ).encode()
+  return hashlib.sha256(material).hexdigest()[:32]
+
+
+# (endpoint, graph_id, canonical variables JSON, document hash, credential scope)
+CacheKey = tuple[str, Optional[str], str, str, str]
+
+
+@dataclass
+class CacheEntry:
+  """A cached value and the wall-clock times its windows end."""
+
+  value: Any
+  fresh_until: float
+  stale_until: float
+
+
+class CacheBackend(Protocol):
+  """Storage behind a :class:`ReadCache`.
+
+  ``get`` returns ``None`` for missing or fully expired keys. ``set`` may
+  decline a value it cannot store (e.g. one that does not serialize).
+  """
+
+  def get(self, key: CacheKey) -> Optional[CacheEntry]: ...
+
+  def set(self, key: CacheKey, entry: CacheEntry) -> None: ...
+
+  def invalidate(
+    self, graph_id: Optional[str], endpoints: Optional[tuple[str, ...]]
+  ) -> int: ...
+
+  def __len__(self) -> int: ...
+
+  def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+  """Per-process, thread-safe LRU storage; values are kept as-is, not copied."""
+
+  def __init__(self, max_entries: int = 1024):
+    self.max_entries = max_entries
+    self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key: CacheKey) -> Optional[CacheEntry]:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      if time.time() >= entry.stale_until:
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+      return entry
+
+  def set(self, key: CacheKey, entry: CacheEntry) -> None:
+    with self._lock:
+      self._entries[key] = entry
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+
+  def invalidate(
+    self, graph_id: Optional[str], endpoints: Optional[tuple[str, ...]]
+  ) -> int:
+    with self._lock:
+      doomed = [
+        key
+        for key in self._entries
+        if (graph_id is None or key[1] == graph_id)
+        and (endpoints is None or key[0] in endpoints)
+      ]
+      for key in doomed:
+        del self._entries[key]
+    return len(doomed)
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def close(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+
+class ReadCache:
+  """Stale-while-revalidate cache keyed by endpoint, graph, variables,
+  document and credential scope.
+
+  Thread-safe. Stale sync reads are refreshed on a small background
+  thread pool; stale async reads on a task of the running loop. A
+  failed refresh is logged and the stale value kept until it expires.
+
+  Args:
+      policies: Endpoint -> policy; replaces :data:`DEFAULT_POLICIES`
+      max_entries: Size of the default in-memory backend
+      refresh_workers: Threads used for background refreshes
+      backend: Entry storage (default :class:`MemoryCacheBackend`)
+  """
+
+  def __init__(
+    self,
+    policies: Optional[dict[str, CachePolicy]] = None,
+    *,
+    max_entries: int = 1024,
+    refresh_workers: int = 2,
+    backend: Optional[CacheBackend] = None,
+  ):
+    self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+    self.refresh_workers = refresh_workers
+    self.backend: CacheBackend = (
+      backend if backend is not None else MemoryCacheBackend(max_entries)
+    )
+    self.hits = 0
+    self.stale_hits = 0
+    self.misses = 0
+    self._refreshing: set[CacheKey] = set()
+    # Bumped by every invalidation; a fetch that started before one must
+    # not store its (possibly pre-write) result.
+    self._epoch = 0
+    self._lock = threading.Lock()
+    self._executor: Optional[ThreadPoolExecutor] = None
+    # Pending async refreshes; the loop only keeps weak references
+    self._tasks: set[asyncio.Task[None]] = set()
+
+  # ── Reads ───────────────────────────────────────────────────────────
+
+  @staticmethod
+  def key(
+    endpoint: str,
+    graph_id: Optional[str],
+    variables: Any = None,
+    document: Optional[str] = None,
+    scope: str = "",
+  ) -> CacheKey:
+    return (
+      endpoint,
+      graph_id,
+      json.dumps(variables, sort_keys=True, default=str) if variables else "",
+      hashlib.sha256(document.encode()).hexdigest()[:16] if document else "",
+      scope,
+    )
+
+  def get(
+    self,
+    endpoint: Optional[str],
+    graph_id: Optional[str],
+    variables: Any,
+    fetch: Callable[[], T],
+    document: Optional[str] = None,
+    scope: str = "",
+  ) -> T:
+    """Return the cached value for the read, calling ``fetch`` as the policy requires.
+
+    ``document`` (the GraphQL text) is part of the key, so a client
+    upgrade that changes a query does not read entries cached for the
+    old one from a persistent backend. ``scope`` is the
+    :func:`credential_scope` of the caller; reads of different scopes
+    never share entries.
+    """
+    policy = self.policies.get(endpoint) if endpoint else None
+    if policy is None:
+      return fetch()
+    key = self.key(endpoint, graph_id, variables, document, scope)
+    entry, refresh = self._lookup(key)
+    if entry is None:
+      epoch = self._epoch
+      value = fetch()
+      self._store(key, policy, value, epoch)
+      return value
+    if refresh:
+      self._refresh_in_thread(key, policy, fetch)
+    return entry.value
+
+  async def aget(
+    self,
+    endpoint: Optional[str],
+    graph_id: Optional[str],
+    variables: Any,
+    fetch: Callable[[], Awaitable[T]],
+    document: Optional[str] = None,
+    scope: str = "",
+  ) -> T:
+    """Asyncio counterpart of :meth:`get`; ``fetch`` returns an awaitable."""
+    policy = self.policies.get(endpoint) if endpoint else None
+    if policy is None:
+      return await fetch()
+    key = self.key(endpoint, graph_id, variables, document, scope)
+    entry, refresh = self._lookup(key)
+    if entry is None:
+      epoch = self._epoch
+      value = await fetch()
+      self._store(key, policy, value, epoch)
+      return value
+    if refresh:
+      task = asyncio.ensure_future(self._arefresh(key, policy, fetch))
+      self._tasks.add(task)
+      task.add_done_callback(self._tasks.discard)
+    return entry.value
+
+  def _lookup(self, key: CacheKey) -> tuple[Optional[CacheEntry], bool]:
+    """The servable entry (if any) and whether this caller should refresh it."""
+    # Backend I/O (possibly disk) runs outside the lock; only the
+    # counters and the refresh claim are serialized.
+    entry = self.backend.get(key)
+    now = time.time()
+    with self._lock:
+      if entry is None or now >= entry.stale_until:
+        self.misses += 1
+        return None, False
+      if now < entry.fresh_until:
+        self.hits += 1
+        return entry, False
+      self.stale_hits += 1
+      if key in self._refreshing:
+        return entry, False
+      self._refreshing.add(key)
+      return entry, True
+
+  def _store(self, key: CacheKey, policy: CachePolicy, value: Any, epoch: int) -> None:
+    now = time.time()
+    entry = CacheEntry(
+      value,
+      fresh_until=now + policy.fresh_seconds,
+      stale_until=now + policy.fresh_seconds + policy.stale_seconds,
+    )
+    # Stays under the lock so no invalidation lands between the epoch
+    # check and the write.
+    with self._lock:
+      if epoch != self._epoch:
+        return
+      self.backend.set(key, entry)
+
+  def _refresh_in_thread(
+    self, key: CacheKey, policy: CachePolicy, fetch: Callable[[], Any]
+  ) -> None:
+    with self._lock:
+      if self._executor is None:
+        self._executor = ThreadPoolExecutor(
+          max_workers=self.refresh_workers, thread_name_prefix="read-cache"
+        )
+      epoch = self._epoch
+
+    def refresh() -> None:
+      try:
+        self._store(key, policy, fetch(), epoch)
+      except Exception:
+        logger.warning("Background refresh of %s failed", key[0], exc_info=True)
+      finally:
+        with self._lock:
+          self._refreshing.discard(key)
+
+    self._executor.submit(refresh)
+
+  async def _arefresh(
+    self,
+    key: CacheKey,
+    policy: CachePolicy,
+    fetch: Callable[[], Awaitable[Any]],
+  ) -> None:
+    epoch = self._epoch
+    try:
+      self._store(key, policy, await fetch(), epoch)
+    except Exception:
+      logger.warning("Background refresh of %s failed", key[0], exc_info=True)
+    finally:
+      with self._lock:
+        self._refreshing.discard(key)
+
+  # ── Invalidation ────────────────────────────────────────────────────
+
+  def invalidate(
+    self, graph_id: Optional[str] = None, endpoints: Optional[tuple[str, ...]] = None
+  ) -> int:
+    """Drop cached reads of ``graph_id`` (all graphs when None) for
+    ``endpoints`` (all when None). Returns the number dropped."""
+    with self._lock:
+      self._epoch += 1
+      return self.backend.invalidate(graph_id, endpoints)
+
+  def on_write(self, operation: str, graph_id: Optional[str]) -> int:
+    """Invalidate what the write ``operation`` changed on ``graph_id``."""
+    endpoints = INVALIDATED_BY.get(operation)
+    if not endpoints:
+      return 0
+    return self.invalidate(graph_id, endpoints)
+
+  def clear(self) -> None:
+    self.invalidate()
+
+  def close(self) -> None:
+    """Stop the background refresh threads and release the backend.
+
+    A persistent backend keeps its entries on disk for the next process.
+    """
+    with self._lock:
+      executor, self._executor = self._executor, None
+      self.backend.close()
+    if executor is not None:
+      executor.shutdown(wait=False, cancel_futures=True)
+
+  def __len__(self) -> int:
+    return len(self.backend)
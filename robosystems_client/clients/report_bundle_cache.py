@@ -0,0 +1,178 @@
+"""On-disk cache for Report serialization bundles.
+
+Published bundles are immutable per ``generation_count``: the server bumps
+the generation whenever a Report is regenerated. A bundle cached under
+``(graph_id, report_id, format, generation_count)`` therefore never goes
+stale, and a repeat download only needs the cheap ``reportDownloadUrl``
+metadata lookup to learn the current generation before it is served from
+disk. The cache is bounded by total size with least-recently-used
+eviction.
+
+Each entry is a blob plus a small JSON metadata file, both named by the
+SHA-256 of the key. The metadata file's mtime doubles as the LRU clock,
+so the cache needs no index and can be shared between processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GiB
+
+
+@dataclass
+class CachedBundle:
+  """Metadata of a cached bundle; ``path`` is the blob on disk."""
+
+  path: Path
+  filename: str
+  format: str
+  content_type: str
+  generation_count: int
+  sha256: str
+  size_bytes: int
+
+
+class ReportBundleCache:
+  """Size-bounded LRU cache of Report bundles keyed by generation.
+
+  Pass an instance as ``RoboSystemsClientConfig(report_bundle_cache=...)``
+  (or ``config["report_bundle_cache"]``) and
+  :meth:`LedgerClient.download_report_bundle` consults it automatically.
+
+  Args:
+      directory: Cache directory (created if missing).
+      max_bytes: Total blob size kept on disk. The entry written last is
+          never evicted, so a single bundle larger than the bound is
+          still served.
+  """
+
+  def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+    self.directory = Path(directory)
+    self.directory.mkdir(parents=True, exist_ok=True)
+    self.max_bytes = max_bytes
+    self._lock = threading.Lock()
+
+  @staticmethod
+  def _digest(graph_id: str, report_id: str, format: str, generation_count: int) -> str:
+    key = json.dumps([graph_id, report_id, format, generation_count])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+  def blob_path(
+    self, graph_id: str, report_id: str, format: str, generation_count: int
+  ) -> Path:
+    """Where the blob for this key lives (or will be written)."""
+    return self.directory / (
+      self._digest(graph_id, report_id, format, generation_count) + ".bin"
+    )
+
+  def get(
+    self, graph_id: str, report_id: str, format: str, generation_count: int
+  ) -> CachedBundle | None:
+    """Return the cached entry and mark it recently used, or ``None``."""
+    blob = self.blob_path(graph_id, report_id, format, generation_count)
+    meta_path = blob.with_suffix(".json")
+    try:
+      meta = json.loads(meta_path.read_text())
+      if blob.stat().st_size != meta["size_bytes"]:
+        raise ValueError("blob size does not match metadata")
+      os.utime(meta_path)
+    except FileNotFoundError:
+      return None
+    except (OSError, ValueError, KeyError):
+      self._remove(meta_path)
+      return None
+    return CachedBundle(path=blob, **meta)
+
+  def put(
+    self,
+    graph_id: str,
+    report_id: str,
+    format: str,
+    generation_count: int,
+    *,
+    filename: str,
+    content_type: str,
+    sha256: str,
+  ) -> CachedBundle:
+    """Record metadata for a blob already written to :meth:`blob_path`,
+    then evict least-recently-used entries beyond ``max_bytes``."""
+    blob = self.blob_path(graph_id, report_id, format, generation_count)
+    entry = CachedBundle(
+      path=blob,
+      filename=filename,
+      format=format,
+      content_type=content_type,
+      generation_count=generation_count,
+      sha256=sha256,
+      size_bytes=blob.stat().st_size,
+    )
+    meta = asdict(entry)
+    del meta["path"]
+    meta_path = blob.with_suffix(".json")
+    tmp = meta_path.with_name(
+      f"{meta_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, meta_path)
+    self._evict(keep=meta_path)
+    return entry
+
+  def discard(
+    self, graph_id: str, report_id: str, format: str, generation_count: int
+  ) -> None:
+    """Delete one entry, if cached."""
+    blob = self.blob_path(graph_id, report_id, format, generation_count)
+    with self._lock:
+      self._remove(blob.with_suffix(".json"))
+
+  def clear(self) -> None:
+    """Delete every cached bundle."""
+    with self._lock:
+      for meta_path in self.directory.glob("*.json"):
+        self._remove(meta_path)
+
+  @property
+  def size_bytes(self) -> int:
+    """Total size of the cached blobs."""
+    return sum(size for _, size, _ in self._entries())
+
+  def _entries(self) -> list[tuple[Path, int, float]]:
+    entries = []
+    for meta_path in self.directory.glob("*.json"):
+      try:
+        stat = meta_path.stat()
+        size = json.loads(meta_path.read_text())["size_bytes"]
+      except (OSError, ValueError, KeyError):
+        continue
+      entries.append((meta_path, size, stat.st_mtime))
+    return entries
+
+  def _evict(self, keep: Path) -> None:
+    with self._lock:
+      entries = self._entries()
+      total = sum(size for _, size, _ in entries)
+      if total <= self.max_bytes:
+        return
+      for meta_path, size, _ in sorted(entries, key=lambda e: e[2]):
+        if total <= self.max_bytes:
+          break
+        if meta_path == keep:
+          continue
+        self._remove(meta_path)
+        total -= size
+
+  @staticmethod
+  def _remove(meta_path: Path) -> None:
+    # Metadata first: an entry without metadata is a miss, never a
+    # half-deleted hit.
+    with contextlib.suppress(OSError):
+      meta_path.unlink()
+    with contextlib.suppress(OSError):
+      meta_path.with_suffix(".bin").unlink()
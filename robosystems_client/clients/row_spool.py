@@ -0,0 +1,272 @@
+"""Memory-budgeted row storage for large query results.
+
+:class:`RowSpool` collects rows in fixed-size batches. Each full batch is
+serialized (typically several times smaller than the live Python
+objects); once the serialized batches held in memory exceed
+``memory_budget`` bytes they are moved to an anonymous temporary file and
+read back one batch at a time on iteration. Only the current unsealed
+batch and one batch being read are ever live as Python objects.
+
+With PyArrow installed, a batch of dict rows is stored in the Arrow IPC
+stream format, provided it converts to Arrow and back unchanged; every
+other batch is pickled. :meth:`RowSpool.to_arrow` reads spilled Arrow
+batches through a memory map of the spill file, so their column buffers
+are paged in from disk on demand rather than copied into memory.
+
+Used by ``QueryClient`` when ``query_memory_budget`` is configured; the
+spool then stands in for ``QueryResult.data``. :meth:`RowSpool.to_pandas`
+and pickled batches in :meth:`RowSpool.to_arrow` still materialize in
+memory, so iterate :meth:`RowSpool.iter_batches` to process a result
+larger than memory without PyArrow.
+"""
+
+from __future__ import annotations
+
+import mmap
+import pickle
+import tempfile
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from .dataframe_utils import pd, require_pandas
+
+try:
+  import pyarrow as pa
+
+  HAS_PYARROW = True
+except ImportError:
+  HAS_PYARROW = False
+  pa = None
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+DEFAULT_BATCH_ROWS = 10_000
+
+
+class _Batch:
+  __slots__ = ("rows", "data", "offset", "length", "arrow")
+
+  def __init__(self, rows: int, data: Any, arrow: bool):
+    self.rows = rows
+    self.data: Any = data
+    self.offset = 0
+    self.length = len(data)
+    self.arrow = arrow
+
+
+def _arrow_ipc(rows: list[Any]) -> Any:
+  """Serialize dict rows as an Arrow IPC stream, or None if that would be lossy.
+
+  Arrow fills missing keys with nulls, drops keys absent from the first
+  row and unifies nested values, so a batch is only stored as Arrow when
+  converting it back yields the same rows.
+  """
+  if not rows or not all(isinstance(row, dict) for row in rows):
+    return None
+  try:
+    table = pa.Table.from_pylist(rows)
+  except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+    return None
+  if table.to_pylist() != rows:
+    return None
+  sink = pa.BufferOutputStream()
+  with pa.ipc.new_stream(sink, table.schema) as writer:
+    writer.write_table(table)
+  return sink.getvalue()
+
+
+class RowSpool:
+  """Append-only sequence of rows that spills to disk past a memory budget.
+
+  Args:
+      memory_budget: Bytes of serialized batches kept in memory before
+          spilling to disk
+      batch_rows: Rows per batch; also the unit of iteration and of the
+          pandas/Arrow conversions
+      directory: Directory for the spill file (default: the system temp
+          directory)
+  """
+
+  def __init__(
+    self,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    directory: Optional[str] = None,
+  ):
+    if batch_rows <= 0:
+      raise ValueError("batch_rows must be positive")
+    self.memory_budget = memory_budget
+    self.batch_rows = batch_rows
+    self._directory = directory
+    self._batches: list[_Batch] = []
+    self._pending: list[Any] = []
+    self._count = 0
+    self._memory_bytes = 0
+    self._file: Optional[IO[bytes]] = None
+    self._map: Any = None
+
+  # ── Writing ─────────────────────────────────────────────────────────
+
+  def append(self, row: Any) -> None:
+    self._pending.append(row)
+    self._count += 1
+    if len(self._pending) >= self.batch_rows:
+      self._seal()
+
+  def extend(self, rows: Iterable[Any]) -> None:
+    for row in rows:
+      self.append(row)
+
+  def _seal(self) -> None:
+    data = _arrow_ipc(self._pending) if HAS_PYARROW else None
+    arrow = data is not None
+    if not arrow:
+      data = pickle.dumps(self._pending, protocol=pickle.HIGHEST_PROTOCOL)
+    self._batches.append(_Batch(len(self._pending), data, arrow))
+    self._pending = []
+    self._memory_bytes += len(data)
+    if self._memory_bytes > self.memory_budget:
+      self._spill()
+
+  def _spill(self) -> None:
+    if self._file is None:
+      self._file = tempfile.TemporaryFile(dir=self._directory, prefix="rows-")
+    self._file.seek(0, 2)
+    for batch in self._batches:
+      if batch.data is None:
+        continue
+      batch.offset = self._file.tell()
+      self._file.write(batch.data)
+      batch.data = None
+    self._file.flush()
+    self._memory_bytes = 0
+
+  # ── Reading ─────────────────────────────────────────────────────────
+
+  @property
+  def spilled(self) -> bool:
+    """True once any batch has been written to disk."""
+    return self._file is not None
+
+  @property
+  def memory_bytes(self) -> int:
+    """Serialized bytes currently held in memory."""
+    return self._memory_bytes
+
+  def iter_batches(self) -> Iterator[list[Any]]:
+    """Yield the rows as lists of up to ``batch_rows`` rows, in order."""
+    for batch in self._batches:
+      yield self._load(batch)
+    if self._pending:
+      yield list(self._pending)
+
+  def _load(self, batch: _Batch) -> list[Any]:
+    if batch.arrow:
+      return self._arrow_table(batch).to_pylist()
+    return pickle.loads(batch.data if batch.data is not None else self._read(batch))
+
+  def _read(self, batch: _Batch) -> bytes:
+    assert self._file is not None
+    self._file.seek(batch.offset)
+    return self._file.read(batch.length)
+
+  def _arrow_table(self, batch: _Batch) -> "pa.Table":
+    data = batch.data if batch.data is not None else self._mapped(batch)
+    return pa.ipc.open_stream(data).read_all()
+
+  def _mapped(self, batch: _Batch) -> "pa.Buffer":
+    """Zero-copy view of a spilled batch through a map of the spill file."""
+    assert self._file is not None
+    end = batch.offset + batch.length
+    if self._map is None or self._map.size < end:
+      # The file grows with every spill; tables read through an older
+      # map keep it alive, so it is dropped rather than closed.
+      self._map = pa.py_buffer(
+        mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+      )
+    return self._map.slice(batch.offset, batch.length)
+
+  def __iter__(self) -> Iterator[Any]:
+    for batch in self.iter_batches():
+      yield from batch
+
+  def __len__(self) -> int:
+    return self._count
+
+  def __getitem__(self, index: int) -> Any:
+    if index < 0:
+      index += self._count
+    if not 0 <= index < self._count:
+      raise IndexError("RowSpool index out of range")
+    for batch in self._batches:
+      if index < batch.rows:
+        return self._load(batch)[index]
+      index -= batch.rows
+    return self._pending[index]
+
+  def __repr__(self) -> str:
+    return f"RowSpool(rows={self._count}, spilled={self.spilled})"
+
+  # ── Conversion ──────────────────────────────────────────────────────
+
+  def to_pandas(self, columns: Optional[list[str]] = None) -> "pd.DataFrame":
+    """Build a DataFrame one batch at a time.
+
+    Goes through :meth:`to_arrow` when any batch is stored as Arrow. The
+    frame holds every row in memory, whatever the budget.
+    """
+    require_pandas()
+    if any(batch.arrow for batch in self._batches):
+      df = self.to_arrow(columns).to_pandas()
+      return df if columns is None else df.reindex(columns=columns)
+    frames = [pd.DataFrame(batch, columns=columns) for batch in self.iter_batches()]
+    if not frames:
+      return pd.DataFrame(columns=columns or [])
+    return pd.concat(frames, ignore_index=True)
+
+  def to_arrow(self, columns: Optional[list[str]] = None) -> "pa.Table":
+    """Build an Arrow table one batch at a time.
+
+    Rows may be dicts, or lists/tuples when ``columns`` names them.
+    Spilled Arrow batches are memory-mapped from the spill file, which
+    stays mapped for as long as the returned table is referenced; all
+    other batches are converted in memory.
+    """
+    if not HAS_PYARROW:
+      raise ImportError(
+        "PyArrow is required for Arrow tables. Install it with: pip install pyarrow"
+      )
+    tables = []
+    for batch in self._batches:
+      if batch.arrow:
+        tables.append(self._arrow_table(batch))
+      else:
+        tables.append(self._rows_to_arrow(self._load(batch), columns))
+    if self._pending:
+      tables.append(self._rows_to_arrow(self._pending, columns))
+    if not tables:
+      return pa.table({name: [] for name in columns or []})
+    return pa.concat_tables(tables, promote_options="default")
+
+  @staticmethod
+  def _rows_to_arrow(rows: list[Any], columns: Optional[list[str]]) -> "pa.Table":
+    if columns is not None and rows and not isinstance(rows[0], dict):
+      rows = [dict(zip(columns, row)) for row in rows]
+    return pa.Table.from_pylist(rows)
+
+  # ── Lifecycle ───────────────────────────────────────────────────────
+
+  def close(self) -> None:
+    """Drop all rows and delete the spill file."""
+    self._map = None
+    if self._file is not None:
+      self._file.close()
+      self._file = None
+    self._batches.clear()
+    self._pending = []
+    self._count = 0
+    self._memory_bytes = 0
+
+  def __enter__(self) -> "RowSpool":
+    return self
+
+  def __exit__(self, *exc: Any) -> None:
+    self.close()
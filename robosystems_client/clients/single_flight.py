@@ -0,0 +1,264 @@
+"""Single-flight coalescing of identical concurrent reads.
+
+When many threads (or tasks) ask for the same thing at the same moment —
+the same fiscal calendar, the same graph list — only the first caller
+goes to the network; the others wait for it and receive its result (or
+its exception). Nothing is cached: once the call completes the key is
+forgotten and the next caller fetches afresh.
+
+A :class:`SingleFlight` (threads) or :class:`AsyncSingleFlight` (one
+event loop) group is shared by everything that should coalesce:
+
+- GraphQL reads, via the ``single_flight`` argument of the GraphQL
+  clients, keyed by URL, credentials, document and variables. Mutations
+  are never coalesced.
+- REST ``GET`` requests, via :class:`SingleFlightTransport` /
+  :class:`AsyncSingleFlightTransport` wrapped around the httpx
+  transport, keyed by method, URL (with query string) and headers. Each
+  waiter gets its own ``httpx.Response`` over the shared body bytes.
+
+Waiters share the leader's result object, so treat coalesced results as
+read-only. Enable it for the facades with
+``RoboSystemsClientConfig(single_flight=True)``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+
+class _Call:
+  __slots__ = ("done", "result", "error")
+
+  def __init__(self):
+    self.done = threading.Event()
+    self.result: Any = None
+    self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+  """Thread-safe coalescing of concurrent calls that share a key.
+
+  ``coalesced`` counts the calls that were served by another caller's
+  request instead of making their own.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._calls: dict[Hashable, _Call] = {}
+    self._transports: dict[Hashable, SingleFlightTransport] = {}
+    self.coalesced = 0
+
+  def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+    """Run ``fn()``, or wait for the in-flight call with the same ``key``."""
+    with self._lock:
+      call = self._calls.get(key)
+      leader = call is None
+      if leader:
+        call = self._calls[key] = _Call()
+      else:
+        self.coalesced += 1
+    if not leader:
+      call.done.wait()
+      if call.error is not None:
+        raise call.error
+      return call.result
+    try:
+      call.result = fn()
+    except BaseException as e:
+      call.error = e
+      raise
+    finally:
+      with self._lock:
+        del self._calls[key]
+      call.done.set()
+    return call.result
+
+  def transport(self, verify: Any = True, cert: Any = None) -> SingleFlightTransport:
+    """The group's pooled transport for these TLS settings.
+
+    Built once per ``(verify, cert)`` and shared by every client that
+    passes it, so connections are pooled across clients; closing a
+    client does not close it — :meth:`close` does.
+    """
+    key = (verify, cert)
+    with self._lock:
+      transport = self._transports.get(key)
+      if transport is None:
+        transport = self._transports[key] = SingleFlightTransport(
+          self, httpx.HTTPTransport(verify=verify, cert=cert), shared=True
+        )
+    return transport
+
+  def close(self) -> None:
+    """Close the pooled transports built by :meth:`transport`."""
+    with self._lock:
+      transports, self._transports = list(self._transports.values()), {}
+    for transport in transports:
+      transport._transport.close()
+
+
+class AsyncSingleFlight:
+  """Coalescing of concurrent coroutine calls that share a key.
+
+  The shared call runs as its own task, so cancelling one waiter —
+  including the one that started it — does not cancel the others. A
+  group must only be used from one event loop at a time.
+  """
+
+  def __init__(self):
+    self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+    self.coalesced = 0
+
+  async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+    """Await ``fn()``, or the in-flight call with the same ``key``."""
+    task = self._tasks.get(key)
+    if task is None:
+      task = asyncio.ensure_future(fn())
+      self._tasks[key] = task
+      task.add_done_callback(lambda t: self._finished(key, t))
+    else:
+      self.coalesced += 1
+    return await asyncio.shield(task)
+
+  def _finished(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+    if self._tasks.get(key) is task:
+      del self._tasks[key]
+    # Mark the exception retrieved even if every waiter was cancelled
+    if not task.cancelled():
+      task.exception()
+
+
+def _request_key(request: httpx.Request) -> Hashable:
+  return (
+    request.method,
+    str(request.url),
+    tuple(sorted((k.lower(), v) for k, v in request.headers.multi_items())),
+  )
+
+
+def _replay(request: httpx.Request, shared: tuple[Any, ...]) -> httpx.Response:
+  status_code, headers, content, extensions = shared
+  return httpx.Response(
+    status_code,
+    headers=headers,
+    stream=httpx.ByteStream(content),
+    request=request,
+    extensions=extensions,
+  )
+
+
+def _shared_extensions(response: httpx.Response) -> dict[str, Any]:
+  return {
+    k: v
+    for k, v in response.extensions.items()
+    if k in ("http_version", "reason_phrase")
+  }
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+  """httpx transport that coalesces identical concurrent ``GET`` requests.
+
+  Other methods pass straight through to the wrapped transport. The raw
+  (still encoded) body of a coalesced response is read in full before
+  it is handed to the waiters.
+
+  httpx ignores a client's ``verify`` / ``cert`` once a transport is
+  supplied, so TLS settings belong on the wrapped transport.
+
+  Args:
+      flight: Group shared by every transport that should coalesce
+      transport: Wrapped transport (default ``httpx.HTTPTransport()``)
+      shared: Owned by ``flight`` (see :meth:`SingleFlight.transport`);
+          :meth:`close` then leaves the wrapped transport open
+  """
+
+  def __init__(
+    self,
+    flight: Optional[SingleFlight] = None,
+    transport: Optional[httpx.BaseTransport] = None,
+    *,
+    shared: bool = False,
+  ):
+    self.flight = flight if flight is not None else SingleFlight()
+    self._transport = transport if transport is not None else httpx.HTTPTransport()
+    self.shared = shared
+
+  def handle_request(self, request: httpx.Request) -> httpx.Response:
+    if request.method != "GET":
+      return self._transport.handle_request(request)
+    shared = self.flight.do(_request_key(request), lambda: self._fetch(request))
+    return _replay(request, shared)
+
+  def _fetch(self, request: httpx.Request) -> tuple[Any, ...]:
+    response = self._transport.handle_request(request)
+    try:
+      content = b"".join(response.stream)
+    finally:
+      response.close()
+    return (
+      response.status_code,
+      response.headers.multi_items(),
+      content,
+      _shared_extensions(response),
+    )
+
+  def close(self) -> None:
+    if not self.shared:
+      self._transport.close()
+
+
+class AsyncSingleFlightTransport(httpx.AsyncBaseTransport):
+  """Asyncio counterpart of :class:`SingleFlightTransport`."""
+
+  def __init__(
+    self,
+    flight: Optional[AsyncSingleFlight] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+  ):
+    self.flight = flight if flight is not None else AsyncSingleFlight()
+    self._transport = transport if transport is not None else httpx.AsyncHTTPTransport()
+
+  async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+    if request.method != "GET":
+      return await self._transport.handle_async_request(request)
+    shared = await self.flight.do(_request_key(request), lambda: self._fetch(request))
+    return _replay(request, shared)
+
+  async def _fetch(self, request: httpx.Request) -> tuple[Any, ...]:
+    response = await self._transport.handle_async_request(request)
+    try:
+      content = b"".join([chunk async for chunk in response.stream])
+    finally:
+      await response.aclose()
+    return (
+      response.status_code,
+      response.headers.multi_items(),
+      content,
+      _shared_extensions(response),
+    )
+
+  async def aclose(self) -> None:
+    await self._transport.aclose()
+
+
+def single_flight_httpx_args(
+  config: dict[str, Any], verify: Any = True, cert: Any = None
+) -> dict[str, Any]:
+  """``httpx_args`` routing a sync REST client through the config's group.
+
+  Pass the client's ``verify_ssl`` and ``cert`` as ``verify`` / ``cert``:
+  they configure the group's shared transport, since httpx ignores them
+  on a client given a transport.
+  """
+  flight = config.get("single_flight")
+  if flight is None:
+    return {}
+  return {"transport": flight.transport(verify, cert)}
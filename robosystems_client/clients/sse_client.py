@@ -1,14 +1,17 @@
 """Core SSE (Server-Sent Events) client for RoboSystems API
 
 Provides automatic reconnection, event replay, and type-safe event handling.
+Streams are parsed from raw byte chunks by :class:`SSEParser`; event data is
+only JSON-decoded when somebody is listening for it.
 """
 
 import json
+import socket
 import time
 import asyncio
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional, Callable, Set, TYPE_CHECKING
+from typing import Dict, Any, Optional, Callable, Iterator, List, Set, TYPE_CHECKING
 from dataclasses import dataclass
 from urllib.parse import urljoin
 
@@ -43,6 +46,11 @@ class SSEConfig:
   retry_delay: int = 1000  # milliseconds
   heartbeat_interval: int = 30000  # milliseconds
   timeout: int = 30  # seconds
+  # Merge consecutive DATA_CHUNK events that arrive in the same network read
+  # into a single dispatch (their ``rows``/``data`` lists are concatenated).
+  # Cuts per-event listener overhead on high-volume result streams; leave
+  # off when listeners need to see chunk boundaries.
+  coalesce_data_chunks: bool = False
 
 
 @dataclass
@@ -74,7 +82,247 @@ class EventType(Enum):
   QUEUE_UPDATE = "queue_update"
 
 
-class SSEClient:
+_TERMINAL_EVENTS = frozenset(
+  {
+    EventType.OPERATION_COMPLETED.value,
+    EventType.OPERATION_ERROR.value,
+    EventType.OPERATION_CANCELLED.value,
+  }
+)
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class SSEParser:
+  """Incremental parser for a ``text/event-stream`` body fed as raw bytes.
+
+  Complete lines are split out of an internal ``bytearray`` one network
+  chunk at a time, so there is no per-line ``str`` decode: only the
+  ``event`` / ``id`` fields are decoded eagerly, and ``data`` lines stay
+  bytes until a listener actually needs them. Field values are taken
+  verbatim apart from the single optional space after the colon (per the
+  SSE spec) — data lines with meaningful whitespace survive intact.
+
+  A single event buffer dict is reused for every event: :meth:`feed` and
+  :meth:`flush` yield it once per completed event and reset it in place
+  when resumed, so consumers must not keep a reference to it.
+  """
+
+  def __init__(self) -> None:
+    self._pending = bytearray()
+    self._started = False
+    self.last_event_id: Optional[str] = None
+    self.buffer: Dict[str, Any] = {"event": None, "data": [], "id": None, "retry": None}
+
+  def feed(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+    """Consume one chunk of the stream, yielding each event it completes."""
+    pending = self._pending
+    pending += chunk
+    if not self._started and len(pending) >= len(_UTF8_BOM):
+      self._started = True
+      if pending.startswith(_UTF8_BOM):
+        del pending[: len(_UTF8_BOM)]
+
+    # A trailing CR may be the first half of a CRLF split across chunks —
+    # hold it back until the next chunk shows what follows.
+    limit = len(pending) - 1 if pending.endswith(b"\r") else len(pending)
+    end = max(pending.rfind(b"\n", 0, limit), pending.rfind(b"\r", 0, limit))
+    if end == -1:
+      return
+    block = bytes(pending[: end + 1])
+    del pending[: end + 1]
+    if b"\r" in block:
+      block = block.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    yield from self._process_lines(block[:-1].split(b"\n"))
+
+  def flush(self) -> Iterator[Dict[str, Any]]:
+    """Finish the stream: parse any unterminated last line and yield the
+    final event if the stream ended without a blank line."""
+    if self._pending:
+      line = bytes(self._pending).rstrip(b"\r")
+      self._pending.clear()
+      yield from self._process_lines([line])
+    buf = self.buffer
+    if buf["data"] or buf["event"]:
+      yield buf
+      self._reset()
+
+  def _reset(self) -> None:
+    buf = self.buffer
+    buf["event"] = None
+    buf["data"].clear()
+    buf["id"] = None
+    buf["retry"] = None
+
+  def _process_lines(self, lines: List[bytes]) -> Iterator[Dict[str, Any]]:
+    buf = self.buffer
+    data = buf["data"]
+    for line in lines:
+      # Empty line indicates end of event
+      if not line:
+        if data or buf["event"]:
+          yield buf
+        self._reset()
+        continue
+
+      # Skip comment lines
+      if line[0] == 0x3A:  # ":"
+        continue
+
+      colon = line.find(b":")
+      if colon == -1:
+        # Field with no value
+        field, value = line, b""
+      else:
+        field = line[:colon]
+        value = line[colon + 1 :]
+        if value[:1] == b" ":
+          value = value[1:]
+
+      if field == b"data":
+        data.append(value)
+      elif field == b"event":
+        buf["event"] = value.decode("utf-8", errors="replace")
+      elif field == b"id":
+        if b"\x00" not in value:
+          event_id = value.decode("utf-8", errors="replace")
+          buf["id"] = event_id
+          self.last_event_id = event_id
+      elif field == b"retry":
+        if value.isdigit():
+          buf["retry"] = int(value)
+        # Ignore invalid retry values
+
+
+def _merge_data_chunks(held: Any, incoming: Any) -> bool:
+  """Fold DATA_CHUNK payload ``incoming`` into ``held`` in place.
+
+  Returns False (leaving both untouched) unless both are dicts carrying
+  their rows under the same list key — ``rows`` for NDJSON-style chunks,
+  ``data`` otherwise. Scalar metadata (e.g. chunk counters) takes the
+  later chunk's value. ``held`` must be a freshly decoded payload that no
+  listener has seen yet.
+  """
+  if not isinstance(held, dict) or not isinstance(incoming, dict):
+    return False
+  for key in ("rows", "data"):
+    rows = held.get(key)
+    more = incoming.get(key)
+    if isinstance(rows, list) and isinstance(more, list):
+      for field, value in incoming.items():
+        if field != key:
+          held[field] = value
+      rows.extend(more)
+      return True
+  return False
+
+
+class _EventDispatcher:
+  """Event dispatch shared by :class:`SSEClient` and :class:`AsyncSSEClient`.
+
+  Dispatch is synchronous in both clients — listeners are plain callables —
+  so the parsing/decoding path is written once here.
+  """
+
+  config: SSEConfig
+  closed: bool
+  last_event_id: Optional[str]
+  listeners: Dict[str, Set[Callable]]
+
+  def _has_listeners(self, event_type: str) -> bool:
+    return bool(self.listeners.get(event_type) or self.listeners.get("event"))
+
+  @staticmethod
+  def _decode_data(lines: List[Any]) -> Any:
+    """Join data lines with newlines (SSE spec) and parse JSON if possible.
+
+    Accepts ``bytes`` lines from :class:`SSEParser` as well as ``str``
+    lines; non-JSON payloads are returned as a string.
+    """
+    if not lines:
+      return ""
+    if len(lines) == 1:
+      raw = lines[0]
+    else:
+      raw = (b"\n" if isinstance(lines[0], bytes) else "\n").join(lines)
+    if not raw:
+      return ""
+    try:
+      return json.loads(raw)
+    except ValueError:
+      # Keep as string if not valid JSON
+      return raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+
+  def _emit_event(self, event_type: str, data: Any, event_id: Optional[str]) -> None:
+    # Emit generic event (only built when someone subscribed to it)
+    if self.listeners.get("event"):
+      self.emit(
+        "event",
+        SSEEvent(event=event_type, data=data, id=event_id, timestamp=datetime.now()),
+      )
+
+    # Emit typed event
+    self.emit(event_type, data)
+
+  def _dispatch_event(self, event_buffer: Dict[str, Any]) -> None:
+    """Dispatch a complete SSE event"""
+    data_lines = event_buffer["data"]
+    if not event_buffer["event"] and not any(data_lines):
+      return  # Skip empty events
+
+    event_type = event_buffer["event"] or "message"
+
+    # Decoding is the expensive part — skip it when nobody is listening.
+    if self._has_listeners(event_type):
+      self._emit_event(event_type, self._decode_data(data_lines), event_buffer["id"])
+
+    # Check for completion events - just set flag, don't close from within loop
+    # The loop will break on next iteration and close() will be called in finally
+    if event_type in _TERMINAL_EVENTS:
+      self.closed = True
+
+  def _dispatch_batch(
+    self, events: Iterator[Dict[str, Any]], parser: SSEParser
+  ) -> None:
+    """Dispatch every event completed by one chunk of the stream.
+
+    With ``config.coalesce_data_chunks`` set, consecutive DATA_CHUNK events
+    in the batch are merged (see :func:`_merge_data_chunks`) and delivered
+    as one dispatch before the next non-chunk event or the end of the batch.
+    """
+    coalesce = self.config.coalesce_data_chunks
+    chunk_type = EventType.DATA_CHUNK.value
+    held: Optional[tuple] = None  # (data, id) of a not-yet-emitted data chunk
+
+    for event in events:
+      if self.closed:
+        break
+      self.last_event_id = parser.last_event_id
+
+      if coalesce and event["event"] == chunk_type:
+        if not self._has_listeners(chunk_type):
+          continue
+        data = self._decode_data(event["data"])
+        if held is not None:
+          if _merge_data_chunks(held[0], data):
+            held = (held[0], event["id"])
+            continue
+          self._emit_event(chunk_type, *held)
+        held = (data, event["id"])
+        continue
+
+      if held is not None:
+        self._emit_event(chunk_type, *held)
+        held = None
+      self._dispatch_event(event)
+
+    if held is not None and not self.closed:
+      self._emit_event(chunk_type, *held)
+    if parser.last_event_id is not None:
+      self.last_event_id = parser.last_event_id
+
+
+class SSEClient(_EventDispatcher):
   """SSE client for RoboSystems API with automatic reconnection"""
 
   def __init__(self, config: SSEConfig) -> None:
@@ -137,100 +385,21 @@ class SSEClient:
     if not self._response:
       return
 
+    parser = SSEParser()
     try:
-      event_buffer = {"event": None, "data": [], "id": None, "retry": None}
-
-      for line in self._response.iter_lines():
+      for chunk in self._response.iter_bytes():
         if self.closed:
           break
-
-        line = line.strip()
-
-        # Empty line indicates end of event
-        if not line:
-          if event_buffer["data"] or event_buffer["event"]:
-            self._dispatch_event(event_buffer)
-          event_buffer = {"event": None, "data": [], "id": None, "retry": None}
-          continue
-
-        # Skip comment lines
-        if line.startswith(":"):
-          continue
-
-        # Parse field
-        if ":" in line:
-          field, value = line.split(":", 1)
-          field = field.strip()
-          value = value.lstrip()  # Remove leading space but keep others
-
-          if field == "data":
-            event_buffer["data"].append(value)
-          elif field == "event":
-            event_buffer["event"] = value
-          elif field == "id":
-            event_buffer["id"] = value
-            self.last_event_id = value
-          elif field == "retry":
-            try:
-              event_buffer["retry"] = int(value)
-            except ValueError:
-              pass  # Ignore invalid retry values
-        else:
-          # Field with no value
-          if line == "data":
-            event_buffer["data"].append("")
-          elif line in ["event", "id", "retry"]:
-            event_buffer[line] = ""
+        self._dispatch_batch(parser.feed(chunk), parser)
 
       # Handle final event if stream ends without empty line
-      if event_buffer["data"] or event_buffer["event"]:
-        self._dispatch_event(event_buffer)
+      if not self.closed:
+        self._dispatch_batch(parser.flush(), parser)
 
     except Exception as error:
       if not self.closed:
         self.emit("error", error)
 
-  def _dispatch_event(self, event_buffer: Dict[str, Any]) -> None:
-    """Dispatch a complete SSE event"""
-    # Join data lines with newlines as per SSE spec
-    data_str = "\n".join(event_buffer["data"])
-
-    if not data_str and not event_buffer["event"]:
-      return  # Skip empty events
-
-    event_type = event_buffer["event"] or "message"
-
-    # Parse JSON data if possible
-    parsed_data = data_str
-    try:
-      if data_str:
-        parsed_data = json.loads(data_str)
-    except json.JSONDecodeError:
-      # Keep as string if not valid JSON
-      pass
-
-    sse_event = SSEEvent(
-      event=event_type,
-      data=parsed_data,
-      id=event_buffer["id"],
-      timestamp=datetime.now(),
-    )
-
-    # Emit generic event
-    self.emit("event", sse_event)
-
-    # Emit typed event
-    self.emit(event_type, parsed_data)
-
-    # Check for completion events - just set flag, don't close from within loop
-    # The loop will break on next iteration and close() will be called in finally
-    if event_type in [
-      EventType.OPERATION_COMPLETED.value,
-      EventType.OPERATION_ERROR.value,
-      EventType.OPERATION_CANCELLED.value,
-    ]:
-      self.closed = True
-
   def _handle_error(
     self, error: Exception, operation_id: str, from_sequence: int
   ) -> None:
@@ -291,8 +460,13 @@ class SSEClient:
           print(f"Error in event listener for {event}: {e}")
 
   def close(self):
-    """Close the SSE connection"""
+    """Close the SSE connection
+
+    Safe to call from another thread: a ``connect()`` blocked reading the
+    stream there returns promptly.
+    """
     self.closed = True
+    self._shutdown_socket()
 
     if hasattr(self, "_context_manager") and self._context_manager:
       try:
@@ -309,12 +483,26 @@ class SSEClient:
     self.emit("closed", None)
     self.listeners.clear()
 
+  def _shutdown_socket(self) -> None:
+    # Closing the response does not wake a read blocked on another
+    # thread; shutting the socket down ends it with EOF.
+    response = self._response
+    if response is None:
+      return
+    stream = response.extensions.get("network_stream")
+    sock = stream.get_extra_info("socket") if stream is not None else None
+    if isinstance(sock, socket.socket):
+      try:
+        sock.shutdown(socket.SHUT_RDWR)
+      except OSError:
+        pass
+
   def is_connected(self) -> bool:
     """Check if the connection is active"""
     return self.client is not None and not self.closed
 
 
-class AsyncSSEClient:
+class AsyncSSEClient(_EventDispatcher):
   """Async version of SSE client"""
 
   def __init__(self, config: SSEConfig) -> None:
@@ -377,100 +565,21 @@ class AsyncSSEClient:
     if not self._response:
       return
 
+    parser = SSEParser()
     try:
-      event_buffer = {"event": None, "data": [], "id": None, "retry": None}
-
-      async for line in self._response.aiter_lines():
+      async for chunk in self._response.aiter_bytes():
         if self.closed:
           break
-
-        line = line.strip()
-
-        # Empty line indicates end of event
-        if not line:
-          if event_buffer["data"] or event_buffer["event"]:
-            self._dispatch_event(event_buffer)
-          event_buffer = {"event": None, "data": [], "id": None, "retry": None}
-          continue
-
-        # Skip comment lines
-        if line.startswith(":"):
-          continue
-
-        # Parse field
-        if ":" in line:
-          field, value = line.split(":", 1)
-          field = field.strip()
-          value = value.lstrip()
-
-          if field == "data":
-            event_buffer["data"].append(value)
-          elif field == "event":
-            event_buffer["event"] = value
-          elif field == "id":
-            event_buffer["id"] = value
-            self.last_event_id = value
-          elif field == "retry":
-            try:
-              event_buffer["retry"] = int(value)
-            except ValueError:
-              pass
-        else:
-          # Field with no value
-          if line == "data":
-            event_buffer["data"].append("")
-          elif line in ["event", "id", "retry"]:
-            event_buffer[line] = ""
+        self._dispatch_batch(parser.feed(chunk), parser)
 
       # Handle final event if stream ends without empty line
-      if event_buffer["data"] or event_buffer["event"]:
-        self._dispatch_event(event_buffer)
+      if not self.closed:
+        self._dispatch_batch(parser.flush(), parser)
 
     except Exception as error:
       if not self.closed:
         self.emit("error", error)
 
-  def _dispatch_event(self, event_buffer: Dict[str, Any]):
-    """Dispatch a complete SSE event (same as sync version)"""
-    # Join data lines with newlines as per SSE spec
-    data_str = "\n".join(event_buffer["data"])
-
-    if not data_str and not event_buffer["event"]:
-      return  # Skip empty events
-
-    event_type = event_buffer["event"] or "message"
-
-    # Parse JSON data if possible
-    parsed_data = data_str
-    try:
-      if data_str:
-        parsed_data = json.loads(data_str)
-    except json.JSONDecodeError:
-      # Keep as string if not valid JSON
-      pass
-
-    sse_event = SSEEvent(
-      event=event_type,
-      data=parsed_data,
-      id=event_buffer["id"],
-      timestamp=datetime.now(),
-    )
-
-    # Emit generic event
-    self.emit("event", sse_event)
-
-    # Emit typed event
-    self.emit(event_type, parsed_data)
-
-    # Check for completion events - just set flag, don't close from within loop
-    # The loop will break on next iteration and close() will be called in finally
-    if event_type in [
-      EventType.OPERATION_COMPLETED.value,
-      EventType.OPERATION_ERROR.value,
-      EventType.OPERATION_CANCELLED.value,
-    ]:
-      self.closed = True
-
   async def _handle_error(
     self, error: Exception, operation_id: str, from_sequence: int
   ) -> None:
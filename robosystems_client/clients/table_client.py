@@ -2,11 +2,18 @@
 
 Manages DuckDB staging table operations.
 Tables provide SQL-queryable staging layer before graph materialization.
+
+``mirror`` copies tables into a local DuckDB/Parquet cache (see
+``table_mirror``) so exploratory SQL can run locally with
+``query(..., local=True)``. ``query_batches`` reads large results as
+column-oriented pages using keyset pagination.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
 import logging
+import time
 
 from ..api.tables.list_tables import (
   sync_detailed as list_tables,
@@ -15,9 +22,31 @@ from ..api.query.execute_sql import (
   sync_detailed as query_tables,
 )
 from ..models.sql_statement_request import SqlStatementRequest
+from .dataframe_utils import pd, require_pandas
+from .table_mirror import DEFAULT_MIRROR_DIR, TableMirror, quote_identifier
+
+try:
+  import pyarrow as pa
+
+  HAS_PYARROW = True
+except ImportError:
+  HAS_PYARROW = False
+  pa = None
 
 logger = logging.getLogger(__name__)
 
+# Rows the SQL endpoint returns per request; larger results are truncated
+MAX_SQL_ROWS = 10_000
+
+
+def _with_limit(sql: str, limit: int, parameters: List[Any]) -> str:
+  """``sql`` with a bound ``LIMIT ?`` appended; ``limit`` is added to
+  ``parameters``"""
+  if limit < 0:
+    raise ValueError(f"limit must not be negative, got {limit}")
+  parameters.append(limit)
+  return f"{sql.strip().rstrip(';')} LIMIT ?"
+
 
 @dataclass
 class TableInfo:
@@ -41,6 +70,80 @@ class QueryResult:
   success: bool = True
   error: Optional[str] = None
 
+  def to_columnar(self) -> "ColumnarResult":
+    """Column-oriented copy of the rows"""
+    return ColumnarResult.from_rows(self.columns, self.rows)
+
+
+def _arrow_column(values: list[Any]) -> Any:
+  """``values`` as an Arrow array, or the list itself when Arrow finds no
+  common type for them"""
+  try:
+    return pa.array(values)
+  except (pa.ArrowInvalid, pa.ArrowTypeError):
+    return values
+
+
+@dataclass
+class ColumnarResult:
+  """Query rows stored column by column
+
+  With PyArrow installed each column in ``data`` is a ``pyarrow.Array``
+  (a column of mixed types stays a list), so :meth:`to_arrow` assembles
+  the table without copying and :meth:`to_pandas` converts through
+  Arrow. Without PyArrow the columns are lists. :meth:`column` returns
+  Python values either way.
+  """
+
+  columns: list[str]
+  data: Dict[str, Any]
+  row_count: int
+
+  @classmethod
+  def from_rows(cls, columns: list[str], rows: list[list[Any]]) -> "ColumnarResult":
+    values = list(zip(*rows)) if rows else [() for _ in columns]
+    data = {name: list(col) for name, col in zip(columns, values)}
+    if HAS_PYARROW:
+      data = {name: _arrow_column(col) for name, col in data.items()}
+    return cls(columns=list(columns), data=data, row_count=len(rows))
+
+  def column(self, name: str) -> list[Any]:
+    """Values of column ``name`` as a Python list"""
+    values = self.data[name]
+    return values if isinstance(values, list) else values.to_pylist()
+
+  def to_rows(self) -> list[list[Any]]:
+    return [list(row) for row in zip(*(self.column(c) for c in self.columns))]
+
+  def to_pandas(self) -> "pd.DataFrame":
+    require_pandas()
+    if HAS_PYARROW:
+      try:
+        return self.to_arrow().to_pandas()
+      except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass  # a mixed-type column; pandas keeps it as objects
+    data = {name: self.column(name) for name in self.columns}
+    return pd.DataFrame(data, columns=self.columns)
+
+  def to_arrow(self) -> "pa.Table":
+    if not HAS_PYARROW:
+      raise ImportError(
+        "PyArrow is required for Arrow tables. Install it with: pip install pyarrow"
+      )
+    return pa.table({name: self.data[name] for name in self.columns})
+
+
+@dataclass
+class TableMirrorResult:
+  """Outcome of a ``TableClient.mirror`` call"""
+
+  graph_id: str
+  path: Path
+  refreshed: list[str] = field(default_factory=list)
+  unchanged: list[str] = field(default_factory=list)
+  removed: list[str] = field(default_factory=list)
+  failed: dict[str, str] = field(default_factory=dict)
+
 
 class TableClient:
   """Client for managing DuckDB staging tables"""
@@ -50,6 +153,9 @@ class TableClient:
     self.base_url = config["base_url"]
     self.headers = config.get("headers", {})
     self.token = config.get("token")
+    self.mirror_dir = Path(config.get("table_mirror_dir") or DEFAULT_MIRROR_DIR)
+    self._mirrors: dict[str, TableMirror] = {}
+    self._files: Any = None  # FileClient, created on first mirror()
 
   def list(self, graph_id: str) -> list[TableInfo]:
     """
@@ -105,7 +211,11 @@ class TableClient:
       return []
 
   def query(
-    self, graph_id: str, sql_query: str, limit: Optional[int] = None
+    self,
+    graph_id: str,
+    sql_query: str,
+    limit: Optional[int] = None,
+    local: bool = False,
   ) -> QueryResult:
     """
     Execute SQL query against DuckDB staging tables.
@@ -114,6 +224,9 @@ class TableClient:
         graph_id: Graph database identifier
         sql_query: SQL query to execute
         limit: Optional row limit
+        local: Run against the local mirror built by ``mirror()`` instead
+            of the server — no round trip and no credits, but only as
+            fresh as the last ``mirror()`` call
 
     Returns:
         QueryResult with columns and rows
@@ -128,10 +241,111 @@ class TableClient:
     """
     try:
       final_query = sql_query
+      parameters: List[Any] = []
       if limit is not None:
-        final_query = f"{sql_query.rstrip(';')} LIMIT {limit}"
+        final_query = _with_limit(sql_query, limit, parameters)
 
-      request = SqlStatementRequest(sql=final_query)
+      if local:
+        return self._query_local(graph_id, final_query, parameters)
+
+      return self._execute(graph_id, final_query, parameters or None)
+
+    except Exception as e:
+      logger.error(f"Query failed: {e}")
+      return QueryResult(
+        columns=[],
+        rows=[],
+        row_count=0,
+        execution_time_ms=0,
+        success=False,
+        error=str(e),
+      )
+
+  def query_batches(
+    self,
+    graph_id: str,
+    sql_query: str,
+    key: Union[str, Sequence[str]],
+    batch_size: int = 10_000,
+    parameters: Optional[List[Any]] = None,
+  ) -> Iterator[ColumnarResult]:
+    """
+    Stream a large result as column-oriented batches.
+
+    Pages are fetched with keyset pagination: each request wraps
+    ``sql_query`` as a subquery ordered by ``key`` and asks for the rows
+    after the last key already seen, so every page costs the server the
+    same regardless of depth and no more than ``batch_size`` rows are held
+    in memory at once.
+
+    Args:
+        graph_id: Graph database identifier
+        sql_query: SQL query to execute (without ORDER BY or LIMIT)
+        key: Result column, or columns, that uniquely identify a row and
+            are never NULL — e.g. ``"identifier"``
+        batch_size: Rows per request, at most ``MAX_SQL_ROWS`` (the
+            server's per-request cap); larger values are clamped so a
+            capped page is never mistaken for the last one
+        parameters: Positional ``?`` parameters used by ``sql_query``
+
+    Yields:
+        ColumnarResult per non-empty page
+
+    Raises:
+        ValueError: If ``batch_size`` is not positive or a key column is
+            missing from the result
+        RuntimeError: If a page request fails
+
+    Example:
+        >>> for batch in client.tables.query_batches(
+        ...     graph_id, "SELECT * FROM Entity", key="identifier"
+        ... ):
+        ...     validate(batch.to_pandas())
+    """
+    if batch_size < 1:
+      raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if batch_size > MAX_SQL_ROWS:
+      logger.warning(
+        f"batch_size {batch_size} exceeds the server row cap; using {MAX_SQL_ROWS}"
+      )
+      batch_size = MAX_SQL_ROWS
+    keys = [key] if isinstance(key, str) else list(key)
+    order = ", ".join(quote_identifier(k) for k in keys)
+    base = f"SELECT * FROM ({sql_query.strip().rstrip(';')}) AS _page"
+    cursor: Optional[List[Any]] = None
+    while True:
+      params = list(parameters or [])
+      if cursor is None:
+        page_sql = f"{base} ORDER BY {order}"
+      else:
+        placeholders = ", ".join("?" for _ in keys)
+        page_sql = f"{base} WHERE ({order}) > ({placeholders}) ORDER BY {order}"
+        params.extend(cursor)
+      page_sql = _with_limit(page_sql, batch_size, params)
+
+      page = self._execute(graph_id, page_sql, params)
+      if not page.success:
+        raise RuntimeError(f"Query failed: {page.error}")
+      missing = [k for k in keys if k not in page.columns]
+      if missing:
+        raise ValueError(f"Key columns not in result: {', '.join(missing)}")
+      if page.rows:
+        yield page.to_columnar()
+      if len(page.rows) < batch_size:
+        return
+      positions = [page.columns.index(k) for k in keys]
+      cursor = [page.rows[-1][i] for i in positions]
+
+  def _execute(
+    self,
+    graph_id: str,
+    sql_query: str,
+    parameters: Optional[List[Any]] = None,
+  ) -> QueryResult:
+    try:
+      request = SqlStatementRequest(sql=sql_query)
+      if parameters is not None:
+        request.parameters = parameters
 
       from ..client import AuthenticatedClient
 
@@ -185,3 +399,143 @@ class TableClient:
         success=False,
         error=str(e),
       )
+
+  def mirror(
+    self,
+    graph_id: str,
+    tables: Optional[List[str]] = None,
+    keys: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+  ) -> TableMirrorResult:
+    """
+    Copy staging tables into the local DuckDB/Parquet cache.
+
+    A table is re-pulled only when its set of staged files (from
+    ``FileClient.list``) differs from the one the local copy was built
+    from; unchanged tables cost one listing call. The server exposes no
+    download for staged files, so rows are pulled through the SQL
+    endpoint, which returns at most ``MAX_SQL_ROWS`` rows per request:
+
+    - tables with a key in ``keys`` are pulled page by page with
+      ``query_batches`` and spooled to Parquet as the pages arrive, so
+      any size is mirrored with one page in memory;
+    - other tables are pulled with a single ``SELECT *``; one that fills
+      the cap may be truncated, so it is reported in ``failed`` and the
+      previous local copy (if any) is kept.
+
+    Args:
+        graph_id: Graph database identifier
+        tables: Tables to mirror (default: every table in the graph;
+            mirrored tables no longer on the server are then removed)
+        keys: Table name -> column(s) that uniquely identify its rows,
+            e.g. ``{"Entity": "identifier"}``
+
+    Returns:
+        TableMirrorResult listing refreshed, unchanged, removed and
+        failed tables
+
+    Example:
+        >>> client.tables.mirror(graph_id, tables=["Entity"])
+        >>> client.tables.query(graph_id, "SELECT COUNT(*) FROM Entity", local=True)
+    """
+    from .file_client import FileClient
+
+    local = self._mirror(graph_id)
+    result = TableMirrorResult(graph_id=graph_id, path=local.path)
+    names = tables
+    if names is None:
+      names = [t.table_name for t in self.list(graph_id)]
+      for stale in sorted(set(local.tables()) - set(names)):
+        local.remove_table(stale)
+        result.removed.append(stale)
+
+    if self._files is None:
+      self._files = FileClient(self.config)
+    for table_name in names:
+      fingerprint = sorted(
+        [f.file_id, f.size_bytes, f.uploaded_at]
+        for f in self._files.list(graph_id, table_name=table_name)
+      )
+      if local.is_current(table_name, fingerprint):
+        result.unchanged.append(table_name)
+        continue
+      key = (keys or {}).get(table_name)
+      try:
+        if key is None:
+          columns, rows = self._pull_table(graph_id, table_name)
+        else:
+          columns, rows = self._pull_table_batches(graph_id, table_name, key)
+        local.write_table(table_name, columns, rows, fingerprint)
+      except Exception as e:
+        logger.error(f"Failed to mirror table {table_name}: {e}")
+        result.failed[table_name] = str(e)
+        continue
+      result.refreshed.append(table_name)
+    return result
+
+  def _pull_table(self, graph_id: str, table_name: str) -> tuple[List[str], Any]:
+    pulled = self.query(graph_id, f"SELECT * FROM {quote_identifier(table_name)}")
+    if not pulled.success:
+      raise RuntimeError(pulled.error or "query failed")
+    if pulled.row_count >= MAX_SQL_ROWS:
+      raise RuntimeError(
+        f"{pulled.row_count} rows reached the server row cap, so the pull may "
+        f"be truncated; pass keys={{{table_name!r}: <unique column>}} to mirror "
+        "it in pages"
+      )
+    return pulled.columns, pulled.rows
+
+  def _pull_table_batches(
+    self, graph_id: str, table_name: str, key: Union[str, Sequence[str]]
+  ) -> tuple[List[str], Any]:
+    sql = f"SELECT * FROM {quote_identifier(table_name)}"
+    batches = self.query_batches(graph_id, sql, key, batch_size=MAX_SQL_ROWS)
+    first = next(batches, None)
+    if first is None:
+      params: List[Any] = []
+      empty = self._execute(graph_id, _with_limit(sql, 0, params), params)
+      if not empty.success:
+        raise RuntimeError(empty.error or "query failed")
+      return empty.columns, []
+
+    def rows() -> Iterator[list[Any]]:
+      yield from first.to_rows()
+      for batch in batches:
+        yield from batch.to_rows()
+
+    return first.columns, rows()
+
+  def _mirror(self, graph_id: str) -> TableMirror:
+    mirror = self._mirrors.get(graph_id)
+    if mirror is None:
+      mirror = self._mirrors[graph_id] = TableMirror(self.mirror_dir, graph_id)
+    return mirror
+
+  def _query_local(
+    self, graph_id: str, sql_query: str, parameters: Optional[List[Any]] = None
+  ) -> QueryResult:
+    try:
+      start = time.perf_counter()
+      columns, rows = self._mirror(graph_id).query(sql_query, parameters)
+      return QueryResult(
+        columns=columns,
+        rows=rows,
+        row_count=len(rows),
+        execution_time_ms=(time.perf_counter() - start) * 1000,
+        success=True,
+      )
+    except Exception as e:
+      logger.error(f"Local query failed: {e}")
+      return QueryResult(
+        columns=[],
+        rows=[],
+        row_count=0,
+        execution_time_ms=0,
+        success=False,
+        error=str(e),
+      )
+
+  def close(self):
+    """Close local mirror connections"""
+    for mirror in self._mirrors.values():
+      mirror.close()
+    self._mirrors.clear()
@@ -0,0 +1,188 @@
+"""Local DuckDB mirror of a graph's staging tables.
+
+Each mirrored table is stored as one Parquet file under
+``<directory>/<graph_id>/``, next to a ``manifest.json`` recording the
+set of staged files the copy was built from. A table is re-pulled only
+when its file set on the server differs from the manifest, so repeat
+mirrors of unchanged tables cost one ``FileClient.list`` call each.
+
+Queries run on an in-process DuckDB connection with one view per
+mirrored table, so SQL written for ``TableClient.query`` runs unchanged
+against the local copy.
+
+Requires the optional ``duckdb`` package, which is imported on first use
+so that ``import robosystems_client`` does not pay for it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+DEFAULT_MIRROR_DIR = Path.home() / ".cache" / "robosystems" / "tables"
+
+
+def _require_duckdb() -> Any:
+  try:
+    import duckdb
+  except ImportError:
+    raise ImportError(
+      "DuckDB is required for local table mirrors. Install it with: pip install duckdb"
+    ) from None
+  return duckdb
+
+
+def quote_identifier(identifier: str) -> str:
+  return '"' + identifier.replace('"', '""') + '"'
+
+
+def _sql_string(value: str) -> str:
+  return "'" + value.replace("'", "''") + "'"
+
+
+class TableMirror:
+  """On-disk Parquet copies of one graph's staging tables.
+
+  Args:
+      directory: Root of the mirror cache; the graph's tables live in
+          ``directory / graph_id``.
+      graph_id: Graph whose tables are mirrored.
+  """
+
+  def __init__(self, directory: str | Path, graph_id: str):
+    self._duckdb = _require_duckdb()
+    self.path = Path(directory) / graph_id
+    self.path.mkdir(parents=True, exist_ok=True)
+    self._manifest_path = self.path / "manifest.json"
+    self._lock = threading.Lock()
+    self._connection: Any = None
+
+  # ── Manifest ────────────────────────────────────────────────────────
+
+  def manifest(self) -> dict[str, list[list[Any]]]:
+    """Table name → file set fingerprint the local copy was built from."""
+    try:
+      return json.loads(self._manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+      return {}
+
+  def is_current(self, table_name: str, fingerprint: list[list[Any]]) -> bool:
+    """True when ``table_name`` is mirrored from exactly ``fingerprint``."""
+    return (
+      self.parquet_path(table_name).exists()
+      and self.manifest().get(table_name) == fingerprint
+    )
+
+  def _record(self, table_name: str, fingerprint: list[list[Any]] | None) -> None:
+    manifest = self.manifest()
+    if fingerprint is None:
+      manifest.pop(table_name, None)
+    else:
+      manifest[table_name] = fingerprint
+    tmp = self._manifest_path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, self._manifest_path)
+
+  # ── Tables ──────────────────────────────────────────────────────────
+
+  def parquet_path(self, table_name: str) -> Path:
+    return self.path / f"{table_name}.parquet"
+
+  def tables(self) -> list[str]:
+    """Names of the tables present in the mirror."""
+    return sorted(p.stem for p in self.path.glob("*.parquet"))
+
+  def write_table(
+    self,
+    table_name: str,
+    columns: list[str],
+    rows: Iterable[Sequence[Any]],
+    fingerprint: list[list[Any]],
+  ) -> None:
+    """Replace the local copy of ``table_name`` with ``rows``.
+
+    ``rows`` may be a lazy iterable (e.g. pages from ``query_batches``);
+    each row is spooled to disk as it arrives and DuckDB streams the
+    spool into Parquet, so only the current page is held in memory. If
+    iterating ``rows`` raises, the previous copy and manifest entry are
+    left untouched.
+
+    Column types are inferred by DuckDB from the JSON values the server
+    returned; an empty table keeps its column names as ``VARCHAR``.
+    """
+    target = self.parquet_path(table_name)
+    fd, tmp_parquet = tempfile.mkstemp(dir=self.path, suffix=".parquet.tmp")
+    os.close(fd)
+    fd, tmp_json = tempfile.mkstemp(dir=self.path, suffix=".ndjson.tmp")
+    try:
+      count = 0
+      with os.fdopen(fd, "w") as out:
+        for row in rows:
+          out.write(json.dumps(dict(zip(columns, row)), default=str))
+          out.write("\n")
+          count += 1
+      if count:
+        source = (
+          f"SELECT {', '.join(quote_identifier(c) for c in columns)} "
+          f"FROM read_json_auto({_sql_string(tmp_json)}, "
+          "format='newline_delimited', sample_size=-1)"
+        )
+      else:
+        source = (
+          "SELECT "
+          + ", ".join(f"NULL::VARCHAR AS {quote_identifier(c)}" for c in columns)
+          + " LIMIT 0"
+        )
+      with self._duckdb.connect() as con:
+        con.execute(f"COPY ({source}) TO {_sql_string(tmp_parquet)} (FORMAT parquet)")
+      os.replace(tmp_parquet, target)
+    finally:
+      for tmp in (tmp_json, tmp_parquet):
+        with contextlib.suppress(OSError):
+          os.unlink(tmp)
+    self._record(table_name, fingerprint)
+    self._invalidate()
+
+  def remove_table(self, table_name: str) -> None:
+    with contextlib.suppress(OSError):
+      self.parquet_path(table_name).unlink()
+    self._record(table_name, None)
+    self._invalidate()
+
+  # ── Queries ─────────────────────────────────────────────────────────
+
+  def query(
+    self, sql: str, parameters: Sequence[Any] | None = None
+  ) -> tuple[list[str], list[list[Any]]]:
+    """Run ``sql`` (with positional ``?`` parameters) against the mirrored
+    tables; returns (columns, rows)."""
+    with self._lock:
+      if self._connection is None:
+        self._connection = self._connect()
+      cursor = self._connection.execute(sql, list(parameters or []))
+      columns = [d[0] for d in cursor.description or []]
+      rows = [list(row) for row in cursor.fetchall()]
+    return columns, rows
+
+  def _connect(self) -> Any:
+    con = self._duckdb.connect()
+    for table_name in self.tables():
+      path = _sql_string(str(self.parquet_path(table_name)))
+      con.execute(
+        f"CREATE VIEW {quote_identifier(table_name)} AS SELECT * FROM read_parquet({path})"
+      )
+    return con
+
+  def _invalidate(self) -> None:
+    with self._lock:
+      if self._connection is not None:
+        self._connection.close()
+        self._connection = None
+
+  def close(self) -> None:
+    self._invalidate()
@@ -0,0 +1,425 @@
+"""In-memory arc graph of one library taxonomy.
+
+:class:`TaxonomyGraph` holds every arc a taxonomy contributes as flat
+columns — ``array("i")`` of element positions, association types and
+structures, one entry per arc — and answers traversals from CSR-style
+adjacency built per association type and direction: ``indptr[pos]`` to
+``indptr[pos + 1]`` indexes the arcs leaving (or, reversed, entering)
+the element at ``pos``, already sorted by ``order_value``. Children,
+ancestors, descendants, equivalence closures and shortest paths are
+then walks over integer arrays instead of one request per element.
+
+``LibraryClient.get_taxonomy_graph`` loads all arcs (pages fetched in
+parallel) and caches the graph as JSON under ``library_index_dir``,
+keyed on the taxonomy id and version.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+# Bump when the cache layout changes; older files are rebuilt.
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class GraphArc:
+  """One arc of a :class:`TaxonomyGraph`."""
+
+  id: str
+  from_element_id: str
+  to_element_id: str
+  association_type: str
+  structure_id: str
+  order_value: Optional[float]
+  weight: Optional[float]
+
+
+class _Adjacency:
+  """CSR index of arcs by source (or, reversed, target) position."""
+
+  __slots__ = ("indptr", "arcs")
+
+  def __init__(self, nodes: int, keys: array, arcs: list[int], order: list[Any]):
+    counts = [0] * (nodes + 1)
+    for arc in arcs:
+      counts[keys[arc] + 1] += 1
+    for pos in range(nodes):
+      counts[pos + 1] += counts[pos]
+    self.indptr = array("i", counts)
+    self.arcs = array("i", sorted(arcs, key=lambda a: (keys[a], order[a])))
+
+  def __call__(self, pos: int) -> array:
+    return self.arcs[self.indptr[pos] : self.indptr[pos + 1]]
+
+
+def _order_key(value: Optional[float], arc: int) -> tuple[float, int]:
+  return (float("inf") if value is None else value, arc)
+
+
+class TaxonomyGraph:
+  """Arcs of one taxonomy with CSR adjacency per association type.
+
+  Elements are addressed by id or qname. Traversals take an
+  ``association_type`` (``None`` follows every type) and an optional
+  ``structure_id`` restricting them to one structure's arcs, e.g. a
+  single presentation hierarchy.
+  """
+
+  def __init__(
+    self,
+    columns: dict[str, list[Any]],
+    taxonomy_id: Optional[str] = None,
+    version: Optional[str] = None,
+  ):
+    """Use :meth:`from_arcs` or :meth:`load`."""
+    self.taxonomy_id = taxonomy_id
+    self.version = version
+    self.ids: list[str] = columns["ids"]
+    self.qnames: list[Optional[str]] = columns["qnames"]
+    self.association_types: list[str] = columns["association_types"]
+    self.structures: list[str] = columns["structures"]
+    self._arc_ids: list[str] = columns["arc_ids"]
+    self._source = array("i", columns["source"])
+    self._target = array("i", columns["target"])
+    self._type = array("i", columns["type"])
+    self._structure = array("i", columns["structure"])
+    self._order: list[Optional[float]] = columns["order"]
+    self._weight: list[Optional[float]] = columns["weight"]
+
+    self._by_id = {element_id: i for i, element_id in enumerate(self.ids)}
+    self._by_qname = {q: i for i, q in enumerate(self.qnames) if q}
+    self._type_index = {t: i for i, t in enumerate(self.association_types)}
+    self._structure_index = {s: i for i, s in enumerate(self.structures)}
+    self._adjacency: dict[tuple[int, bool], _Adjacency] = {}
+
+  @classmethod
+  def from_arcs(
+    cls,
+    arcs: Iterable[Any],
+    taxonomy_id: Optional[str] = None,
+    version: Optional[str] = None,
+  ) -> TaxonomyGraph:
+    """Build from ``list_library_taxonomy_arcs`` results (models or views)."""
+    columns: dict[str, list[Any]] = {
+      key: []
+      for key in (
+        "ids",
+        "qnames",
+        "association_types",
+        "structures",
+        "arc_ids",
+        "source",
+        "target",
+        "type",
+        "structure",
+        "order",
+        "weight",
+      )
+    }
+    nodes: dict[str, int] = {}
+    types: dict[str, int] = {}
+    structures: dict[str, int] = {}
+
+    def intern(table: dict[str, int], values: list[str], key: str) -> int:
+      pos = table.get(key)
+      if pos is None:
+        pos = table[key] = len(values)
+        values.append(key)
+      return pos
+
+    def node(element_id: str, qname: Optional[str]) -> int:
+      pos = nodes.get(element_id)
+      if pos is None:
+        pos = nodes[element_id] = len(columns["ids"])
+        columns["ids"].append(element_id)
+        columns["qnames"].append(qname)
+      return pos
+
+    for arc in arcs:
+      columns["arc_ids"].append(arc.id)
+      columns["source"].append(node(arc.from_element_id, arc.from_element_qname))
+      columns["target"].append(node(arc.to_element_id, arc.to_element_qname))
+      columns["type"].append(
+        intern(types, columns["association_types"], arc.association_type)
+      )
+      columns["structure"].append(
+        intern(structures, columns["structures"], arc.structure_id)
+      )
+      columns["order"].append(arc.order_value)
+      columns["weight"].append(arc.weight)
+    return cls(columns, taxonomy_id, version)
+
+  # ── Persistence ─────────────────────────────────────────────────────
+
+  def save(self, path: str | Path) -> None:
+    """Write the graph to ``path`` as JSON, atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+      "schema_version": SCHEMA_VERSION,
+      "taxonomy_id": self.taxonomy_id,
+      "version": self.version,
+      "ids": self.ids,
+      "qnames": self.qnames,
+      "association_types": self.association_types,
+      "structures": self.structures,
+      "arc_ids": self._arc_ids,
+      "source": self._source.tolist(),
+      "target": self._target.tolist(),
+      "type": self._type.tolist(),
+      "structure": self._structure.tolist(),
+      "order": self._order,
+      "weight": self._weight,
+    }
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".json.tmp")
+    try:
+      with os.fdopen(fd, "w") as out:
+        json.dump(document, out, separators=(",", ":"))
+      os.replace(tmp, path)
+    finally:
+      with contextlib.suppress(OSError):
+        os.unlink(tmp)
+
+  @classmethod
+  def load(cls, path: str | Path) -> TaxonomyGraph:
+    """Read a graph written by :meth:`save`.
+
+    Raises:
+        ValueError: The file is not a graph of the current schema version
+    """
+    document = json.loads(Path(path).read_text())
+    if document.get("schema_version") != SCHEMA_VERSION:
+      raise ValueError(f"Unsupported taxonomy graph file: {path}")
+    return cls(document, document["taxonomy_id"], document["version"])
+
+  def is_current(self, taxonomy: Any) -> bool:
+    """True when this graph was built from ``taxonomy``'s id and version."""
+    return self.taxonomy_id == taxonomy.id and self.version == taxonomy.version
+
+  # ── Lookup ──────────────────────────────────────────────────────────
+
+  def __len__(self) -> int:
+    return len(self.ids)
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._by_id or key in self._by_qname
+
+  @property
+  def arc_count(self) -> int:
+    return len(self._arc_ids)
+
+  def position(self, key: str) -> int:
+    """Position of the element with id or qname ``key``."""
+    pos = self._by_id.get(key)
+    if pos is None:
+      pos = self._by_qname.get(key)
+    if pos is None:
+      raise KeyError(key)
+    return pos
+
+  def arc(self, index: int) -> GraphArc:
+    return GraphArc(
+      id=self._arc_ids[index],
+      from_element_id=self.ids[self._source[index]],
+      to_element_id=self.ids[self._target[index]],
+      association_type=self.association_types[self._type[index]],
+      structure_id=self.structures[self._structure[index]],
+      order_value=self._order[index],
+      weight=self._weight[index],
+    )
+
+  def arcs_from(
+    self,
+    key: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+  ) -> list[GraphArc]:
+    """Arcs leaving ``key``, in ``order_value`` order (with weights)."""
+    pos = self.position(key)
+    return [self.arc(a) for a in self._arcs(pos, association_type, structure_id, False)]
+
+  def arcs_to(
+    self,
+    key: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+  ) -> list[GraphArc]:
+    """Arcs entering ``key``."""
+    pos = self.position(key)
+    return [self.arc(a) for a in self._arcs(pos, association_type, structure_id, True)]
+
+  # ── Traversal ───────────────────────────────────────────────────────
+
+  def children(
+    self,
+    key: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+  ) -> list[str]:
+    """Ids of the direct targets of ``key``, in ``order_value`` order."""
+    pos = self.position(key)
+    return [self.ids[p] for p in self._step(pos, association_type, structure_id, False)]
+
+  def parents(
+    self,
+    key: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+  ) -> list[str]:
+    """Ids of the direct sources of ``key``."""
+    pos = self.position(key)
+    return [self.ids[p] for p in self._step(pos, association_type, structure_id, True)]
+
+  def descendants(
+    self,
+    key: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+  ) -> list[str]:
+    """Ids reachable from ``key`` along arcs, depth-first in arc order
+    (the pre-order of a presentation tree). Each element appears once.
+    """
+    start = self.position(key)
+    seen = bytearray(len(self.ids))
+    seen[start] = 1
+    result = []
+    stack = [start]
+    while stack:
+      pos = stack.pop()
+      if pos != start:
+        result.append(self.ids[pos])
+      children = [
+        p for p in self._step(pos, association_type, structure_id, False) if not seen[p]
+      ]
+      for child in children:
+        seen[child] = 1
+      stack.extend(reversed(children))
+    return result
+
+  def ancestors(
+    self,
+    key: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+  ) -> list[str]:
+    """Ids from which ``key`` is reachable, nearest first."""
+    return self._bfs(self.position(key), association_type, structure_id, (True,))
+
+  def closure(
+    self,
+    key: str,
+    association_type: Optional[str] = "equivalence",
+    structure_id: Optional[str] = None,
+  ) -> list[str]:
+    """Ids connected to ``key`` by arcs in either direction, nearest first —
+    with the default ``equivalence`` arcs, every element equivalent to
+    ``key``.
+    """
+    return self._bfs(self.position(key), association_type, structure_id, (False, True))
+
+  def shortest_path(
+    self,
+    source: str,
+    target: str,
+    association_type: Optional[str] = None,
+    structure_id: Optional[str] = None,
+    directed: bool = True,
+  ) -> Optional[list[str]]:
+    """Fewest-arc path from ``source`` to ``target`` as a list of ids
+    (both ends included), or ``None`` when ``target`` is unreachable.
+    ``directed=False`` also walks arcs backwards.
+    """
+    start, goal = self.position(source), self.position(target)
+    directions = (False,) if directed else (False, True)
+    previous = array("i", [-1]) * len(self.ids)
+    previous[start] = start
+    queue = deque([start])
+    while queue:
+      pos = queue.popleft()
+      if pos == goal:
+        path = [goal]
+        while path[-1] != start:
+          path.append(previous[path[-1]])
+        return [self.ids[p] for p in reversed(path)]
+      for reverse in directions:
+        for nxt in self._step(pos, association_type, structure_id, reverse):
+          if previous[nxt] < 0:
+            previous[nxt] = pos
+            queue.append(nxt)
+    return None
+
+  # ── Internals ───────────────────────────────────────────────────────
+
+  def _bfs(
+    self,
+    start: int,
+    association_type: Optional[str],
+    structure_id: Optional[str],
+    directions: tuple[bool, ...],
+  ) -> list[str]:
+    seen = bytearray(len(self.ids))
+    seen[start] = 1
+    result = []
+    queue = deque([start])
+    while queue:
+      pos = queue.popleft()
+      for reverse in directions:
+        for nxt in self._step(pos, association_type, structure_id, reverse):
+          if not seen[nxt]:
+            seen[nxt] = 1
+            result.append(self.ids[nxt])
+            queue.append(nxt)
+    return result
+
+  def _step(
+    self,
+    pos: int,
+    association_type: Optional[str],
+    structure_id: Optional[str],
+    reverse: bool,
+  ) -> Iterator[int]:
+    ends = self._source if reverse else self._target
+    for arc in self._arcs(pos, association_type, structure_id, reverse):
+      yield ends[arc]
+
+  def _arcs(
+    self,
+    pos: int,
+    association_type: Optional[str],
+    structure_id: Optional[str],
+    reverse: bool,
+  ) -> Iterator[int]:
+    if association_type is None:
+      types = range(len(self.association_types))
+    elif association_type in self._type_index:
+      types = (self._type_index[association_type],)
+    else:
+      return
+    structure = None
+    if structure_id is not None:
+      structure = self._structure_index.get(structure_id)
+      if structure is None:
+        return
+    for type_index in types:
+      for arc in self._index(type_index, reverse)(pos):
+        if structure is None or self._structure[arc] == structure:
+          yield arc
+
+  def _index(self, type_index: int, reverse: bool) -> _Adjacency:
+    adjacency = self._adjacency.get((type_index, reverse))
+    if adjacency is None:
+      arcs = [a for a, t in enumerate(self._type) if t == type_index]
+      order = [_order_key(value, a) for a, value in enumerate(self._order)]
+      keys = self._target if reverse else self._source
+      adjacency = _Adjacency(len(self.ids), keys, arcs, order)
+      self._adjacency[(type_index, reverse)] = adjacency
+    return adjacency
@@ -10,6 +10,10 @@ This is an implementation detail — consumers only interact with the
 facade clients, which hide the transport entirely.
 """
 
-from robosystems_client.graphql.client import GraphQLClient, GraphQLError
+from robosystems_client.graphql.client import (
+  AsyncGraphQLClient,
+  GraphQLClient,
+  GraphQLError,
+)
 
-__all__ = ["GraphQLClient", "GraphQLError"]
+__all__ = ["AsyncGraphQLClient", "GraphQLClient", "GraphQLError"]
@@ -13,15 +13,36 @@ snapshot plus the query documents in
 `/extensions/{graph_id}/graphql`. Resolvers read the graph from the URL
 path, never from GraphQL variables. `execute()` takes `graph_id` and
 builds the per-request URL on each call.
+
+**Persisted queries.** With ``persisted_queries=True`` the client speaks
+the automatic persisted query (APQ) protocol: a read first sends only the
+SHA-256 of its document; if the server has not seen that hash yet
+(``PersistedQueryNotFound``) the client resends with the full text, which
+registers it. With ``use_get=True`` the hash-only reads go out as GET so
+HTTP caches can serve them. A server answering
+``PersistedQueryNotSupported`` is remembered (per base URL, for the
+process — facades build a client per call), and later reads go straight
+to a plain POST of the document.
+
+**Single flight.** Pass a ``single_flight`` group
+(``clients/single_flight.py``) and identical reads in flight at the same
+time — same URL, credentials, document, variables and operation name —
+share one request. Mutations always go out on their own.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+if TYPE_CHECKING:
+  from ..clients.single_flight import AsyncSingleFlight, SingleFlight
+
 
 class GraphQLError(Exception):
   """Raised when a GraphQL response contains errors or a non-2xx status.
@@ -45,13 +66,56 @@ class GraphQLError(Exception):
     self.status_code = status_code
 
 
-class GraphQLClient:
-  """Synchronous GraphQL client for the per-graph `/extensions/{graph_id}/graphql` endpoint.
+_PERSISTED_QUERY_ERRORS = frozenset(
+  {
+    "PersistedQueryNotFound",
+    "PersistedQueryNotSupported",
+    "PERSISTED_QUERY_NOT_FOUND",
+    "PERSISTED_QUERY_NOT_SUPPORTED",
+  }
+)
+_PERSISTED_QUERY_NOT_SUPPORTED = frozenset(
+  {"PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"}
+)
+# Only bodies containing one of these are decoded to look for APQ errors
+_PERSISTED_QUERY_MARKERS = (b"PersistedQuery", b"PERSISTED_QUERY")
+_MUTATION = re.compile(r"^\s*mutation\b", re.MULTILINE)
 
-  Not a context manager — each `execute` call opens and closes its own
-  httpx.Client, matching the existing facade convention of constructing
-  a fresh `AuthenticatedClient` per request.
+# Base URLs whose server answered PersistedQueryNotSupported
+_APQ_UNSUPPORTED: set[str] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def document_hash(query: str) -> str:
+  """SHA-256 hex digest of a GraphQL document, as APQ identifies it.
+
+  Cached per document, so the ``*_GQL`` constants are hashed once per
+  process.
   """
+  return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _persisted_query_error(response: httpx.Response) -> str | None:
+  """The APQ error a hash-only query was answered with, if any.
+
+  Bodies that do not mention a persisted query are not decoded, so a
+  successful read is parsed once, by ``_parse_response``.
+  """
+  if not any(marker in response.content for marker in _PERSISTED_QUERY_MARKERS):
+    return None
+  try:
+    errors = response.json().get("errors") or []
+  except (ValueError, AttributeError):
+    return None
+  for error in errors:
+    for value in (error.get("message"), (error.get("extensions") or {}).get("code")):
+      if value in _PERSISTED_QUERY_ERRORS:
+        return value
+  return None
+
+
+class _GraphQLTransport:
+  """Request building and response parsing shared by the sync and async clients."""
 
   def __init__(
     self,
@@ -60,9 +124,14 @@ class GraphQLClient:
     token: str | None = None,
     headers: dict[str, str] | None = None,
     timeout: float = 60.0,
+    persisted_queries: bool = False,
+    use_get: bool = False,
   ):
     self.base_url = base_url.rstrip("/")
     self.timeout = timeout
+    self.persisted_queries = persisted_queries
+    self.use_get = use_get
+    self.single_flight: SingleFlight | AsyncSingleFlight | None = None
     self._headers: dict[str, str] = {"Content-Type": "application/json"}
     if headers:
       self._headers.update(headers)
@@ -86,35 +155,89 @@ class GraphQLClient:
       else:
         self._headers["Authorization"] = f"Bearer {token}"
 
+  @property
+  def _hash_only(self) -> bool:
+    """Whether reads start with a hash-only persisted query."""
+    return self.persisted_queries and self.base_url not in _APQ_UNSUPPORTED
+
+  def _persisted_query_missed(self, response: httpx.Response) -> bool:
+    """True when the server did not resolve a hash-only persisted query."""
+    error = _persisted_query_error(response)
+    if error in _PERSISTED_QUERY_NOT_SUPPORTED:
+      _APQ_UNSUPPORTED.add(self.base_url)
+    return error is not None
+
   def _url_for(self, graph_id: str) -> str:
     if not graph_id:
       raise ValueError("graph_id must be a non-empty string")
     return f"{self.base_url}/extensions/{graph_id}/graphql"
 
-  def execute(
+  def _flight_key(
     self,
     graph_id: str,
     query: str,
-    variables: dict[str, Any] | None = None,
-    *,
-    operation_name: str | None = None,
+    variables: dict[str, Any] | None,
+    operation_name: str | None,
+  ) -> tuple[Any, ...] | None:
+    """Single-flight key of a read; ``None`` for mutations."""
+    if self.single_flight is None or _MUTATION.search(query):
+      return None
+    return (
+      "graphql",
+      self._url_for(graph_id),
+      tuple(sorted(self._headers.items())),
+      document_hash(query),
+      json.dumps(variables, sort_keys=True, default=str),
+      operation_name,
+    )
+
+  @staticmethod
+  def _payload(
+    query: str,
+    variables: dict[str, Any] | None,
+    operation_name: str | None,
   ) -> dict[str, Any]:
-    """Execute a GraphQL query against the given graph and return the `data` dict.
-
-    Raises:
-        GraphQLError: If the HTTP response is non-2xx, or the body
-            contains `errors[]`.
-    """
     payload: dict[str, Any] = {"query": query}
     if variables is not None:
       payload["variables"] = variables
     if operation_name is not None:
       payload["operationName"] = operation_name
+    return payload
 
-    url = self._url_for(graph_id)
-    with httpx.Client(timeout=self.timeout) as client:
-      response = client.post(url, json=payload, headers=self._headers)
+  def _request_kwargs(
+    self,
+    query: str,
+    variables: dict[str, Any] | None,
+    operation_name: str | None,
+    *,
+    send_document: bool,
+  ) -> dict[str, Any]:
+    """``httpx`` request arguments for one attempt at executing ``query``.
 
+    Without persisted queries (or against a server that does not support
+    them) this is always a POST of the full document. With them,
+    ``send_document=False`` sends only the hash (as GET for reads when
+    ``use_get`` is set); ``send_document=True`` sends the text plus its
+    hash so the server registers it.
+    """
+    if not self._hash_only:
+      return {"method": "POST", "json": self._payload(query, variables, operation_name)}
+    payload = self._payload(query, variables, operation_name)
+    if not send_document:
+      del payload["query"]
+    payload["extensions"] = {
+      "persistedQuery": {"version": 1, "sha256Hash": document_hash(query)}
+    }
+    if send_document or not self.use_get or _MUTATION.search(query):
+      return {"method": "POST", "json": payload}
+    params = {
+      key: value if isinstance(value, str) else json.dumps(value, separators=(",", ":"))
+      for key, value in payload.items()
+    }
+    return {"method": "GET", "params": params}
+
+  @staticmethod
+  def _parse_response(response: httpx.Response) -> dict[str, Any]:
     if response.status_code >= 400:
       raise GraphQLError(
         f"GraphQL request failed: HTTP {response.status_code}: {response.text[:500]}",
@@ -141,6 +264,177 @@ class GraphQLClient:
     return body.get("data") or {}
 
 
+class GraphQLClient(_GraphQLTransport):
+  """Synchronous GraphQL client for the per-graph `/extensions/{graph_id}/graphql` endpoint.
+
+  Not a context manager — each `execute` call opens and closes its own
+  httpx.Client, matching the existing facade convention of constructing
+  a fresh `AuthenticatedClient` per request.
+  """
+
+  def __init__(
+    self,
+    base_url: str,
+    *,
+    token: str | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 60.0,
+    persisted_queries: bool = False,
+    use_get: bool = False,
+    single_flight: SingleFlight | None = None,
+  ):
+    super().__init__(
+      base_url,
+      token=token,
+      headers=headers,
+      timeout=timeout,
+      persisted_queries=persisted_queries,
+      use_get=use_get,
+    )
+    self.single_flight = single_flight
+
+  def execute(
+    self,
+    graph_id: str,
+    query: str,
+    variables: dict[str, Any] | None = None,
+    *,
+    operation_name: str | None = None,
+  ) -> dict[str, Any]:
+    """Execute a GraphQL query against the given graph and return the `data` dict.
+
+    Raises:
+        GraphQLError: If the HTTP response is non-2xx, or the body
+            contains `errors[]`.
+    """
+    key = self._flight_key(graph_id, query, variables, operation_name)
+    if key is not None:
+      return self.single_flight.do(
+        key, lambda: self._execute(graph_id, query, variables, operation_name)
+      )
+    return self._execute(graph_id, query, variables, operation_name)
+
+  def _execute(
+    self,
+    graph_id: str,
+    query: str,
+    variables: dict[str, Any] | None,
+    operation_name: str | None,
+  ) -> dict[str, Any]:
+    url = self._url_for(graph_id)
+    with httpx.Client(timeout=self.timeout) as client:
+      response = None
+      if self._hash_only:
+        response = client.request(
+          url=url,
+          headers=self._headers,
+          **self._request_kwargs(query, variables, operation_name, send_document=False),
+        )
+      if response is None or self._persisted_query_missed(response):
+        response = client.request(
+          url=url,
+          headers=self._headers,
+          **self._request_kwargs(query, variables, operation_name, send_document=True),
+        )
+    return self._parse_response(response)
+
+
+class AsyncGraphQLClient(_GraphQLTransport):
+  """Asyncio GraphQL client for the per-graph `/extensions/{graph_id}/graphql` endpoint.
+
+  Pass ``http_client`` to run every request over a shared
+  ``httpx.AsyncClient`` — its connection pool is then reused across
+  calls (and across facades holding the same client), which is what
+  lets many concurrent reads share one event loop without a TLS
+  handshake each. The caller owns a shared client and closes it. With
+  no ``http_client``, each `execute` opens and closes its own.
+  """
+
+  def __init__(
+    self,
+    base_url: str,
+    *,
+    token: str | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 60.0,
+    persisted_queries: bool = False,
+    use_get: bool = False,
+    http_client: httpx.AsyncClient | None = None,
+    single_flight: AsyncSingleFlight | None = None,
+  ):
+    super().__init__(
+      base_url,
+      token=token,
+      headers=headers,
+      timeout=timeout,
+      persisted_queries=persisted_queries,
+      use_get=use_get,
+    )
+    self.http_client = http_client
+    self.single_flight = single_flight
+
+  async def execute(
+    self,
+    graph_id: str,
+    query: str,
+    variables: dict[str, Any] | None = None,
+    *,
+    operation_name: str | None = None,
+  ) -> dict[str, Any]:
+    """Execute a GraphQL query against the given graph and return the `data` dict.
+
+    Raises:
+        GraphQLError: If the HTTP response is non-2xx, or the body
+            contains `errors[]`.
+    """
+    key = self._flight_key(graph_id, query, variables, operation_name)
+    if key is not None:
+      return await self.single_flight.do(
+        key, lambda: self._execute(graph_id, query, variables, operation_name)
+      )
+    return await self._execute(graph_id, query, variables, operation_name)
+
+  async def _execute(
+    self,
+    graph_id: str,
+    query: str,
+    variables: dict[str, Any] | None,
+    operation_name: str | None,
+  ) -> dict[str, Any]:
+    if self.http_client is not None:
+      # The shared client's own timeout applies, so requests queued for
+      # a pooled connection are governed by its pool settings.
+      return await self._execute_on(
+        self.http_client, graph_id, query, variables, operation_name
+      )
+    async with httpx.AsyncClient(timeout=self.timeout) as client:
+      return await self._execute_on(client, graph_id, query, variables, operation_name)
+
+  async def _execute_on(
+    self,
+    client: httpx.AsyncClient,
+    graph_id: str,
+    query: str,
+    variables: dict[str, Any] | None,
+    operation_name: str | None,
+  ) -> dict[str, Any]:
+    url = self._url_for(graph_id)
+    response = None
+    if self._hash_only:
+      response = await client.request(
+        url=url,
+        headers=self._headers,
+        **self._request_kwargs(query, variables, operation_name, send_document=False),
+      )
+    if response is None or self._persisted_query_missed(response):
+      response = await client.request(
+        url=url,
+        headers=self._headers,
+        **self._request_kwargs(query, variables, operation_name, send_document=True),
+      )
+    return self._parse_response(response)
+
+
 # ── Shared helpers for query parsers ──────────────────────────────────
 
 # Two-group pattern that correctly handles consecutive uppercase letters
@@ -0,0 +1,134 @@
+"""Lazy, read-only views over GraphQL response data.
+
+``Model.model_validate(data)`` instantiates and checks every nested object
+of a response up front — for a 5,000-row ``ListLedgerTransactions`` page
+that is tens of thousands of field validations before the caller reads a
+single value. When the server is trusted to honour the schema,
+:func:`model_view` skips that work: it wraps the decoded ``data`` dict in a
+view whose attributes mirror the generated model's fields (snake_case
+names, nested models returned as views, lists of models as lists of
+views) and resolves each one only when it is read.
+
+Views are duck-typed stand-ins, not model instances:
+
+- values are returned as received — no type coercion (an integral
+  ``amount`` stays an ``int``) and a missing key reads as ``None``;
+- they are read-only and do not expose the pydantic API beyond
+  :meth:`ModelView.model_dump`; :meth:`ModelView.to_model` validates the
+  underlying data into the real model when one is needed.
+
+Facades return views when ``graphql_trusted_server`` is set in their
+config (see :func:`parse_model`).
+"""
+
+from __future__ import annotations
+
+import functools
+import types
+from collections.abc import Callable, Mapping
+from enum import Enum
+from typing import Any, ClassVar, TypeVar, Union, cast, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+_Converter = Callable[[Any], Any]
+
+
+class ModelView:
+  """Base class of the generated per-model view classes."""
+
+  __slots__ = ("_data",)
+  __model__: ClassVar[type[BaseModel]]
+
+  def __init__(self, data: Mapping[str, Any]):
+    object.__setattr__(self, "_data", data)
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    raise AttributeError(f"{type(self).__name__} is read-only")
+
+  def __repr__(self) -> str:
+    return f"{type(self).__name__}({self._data!r})"
+
+  def __eq__(self, other: object) -> bool:
+    if type(other) is not type(self):
+      return NotImplemented
+    return self._data == cast(ModelView, other)._data
+
+  __hash__ = None  # type: ignore[assignment]
+
+  def to_model(self) -> BaseModel:
+    """Validate the underlying data into the real generated model."""
+    return self.__model__.model_validate(self._data)
+
+  def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+    """``to_model().model_dump(**kwargs)``."""
+    return self.to_model().model_dump(**kwargs)
+
+
+def model_view(model: type[M], data: Mapping[str, Any]) -> M:
+  """Wrap ``data`` in a lazy view of ``model``.
+
+  Typed as ``model`` so facade signatures hold for attribute access; see
+  the module docstring for what a view does not do.
+  """
+  return cast(M, view_class(model)(data))
+
+
+def parse_model(model: type[M], data: Mapping[str, Any], *, trusted: bool) -> M:
+  """``model.model_validate(data)``, or a :func:`model_view` when ``trusted``."""
+  if trusted:
+    return model_view(model, data)
+  return model.model_validate(data)
+
+
+@functools.cache
+def view_class(model: type[BaseModel]) -> type[ModelView]:
+  """The view class for ``model``, built once per model."""
+  namespace: dict[str, Any] = {"__slots__": (), "__model__": model}
+  for name, field in model.model_fields.items():
+    namespace[name] = _field_property(field.alias or name, _converter(field.annotation))
+  return type(f"{model.__name__}View", (ModelView,), namespace)
+
+
+def _field_property(key: str, convert: _Converter | None) -> property:
+  if convert is None:
+    return property(lambda self: self._data.get(key))
+
+  def read(self: ModelView) -> Any:
+    value = self._data.get(key)
+    return None if value is None else convert(value)
+
+  return property(read)
+
+
+def _converter(annotation: Any) -> _Converter | None:
+  """Converter applied to a non-null raw value, or ``None`` to pass it through.
+
+  Nested view classes are looked up when a value is read, not here, so
+  self-referential models (account trees) do not recurse at build time.
+  """
+  origin = get_origin(annotation)
+  if origin is Union or origin is types.UnionType:
+    members = [a for a in get_args(annotation) if a is not type(None)]
+    if len(members) == 1:
+      return _converter(members[0])
+    if all(_converter(m) is None for m in members):
+      return None
+    return TypeAdapter(annotation).validate_python
+  if origin is list:
+    (item,) = get_args(annotation) or (Any,)
+    inner = _converter(item)
+    if inner is None:
+      return None
+    return lambda values: [None if v is None else inner(v) for v in values]
+  if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+    return lambda value: view_class(annotation)(value)
+  if isinstance(annotation, type) and issubclass(annotation, Enum):
+    return annotation
+  if origin is not None:
+    # dict[...], tuple[...], Literal[...]: nothing generated uses these
+    # for nested data today, so validate rather than guess.
+    return TypeAdapter(annotation).validate_python
+  return None
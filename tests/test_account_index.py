@@ -0,0 +1,136 @@
+"""Unit tests for AccountIndex."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from robosystems_client.clients.account_index import AccountIndex
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.graphql.generated.get_ledger_account_tree import (
+  GetLedgerAccountTree,
+)
+
+
+def _node(code: str, children: list) -> dict:
+  return {
+    "id": f"acc_{code}",
+    "code": code,
+    "name": f"Account {code}",
+    "trait": "asset",
+    "accountType": None,
+    "balanceType": "debit",
+    "depth": 0,
+    "isActive": True,
+    "children": children,
+  }
+
+
+# 1000 ─┬─ 1100 ─┬─ 1110
+#       │        └─ 1120
+#       └─ 1200
+# 2000
+TREE = {
+  "accountTree": {
+    "totalAccounts": 6,
+    "roots": [
+      _node(
+        "1000",
+        [_node("1100", [_node("1110", []), _node("1120", [])]), _node("1200", [])],
+      ),
+      _node("2000", []),
+    ],
+  }
+}
+
+
+@pytest.fixture
+def index() -> AccountIndex:
+  return AccountIndex.from_tree(GetLedgerAccountTree.model_validate(TREE).account_tree)
+
+
+@pytest.mark.unit
+class TestAccountIndex:
+  def test_preorder_layout(self, index):
+    assert index.codes == ["1000", "1100", "1110", "1120", "1200", "2000"]
+    assert list(index.parent) == [-1, 0, 1, 1, 0, -1]
+    assert list(index.depth) == [0, 1, 2, 2, 1, 0]
+    assert list(index.end) == [5, 4, 3, 4, 5, 6]
+
+  def test_lookups(self, index):
+    assert index.get("1120").id == "acc_1120"
+    assert index.position("acc_1200") == 4
+    assert "1110" in index and "9999" not in index
+    assert index.parent_id("1110") == "acc_1100"
+    assert index.parent_id("2000") is None
+    assert index.ancestors("1120") == ["acc_1100", "acc_1000"]
+    assert index.descendants("1100") == ["acc_1110", "acc_1120"]
+    assert list(index.subtree("1000")) == [0, 1, 2, 3, 4]
+    with pytest.raises(KeyError):
+      index.position("9999")
+
+  def test_from_accounts_matches_tree(self, index):
+    flat = [
+      SimpleNamespace(id=account_id, code=code, parent_id=index.parent_id(code))
+      for account_id, code in zip(index.ids, index.codes)
+    ]
+    # Input order of unrelated accounts should not matter.
+    rebuilt = AccountIndex.from_accounts(reversed(flat))
+    assert sorted(rebuilt.ids) == sorted(index.ids)
+    assert rebuilt.descendants("1100") == ["acc_1120", "acc_1110"]
+    assert rebuilt.ancestors("1110") == ["acc_1100", "acc_1000"]
+
+  def test_from_accounts_rejects_cycles(self):
+    accounts = [
+      SimpleNamespace(id="a", code="A", parent_id="b"),
+      SimpleNamespace(id="b", code="B", parent_id="a"),
+    ]
+    with pytest.raises(ValueError, match="cycle"):
+      AccountIndex.from_accounts(accounts)
+
+  @pytest.mark.parametrize("vectorized", [False, True])
+  def test_rollup_periods(self, index, vectorized):
+    if vectorized:
+      pytest.importorskip("numpy")
+    periods = {
+      "2026-01": {"acc_1000": 1.0, "acc_1110": 10.0, "acc_1120": 20.0, "1200": 5.0},
+      "2026-02": {"acc_1110": -4.0, "acc_2000": 7.0, "acc_unknown": 99.0},
+    }
+
+    with patch("robosystems_client.clients.account_index.HAS_NUMPY", vectorized):
+      totals = index.rollup_periods(periods, keys=["1000", "1100", "2000"])
+
+    assert totals == {
+      "2026-01": {"acc_1000": 36.0, "acc_1100": 30.0, "acc_2000": 0.0},
+      "2026-02": {"acc_1000": -4.0, "acc_1100": -4.0, "acc_2000": 7.0},
+    }
+
+  @pytest.mark.parametrize("vectorized", [False, True])
+  def test_rollup_is_exact_beside_large_balances(self, index, vectorized):
+    if vectorized:
+      pytest.importorskip("numpy")
+    balances = {"acc_1000": 123_456_789_012.34, "acc_1110": 0.10, "acc_1200": 5.07}
+
+    with patch("robosystems_client.clients.account_index.HAS_NUMPY", vectorized):
+      totals = index.rollup(balances)
+
+    assert totals["acc_1110"] == 0.10
+    assert totals["acc_1100"] == 0.10
+    assert totals["acc_1200"] == 5.07
+    assert totals["acc_2000"] == 0.0
+    assert totals["acc_1000"] == 123_456_789_012.34 + 0.10 + 5.07
+
+  def test_rollup_all_accounts(self, index):
+    totals = index.rollup({"acc_1110": 2.0, "acc_1200": 3.0})
+    assert totals["acc_1000"] == 5.0
+    assert totals["acc_1110"] == 2.0
+    assert len(totals) == 6
+
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_ledger_client_get_account_index(self, mock_execute, mock_config, graph_id):
+    mock_execute.return_value = TREE
+    index = LedgerClient(mock_config).get_account_index(graph_id)
+    assert index.descendants("1000")[-1] == "acc_1200"
+
+    mock_execute.return_value = {"accountTree": None}
+    assert LedgerClient(mock_config).get_account_index(graph_id) is None
@@ -0,0 +1,216 @@
+"""Unit tests for AsyncGraphQLClient and the generated async facades."""
+
+import ast
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from robosystems_client.clients.async_graphql_facade import create_async_http_client
+from robosystems_client.clients.async_investor_client import AsyncInvestorClient
+from robosystems_client.clients.async_ledger_client import AsyncLedgerClient
+from robosystems_client.clients.async_library_client import AsyncLibraryClient
+from robosystems_client.clients.facade import (
+  AsyncRoboSystemsClients,
+  RoboSystemsClientConfig,
+)
+from robosystems_client.graphql.client import AsyncGraphQLClient, GraphQLError
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _normalized(source: str) -> str:
+  """AST dump with docstrings cleaned, so ruff's docstring formatting is ignored."""
+  tree = ast.parse(source)
+  for node in ast.walk(tree):
+    if isinstance(
+      node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+    ):
+      doc = ast.get_docstring(node)
+      if doc is not None:
+        node.body[0].value.value = doc
+  return ast.dump(tree)
+
+
+def _load_generator():
+  spec = importlib.util.spec_from_file_location(
+    "generate_async_facades", ROOT / "bin" / "generate-async-facades.py"
+  )
+  module = importlib.util.module_from_spec(spec)
+  sys.modules[spec.name] = module  # dataclasses resolve their module by name
+  spec.loader.exec_module(module)
+  return module
+
+
+class Recorder:
+  """MockTransport handler answering GraphQL and operation requests."""
+
+  def __init__(self, data=None):
+    self.data = data or {}
+    self.requests: list[httpx.Request] = []
+
+  def __call__(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request)
+    if request.url.path.endswith("/graphql"):
+      return httpx.Response(200, json={"data": self.data})
+    return httpx.Response(
+      200,
+      json={
+        "operation": "update-entity",
+        "operationId": "op_1",
+        "status": "completed",
+        "result": {"id": "ent_1", "name": "Acme"},
+        "at": "2026-01-01T00:00:00Z",
+      },
+    )
+
+
+def _config(mock_config, server, **overrides):
+  config = {**mock_config, **overrides}
+  config["async_http_client"] = create_async_http_client(
+    config, transport=httpx.MockTransport(server)
+  )
+  return config
+
+
+@pytest.mark.unit
+class TestGeneratedFacades:
+  def test_generated_modules_are_current(self):
+    generator = _load_generator()
+    for spec in generator.SPECS:
+      path = ROOT / "robosystems_client" / "clients" / f"{spec.async_module}.py"
+      expected = _normalized(generator.generate(spec))
+      assert _normalized(path.read_text()) == expected, (
+        f"{path.name} is stale — run bin/generate-async-facades.py"
+      )
+
+  def test_io_methods_are_coroutines(self):
+    assert asyncio.iscoroutinefunction(AsyncLedgerClient.get_summary)
+    assert asyncio.iscoroutinefunction(AsyncLedgerClient.create_journal_entry)
+    assert asyncio.iscoroutinefunction(AsyncInvestorClient.get_holdings)
+    assert asyncio.iscoroutinefunction(AsyncLibraryClient.list_library_taxonomies)
+    assert not asyncio.iscoroutinefunction(AsyncLedgerClient.is_shared_report)
+    assert not hasattr(AsyncLedgerClient, "download_report_bundle")
+    assert not hasattr(AsyncLedgerClient, "create_journal_entries")
+
+
+@pytest.mark.unit
+class TestAsyncGraphQLClient:
+  @pytest.mark.asyncio
+  async def test_execute_on_shared_client(self):
+    server = Recorder({"summary": {"accountCount": 3}})
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as http:
+      client = AsyncGraphQLClient("http://api.test/", token="rfs_key", http_client=http)
+      data = await client.execute("kg_1", "query { summary }", {"a": 1})
+
+    assert data == {"summary": {"accountCount": 3}}
+    request = server.requests[0]
+    assert str(request.url) == "http://api.test/extensions/kg_1/graphql"
+    assert request.headers["X-API-Key"] == "rfs_key"
+    assert json.loads(request.content) == {
+      "query": "query { summary }",
+      "variables": {"a": 1},
+    }
+
+  @pytest.mark.asyncio
+  async def test_graphql_errors_raise(self):
+    def handler(request):
+      return httpx.Response(200, json={"errors": [{"message": "boom"}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+      client = AsyncGraphQLClient("http://api.test", token="jwt", http_client=http)
+      with pytest.raises(GraphQLError, match="boom"):
+        await client.execute("kg_1", "query { x }")
+
+
+@pytest.mark.unit
+class TestAsyncLedgerClient:
+  @pytest.mark.asyncio
+  async def test_concurrent_reads_share_one_client(self, mock_config):
+    server = Recorder({"summary": None})
+    config = _config(mock_config, server)
+    client = AsyncLedgerClient(config)
+
+    with patch.object(
+      httpx.AsyncClient, "send", autospec=True, side_effect=httpx.AsyncClient.send
+    ) as send:
+      results = await asyncio.gather(
+        *(client.get_summary(f"kg_{i}") for i in range(20))
+      )
+    await config["async_http_client"].aclose()
+
+    assert results == [None] * 20
+    assert len(server.requests) == 20
+    assert {id(call.args[0]) for call in send.call_args_list} == {
+      id(config["async_http_client"])
+    }
+
+  @pytest.mark.asyncio
+  async def test_write_uses_asyncio_op_with_rotating_token(self, mock_config):
+    current = {"token": "rfs_first"}
+    server = Recorder()
+    config = _config(
+      mock_config, server, token_provider=lambda: current["token"], headers={}
+    )
+    client = AsyncLedgerClient(config)
+
+    entity = await client.update_entity("kg_1", {"name": "Acme"})
+    current["token"] = "rfs_second"
+    await client.update_entity("kg_1", {"name": "Acme"})
+    await config["async_http_client"].aclose()
+
+    assert entity.name == "Acme"
+    assert [r.url.path for r in server.requests] == [
+      "/extensions/roboledger/kg_1/operations/update-entity"
+    ] * 2
+    assert [r.headers["X-API-Key"] for r in server.requests] == [
+      "rfs_first",
+      "rfs_second",
+    ]
+
+  @pytest.mark.asyncio
+  async def test_static_credential_header_not_reused_for_rest(self, mock_config):
+    server = Recorder()
+    config = _config(
+      mock_config,
+      server,
+      headers={"X-API-Key": "stale", "X-Trace": "1"},
+      token_provider=lambda: "rfs_fresh",
+    )
+    await AsyncLedgerClient(config).update_entity("kg_1", {"name": "Acme"})
+    await config["async_http_client"].aclose()
+
+    request = server.requests[0]
+    assert request.headers["X-API-Key"] == "rfs_fresh"
+    assert request.headers["X-Trace"] == "1"
+
+  @pytest.mark.asyncio
+  async def test_owned_client_closed_by_aclose(self, mock_config):
+    async with AsyncLibraryClient(mock_config) as client:
+      http = client._http_client()
+      assert client._http_client() is http
+    assert http.is_closed
+
+
+@pytest.mark.unit
+class TestAsyncRoboSystemsClients:
+  @pytest.mark.asyncio
+  async def test_facades_share_http_client(self):
+    clients = AsyncRoboSystemsClients(
+      RoboSystemsClientConfig(
+        base_url="http://api.test", headers={"X-API-Key": "rfs_key"}
+      )
+    )
+    assert clients.config["token"] == "rfs_key"
+    assert clients.reports is clients.ledger
+    http = clients.ledger._http_client()
+    assert clients.investor._http_client() is http
+    assert clients.library._http_client() is http
+
+    await clients.close()
+    assert http.is_closed
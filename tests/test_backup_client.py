@@ -0,0 +1,289 @@
+"""Unit tests for BackupClient."""
+
+import hashlib
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from robosystems_client.clients.backup_client import (
+  BackupChangedError,
+  BackupClient,
+  BackupDownloadResult,
+)
+from robosystems_client.models.backup_download_url_response import (
+  BackupDownloadUrlResponse,
+)
+
+PAYLOAD = bytes(range(256)) * 41  # 10,496 bytes — not a multiple of the segment
+
+
+def _url_response(url="https://s3.example.com/backup?sig=1", expires_in=3600):
+  response = Mock()
+  response.status_code = 200
+  response.parsed = BackupDownloadUrlResponse(
+    download_url=url,
+    expires_in=expires_in,
+    expires_at=time.time() + expires_in,
+    backup_id="bk_1",
+    graph_id="kg_1",
+  )
+  return response
+
+
+class RangeServer:
+  """httpx MockTransport handler serving PAYLOAD with Range support."""
+
+  def __init__(self, payload=PAYLOAD, etag='"abc"'):
+    self.payload = payload
+    self.etag = etag
+    self.requests: list[httpx.Request] = []
+    self.fail_ranges: dict[str, int] = {}  # range header -> failures left
+    self.forbidden_urls: set[str] = set()
+
+  def __call__(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request)
+    if str(request.url) in self.forbidden_urls:
+      return httpx.Response(403, content=b"Request has expired")
+    if request.headers.get("if-match") not in (None, self.etag):
+      return httpx.Response(412)
+    header = request.headers.get("range")
+    if header is None:
+      return httpx.Response(200, content=self.payload, headers={"ETag": self.etag})
+    if self.fail_ranges.get(header):
+      self.fail_ranges[header] -= 1
+      return httpx.Response(500)
+    start, end = (int(x) for x in header.removeprefix("bytes=").split("-"))
+    body = self.payload[start : end + 1]
+    return httpx.Response(
+      206,
+      content=body,
+      headers={
+        "ETag": self.etag,
+        "Content-Range": f"bytes {start}-{end}/{len(self.payload)}",
+      },
+    )
+
+
+@pytest.fixture
+def backup_client(mock_config):
+  mock_config["retry_delay"] = 0
+  return BackupClient(mock_config)
+
+
+def _download(client, server, tmp_path, url_side_effect=None, **kwargs):
+  transport = httpx.MockTransport(server)
+  real_client = httpx.Client
+
+  with (
+    patch(
+      "robosystems_client.clients.backup_client.get_backup_download_url",
+      side_effect=url_side_effect or (lambda **kw: _url_response()),
+    ),
+    patch(
+      "robosystems_client.clients.backup_client.httpx.Client",
+      side_effect=lambda **kw: real_client(transport=transport),
+    ),
+  ):
+    return client.download("kg_1", "bk_1", tmp_path / "backup.lbug.zst", **kwargs)
+
+
+@pytest.mark.unit
+class TestBackupDownload:
+  """Test suite for BackupClient.download."""
+
+  def test_parallel_segments_reassemble_file(self, backup_client, tmp_path):
+    server = RangeServer()
+    progress = []
+    result = _download(
+      backup_client,
+      server,
+      tmp_path,
+      segment_size=1024,
+      max_workers=4,
+      on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert isinstance(result, BackupDownloadResult)
+    assert result.path.read_bytes() == PAYLOAD
+    assert result.size_bytes == len(PAYLOAD)
+    assert result.segments == 11
+    assert result.resumed_segments == 0
+    assert progress[-1] == (len(PAYLOAD), len(PAYLOAD))
+    # Probe + one request per segment, each pinned to the probed ETag.
+    ranged = [r for r in server.requests if r.headers.get("range") != "bytes=0-0"]
+    assert len(ranged) == 11
+    assert all(r.headers["if-match"] == '"abc"' for r in ranged)
+    assert not (tmp_path / "backup.lbug.zst.part").exists()
+    assert not (tmp_path / "backup.lbug.zst.part.json").exists()
+
+  def test_checksum_verified(self, backup_client, tmp_path):
+    expected = hashlib.sha256(PAYLOAD).hexdigest()
+    result = _download(
+      backup_client,
+      RangeServer(),
+      tmp_path,
+      segment_size=4096,
+      expected_sha256=expected,
+    )
+    assert result.sha256 == expected
+
+  def test_checksum_mismatch_raises_and_discards(self, backup_client, tmp_path):
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+      _download(
+        backup_client, RangeServer(), tmp_path, segment_size=4096, expected_sha256="00"
+      )
+    assert list(tmp_path.iterdir()) == []
+
+  def test_failed_segment_is_retried(self, backup_client, tmp_path):
+    server = RangeServer()
+    server.fail_ranges["bytes=1024-2047"] = 2
+    result = _download(backup_client, server, tmp_path, segment_size=1024)
+    assert result.path.read_bytes() == PAYLOAD
+
+  def test_resume_skips_completed_segments(self, backup_client, tmp_path):
+    backup_client.max_retries = 1
+    server = RangeServer()
+    server.fail_ranges["bytes=9216-10239"] = 1
+    with pytest.raises(RuntimeError, match="failed after 1 attempts"):
+      _download(backup_client, server, tmp_path, segment_size=1024, max_workers=1)
+
+    state = json.loads((tmp_path / "backup.lbug.zst.part.json").read_text())
+    assert 9 not in state["done"]
+    assert len(state["done"]) >= 1
+
+    server.requests.clear()
+    result = _download(backup_client, server, tmp_path, segment_size=1024)
+    assert result.path.read_bytes() == PAYLOAD
+    assert result.resumed_segments == len(state["done"])
+    ranged = [r for r in server.requests if r.headers.get("range") != "bytes=0-0"]
+    assert len(ranged) == 11 - len(state["done"])
+
+  def test_segment_cut_short_by_abort_is_not_checkpointed(
+    self, backup_client, tmp_path
+  ):
+    backup_client.max_retries = 1
+    server = RangeServer()
+    server.fail_ranges["bytes=1024-2047"] = 1
+    failed = threading.Event()
+
+    def handler(request):
+      header = request.headers.get("range")
+      if header == "bytes=1024-2047":
+        failed.set()
+      response = server(request)
+      if header != "bytes=0-1023":
+        return response
+
+      def slow_body():
+        failed.wait(5)
+        time.sleep(0.2)  # the failure has aborted the download by now
+        yield response.content
+
+      return httpx.Response(206, headers=response.headers, content=slow_body())
+
+    with pytest.raises(RuntimeError, match="failed after 1 attempts"):
+      _download(backup_client, handler, tmp_path, segment_size=1024, max_workers=2)
+
+    state_path = tmp_path / "backup.lbug.zst.part.json"
+    if state_path.exists():
+      assert 0 not in json.loads(state_path.read_text())["done"]
+    result = _download(backup_client, server, tmp_path, segment_size=1024)
+    assert result.path.read_bytes() == PAYLOAD
+
+  def test_resume_ignored_when_object_changed(self, backup_client, tmp_path):
+    (tmp_path / "backup.lbug.zst.part").write_bytes(b"\0" * len(PAYLOAD))
+    (tmp_path / "backup.lbug.zst.part.json").write_text(
+      json.dumps(
+        {"size": len(PAYLOAD), "etag": '"old"', "segment_size": 1024, "done": [0, 1]}
+      )
+    )
+    result = _download(backup_client, RangeServer(), tmp_path, segment_size=1024)
+    assert result.resumed_segments == 0
+    assert result.path.read_bytes() == PAYLOAD
+
+  def test_expired_url_is_refreshed(self, backup_client, tmp_path):
+    server = RangeServer()
+    server.forbidden_urls.add("https://s3.example.com/backup?sig=1")
+    urls = iter(
+      [
+        _url_response("https://s3.example.com/backup?sig=1"),
+        _url_response("https://s3.example.com/backup?sig=2"),
+      ]
+    )
+    result = _download(
+      backup_client,
+      server,
+      tmp_path,
+      url_side_effect=lambda **kw: next(urls),
+      segment_size=4096,
+    )
+    assert result.path.read_bytes() == PAYLOAD
+    assert str(server.requests[-1].url).endswith("sig=2")
+
+  def test_url_near_expiry_is_renewed_before_use(self, backup_client, tmp_path):
+    calls = []
+
+    def url_side_effect(**kw):
+      calls.append(kw)
+      return _url_response(expires_in=30 if len(calls) == 1 else 3600)
+
+    _download(backup_client, RangeServer(), tmp_path, url_side_effect=url_side_effect)
+    assert len(calls) == 2
+
+  def test_object_changed_mid_download(self, backup_client, tmp_path):
+    server = RangeServer()
+    original = server.__call__
+
+    def swap_etag_after_probe(request):
+      response = original(request)
+      server.etag = '"new"'
+      return response
+
+    with pytest.raises(BackupChangedError):
+      _download(
+        backup_client,
+        swap_etag_after_probe,
+        tmp_path,
+        segment_size=1024,
+      )
+    assert list(tmp_path.iterdir()) == []
+
+  def test_server_without_range_support(self, backup_client, tmp_path):
+    def no_ranges(request):
+      return httpx.Response(200, content=PAYLOAD)
+
+    result = _download(backup_client, no_ranges, tmp_path)
+    assert result.path.read_bytes() == PAYLOAD
+    assert result.segments == 1
+
+  def test_empty_backup(self, backup_client, tmp_path):
+    def empty(request):
+      return httpx.Response(416, headers={"Content-Range": "bytes */0"})
+
+    result = _download(backup_client, empty, tmp_path)
+    assert result.size_bytes == 0
+    assert result.path.read_bytes() == b""
+
+  def test_url_lookup_failure(self, backup_client, tmp_path):
+    not_found = Mock(status_code=404, parsed=None)
+    with pytest.raises(RuntimeError, match="Failed to get download URL"):
+      _download(
+        backup_client,
+        RangeServer(),
+        tmp_path,
+        url_side_effect=lambda **kw: not_found,
+      )
+
+  def test_s3_endpoint_override(self, mock_config):
+    mock_config["s3_endpoint_url"] = "http://localhost:4566"
+    client = BackupClient(mock_config)
+    with patch(
+      "robosystems_client.clients.backup_client.get_backup_download_url",
+      return_value=_url_response("https://bucket.s3.amazonaws.com/key?X-Amz=1"),
+    ):
+      info = client.get_download_url("kg_1", "bk_1")
+    assert info.download_url == "http://localhost:4566/key?X-Amz=1"
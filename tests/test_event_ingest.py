@@ -0,0 +1,186 @@
+"""Unit tests for LedgerClient.ingest_event_blocks and IngestCheckpoint."""
+
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from robosystems_client.client import AuthenticatedClient
+from robosystems_client.clients.event_ingest import IngestCheckpoint, event_key
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.models.operation_envelope import OperationEnvelope
+from robosystems_client.models.operation_envelope_status import OperationEnvelopeStatus
+
+
+def _event(memo: str, amount: int = 100) -> dict:
+  return {
+    "event_type": "bank_transaction_imported",
+    "event_category": "treasury",
+    "source": "plaid",
+    "occurred_at": "2026-03-31T00:00:00+00:00",
+    "metadata": {"memo": memo, "amount": amount},
+  }
+
+
+def _response(result: dict, status_code: int = HTTPStatus.OK) -> Mock:
+  resp = Mock()
+  resp.status_code = status_code
+  resp.parsed = OperationEnvelope(
+    operation="create-event-block",
+    operation_id="op_1",
+    status=OperationEnvelopeStatus.COMPLETED,
+    result=result,
+    at="2026-04-14T12:00:00Z",
+  )
+  resp.content = b""
+  return resp
+
+
+def _created(**kwargs) -> Mock:
+  memo = kwargs["body"].metadata.to_dict()["memo"]
+  return _response({"id": f"evt_{memo}", "status": "classified"})
+
+
+@pytest.mark.unit
+class TestIngestCheckpoint:
+  def test_records_survive_reopen_and_torn_lines(self, tmp_path):
+    path = tmp_path / "feed.checkpoint"
+    with IngestCheckpoint(path) as checkpoint:
+      checkpoint.record("k1", "evt_1")
+      checkpoint.record("k2", None)
+    with open(path, "a") as f:
+      f.write('{"key": "k3", "ev')  # crash mid-write
+
+    reopened = IngestCheckpoint(path)
+    assert len(reopened) == 2
+    assert "k1" in reopened and "k3" not in reopened
+    assert reopened.event_id("k1") == "evt_1"
+    reopened.close()
+
+  def test_event_key_ignores_dict_order(self):
+    a = _event("x")
+    b = dict(reversed(list(a.items())))
+    assert event_key(a) == event_key(b)
+    assert event_key(a) != event_key(_event("y"))
+
+
+@pytest.mark.unit
+class TestIngestEventBlocks:
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  def test_dedupes_and_resumes_from_checkpoint(
+    self, mock_op, mock_config, graph_id, tmp_path
+  ):
+    mock_op.side_effect = _created
+    client = LedgerClient(mock_config)
+    checkpoint = tmp_path / "feed.checkpoint"
+    events = [_event("a"), _event("b"), _event("a"), _event("c")]
+
+    first = client.ingest_event_blocks(
+      graph_id, iter(events[:2]), checkpoint=checkpoint, max_pending=1
+    )
+    assert [o.status for o in first.outcomes] == ["created", "created"]
+    assert first.created[0].result["id"] == "evt_a"
+
+    mock_op.reset_mock()
+    progress = []
+    second = client.ingest_event_blocks(
+      graph_id, events, checkpoint=checkpoint, on_progress=progress.append
+    )
+    assert [o.status for o in second.outcomes] == [
+      "checkpointed",
+      "checkpointed",
+      "duplicate",
+      "created",
+    ]
+    assert second.success
+    assert len(second.skipped) == 3
+    assert progress[-1] == 4
+    (call,) = mock_op.call_args_list
+    assert call.kwargs["idempotency_key"] == event_key(_event("c"))
+    with IngestCheckpoint(checkpoint) as reopened:
+      assert len(reopened) == 3
+
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  @patch("robosystems_client.clients.ledger_client.op_preview_event_block")
+  def test_preview_gates_creation(
+    self, mock_preview, mock_create, mock_config, graph_id
+  ):
+    def preview(**kwargs):
+      ok = kwargs["body"].metadata.to_dict()["amount"] > 0
+      errors = [] if ok else ["Amount must be positive"]
+      return _response({"would_succeed": ok, "validation_errors": errors})
+
+    mock_preview.side_effect = preview
+    mock_create.side_effect = _created
+    client = LedgerClient(mock_config)
+
+    result = client.ingest_event_blocks(
+      graph_id, [_event("good"), _event("bad", amount=-5)], preview=True
+    )
+
+    good, bad = result.outcomes
+    assert good.status == "created" and good.preview["would_succeed"] is True
+    assert bad.status == "rejected"
+    assert bad.error == "Amount must be positive"
+    assert result.rejected == [bad]
+    assert mock_create.call_count == 1
+
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  def test_failures_do_not_abort_or_checkpoint(
+    self, mock_op, mock_config, graph_id, tmp_path
+  ):
+    def create(**kwargs):
+      if kwargs["body"].metadata.to_dict()["memo"] == "conflict":
+        return _response({}, HTTPStatus.CONFLICT)
+      return _created(**kwargs)
+
+    mock_op.side_effect = create
+    client = LedgerClient(mock_config)
+    checkpoint = IngestCheckpoint(tmp_path / "feed.checkpoint")
+
+    result = client.ingest_event_blocks(
+      graph_id,
+      [_event("conflict"), _event("ok"), {"event_type": "missing fields"}],
+      checkpoint=checkpoint,
+    )
+
+    conflict, ok, invalid = result.outcomes
+    assert conflict.status == "failed" and "409" in conflict.error
+    assert ok.status == "created"
+    assert invalid.status == "failed" and "Invalid event block" in invalid.error
+    assert len(checkpoint) == 1
+    checkpoint.close()
+
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  def test_rotating_token_is_resolved_per_request(self, mock_op, mock_config, graph_id):
+    sent = []
+    current = {"token": "jwt-1"}
+    transport = httpx.MockTransport(
+      lambda request: sent.append(request.headers["X-API-Key"]) or httpx.Response(200)
+    )
+
+    def create(**kwargs):
+      kwargs["client"].get_httpx_client().post("/probe")
+      current["token"] = "jwt-2"  # rotates after the first request
+      return _created(**kwargs)
+
+    mock_op.side_effect = create
+    client = LedgerClient({**mock_config, "token_provider": lambda: current["token"]})
+    with patch.object(
+      LedgerClient,
+      "_get_client",
+      return_value=AuthenticatedClient(
+        base_url="http://api.test",
+        token="jwt-1",
+        prefix="",
+        auth_header_name="X-API-Key",
+        httpx_args={"transport": transport},
+      ),
+    ):
+      result = client.ingest_event_blocks(
+        graph_id, [_event("a"), _event("b")], concurrency=1
+      )
+
+    assert result.success
+    assert sent == ["jwt-1", "jwt-2"]
@@ -0,0 +1,149 @@
+"""Unit tests for FactGrid columnar conversion."""
+
+from unittest.mock import patch
+
+import pytest
+
+from robosystems_client.clients.fact_grid import FactGrid
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.models.view_response import ViewResponse
+
+pd = pytest.importorskip("pandas")
+
+
+def _fact(element: str, start, end, value, **extra) -> dict:
+  return {
+    "element_id": element,
+    "element_name": element.split(":")[-1],
+    "period_start": start,
+    "period_end": end,
+    "duration_type": "duration" if start else "instant",
+    "value": value,
+    "unit": "USD",
+    "entity_ticker": "NVDA",
+    "entity_name": "NVIDIA Corp",
+    **extra,
+  }
+
+
+_FACTS = [
+  _fact("us-gaap:Revenues", "2025-01-01", "2025-12-31", 1000),
+  _fact("us-gaap:Revenues", "2024-01-01", "2024-12-31", 800),
+  _fact("us-gaap:Assets", None, "2025-12-31", 5000),
+  _fact("us-gaap:Assets", None, "2024-12-31", None),
+]
+
+_RESPONSE = {
+  "metadata": {
+    "view_id": "view_1",
+    "facts_processed": 4,
+    "construction_time_ms": 12.5,
+    "source": "graph",
+  },
+  "facts": _FACTS,
+}
+
+
+@pytest.mark.unit
+class TestFactGrid:
+  def test_long_frame_from_typed_response(self):
+    grid = FactGrid(ViewResponse.from_dict(_RESPONSE))
+
+    df = grid.to_dataframe()
+
+    assert len(grid) == 4
+    assert grid.metadata.view_id == "view_1"
+    assert df.shape == (4, 9)
+    assert df["element_id"].dtype == "category"
+    assert set(df["element_id"].cat.categories) == {
+      "us-gaap:Revenues",
+      "us-gaap:Assets",
+    }
+    assert df["value"].dtype == "float64"
+    assert df["value"].isna().tolist() == [False, False, False, True]
+    assert df["period_start"].isna().tolist() == [False, False, True, True]
+
+  def test_dict_response_matches_typed(self):
+    typed = FactGrid(ViewResponse.from_dict(_RESPONSE)).to_dataframe()
+    plain = FactGrid(_RESPONSE).to_dataframe()
+    pd.testing.assert_frame_equal(typed, plain)
+
+  def test_pivot_by_element_and_period(self):
+    df = FactGrid(_RESPONSE).to_dataframe(pivot=True)
+
+    assert df.index.names == ["element_id", "entity_ticker", "entity_name", "unit"]
+    assert set(df.columns) == {
+      "2025-01-01/2025-12-31",
+      "2024-01-01/2024-12-31",
+      "2025-12-31",
+      "2024-12-31",
+    }
+    revenues = df.xs("us-gaap:Revenues", level="element_id").iloc[0]
+    assert revenues["2025-01-01/2025-12-31"] == 1000
+    assert pd.isna(revenues["2025-12-31"])
+    assets = df.xs("us-gaap:Assets", level="element_id").iloc[0]
+    assert assets["2025-12-31"] == 5000
+
+  def test_dimension_members_become_columns(self):
+    axis = "us-gaap:StatementBusinessSegmentsAxis"
+    facts = [
+      _fact(
+        "us-gaap:Revenues", "2025-01-01", "2025-12-31", 600, dimensions={axis: "a"}
+      ),
+      _fact(
+        "us-gaap:Revenues", "2025-01-01", "2025-12-31", 400, dimensions={axis: "b"}
+      ),
+      _fact("us-gaap:Revenues", "2025-01-01", "2025-12-31", 1000),
+    ]
+    grid = FactGrid(ViewResponse.from_dict({**_RESPONSE, "facts": facts}))
+
+    assert grid.dimension_names == [axis]
+    assert grid.to_dataframe()[axis].tolist()[:2] == ["a", "b"]
+    pivot = grid.to_dataframe(pivot=True)
+    assert axis in pivot.index.names
+    assert sorted(pivot["2025-01-01/2025-12-31"]) == [400, 600, 1000]
+
+  def test_pivot_combines_facts_in_the_same_cell(self):
+    facts = [
+      _FACTS[0],
+      {**_FACTS[0], "element_name": "Revenue", "value": None},
+      {**_FACTS[0], "element_name": "Revenue", "value": 1200},
+    ]
+    grid = FactGrid({**_RESPONSE, "facts": facts})
+
+    first = grid.to_dataframe(pivot=True)
+    assert first.shape == (1, 1)
+    assert first.iloc[0, 0] == 1000
+    assert grid.to_dataframe(pivot=True, aggfunc="max").iloc[0, 0] == 1200
+
+  def test_empty_response(self):
+    grid = FactGrid({**_RESPONSE, "facts": []})
+    assert len(grid) == 0
+    assert grid.to_dataframe().empty
+
+  def test_to_arrow_dictionary_encodes_strings(self):
+    pa = pytest.importorskip("pyarrow")
+    table = FactGrid(_RESPONSE).to_arrow()
+    assert table.num_rows == 4
+    assert pa.types.is_dictionary(table.schema.field("element_id").type)
+    assert table.schema.field("value").type == pa.float64()
+
+  def test_to_arrow_infers_extra_column_types(self):
+    pa = pytest.importorskip("pyarrow")
+    facts = [
+      _fact("us-gaap:Revenues", "2025-01-01", "2025-12-31", 1, segment="a", rank=1),
+      _fact("us-gaap:Revenues", "2024-01-01", "2024-12-31", 2, mixed=1),
+      _fact("us-gaap:Revenues", "2023-01-01", "2023-12-31", 3, mixed="x"),
+    ]
+    table = FactGrid({**_RESPONSE, "facts": facts}).to_arrow()
+    assert table.schema.field("segment").type == pa.string()
+    assert table.schema.field("rank").type == pa.int64()
+    assert table.column("mixed").to_pylist() == [None, "1", "x"]
+
+  def test_ledger_client_get_fact_grid(self, mock_config, graph_id):
+    with patch.object(LedgerClient, "build_fact_grid", return_value=_RESPONSE):
+      grid = LedgerClient(mock_config).get_fact_grid(
+        graph_id, {"elements": ["us-gaap:Revenues"]}
+      )
+    assert isinstance(grid, FactGrid)
+    assert grid.response is _RESPONSE
@@ -1,5 +1,8 @@
 """Unit tests for FileClient."""
 
+import threading
+
+import httpx
 import pytest
 from io import BytesIO
 from unittest.mock import Mock, patch
@@ -463,3 +466,254 @@ class TestFileDelete:
     assert result is True
     call_kwargs = mock_delete.call_args[1]
     assert call_kwargs["body"].cascade is True
+
+
+class StagingServer:
+  """Presign/ingest stand-ins plus an S3 MockTransport handler."""
+
+  def __init__(
+    self,
+    s3_failures: dict[str, int] | None = None,
+    ingest_failures: frozenset[str] = frozenset(),
+  ):
+    self.s3_failures = dict(s3_failures or {})
+    self.ingest_failures = ingest_failures
+    self.lock = threading.Lock()
+    self.presigned: list[str] = []
+    self.tokens: set[str] = set()
+    self.puts: list[str] = []
+    self.ingested: list[tuple[str, bool]] = []
+    self.in_flight = 0
+    self.max_in_flight = 0
+
+  def presign(self, graph_id, client, body):
+    with self.lock:
+      self.presigned.append(body.file_name)
+      self.tokens.add(client.token)
+    response = Mock(status_code=200)
+    response.parsed = Mock(
+      result={
+        "upload_url": f"http://s3.localhost/bucket/{body.file_name}",
+        "file_id": f"file-{body.file_name}",
+      }
+    )
+    return response
+
+  def ingest(self, graph_id, client, body):
+    with self.lock:
+      self.ingested.append((body.file_id, body.ingest_to_graph))
+    if body.file_id in self.ingest_failures:
+      return Mock(status_code=504, parsed=None)
+    response = Mock(status_code=200)
+    response.parsed = Mock(result={"file_size_bytes": 4, "row_count": 2})
+    return response
+
+  def s3(self, request: httpx.Request) -> httpx.Response:
+    name = request.url.path.rsplit("/", 1)[-1]
+    with self.lock:
+      self.puts.append(name)
+      self.in_flight += 1
+      self.max_in_flight = max(self.max_in_flight, self.in_flight)
+      failing = self.s3_failures.get(name, 0)
+      if failing:
+        self.s3_failures[name] = failing - 1
+    threading.Event().wait(0.01)
+    with self.lock:
+      self.in_flight -= 1
+    return httpx.Response(503 if failing else 200)
+
+
+@pytest.mark.unit
+class TestFileUploadMany:
+  """Test suite for FileClient.upload_many."""
+
+  @pytest.fixture
+  def paths(self, tmp_path):
+    paths = []
+    for i in range(6):
+      path = tmp_path / f"part-{i}.parquet"
+      path.write_bytes(b"data")
+      paths.append(path)
+    return paths
+
+  def _upload(self, mock_config, server, paths, **kwargs):
+    real_client = httpx.Client
+    transport = httpx.MockTransport(server.s3)
+    client = FileClient({**mock_config, "retry_delay": 0})
+    with (
+      patch(
+        "robosystems_client.clients.file_client.create_file_upload",
+        side_effect=server.presign,
+      ),
+      patch(
+        "robosystems_client.clients.file_client.ingest_file",
+        side_effect=server.ingest,
+      ),
+      patch(
+        "robosystems_client.clients.file_client.httpx.Client",
+        side_effect=lambda **kw: real_client(transport=transport),
+      ),
+      patch(
+        "robosystems_client.clients.graph_client.GraphClient.materialize",
+        return_value=Mock(success=True),
+      ) as materialize,
+    ):
+      result = client.upload_many("graph-1", "Fact", paths, **kwargs)
+    return result, materialize
+
+  def test_parallel_upload_then_single_materialize(self, mock_config, paths):
+    server = StagingServer()
+    messages = []
+    result, materialize = self._upload(
+      mock_config, server, paths, concurrency=3, on_progress=messages.append
+    )
+
+    assert result.success is True
+    assert [f.file_name for f in result.files] == [p.name for p in paths]
+    assert all(f.row_count == 2 for f in result.files)
+    assert result.bytes_uploaded == 24
+    assert 1 < server.max_in_flight <= 3
+    # Every file is ingested into staging only; the graph is built once.
+    assert sorted(server.ingested) == sorted((f"file-{p.name}", False) for p in paths)
+    materialize.assert_called_once_with("graph-1", None)
+    assert messages[0].startswith("Uploaded 1/6 files")
+    assert "MB/s" in messages[0]
+
+  def test_failed_put_is_retried(self, mock_config, paths):
+    server = StagingServer(s3_failures={"part-2.parquet": 2})
+    result, materialize = self._upload(mock_config, server, paths)
+
+    assert result.success is True
+    assert server.puts.count("part-2.parquet") == 3
+    # Retries reuse the presigned URL instead of creating new file records
+    assert server.presigned.count("part-2.parquet") == 1
+    materialize.assert_called_once()
+
+  def test_failed_ingest_is_not_retried(self, mock_config, paths):
+    server = StagingServer(ingest_failures=frozenset({"file-part-1.parquet"}))
+    result, materialize = self._upload(mock_config, server, paths)
+
+    assert [f.file_name for f in result.failed] == ["part-1.parquet"]
+    assert server.ingested.count(("file-part-1.parquet", False)) == 1
+    materialize.assert_not_called()
+
+  def test_token_provider_is_used(self, mock_config, paths):
+    server = StagingServer()
+    result, _ = self._upload(
+      {**mock_config, "token": None, "token_provider": lambda: "jwt-1"},
+      server,
+      paths,
+    )
+    assert result.success is True
+    assert server.tokens == {"jwt-1"}
+
+  def test_persistent_failure_skips_materialize(self, mock_config, paths):
+    server = StagingServer(s3_failures={"part-4.parquet": 10})
+    result, materialize = self._upload(mock_config, server, paths)
+
+    assert result.success is False
+    assert [f.file_name for f in result.failed] == ["part-4.parquet"]
+    assert result.failed[0].error == "S3 upload failed: 503"
+    assert ("file-part-4.parquet", False) not in server.ingested
+    assert len(server.ingested) == 5
+    materialize.assert_not_called()
+
+  def test_materialize_disabled(self, mock_config, paths):
+    result, materialize = self._upload(
+      mock_config, StagingServer(), paths, materialize=False
+    )
+    assert result.success is True
+    assert result.materialization is None
+    materialize.assert_not_called()
+
+  def test_no_token(self, mock_config, paths):
+    mock_config["token"] = None
+    result = FileClient(mock_config).upload_many("graph-1", "Fact", paths)
+    assert len(result.failed) == 6
+    assert "No API key" in result.failed[0].error
+
+
+@pytest.mark.unit
+class TestFileUploadStreaming:
+  """Test suite for streamed and DataFrame uploads."""
+
+  def _client(self, mock_config):
+    client = FileClient(mock_config)
+    client._http_client = Mock()
+    client._http_client.put.return_value = Mock(status_code=200)
+    return client
+
+  def _mock_api(self, mock_create, mock_update):
+    mock_create.side_effect = lambda graph_id, client, body: Mock(
+      status_code=200,
+      parsed=Mock(
+        result={
+          "upload_url": f"http://s3.localhost/bucket/{body.file_name}",
+          "file_id": f"file-{body.file_name}",
+        }
+      ),
+    )
+    mock_update.return_value = Mock(status_code=200, parsed=Mock(result={}))
+
+  @patch("robosystems_client.clients.file_client.ingest_file")
+  @patch("robosystems_client.clients.file_client.create_file_upload")
+  def test_path_is_streamed_with_length(
+    self, mock_create, mock_update, mock_config, graph_id, tmp_path
+  ):
+    self._mock_api(mock_create, mock_update)
+    path = tmp_path / "entities.parquet"
+    path.write_bytes(b"x" * 3_000_000)
+    client = self._client(mock_config)
+
+    result = client.upload(graph_id, "Entity", path)
+
+    assert result.success is True
+    assert result.file_name == "entities.parquet"
+    kwargs = client._http_client.put.call_args.kwargs
+    assert kwargs["headers"]["Content-Length"] == "3000000"
+    assert not isinstance(kwargs["content"], bytes)
+    assert b"".join(kwargs["content"]) == path.read_bytes()
+
+  @patch("robosystems_client.clients.file_client.ingest_file")
+  @patch("robosystems_client.clients.file_client.create_file_upload")
+  def test_file_name_override(self, mock_create, mock_update, mock_config, graph_id):
+    self._mock_api(mock_create, mock_update)
+    result = self._client(mock_config).upload(
+      graph_id, "Entity", BytesIO(b"data"), file_name="entity-0001.parquet"
+    )
+    assert result.file_name == "entity-0001.parquet"
+    assert mock_create.call_args.kwargs["body"].file_name == "entity-0001.parquet"
+
+  def test_upload_dataframe_requires_pyarrow(self, mock_config, graph_id):
+    with patch("robosystems_client.clients.file_client.HAS_PYARROW", False):
+      with pytest.raises(ImportError, match="pip install pyarrow"):
+        FileClient(mock_config).upload_dataframe(graph_id, "Entity", object())
+
+  @patch("robosystems_client.clients.file_client.ingest_file")
+  @patch("robosystems_client.clients.file_client.create_file_upload")
+  def test_upload_dataframe_splits_into_files(
+    self, mock_create, mock_update, mock_config, graph_id
+  ):
+    pd = pytest.importorskip("pandas")
+    pq = pytest.importorskip("pyarrow.parquet")
+    self._mock_api(mock_create, mock_update)
+    client = self._client(mock_config)
+    bodies = []
+    client._http_client.put.side_effect = lambda url, content, headers: (
+      bodies.append(b"".join(content)) or Mock(status_code=200)
+    )
+    df = pd.DataFrame({"id": range(25), "name": [f"e{i}" for i in range(25)]})
+
+    results = client.upload_dataframe(
+      graph_id, "Entity", df, row_group_size=4, rows_per_file=10
+    )
+
+    assert [r.file_name for r in results] == [
+      "Entity-00000.parquet",
+      "Entity-00001.parquet",
+      "Entity-00002.parquet",
+    ]
+    files = [pq.ParquetFile(BytesIO(body)) for body in bodies]
+    assert [f.metadata.num_rows for f in files] == [10, 10, 5]
+    assert files[0].metadata.num_row_groups == 3
+    assert files[2].read().column("id").to_pylist() == list(range(20, 25))
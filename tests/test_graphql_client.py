@@ -0,0 +1,189 @@
+"""Unit tests for GraphQLClient / AsyncGraphQLClient persisted queries."""
+
+import hashlib
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.graphql.client import (
+  AsyncGraphQLClient,
+  GraphQLClient,
+  document_hash,
+)
+from robosystems_client.graphql.generated.operations import GET_LEDGER_SUMMARY_GQL
+
+QUERY = "query Summary { summary { accountCount } }"
+HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+class APQServer:
+  """MockTransport handler implementing the APQ protocol."""
+
+  def __init__(self, known: set[str] | None = None, data=None):
+    self.known = known if known is not None else set()
+    self.data = data if data is not None else {"summary": {"accountCount": 3}}
+    self.requests: list[httpx.Request] = []
+
+  def __call__(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request)
+    if request.method == "GET":
+      body = {
+        k: v if k in ("query", "operationName") else json.loads(v)
+        for k, v in request.url.params.items()
+      }
+    else:
+      body = json.loads(request.content)
+    digest = body.get("extensions", {}).get("persistedQuery", {}).get("sha256Hash")
+    if "query" in body:
+      if digest:
+        self.known.add(digest)
+    elif digest not in self.known:
+      return httpx.Response(
+        200,
+        json={
+          "errors": [
+            {
+              "message": "PersistedQueryNotFound",
+              "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+          ]
+        },
+      )
+    return httpx.Response(200, json={"data": self.data})
+
+
+def _sync_execute(server, **kwargs):
+  transport = httpx.MockTransport(server)
+  real_client = httpx.Client
+  with patch(
+    "robosystems_client.graphql.client.httpx.Client",
+    side_effect=lambda **kw: real_client(transport=transport),
+  ):
+    client = GraphQLClient("http://api.test", token="rfs_key", **kwargs)
+    return client.execute("kg_1", QUERY, {"limit": 5})
+
+
+@pytest.mark.unit
+class TestPersistedQueries:
+  def test_document_hash(self):
+    assert document_hash(QUERY) == HASH
+
+  def test_disabled_by_default(self):
+    server = APQServer()
+    _sync_execute(server)
+
+    body = json.loads(server.requests[0].content)
+    assert body == {"query": QUERY, "variables": {"limit": 5}}
+    assert len(server.requests) == 1
+
+  def test_known_hash_sends_no_document(self):
+    server = APQServer(known={HASH})
+    data = _sync_execute(server, persisted_queries=True)
+
+    assert data == {"summary": {"accountCount": 3}}
+    assert len(server.requests) == 1
+    body = json.loads(server.requests[0].content)
+    assert "query" not in body
+    assert body["extensions"]["persistedQuery"] == {"version": 1, "sha256Hash": HASH}
+
+  def test_miss_falls_back_to_full_document(self):
+    server = APQServer()
+    first = _sync_execute(server, persisted_queries=True)
+    second = _sync_execute(server, persisted_queries=True)
+
+    assert first == second == {"summary": {"accountCount": 3}}
+    # Miss, register, then a hash-only hit.
+    bodies = [json.loads(r.content) for r in server.requests]
+    assert ["query" in b for b in bodies] == [False, True, False]
+
+  def test_successful_read_is_decoded_once(self):
+    server = APQServer(known={HASH})
+    real_json = httpx.Response.json
+    with patch.object(
+      httpx.Response, "json", autospec=True, side_effect=real_json
+    ) as decode:
+      _sync_execute(server, persisted_queries=True)
+    assert decode.call_count == 1
+
+  def test_not_supported_is_remembered(self):
+    not_supported = {
+      "errors": [
+        {
+          "message": "PersistedQueryNotSupported",
+          "extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        }
+      ]
+    }
+    requests = []
+
+    def server(request):
+      requests.append(json.loads(request.content))
+      if "extensions" in requests[-1]:
+        return httpx.Response(200, json=not_supported)
+      return httpx.Response(200, json={"data": {"summary": None}})
+
+    transport = httpx.MockTransport(server)
+    real_client = httpx.Client
+    with patch(
+      "robosystems_client.graphql.client.httpx.Client",
+      side_effect=lambda **kw: real_client(transport=transport),
+    ):
+      for _ in range(2):  # a fresh client per read, as the facades do
+        client = GraphQLClient("http://no-apq.test", persisted_queries=True)
+        assert client.execute("kg_1", QUERY) == {"summary": None}
+
+    # Hash-only, then plain POSTs only
+    assert ["extensions" in body for body in requests] == [True, False, False]
+    assert all("query" in body for body in requests[1:])
+
+  def test_get_for_reads(self):
+    server = APQServer(known={HASH})
+    _sync_execute(server, persisted_queries=True, use_get=True)
+
+    request = server.requests[0]
+    assert request.method == "GET"
+    assert json.loads(request.url.params["variables"]) == {"limit": 5}
+    assert "query" not in request.url.params
+
+  def test_get_miss_registers_with_post(self):
+    server = APQServer()
+    _sync_execute(server, persisted_queries=True, use_get=True)
+    assert [r.method for r in server.requests] == ["GET", "POST"]
+
+  def test_mutations_never_use_get(self):
+    client = GraphQLClient("http://api.test", persisted_queries=True, use_get=True)
+    kwargs = client._request_kwargs("mutation M { m }", None, None, send_document=False)
+    assert kwargs["method"] == "POST"
+
+  @pytest.mark.asyncio
+  async def test_async_fallback(self):
+    server = APQServer()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as http:
+      client = AsyncGraphQLClient(
+        "http://api.test",
+        token="rfs_key",
+        persisted_queries=True,
+        use_get=True,
+        http_client=http,
+      )
+      await client.execute("kg_1", QUERY)
+      await client.execute("kg_1", QUERY)
+    assert [r.method for r in server.requests] == ["GET", "POST", "GET"]
+
+  def test_facade_config_enables_apq(self, mock_config, graph_id):
+    mock_config["graphql_persisted_queries"] = True
+    server = APQServer(
+      known={document_hash(GET_LEDGER_SUMMARY_GQL)}, data={"summary": None}
+    )
+    transport = httpx.MockTransport(server)
+    real_client = httpx.Client
+    with patch(
+      "robosystems_client.graphql.client.httpx.Client",
+      side_effect=lambda **kw: real_client(transport=transport),
+    ):
+      assert LedgerClient(mock_config).get_summary(graph_id) is None
+
+    assert "query" not in json.loads(server.requests[0].content)
@@ -0,0 +1,116 @@
+"""Unit tests for the trusted-server model views."""
+
+from unittest.mock import patch
+
+import pytest
+
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.graphql.generated.get_ledger_account_tree import (
+  GetLedgerAccountTree,
+)
+from robosystems_client.graphql.generated.list_ledger_transactions import (
+  ListLedgerTransactions,
+)
+from robosystems_client.graphql.views import ModelView, model_view, parse_model
+
+
+def _node(code: str, children: list) -> dict:
+  return {
+    "id": f"acc_{code}",
+    "code": code,
+    "name": f"Account {code}",
+    "trait": "asset",
+    "accountType": None,
+    "balanceType": "debit",
+    "depth": 0,
+    "isActive": True,
+    "children": children,
+  }
+
+
+TREE = {
+  "accountTree": {
+    "totalAccounts": 2,
+    "roots": [_node("1000", [_node("1100", [])])],
+  }
+}
+
+TRANSACTIONS = {
+  "transactions": {
+    "transactions": [
+      {
+        "id": "txn_1",
+        "number": None,
+        "type": "journal_entry",
+        "category": None,
+        "amount": 12.5,
+        "currency": "USD",
+        "date": "2026-01-15",
+        "dueDate": None,
+        "merchantName": "Acme",
+        "referenceNumber": None,
+        "description": None,
+        "source": "manual",
+        "status": "posted",
+      }
+    ],
+    "pagination": {"total": 1, "limit": 100, "offset": 0, "hasMore": False},
+  }
+}
+
+
+@pytest.mark.unit
+class TestModelView:
+  def test_fields_match_validated_model(self):
+    view = model_view(ListLedgerTransactions, TRANSACTIONS)
+    model = ListLedgerTransactions.model_validate(TRANSACTIONS)
+
+    row, expected = (
+      view.transactions.transactions[0],
+      model.transactions.transactions[0],
+    )
+    for name in type(expected).model_fields:
+      assert getattr(row, name) == getattr(expected, name)
+    assert view.transactions.pagination.has_more is False
+
+  def test_nested_and_recursive_models_are_views(self):
+    view = model_view(GetLedgerAccountTree, TREE)
+    root = view.account_tree.roots[0]
+
+    assert isinstance(root, ModelView)
+    assert root.is_active is True
+    assert root.children[0].code == "1100"
+    assert root.children[0].children == []
+
+  def test_null_nested_object(self):
+    assert model_view(GetLedgerAccountTree, {"accountTree": None}).account_tree is None
+
+  def test_to_model_and_dump(self):
+    view = model_view(GetLedgerAccountTree, TREE)
+    model = GetLedgerAccountTree.model_validate(TREE)
+    assert view.to_model() == model
+    assert view.model_dump() == model.model_dump()
+
+  def test_read_only_and_equality(self):
+    view = model_view(GetLedgerAccountTree, TREE)
+    with pytest.raises(AttributeError, match="read-only"):
+      view.account_tree = None
+    assert view == model_view(GetLedgerAccountTree, TREE)
+    assert view != model_view(GetLedgerAccountTree, {"accountTree": None})
+
+  def test_parse_model(self):
+    assert isinstance(
+      parse_model(GetLedgerAccountTree, TREE, trusted=False), GetLedgerAccountTree
+    )
+    assert isinstance(parse_model(GetLedgerAccountTree, TREE, trusted=True), ModelView)
+
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_facade_trusted_server_option(self, mock_execute, mock_config, graph_id):
+    mock_execute.return_value = TREE
+    mock_config["graphql_trusted_server"] = True
+
+    result = LedgerClient(mock_config).get_account_tree(graph_id)
+
+    assert isinstance(result, ModelView)
+    assert result.total_accounts == 2
+    assert result.roots[0].children[0].code == "1100"
@@ -12,12 +12,14 @@ These tests mock at the function-import boundary: GraphQL reads patch
 
 from __future__ import annotations
 
+import hashlib
 from http import HTTPStatus
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
 
-from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.clients.ledger_client import LedgerClient, ReportBundleDownload
 from robosystems_client.models.operation_envelope import OperationEnvelope
 from robosystems_client.models.operation_envelope_status import OperationEnvelopeStatus
 from robosystems_client.types import UNSET
@@ -632,6 +634,102 @@ class TestJournalEntries:
     assert metadata["posting_date"] == "2026-04-01"
 
 
+@pytest.mark.unit
+class TestBulkJournalEntries:
+  _LINE_ITEMS = TestJournalEntries._LINE_ITEMS
+
+  def _entries(self, memos):
+    return [
+      {"posting_date": "2025-12-31", "memo": memo, "line_items": self._LINE_ITEMS}
+      for memo in memos
+    ]
+
+  @staticmethod
+  def _ok():
+    return _mock_response(
+      _envelope("create-event-block", {"id": "evt_1", "status": "classified"})
+    )
+
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  def test_outcomes_in_order_with_stable_keys(self, mock_op, mock_config, graph_id):
+    mock_op.side_effect = lambda **kwargs: self._ok()
+    client = LedgerClient(mock_config)
+    entries = self._entries(["a", "b", "a", "c", "d"])
+    entries[3]["idempotency_key"] = "caller-key"
+    progress = []
+
+    result = client.create_journal_entries(
+      graph_id, iter(entries), concurrency=3, chunk=2, on_progress=progress.append
+    )
+
+    assert result.success
+    assert [o.index for o in result.outcomes] == [0, 1, 2, 3, 4]
+    assert progress == [2, 4, 5]
+    keys = [o.idempotency_key for o in result.outcomes]
+    assert keys[3] == "caller-key"
+    # Identical entries still get distinct keys
+    assert len(set(keys)) == 5
+    sent = {call.kwargs["idempotency_key"] for call in mock_op.call_args_list}
+    assert sent == set(keys)
+    assert all(
+      call.kwargs["body"].event_type == "journal_entry_recorded"
+      for call in mock_op.call_args_list
+    )
+
+    rerun = client.create_journal_entries(graph_id, entries[::-1])
+    assert sorted(o.idempotency_key for o in rerun.outcomes) == sorted(keys)
+
+  @patch("robosystems_client.clients.ledger_client.time.sleep")
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  def test_retries_rate_limits_and_transient_errors(
+    self, mock_op, mock_sleep, mock_config, graph_id
+  ):
+    throttled = _mock_response(None, HTTPStatus.TOO_MANY_REQUESTS)
+    throttled.headers = {"retry-after": "2"}
+    unavailable = _mock_response(None, HTTPStatus.SERVICE_UNAVAILABLE)
+    responses = {
+      "throttled": [throttled, self._ok()],
+      "flaky": [httpx.ConnectError("reset"), unavailable, self._ok()],
+      "invalid": [_mock_response(None, HTTPStatus.UNPROCESSABLE_ENTITY)],
+    }
+    mock_op.side_effect = lambda **kwargs: _next(
+      responses[kwargs["body"].metadata.to_dict()["memo"]]
+    )
+    client = LedgerClient(mock_config)
+
+    result = client.create_journal_entries(
+      graph_id, self._entries(["throttled", "flaky", "invalid"]), concurrency=1
+    )
+
+    throttled_outcome, flaky, invalid = result.outcomes
+    assert throttled_outcome.success and throttled_outcome.attempts == 2
+    assert flaky.success and flaky.attempts == 3
+    assert not invalid.success and invalid.attempts == 1
+    assert "422" in invalid.error
+    assert result.failed == [invalid]
+    assert 2.0 in [call.args[0] for call in mock_sleep.call_args_list]
+
+  @patch("robosystems_client.clients.ledger_client.time.sleep")
+  @patch("robosystems_client.clients.ledger_client.op_create_event_block")
+  def test_gives_up_after_max_retries(self, mock_op, mock_sleep, mock_config, graph_id):
+    mock_op.return_value = _mock_response(None, HTTPStatus.BAD_GATEWAY)
+    client = LedgerClient(mock_config)
+    result = client.create_journal_entries(
+      graph_id, self._entries(["x"]), max_retries=2, retry_delay=0.5
+    )
+    (outcome,) = result.outcomes
+    assert not outcome.success
+    assert outcome.attempts == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+def _next(queue):
+  item = queue.pop(0)
+  if isinstance(item, Exception):
+    raise item
+  return item
+
+
 # ── Taxonomy / entity linking ───────────────────────────────────────────
 
 
@@ -2010,6 +2108,13 @@ class TestDownloadReportBundle:
     mock_client.__enter__ = Mock(return_value=mock_client)
     mock_client.__exit__ = Mock(return_value=None)
     mock_client.get.return_value = artifact
+    # Streaming path (``to=``): the body arrives in chunks.
+    artifact.iter_bytes = Mock(
+      side_effect=lambda: iter([artifact.content[:4], artifact.content[4:]])
+    )
+    stream_ctx = MagicMock()
+    stream_ctx.__enter__.return_value = artifact
+    mock_client.stream.return_value = stream_ctx
     mock_client_cls.return_value = mock_client
     return mock_client
 
@@ -2069,7 +2174,9 @@ class TestDownloadReportBundle:
   ):
     """``to=path`` writes the artifact and exposes ``result.path``."""
     zip_bytes = b"PK\x03\x04zip"
-    self._patch_httpx(mock_client_cls, self._mock_artifact(zip_bytes, "rpt_01-g1.zip"))
+    mock_client = self._patch_httpx(
+      mock_client_cls, self._mock_artifact(zip_bytes, "rpt_01-g1.zip")
+    )
     target = tmp_path / "subdir" / "out.zip"
     with patch.object(
       LedgerClient,
@@ -2084,6 +2191,48 @@ class TestDownloadReportBundle:
     assert target.read_bytes() == zip_bytes
     # Parent directories get created automatically.
     assert target.parent.is_dir()
+    # Streamed, not buffered: no bytes on the result, digest instead.
+    assert result.content is None
+    assert result.sha256 == hashlib.sha256(zip_bytes).hexdigest()
+    mock_client.get.assert_not_called()
+    # Only the target remains — the temp file was renamed into place.
+    assert list(target.parent.iterdir()) == [target]
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_to_arg_checksum_mismatch_leaves_no_file(
+    self, mock_client_cls, mock_config, graph_id, tmp_path
+  ):
+    self._patch_httpx(mock_client_cls, self._mock_artifact(b"PK\x03\x04zip", "x.zip"))
+    target = tmp_path / "out.zip"
+    with patch.object(
+      LedgerClient,
+      "_query",
+      return_value=self._gql_data("application/zip", "xbrl-2.1"),
+    ):
+      with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        LedgerClient(mock_config).download_report_bundle(
+          graph_id, "rpt_01", to=target, expected_sha256="0" * 64
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_to_arg_stream_non_200_raises(
+    self, mock_client_cls, mock_config, graph_id, tmp_path
+  ):
+    err_resp = Mock(status_code=403, text="expired", content=b"")
+    err_resp.headers = {}
+    self._patch_httpx(mock_client_cls, err_resp)
+    with patch.object(
+      LedgerClient,
+      "_query",
+      return_value=self._gql_data("application/ld+json", "jsonld"),
+    ):
+      with pytest.raises(RuntimeError, match="Failed to follow presigned URL"):
+        LedgerClient(mock_config).download_report_bundle(
+          graph_id, "rpt_01", to=tmp_path / "out.jsonld"
+        )
+    assert list(tmp_path.iterdir()) == []
 
   @patch("robosystems_client.clients.ledger_client.httpx.Client")
   def test_presigned_url_non_200_raises(self, mock_client_cls, mock_config, graph_id):
@@ -2112,6 +2261,66 @@ class TestDownloadReportBundle:
       LedgerClient(mock_config).download_report_bundle(graph_id, "rpt_01")
 
 
+@pytest.mark.unit
+class TestDownloadReportBundles:
+  """Bulk ``download_report_bundles`` — one resolve + fetch per report on
+  a shared httpx client; failures are returned per report."""
+
+  def _gql_data(self, report_id: str) -> dict:
+    return {
+      "reportDownloadUrl": {
+        "downloadUrl": f"https://s3.example.com/bundles/{report_id}",
+        "expiresAt": "2026-05-28T12:30:00Z",
+        "contentType": "application/ld+json",
+        "format": "jsonld",
+        "generationCount": 1,
+      }
+    }
+
+  def _query(self, graph_id, query, variables):
+    report_id = variables["reportId"]
+    if report_id == "rpt_missing":
+      return {"reportDownloadUrl": None}
+    return self._gql_data(report_id)
+
+  def _stream(self, method, url):
+    report_id = url.rsplit("/", 1)[1]
+    artifact = Mock(status_code=200)
+    artifact.headers = {
+      # A hostile filename must not escape to_dir.
+      "content-disposition": f'attachment; filename="../{report_id}.jsonld"'
+    }
+    artifact.iter_bytes = Mock(return_value=iter([report_id.encode()]))
+    ctx = MagicMock()
+    ctx.__enter__.return_value = artifact
+    return ctx
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_bulk_download_to_dir(self, mock_client_cls, mock_config, graph_id, tmp_path):
+    mock_client = MagicMock()
+    mock_client.__enter__.return_value = mock_client
+    mock_client.stream.side_effect = self._stream
+    mock_client_cls.return_value = mock_client
+
+    with patch.object(LedgerClient, "_query", side_effect=self._query):
+      results = LedgerClient(mock_config).download_report_bundles(
+        graph_id,
+        ["rpt_a", "rpt_missing", "rpt_b"],
+        to_dir=tmp_path / "export",
+        concurrency=2,
+      )
+
+    assert list(results) == ["rpt_a", "rpt_missing", "rpt_b"]
+    assert isinstance(results["rpt_missing"], RuntimeError)
+    for report_id in ("rpt_a", "rpt_b"):
+      result = results[report_id]
+      assert isinstance(result, ReportBundleDownload)
+      assert result.path == tmp_path / "export" / f"{report_id}.jsonld"
+      assert result.path.read_bytes() == report_id.encode()
+    # One shared connection pool for the whole batch.
+    assert mock_client_cls.call_count == 1
+
+
 def test_parse_filename_quoted():
   from robosystems_client.clients.ledger_client import _parse_filename
 
@@ -0,0 +1,185 @@
+"""Unit tests for LibraryIndex and LibraryClient.get_library_index."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from robosystems_client.clients.library_client import LibraryClient
+from robosystems_client.clients.library_index import LibraryIndex
+from robosystems_client.graphql.generated.list_library_elements import (
+  ListLibraryElementsLibraryElements,
+)
+from robosystems_client.graphql.views import model_view
+
+
+def _payload(id: str, name: str, label: str, **overrides) -> dict:
+  payload = {
+    "id": id,
+    "qname": f"rs-gaap:{name}",
+    "namespace": "https://taxonomy.robosystems.ai/rs-gaap",
+    "name": name,
+    "trait": "asset",
+    "balanceType": "debit",
+    "periodType": "instant",
+    "isAbstract": False,
+    "isMonetary": True,
+    "elementType": "monetaryItemType",
+    "source": "rs-gaap",
+    "taxonomyId": "tax_rsgaap",
+    "parentId": None,
+    "labels": [{"role": "label", "language": "en", "text": label}],
+    "references": [],
+  }
+  payload.update(overrides)
+  return payload
+
+
+PAYLOADS = [
+  _payload("el_1", "Cash", "Cash"),
+  _payload("el_2", "CashAndCashEquivalents", "Cash and Cash Equivalents"),
+  _payload("el_3", "AccountsReceivable", "Trade Receivables"),
+  _payload(
+    "el_4",
+    "Revenue",
+    "Sales Revenue",
+    trait="revenue",
+    balanceType="credit",
+    periodType="duration",
+  ),
+  _payload("el_5", "AssetsAbstract", "Assets", isAbstract=True),
+]
+
+
+def _taxonomy(version: str = "2026", element_count: int = len(PAYLOADS)) -> dict:
+  return {
+    "id": "tax_rsgaap",
+    "name": "RoboSystems GAAP",
+    "description": None,
+    "standard": "rs-gaap",
+    "version": version,
+    "namespaceUri": "https://taxonomy.robosystems.ai/rs-gaap",
+    "taxonomyType": "reporting",
+    "isShared": True,
+    "isActive": True,
+    "isLocked": True,
+    "elementCount": element_count,
+  }
+
+
+@pytest.fixture
+def index(tmp_path):
+  taxonomy = SimpleNamespace(id="tax_rsgaap", version="2026", element_count=5)
+  elements = [ListLibraryElementsLibraryElements.model_validate(p) for p in PAYLOADS]
+  with LibraryIndex.build(tmp_path / "tax.sqlite", taxonomy, elements) as index:
+    yield index
+
+
+@pytest.mark.unit
+class TestLibraryIndex:
+  def test_metadata(self, index):
+    assert len(index) == 5
+    assert index.taxonomy_id == "tax_rsgaap"
+    assert index.version == "2026"
+
+  def test_search_matches_label_substring(self, index):
+    results = index.search("receivab")
+    assert [e.id for e in results] == ["el_3"]
+    assert results[0].labels[0].text == "Trade Receivables"
+
+  def test_search_ranks_exact_then_prefix(self, index):
+    results = index.search("cash")
+    assert [e.name for e in results] == ["Cash", "CashAndCashEquivalents"]
+
+  def test_short_query_uses_prefix(self, index):
+    assert [e.id for e in index.search("Re")] == ["el_4"]
+    assert index.search("  ") == []
+
+  def test_short_query_is_an_index_range(self, index):
+    sql = (
+      "EXPLAIN QUERY PLAN SELECT data FROM elements e "
+      "WHERE (e.qname_lower >= ? AND e.qname_lower < ?) "
+      "OR (e.name_lower >= ? AND e.name_lower < ?)"
+    )
+    plan = " ".join(row[-1] for row in index._conn.execute(sql, ["re", "rf"] * 2))
+    assert "elements_qname_lower" in plan
+    assert "elements_name_lower" in plan
+    assert len(index.search("RS")) == len(PAYLOADS)
+
+  def test_trusted_views_without_is_abstract(self, tmp_path):
+    taxonomy = SimpleNamespace(id="tax_rsgaap", version="2026", element_count=1)
+    payload = _payload("el_1", "Cash", "Cash", isAbstract=None)
+    element = model_view(ListLibraryElementsLibraryElements, payload)
+    with LibraryIndex.build(tmp_path / "tax.sqlite", taxonomy, [element]) as index:
+      assert [e.id for e in index.search("cash", is_abstract=False)] == ["el_1"]
+
+  def test_search_filters_and_limit(self, index):
+    assert [e.id for e in index.search("ass", is_abstract=True)] == ["el_5"]
+    assert [e.id for e in index.search("rev", trait="revenue")] == ["el_4"]
+    assert len(index.search("cash", limit=1)) == 1
+    with pytest.raises(TypeError):
+      index.search("cash", classification="asset")
+
+  def test_elements_and_get(self, index):
+    credit = list(index.elements(balance_type="credit"))
+    assert [e.qname for e in credit] == ["rs-gaap:Revenue"]
+    assert index.get(id="el_2").name == "CashAndCashEquivalents"
+    assert index.get(qname="rs-gaap:Cash").id == "el_1"
+    assert index.get(id="el_nope") is None
+    with pytest.raises(ValueError):
+      index.get()
+
+  def test_is_current(self, index):
+    same = SimpleNamespace(id="tax_rsgaap", version="2026", element_count=5)
+    newer = SimpleNamespace(id="tax_rsgaap", version="2027", element_count=5)
+    assert index.is_current(same)
+    assert not index.is_current(newer)
+
+
+@pytest.mark.unit
+class TestGetLibraryIndex:
+  @staticmethod
+  def _responder(version: str):
+    def execute(graph_id, query, variables, **kwargs):
+      if "libraryTaxonomy" in query:
+        return {"libraryTaxonomy": _taxonomy(version)}
+      offset, limit = variables["offset"], variables["limit"]
+      return {"libraryElements": PAYLOADS[offset : offset + limit]}
+
+    return execute
+
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_builds_once_and_rebuilds_on_new_version(
+    self, mock_execute, mock_config, tmp_path
+  ):
+    mock_config["library_index_dir"] = str(tmp_path)
+    client = LibraryClient(mock_config)
+    mock_execute.side_effect = self._responder("2026")
+
+    with client.get_library_index("tax_rsgaap", page_size=2) as index:
+      assert len(index) == 5
+      assert index.search("cash")[0].id == "el_1"
+    # One taxonomy read plus pages of 2, 2, 1 and an empty page
+    assert mock_execute.call_count == 5
+    assert (tmp_path / "library" / "tax_rsgaap.sqlite").exists()
+
+    mock_execute.reset_mock()
+    with client.get_library_index("tax_rsgaap") as index:
+      assert index.version == "2026"
+    assert mock_execute.call_count == 1
+
+    mock_execute.reset_mock()
+    mock_execute.side_effect = self._responder("2027")
+    with client.get_library_index("tax_rsgaap") as index:
+      assert index.version == "2027"
+    assert mock_execute.call_count == 3
+
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_missing_taxonomy_raises(self, mock_execute, mock_config, tmp_path):
+    mock_config["library_index_dir"] = str(tmp_path)
+    mock_execute.return_value = {"libraryTaxonomy": None}
+    client = LibraryClient(mock_config)
+    with pytest.raises(RuntimeError, match="not found"):
+      client.get_library_index("tax_nope")
@@ -0,0 +1,84 @@
+"""Unit tests for NDJSON decoding."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from robosystems_client.clients.ndjson import decode_ndjson, loads, split_lines
+from robosystems_client.clients.query_client import QueryClient
+
+
+def _payload(lines: int) -> bytes:
+  return b"".join(
+    json.dumps({"rows": [[i, f"Entity {i}"]]}).encode() + b"\n" for i in range(lines)
+  )
+
+
+@pytest.mark.unit
+class TestNdjsonDecode:
+  def test_split_lines_ends_on_newlines(self):
+    payload = _payload(50)
+    pieces = split_lines(payload, 7)
+
+    assert b"".join(pieces) == payload
+    assert 1 < len(pieces) <= 7
+    assert all(piece.endswith(b"\n") for piece in pieces)
+
+  def test_split_lines_without_trailing_newline(self):
+    assert split_lines(b'{"a": 1}\n{"a": 2}', 4) == [b'{"a": 1}\n', b'{"a": 2}']
+    assert split_lines(b"", 4) == [b""]
+
+  def test_parallel_decode_keeps_order(self):
+    payload = _payload(200)
+    expected = decode_ndjson(payload)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+      records = decode_ndjson(payload, workers=4, executor=pool, min_parallel_bytes=0)
+
+    assert records == expected
+    assert [r["rows"][0][0] for r in records] == list(range(200))
+
+  def test_process_pool_decode(self):
+    payload = _payload(20)
+    assert decode_ndjson(payload, workers=2, min_parallel_bytes=0) == decode_ndjson(
+      payload
+    )
+
+  def test_small_payload_stays_in_process(self):
+    with patch("robosystems_client.clients.ndjson.ProcessPoolExecutor") as pool:
+      decode_ndjson(_payload(5), workers=4)
+    pool.assert_not_called()
+
+  def test_blank_lines_and_invalid_json(self):
+    assert decode_ndjson(b'{"a": 1}\n\n  \n{"a": 2}\n') == [{"a": 1}, {"a": 2}]
+    with pytest.raises(ValueError):
+      decode_ndjson(b'{"a": 1}\n{"a": \n')
+
+  def test_non_finite_numbers_decode_as_with_json(self):
+    row = decode_ndjson(b'{"rows": [[NaN, Infinity, -Infinity, 1e400]]}\n')[0]
+    values = row["rows"][0]
+    assert values[0] != values[0]  # NaN
+    assert values[1:] == [float("inf"), float("-inf"), float("inf")]
+
+  def test_big_integers_keep_full_precision(self):
+    big = 18446744073709551616
+    assert decode_ndjson(f'{{"id": {big}, "n": {-(2**63) - 1}}}\n'.encode()) == [
+      {"id": big, "n": -(2**63) - 1}
+    ]
+    assert loads(f"[{big}]") == [big]  # str lines, as from iter_lines
+    assert loads(b'[18446744073709551615, "x"]') == [18446744073709551615, "x"]
+
+  def test_query_client_uses_configured_workers(self, mock_config, graph_id):
+    mock_config["ndjson_decode_workers"] = 3
+    response = Mock(content=_payload(3))
+
+    with patch(
+      "robosystems_client.clients.query_client.decode_ndjson",
+      side_effect=decode_ndjson,
+    ) as decode:
+      result = QueryClient(mock_config)._parse_ndjson_response(response, graph_id)
+
+    assert decode.call_args.kwargs["workers"] == 3
+    assert result.row_count == 3
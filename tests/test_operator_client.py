@@ -1,5 +1,8 @@
 """Unit tests for OperatorClient."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from robosystems_client.clients.operator_client import (
@@ -7,9 +10,11 @@ from robosystems_client.clients.operator_client import (
   OperatorQueryRequest,
   OperatorOptions,
   OperatorResult,
+  OperatorStreamEvent,
   QueuedOperatorResponse,
   QueuedOperatorError,
 )
+from robosystems_client.clients.sse_client import AsyncSSEClient, SSEClient
 
 
 @pytest.mark.unit
@@ -333,3 +338,135 @@ class TestOperatorConvenienceMethods:
     assert result.operator_used == "rag"
     call_args = mock_exec.call_args
     assert call_args[0][1] == "rag"
+
+
+# Operation-stream events replayed by the fake SSE connect() below.
+STREAM_EVENTS = [
+  ("operator_started", {"operator_type": "financial"}),
+  ("data_chunk", {"content": "Revenue "}),
+  ("operation_progress", {"message": "Querying graph", "percentage": 40}),
+  ("data_chunk", {"content": "grew 12%."}),
+  ("operator_completed", {"operator_used": "financial", "mode_used": "standard"}),
+  ("operation_completed", {"result": {}}),
+]
+
+
+def _queued_response():
+  mock_resp = Mock()
+  mock_resp.parsed = {"operation_id": "op-stream", "status": "queued"}
+  return mock_resp
+
+
+@pytest.mark.unit
+class TestOperatorStreaming:
+  """Test suite for stream_operator / stream_operator_async."""
+
+  @patch("robosystems_client.clients.operator_client.execute_specific_operator")
+  def test_stream_yields_deltas_then_result(self, mock_exec, mock_config, graph_id):
+    mock_exec.return_value = _queued_response()
+
+    def fake_connect(self, operation_id, from_sequence=0):
+      assert operation_id == "op-stream"
+      for event_type, data in STREAM_EVENTS:
+        self.emit(event_type, data)
+
+    with patch.object(SSEClient, "connect", fake_connect):
+      events = list(
+        OperatorClient(mock_config).stream_operator(graph_id, "Revenue?", "financial")
+      )
+
+    assert [e.type for e in events] == [
+      "progress",
+      "delta",
+      "progress",
+      "delta",
+      "completed",
+    ]
+    assert "".join(e.delta for e in events) == "Revenue grew 12%."
+    assert events[2].percentage == 40
+    result = events[-1].result
+    assert result.operator_used == "financial"
+    # The completion payload carried no content — it's rebuilt from deltas.
+    assert result.content == "Revenue grew 12%."
+    # Submitted in async mode so the agent runs behind the operation stream.
+    assert mock_exec.call_args.kwargs["mode"].value == "async"
+    assert mock_exec.call_args.kwargs["operator_type"] == "financial"
+
+  @patch("robosystems_client.clients.operator_client.auto_select_operator")
+  def test_stream_immediate_response(self, mock_auto, mock_config, graph_id):
+    mock_resp = Mock()
+    mock_resp.parsed = {
+      "content": "Quick answer",
+      "operator_used": "rag",
+      "mode_used": "quick",
+    }
+    mock_auto.return_value = mock_resp
+
+    events = list(OperatorClient(mock_config).stream_operator(graph_id, "Q?"))
+
+    assert events == [
+      OperatorStreamEvent(type="delta", delta="Quick answer"),
+      OperatorStreamEvent(type="completed", result=events[1].result),
+    ]
+    assert events[1].result.content == "Quick answer"
+
+  @patch("robosystems_client.clients.operator_client.auto_select_operator")
+  def test_stream_error_raises(self, mock_auto, mock_config, graph_id):
+    mock_auto.return_value = _queued_response()
+
+    def fake_connect(self, operation_id, from_sequence=0):
+      self.emit("data_chunk", {"content": "partial"})
+      self.emit("operation_error", {"message": "model overloaded"})
+
+    with patch.object(SSEClient, "connect", fake_connect):
+      stream = OperatorClient(mock_config).stream_operator(graph_id, "Q?")
+      assert next(stream).delta == "partial"
+      with pytest.raises(Exception, match="model overloaded"):
+        next(stream)
+
+  @patch("robosystems_client.clients.operator_client.auto_select_operator")
+  def test_stream_ended_without_completion_raises(
+    self, mock_auto, mock_config, graph_id
+  ):
+    mock_auto.return_value = _queued_response()
+
+    with patch.object(SSEClient, "connect", lambda self, op, from_sequence=0: None):
+      with pytest.raises(Exception, match="ended before completion"):
+        list(OperatorClient(mock_config).stream_operator(graph_id, "Q?"))
+
+  @patch("robosystems_client.clients.operator_client.auto_select_operator")
+  def test_stream_closed_early_stops_reader(self, mock_auto, mock_config, graph_id):
+    mock_auto.return_value = _queued_response()
+    late = []
+
+    def fake_connect(self, operation_id, from_sequence=0):
+      self.emit("data_chunk", {"content": "first"})
+      while not self.closed:  # blocked on the stream until close()
+        time.sleep(0.01)
+      late.append(self.listeners.get("data_chunk"))
+
+    with patch.object(SSEClient, "connect", fake_connect):
+      stream = OperatorClient(mock_config).stream_operator(graph_id, "Q?")
+      assert next(stream).delta == "first"
+      stream.close()
+
+    assert late == [None]  # listeners were detached before connect returned
+    assert not any(t.name == "operator-stream" for t in threading.enumerate())
+
+  @pytest.mark.asyncio
+  @patch("robosystems_client.clients.operator_client.execute_specific_operator")
+  async def test_stream_async(self, mock_exec, mock_config, graph_id):
+    mock_exec.return_value = _queued_response()
+
+    async def fake_connect(self, operation_id, from_sequence=0):
+      for event_type, data in STREAM_EVENTS:
+        self.emit(event_type, data)
+
+    client = OperatorClient(mock_config)
+    with patch.object(AsyncSSEClient, "connect", fake_connect):
+      events = [
+        e async for e in client.stream_operator_async(graph_id, "Revenue?", "rag")
+      ]
+
+    assert "".join(e.delta for e in events) == "Revenue grew 12%."
+    assert events[-1].type == "completed"
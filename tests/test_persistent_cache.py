@@ -0,0 +1,123 @@
+"""Unit tests for the SQLite ReadCache backend."""
+
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.clients.persistent_cache import SQLiteCacheBackend
+from robosystems_client.clients.read_cache import (
+  CacheEntry,
+  CachePolicy,
+  ReadCache,
+  credential_scope,
+)
+
+CALENDAR = {"fiscalCalendar": {"closeTarget": "2026-04", "periods": ["2026-03"] * 50}}
+
+
+def _entry(value, ttl=60.0):
+  now = time.time()
+  return CacheEntry(value, fresh_until=now + ttl, stale_until=now + ttl)
+
+
+@pytest.fixture
+def path(tmp_path):
+  return tmp_path / "cache" / "reads.sqlite"
+
+
+@pytest.mark.unit
+class TestSQLiteCacheBackend:
+  def test_round_trip_is_compressed(self, path):
+    backend = SQLiteCacheBackend(path)
+    key = ReadCache.key("Cal", "kg_1", {"a": 1}, "query Cal { x }")
+    backend.set(key, _entry(CALENDAR))
+
+    assert backend.get(key).value == CALENDAR
+    assert (
+      backend.get(ReadCache.key("Cal", "kg_1", {"a": 1}, "query Cal { y }")) is None
+    )
+    assert backend.size_bytes() < len(str(CALENDAR)) / 2
+
+  def test_expired_and_unserializable_values(self, path):
+    backend = SQLiteCacheBackend(path)
+    backend.set(("Cal", "kg_1", "", ""), _entry("old", ttl=-1))
+    backend.set(("Cal", "kg_2", "", ""), _entry(object()))
+
+    assert backend.get(("Cal", "kg_1", "", "")) is None
+    assert backend.get(("Cal", "kg_2", "", "")) is None
+    backend.prune()
+    assert len(backend) == 0
+
+  def test_size_bound_drops_least_recently_read(self, path):
+    backend = SQLiteCacheBackend(path)
+    for i in range(4):
+      backend.set(("Tax", f"kg_{i}", "", ""), _entry({"blob": str(i) * 2000}))
+    per_entry = backend.size_bytes() // 4
+    backend.max_bytes = per_entry * 2
+    with backend._lock:
+      backend._conn.execute(
+        "UPDATE entries SET accessed_at = ? WHERE graph_id = 'kg_0'", (time.time() + 1,)
+      )
+
+    assert backend.prune() == 2
+    assert backend.get(("Tax", "kg_0", "", "")) is not None
+    assert backend.get(("Tax", "kg_3", "", "")) is not None
+
+  def test_processes_share_entries_and_invalidations(self, path):
+    first, second = SQLiteCacheBackend(path), SQLiteCacheBackend(path)
+    first.set(("Cal", "kg_1", "", ""), _entry(CALENDAR))
+    first.set(("Tax", "kg_1", "", ""), _entry([1]))
+    first.set(("Cal", "kg_2", "", ""), _entry(CALENDAR))
+
+    assert second.get(("Cal", "kg_1", "", "")).value == CALENDAR
+    assert second.invalidate("kg_1", ("Cal",)) == 1
+    assert first.get(("Cal", "kg_1", "", "")) is None
+    assert first.invalidate(None, None) == 2
+    assert len(second) == 0
+
+  def test_locked_file_does_not_fail_invalidation(self, path):
+    backend = SQLiteCacheBackend(path, timeout=0)
+    backend.set(("Cal", "kg_1", "", ""), _entry(CALENDAR))
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+      assert backend.invalidate("kg_1", ("Cal",)) == 0
+    finally:
+      other.execute("ROLLBACK")
+      other.close()
+    assert backend.invalidate("kg_1", ("Cal",)) == 1
+
+  def test_file_is_owner_only_and_keys_are_scoped(self, path):
+    backend = SQLiteCacheBackend(path)
+    assert path.stat().st_mode & 0o777 == 0o600
+    alice = ReadCache.key("Cal", "kg_1", scope=credential_scope("u", "jwt-alice"))
+    bob = ReadCache.key("Cal", "kg_1", scope=credential_scope("u", "jwt-bob"))
+    backend.set(alice, _entry("alice's"))
+
+    assert backend.get(bob) is None
+    assert b"jwt-alice" not in path.read_bytes()
+
+  def test_schema_version_change_empties_file(self, path):
+    SQLiteCacheBackend(path).set(("Cal", None, "", ""), _entry(1))
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA user_version = 0")
+    conn.close()
+    assert len(SQLiteCacheBackend(path)) == 0
+
+  def test_read_cache_survives_restart(self, path, mock_config, graph_id):
+    with patch(
+      "robosystems_client.graphql.client.GraphQLClient.execute",
+      return_value={"fiscalCalendar": None},
+    ) as mock_execute:
+      for _ in range(2):  # two "processes" on the same file
+        cache = ReadCache(
+          {"GetLedgerFiscalCalendar": CachePolicy(60)},
+          backend=SQLiteCacheBackend(path),
+        )
+        mock_config["read_cache"] = cache
+        LedgerClient(mock_config).get_fiscal_calendar(graph_id)
+        cache.close()
+    assert mock_execute.call_count == 1
@@ -2,11 +2,15 @@
 
 Covers: execute_query (sync dict response, attrs response, queued response,
 NDJSON streaming, error handling), _parse_ndjson_response,
-_wait_for_query_completion, query convenience, query_batch, stream_query.
+_wait_for_query_completion, query convenience, query_batch, stream_query,
+query_many_graphs.
 
 Dataclass tests already exist in tests/test_query_client.py.
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from robosystems_client.clients.query_client import (
@@ -522,3 +526,113 @@ class TestStreamQuery:
 
     assert len(progress_calls) == 5
     assert progress_calls[-1] == (5, 5)
+
+
+# ── query_many_graphs ────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+class TestQueryManyGraphs:
+  """Test query_many_graphs and iter_query_many_graphs."""
+
+  @staticmethod
+  def _query(graph_id, cypher, parameters=None):
+    if graph_id == "kg_bad":
+      raise Exception("Query failed (404): Graph not found")
+    if graph_id == "kg_rows":
+      # NDJSON results carry positional rows
+      return QueryResult(
+        data=[["Beta", 2]], columns=["name", "n"], row_count=1, execution_time_ms=1
+      )
+    return QueryResult(
+      data=[{"name": "Alpha", "n": 1}, {"name": "Gamma", "n": 3}],
+      columns=["name", "n"],
+      row_count=2,
+      execution_time_ms=1,
+    )
+
+  @patch.object(QueryClient, "query")
+  def test_collects_in_graph_order_and_merges(self, mock_query, mock_config):
+    mock_query.side_effect = self._query
+    seen = []
+
+    client = QueryClient(mock_config)
+    result = client.query_many_graphs(
+      ["kg_a", "kg_rows", "kg_bad", "kg_a"],
+      "MATCH (e:Entity) RETURN e.name AS name, e.n AS n",
+      {"limit": 10},
+      on_result=lambda o: seen.append(o.graph_id),
+    )
+
+    assert [o.graph_id for o in result.outcomes] == ["kg_a", "kg_rows", "kg_bad"]
+    assert sorted(seen) == ["kg_a", "kg_bad", "kg_rows"]
+    assert mock_query.call_count == 3
+    assert mock_query.call_args.args[2] == {"limit": 10}
+    assert not result.success
+    assert "Graph not found" in result.errors["kg_bad"]
+    assert list(result.results) == ["kg_a", "kg_rows"]
+
+    assert result.to_columns() == {
+      "graph_id": ["kg_a", "kg_a", "kg_rows"],
+      "name": ["Alpha", "Gamma", "Beta"],
+      "n": [1, 3, 2],
+    }
+    assert list(result.rows())[2] == {"graph_id": "kg_rows", "name": "Beta", "n": 2}
+
+  @patch.object(QueryClient, "query")
+  def test_missing_columns_filled_with_none(self, mock_query, mock_config):
+    mock_query.side_effect = [
+      QueryResult(data=[{"a": 1}], columns=["a"], row_count=1, execution_time_ms=0),
+    ]
+    client = QueryClient(mock_config)
+    first = client.query_many_graphs(["kg_1"], "RETURN 1 AS a")
+    mock_query.side_effect = [
+      QueryResult(data=[[2]], columns=["b"], row_count=1, execution_time_ms=0),
+    ]
+    second = client.query_many_graphs(["kg_2"], "RETURN 2 AS b")
+
+    first.outcomes += second.outcomes
+    assert first.to_columns() == {
+      "graph_id": ["kg_1", "kg_2"],
+      "a": [1, None],
+      "b": [None, 2],
+    }
+
+  @patch.object(QueryClient, "query")
+  def test_concurrency_is_bounded(self, mock_query, mock_config):
+    lock = threading.Lock()
+    active = peak = 0
+
+    def slow(graph_id, cypher, parameters=None):
+      nonlocal active, peak
+      with lock:
+        active += 1
+        peak = max(peak, active)
+      time.sleep(0.02)
+      with lock:
+        active -= 1
+      return QueryResult(data=[], columns=[], row_count=0, execution_time_ms=0)
+
+    mock_query.side_effect = slow
+    client = QueryClient(mock_config)
+    outcomes = list(
+      client.iter_query_many_graphs(
+        [f"kg_{i}" for i in range(8)], "RETURN 1", concurrency=3
+      )
+    )
+
+    assert len(outcomes) == 8
+    assert all(o.success for o in outcomes)
+    assert peak <= 3
+
+  @patch.object(QueryClient, "query")
+  def test_to_dataframe(self, mock_query, mock_config):
+    pytest.importorskip("pandas")
+    mock_query.side_effect = self._query
+    client = QueryClient(mock_config)
+
+    df = client.query_many_graphs(["kg_a", "kg_rows"], "RETURN 1").to_dataframe()
+
+    assert list(df.columns) == ["graph_id", "name", "n"]
+    assert df["graph_id"].dtype == "category"
+    assert len(df) == 3
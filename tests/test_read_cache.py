@@ -0,0 +1,201 @@
+"""Unit tests for the stale-while-revalidate ReadCache."""
+
+import asyncio
+import time
+from http import HTTPStatus
+from unittest.mock import Mock, patch
+
+import pytest
+
+from robosystems_client.clients.graph_client import GraphClient
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.clients.read_cache import (
+  CachePolicy,
+  MemoryCacheBackend,
+  ReadCache,
+  credential_scope,
+  operation_name,
+)
+from robosystems_client.graphql.generated.operations import (
+  GET_LEDGER_FISCAL_CALENDAR_GQL,
+)
+from robosystems_client.models.available_graph_tiers_response import (
+  AvailableGraphTiersResponse,
+)
+from robosystems_client.models.operation_envelope import OperationEnvelope
+from robosystems_client.models.operation_envelope_status import OperationEnvelopeStatus
+
+
+def _counter(*values):
+  calls = []
+
+  def fetch():
+    calls.append(1)
+    return values[min(len(calls), len(values)) - 1]
+
+  return fetch, calls
+
+
+def _wait_for(predicate, timeout=2.0):
+  deadline = time.monotonic() + timeout
+  while not predicate():
+    if time.monotonic() > deadline:
+      raise AssertionError("timed out")
+    time.sleep(0.001)
+
+
+@pytest.mark.unit
+class TestReadCache:
+  def test_operation_name(self):
+    assert operation_name(GET_LEDGER_FISCAL_CALENDAR_GQL) == "GetLedgerFiscalCalendar"
+    assert operation_name("{ summary { n } }") is None
+
+  def test_fresh_hits_and_uncached_endpoints(self):
+    cache = ReadCache({"Cal": CachePolicy(60)})
+    fetch, calls = _counter("v1", "v2")
+
+    assert cache.get("Cal", "kg_1", {"a": 1, "b": 2}, fetch) == "v1"
+    assert cache.get("Cal", "kg_1", {"b": 2, "a": 1}, fetch) == "v1"
+    assert len(calls) == 1
+    assert cache.get("Cal", "kg_2", None, fetch) == "v2"
+    assert cache.get("Other", "kg_1", None, fetch) == "v2"
+    assert cache.get("Other", "kg_1", None, fetch) == "v2"
+    assert len(calls) == 4
+    assert (cache.hits, cache.misses) == (1, 2)
+
+  def test_stale_value_served_while_refreshing(self):
+    cache = ReadCache({"Cal": CachePolicy(0, 60)})
+    fetch, calls = _counter("old", "new")
+
+    assert cache.get("Cal", "kg_1", None, fetch) == "old"
+    assert cache.get("Cal", "kg_1", None, fetch) == "old"
+    _wait_for(lambda: len(calls) == 2 and not cache._refreshing)
+    assert cache.get("Cal", "kg_1", None, fetch) == "new"
+    assert cache.stale_hits == 2
+    cache.close()
+
+  def test_expired_entries_are_fetched_inline(self):
+    cache = ReadCache({"Cal": CachePolicy(0, 0)})
+    fetch, calls = _counter("v1", "v2")
+    cache.get("Cal", "kg_1", None, fetch)
+    assert cache.get("Cal", "kg_1", None, fetch) == "v2"
+    assert cache.misses == 2
+
+  def test_invalidate_and_lru_bound(self):
+    cache = ReadCache({"A": CachePolicy(60), "B": CachePolicy(60)}, max_entries=3)
+    for endpoint, graph in [("A", "kg_1"), ("B", "kg_1"), ("A", "kg_2")]:
+      cache.get(endpoint, graph, None, lambda: 1)
+
+    assert cache.invalidate("kg_1", ("A",)) == 1
+    assert cache.invalidate("kg_1") == 1
+    for graph in ("kg_3", "kg_4", "kg_5"):
+      cache.get("A", graph, None, lambda: 1)
+    assert len(cache) == 3
+    assert cache.invalidate() == 3
+
+  def test_refresh_started_before_invalidation_is_discarded(self):
+    endpoint = "GetLedgerFiscalCalendar"
+    cache = ReadCache({endpoint: CachePolicy(0, 60)})
+    cache.get(endpoint, "kg_1", None, lambda: "old")
+
+    def refresh():
+      cache.on_write("close-period", "kg_1")  # a write lands mid-refresh
+      return "pre-write"
+
+    assert cache.get(endpoint, "kg_1", None, refresh) == "old"
+    _wait_for(lambda: not cache._refreshing)
+    assert len(cache) == 0
+    cache.close()
+
+  @pytest.mark.asyncio
+  async def test_async_stale_refresh(self):
+    cache = ReadCache({"Cal": CachePolicy(0, 60)})
+    values = iter(["old", "new", "newer"])
+
+    async def fetch():
+      return next(values)
+
+    assert await cache.aget("Cal", "kg_1", None, fetch) == "old"
+    assert await cache.aget("Cal", "kg_1", None, fetch) == "old"
+    assert len(cache._tasks) == 1  # held until done, not left to the GC
+    await asyncio.sleep(0)
+    assert await cache.aget("Cal", "kg_1", None, fetch) == "new"
+    await asyncio.gather(*cache._tasks)
+    await asyncio.sleep(0)  # done callbacks run on the next iteration
+    assert not cache._tasks
+
+  def test_scopes_do_not_share_entries(self):
+    cache = ReadCache({"Cal": CachePolicy(60)})
+    alice = credential_scope("http://api.test", "jwt-alice")
+    bob = credential_scope("http://api.test", "jwt-bob")
+
+    assert cache.get("Cal", "kg_1", None, lambda: "alice's", scope=alice) == "alice's"
+    assert cache.get("Cal", "kg_1", None, lambda: "bob's", scope=bob) == "bob's"
+    assert "jwt-alice" not in repr(cache.backend._entries)
+    # A write by anyone invalidates the graph for every scope
+    assert cache.invalidate("kg_1") == 2
+
+  def test_backend_read_runs_outside_lock(self):
+    cache = ReadCache({"Cal": CachePolicy(60)})
+
+    class Backend(MemoryCacheBackend):
+      def get(self, key):
+        assert not cache._lock.locked()
+        return super().get(key)
+
+    cache.backend = Backend()
+    cache.get("Cal", "kg_1", None, lambda: 1)
+    assert cache.get("Cal", "kg_1", None, lambda: 2) == 1
+
+
+@pytest.mark.unit
+class TestFacadeReadCache:
+  @patch("robosystems_client.clients.ledger_client.op_set_close_target")
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_ledger_reads_cached_and_invalidated_by_writes(
+    self, mock_execute, mock_op, mock_config, graph_id
+  ):
+    mock_execute.return_value = {"fiscalCalendar": None}
+    response = Mock(status_code=HTTPStatus.OK, content=b"")
+    response.parsed = OperationEnvelope(
+      operation="set-close-target",
+      operation_id="op_1",
+      status=OperationEnvelopeStatus.COMPLETED,
+      result={},
+      at="2026-04-14T12:00:00Z",
+    )
+    mock_op.return_value = response
+    mock_config["read_cache"] = ReadCache()
+    client = LedgerClient(mock_config)
+
+    client.get_fiscal_calendar(graph_id)
+    client.get_fiscal_calendar(graph_id)
+    assert mock_execute.call_count == 1
+
+    client.set_close_target(graph_id, "2026-04")
+    client.get_fiscal_calendar(graph_id)
+    assert mock_execute.call_count == 2
+
+    # Another credential does not see the cached calendar
+    LedgerClient(
+      {**mock_config, "token_provider": lambda: "other"}
+    ).get_fiscal_calendar(graph_id)
+    assert mock_execute.call_count == 3
+
+    # Reads without a policy always go to the server
+    client._query(graph_id, "query GetLedgerSummary { summary { n } }")
+    client._query(graph_id, "query GetLedgerSummary { summary { n } }")
+    assert mock_execute.call_count == 5
+
+  @patch("robosystems_client.api.graphs.get_available_graph_tiers.sync_detailed")
+  def test_graph_tiers_cached(self, mock_tiers, mock_config):
+    mock_tiers.return_value = Mock(
+      status_code=200, parsed=AvailableGraphTiersResponse(tiers=[])
+    )
+    mock_config["read_cache"] = ReadCache()
+    client = GraphClient(mock_config)
+
+    assert client.get_available_graph_tiers().tiers == []
+    client.get_available_graph_tiers()
+    client.get_available_graph_tiers(include_disabled=True)
+    assert mock_tiers.call_count == 2
@@ -0,0 +1,208 @@
+"""Unit tests for ReportBundleCache and its use by LedgerClient."""
+
+import hashlib
+import os
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from robosystems_client.clients.ledger_client import LedgerClient
+from robosystems_client.clients.report_bundle_cache import ReportBundleCache
+
+
+def _store(cache, report_id, payload, generation=1, fmt="jsonld"):
+  key = ("kg_1", report_id, fmt, generation)
+  cache.blob_path(*key).write_bytes(payload)
+  return cache.put(
+    *key,
+    filename=f"{report_id}-g{generation}.jsonld",
+    content_type="application/ld+json",
+    sha256=hashlib.sha256(payload).hexdigest(),
+  )
+
+
+@pytest.mark.unit
+class TestReportBundleCache:
+  def test_put_then_get(self, tmp_path):
+    cache = ReportBundleCache(tmp_path)
+    stored = _store(cache, "rpt_a", b"{}")
+
+    entry = cache.get("kg_1", "rpt_a", "jsonld", 1)
+    assert entry == stored
+    assert entry.path.read_bytes() == b"{}"
+    assert cache.size_bytes == 2
+
+  def test_key_includes_generation_and_format(self, tmp_path):
+    cache = ReportBundleCache(tmp_path)
+    _store(cache, "rpt_a", b"{}", generation=1)
+
+    assert cache.get("kg_1", "rpt_a", "jsonld", 2) is None
+    assert cache.get("kg_1", "rpt_a", "xbrl-2.1", 1) is None
+    assert cache.get("kg_2", "rpt_a", "jsonld", 1) is None
+
+  def test_lru_eviction(self, tmp_path):
+    cache = ReportBundleCache(tmp_path, max_bytes=25)
+    _store(cache, "rpt_a", b"a" * 10)
+    _store(cache, "rpt_b", b"b" * 10)
+    # Age both entries, then touch rpt_a so rpt_b becomes the LRU entry.
+    for meta in tmp_path.glob("*.json"):
+      os.utime(meta, (1, 1))
+    assert cache.get("kg_1", "rpt_a", "jsonld", 1) is not None
+
+    _store(cache, "rpt_c", b"c" * 10)
+
+    assert cache.get("kg_1", "rpt_b", "jsonld", 1) is None
+    assert cache.get("kg_1", "rpt_a", "jsonld", 1) is not None
+    assert cache.get("kg_1", "rpt_c", "jsonld", 1) is not None
+    assert cache.size_bytes == 20
+
+  def test_oversized_entry_is_kept(self, tmp_path):
+    cache = ReportBundleCache(tmp_path, max_bytes=5)
+    _store(cache, "rpt_a", b"a" * 10)
+    assert cache.get("kg_1", "rpt_a", "jsonld", 1) is not None
+
+  def test_truncated_blob_is_a_miss(self, tmp_path):
+    cache = ReportBundleCache(tmp_path)
+    entry = _store(cache, "rpt_a", b"0123456789")
+    entry.path.write_bytes(b"01234")
+
+    assert cache.get("kg_1", "rpt_a", "jsonld", 1) is None
+    assert list(tmp_path.iterdir()) == []
+
+  def test_clear(self, tmp_path):
+    cache = ReportBundleCache(tmp_path)
+    _store(cache, "rpt_a", b"{}")
+    cache.clear()
+    assert cache.size_bytes == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+class TestLedgerClientBundleCache:
+  """``download_report_bundle`` with ``report_bundle_cache`` configured."""
+
+  def _gql_data(self, gen: int) -> dict:
+    return {
+      "reportDownloadUrl": {
+        "downloadUrl": f"https://s3.example.com/bundles/rpt_01/g{gen}",
+        "expiresAt": "2026-05-28T12:30:00Z",
+        "contentType": "application/ld+json",
+        "format": "jsonld",
+        "generationCount": gen,
+      }
+    }
+
+  def _http(self, mock_client_cls, body: bytes) -> MagicMock:
+    artifact = Mock(status_code=200)
+    artifact.headers = {"content-disposition": 'attachment; filename="rpt_01.jsonld"'}
+    artifact.iter_bytes = Mock(side_effect=lambda: iter([body]))
+    stream_ctx = MagicMock()
+    stream_ctx.__enter__.return_value = artifact
+    mock_client = MagicMock()
+    mock_client.__enter__.return_value = mock_client
+    mock_client.stream.return_value = stream_ctx
+    mock_client_cls.return_value = mock_client
+    return mock_client
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_repeat_download_served_from_cache(
+    self, mock_client_cls, mock_config, graph_id, tmp_path
+  ):
+    mock_config["report_bundle_cache"] = ReportBundleCache(tmp_path / "cache")
+    client = LedgerClient(mock_config)
+    mock_http = self._http(mock_client_cls, b'{"@graph": []}')
+
+    with patch.object(LedgerClient, "_query", return_value=self._gql_data(2)):
+      first = client.download_report_bundle(graph_id, "rpt_01")
+      second = client.download_report_bundle(
+        graph_id, "rpt_01", to=tmp_path / "out" / "bundle.jsonld"
+      )
+
+    assert first.from_cache is False
+    assert first.content == b'{"@graph": []}'
+    assert second.from_cache is True
+    assert second.filename == "rpt_01.jsonld"
+    assert second.path.read_bytes() == b'{"@graph": []}'
+    assert second.sha256 == hashlib.sha256(b'{"@graph": []}').hexdigest()
+    # Only the first call transferred the artifact.
+    assert mock_http.stream.call_count == 1
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_new_generation_refetches(
+    self, mock_client_cls, mock_config, graph_id, tmp_path
+  ):
+    mock_config["report_bundle_cache"] = ReportBundleCache(tmp_path)
+    client = LedgerClient(mock_config)
+    mock_http = self._http(mock_client_cls, b"{}")
+
+    with patch.object(LedgerClient, "_query", return_value=self._gql_data(1)):
+      client.download_report_bundle(graph_id, "rpt_01")
+    with patch.object(LedgerClient, "_query", return_value=self._gql_data(2)):
+      result = client.download_report_bundle(graph_id, "rpt_01")
+
+    assert result.from_cache is False
+    assert result.generation_count == 2
+    assert mock_http.stream.call_count == 2
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_checksum_mismatch_evicts_and_redownloads_once(
+    self, mock_client_cls, mock_config, graph_id, tmp_path
+  ):
+    cache = ReportBundleCache(tmp_path)
+    key = (graph_id, "rpt_01", "jsonld", 2)
+    cache.blob_path(*key).write_bytes(b"corrupt")
+    cache.put(
+      *key,
+      filename="rpt_01.jsonld",
+      content_type="application/ld+json",
+      sha256=hashlib.sha256(b"corrupt").hexdigest(),
+    )
+    mock_config["report_bundle_cache"] = cache
+    client = LedgerClient(mock_config)
+    mock_http = self._http(mock_client_cls, b"{}")
+    good = hashlib.sha256(b"{}").hexdigest()
+
+    with patch.object(LedgerClient, "_query", return_value=self._gql_data(2)):
+      out = tmp_path / "out" / "b.jsonld"
+      result = client.download_report_bundle(
+        graph_id, "rpt_01", to=out, expected_sha256=good
+      )
+      assert out.read_bytes() == b"{}"
+      assert result.from_cache is False
+      assert mock_http.stream.call_count == 1
+
+      # A fresh download that still mismatches raises and is not kept
+      with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        client.download_report_bundle(
+          graph_id, "rpt_01", to=out, expected_sha256="0" * 64
+        )
+    assert mock_http.stream.call_count == 2
+    assert cache.get(*key) is None
+
+  @patch("robosystems_client.clients.ledger_client.httpx.Client")
+  def test_hit_evicted_by_another_process_is_redownloaded(
+    self, mock_client_cls, mock_config, graph_id, tmp_path
+  ):
+    cache = ReportBundleCache(tmp_path)
+    mock_config["report_bundle_cache"] = cache
+    client = LedgerClient(mock_config)
+    mock_http = self._http(mock_client_cls, b"{}")
+    real_get = cache.get
+    evicted = []
+
+    def get_then_evict(*key):
+      entry = real_get(*key)
+      if entry is not None and not evicted:
+        entry.path.unlink()  # another process evicts right after the lookup
+        evicted.append(key)
+      return entry
+
+    with patch.object(LedgerClient, "_query", return_value=self._gql_data(2)):
+      client.download_report_bundle(graph_id, "rpt_01")
+      with patch.object(cache, "get", side_effect=get_then_evict):
+        result = client.download_report_bundle(graph_id, "rpt_01")
+
+    assert evicted
+    assert result.content == b"{}"
+    assert result.from_cache is False
+    assert mock_http.stream.call_count == 2
@@ -0,0 +1,162 @@
+"""Unit tests for the memory-budgeted RowSpool."""
+
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from robosystems_client.client import AuthenticatedClient
+from robosystems_client.clients.query_client import QueryClient
+from robosystems_client.clients.row_spool import RowSpool
+
+
+def _rows(n: int) -> list[dict]:
+  return [{"id": i, "name": f"Entity {i}"} for i in range(n)]
+
+
+@pytest.mark.unit
+class TestRowSpool:
+  def test_under_budget_stays_in_memory(self):
+    spool = RowSpool(memory_budget=1 << 20, batch_rows=10)
+    spool.extend(_rows(25))
+
+    assert spool.spilled is False
+    assert len(spool) == 25
+    assert list(spool) == _rows(25)
+    assert [len(b) for b in spool.iter_batches()] == [10, 10, 5]
+
+  def test_spills_past_budget_and_reads_back_in_order(self, tmp_path):
+    spool = RowSpool(memory_budget=512, batch_rows=10, directory=str(tmp_path))
+    spool.extend(_rows(1_000))
+
+    assert spool.spilled is True
+    assert spool.memory_bytes <= 512
+    assert list(spool) == _rows(1_000)
+    # Iterating twice re-reads the spill file.
+    assert sum(1 for _ in spool) == 1_000
+
+  def test_indexing(self):
+    spool = RowSpool(memory_budget=0, batch_rows=4)
+    spool.extend(_rows(10))
+
+    assert spool[0] == {"id": 0, "name": "Entity 0"}
+    assert spool[5]["id"] == 5
+    assert spool[-1]["id"] == 9
+    with pytest.raises(IndexError):
+      spool[10]
+
+  def test_close_drops_rows(self):
+    with RowSpool(memory_budget=0, batch_rows=2) as spool:
+      spool.extend(_rows(5))
+      assert spool.spilled
+    assert len(spool) == 0
+    assert spool.spilled is False
+    assert list(spool) == []
+
+  def test_to_pandas(self):
+    pytest.importorskip("pandas")
+    spool = RowSpool(memory_budget=0, batch_rows=3)
+    spool.extend([[i, f"Entity {i}"] for i in range(7)])
+
+    df = spool.to_pandas(columns=["id", "name"])
+    assert list(df["id"]) == list(range(7))
+    assert RowSpool().to_pandas(columns=["id"]).columns.tolist() == ["id"]
+
+  def test_to_pandas_from_arrow_batches(self, tmp_path):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    spool = RowSpool(memory_budget=0, batch_rows=4, directory=str(tmp_path))
+    spool.extend(_rows(10))
+
+    df = spool.to_pandas(columns=["name", "id"])
+    assert df.columns.tolist() == ["name", "id"]
+    assert list(df["id"]) == list(range(10))
+
+  def test_spilled_dict_batches_are_memory_mapped_arrow(self, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    spool = RowSpool(memory_budget=0, batch_rows=4, directory=str(tmp_path))
+    spool.extend(_rows(10))
+
+    assert spool.spilled
+    assert all(batch.arrow and batch.data is None for batch in spool._batches)
+    table = spool.to_arrow()
+    assert isinstance(table, pa.Table)
+    assert table.to_pylist() == _rows(10)
+    assert list(spool) == _rows(10)
+    assert spool[5] == {"id": 5, "name": "Entity 5"}
+
+  def test_lossy_batches_stay_pickled(self):
+    pytest.importorskip("pyarrow")
+    ragged = [{"id": 1}, {"id": 2, "extra": "x"}, {"id": "3"}]
+    spool = RowSpool(memory_budget=0, batch_rows=3)
+    spool.extend(ragged)
+
+    assert spool._batches[0].arrow is False
+    assert list(spool) == ragged
+
+  def test_query_client_spools_ndjson(self, mock_config, graph_id):
+    mock_config["query_memory_budget"] = 256
+    payload = b"".join(
+      json.dumps({"rows": _rows(50)[i : i + 10]}).encode() + b"\n"
+      for i in range(0, 50, 10)
+    )
+
+    result = QueryClient(mock_config)._parse_ndjson_response(
+      Mock(content=payload), graph_id
+    )
+
+    assert isinstance(result.data, RowSpool)
+    assert result.row_count == 50
+    assert list(result.data) == _rows(50)
+
+  def test_query_client_streams_ndjson_into_spool(self, mock_config, graph_id):
+    mock_config["query_memory_budget"] = 256
+    sent = []
+
+    def body():
+      for i in range(0, 50, 10):
+        sent.append(i)
+        yield json.dumps({"rows": _rows(50)[i : i + 10]}).encode() + b"\n"
+
+    def server(request):
+      if b"ndjson" in request.content:
+        headers = {"content-type": "application/x-ndjson"}
+        return httpx.Response(200, headers=headers, content=body())
+      return httpx.Response(200, json={"data": [{"n": 1}], "columns": ["n"]})
+
+    def client(**kwargs):
+      return AuthenticatedClient(
+        **kwargs, httpx_args={"transport": httpx.MockTransport(server)}
+      )
+
+    with patch("robosystems_client.client.AuthenticatedClient", side_effect=client):
+      query = QueryClient(mock_config)
+      result = query.query(graph_id, "MATCH (e:Entity) RETURN e  // ndjson")
+      small = query.query(graph_id, "RETURN 1 AS n")
+
+    assert sent == [0, 10, 20, 30, 40]
+    assert isinstance(result.data, RowSpool)
+    assert list(result.data) == _rows(50)
+    assert small.data == [{"n": 1}]
+
+  def test_streamed_error_response_is_raised(self, mock_config, graph_id):
+    mock_config["query_memory_budget"] = 256
+
+    def server(request):
+      return httpx.Response(400, json={"detail": "bad cypher"})
+
+    def client(**kwargs):
+      return AuthenticatedClient(
+        **kwargs, httpx_args={"transport": httpx.MockTransport(server)}
+      )
+
+    with patch("robosystems_client.client.AuthenticatedClient", side_effect=client):
+      with pytest.raises(Exception, match=r"Query failed \(400\): bad cypher"):
+        QueryClient(mock_config).query(graph_id, "MATCH (")
+
+  def test_query_client_defaults_to_list(self, mock_config, graph_id):
+    result = QueryClient(mock_config)._parse_ndjson_response(
+      Mock(content=b'{"rows": [[1]]}\n'), graph_id
+    )
+    assert result.data == [[1]]
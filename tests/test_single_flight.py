@@ -0,0 +1,269 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import ssl
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from robosystems_client.clients.async_graphql_facade import create_async_http_client
+from robosystems_client.clients.facade import (
+  RoboSystemsClientConfig,
+  RoboSystemsClients,
+)
+from robosystems_client.clients.single_flight import (
+  AsyncSingleFlight,
+  AsyncSingleFlightTransport,
+  SingleFlight,
+  SingleFlightTransport,
+)
+from robosystems_client.graphql.client import AsyncGraphQLClient, GraphQLClient
+
+QUERY = "query Calendar { fiscalCalendar { closeTarget } }"
+
+
+def _wait_for(predicate, timeout=2.0):
+  deadline = time.monotonic() + timeout
+  while not predicate():
+    if time.monotonic() > deadline:
+      raise AssertionError("timed out")
+    time.sleep(0.001)
+
+
+def _run_concurrently(n, fn):
+  results = [None] * n
+
+  def worker(i):
+    try:
+      results[i] = fn()
+    except Exception as e:
+      results[i] = e
+
+  threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+  for t in threads:
+    t.start()
+  return threads, results
+
+
+class BlockingServer:
+  """MockTransport handler that holds every request until released."""
+
+  def __init__(self):
+    self.release = threading.Event()
+    self.requests: list[httpx.Request] = []
+
+  def __call__(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(request)
+    self.release.wait(2)
+    return httpx.Response(200, json={"data": {"n": len(self.requests)}})
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+  def test_concurrent_callers_share_one_call(self):
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+      calls.append(1)
+      release.wait(2)
+      return {"value": 42}
+
+    threads, results = _run_concurrently(4, lambda: flight.do("k", fetch))
+    _wait_for(lambda: flight.coalesced == 3)
+    release.set()
+    for t in threads:
+      t.join()
+
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 4
+    assert results[0] is results[3]
+    # The key is forgotten once the call completes
+    assert flight.do("k", lambda: "fresh") == "fresh"
+
+  def test_error_reaches_every_waiter(self):
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+      release.wait(2)
+      raise ValueError("boom")
+
+    threads, results = _run_concurrently(3, lambda: flight.do("k", fail))
+    _wait_for(lambda: flight.coalesced == 2)
+    release.set()
+    for t in threads:
+      t.join()
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+  @pytest.mark.asyncio
+  async def test_async_coalesces_and_survives_leader_cancel(self):
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+      calls.append(1)
+      await asyncio.sleep(0.01)
+      return "calendar"
+
+    leader = asyncio.ensure_future(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    followers = [asyncio.ensure_future(flight.do("k", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == ["calendar"] * 3
+    assert len(calls) == 1
+    assert flight.coalesced == 3
+    assert not flight._tasks
+
+
+@pytest.mark.unit
+class TestSingleFlightTransport:
+  def test_identical_gets_coalesce(self):
+    server = BlockingServer()
+    transport = SingleFlightTransport(SingleFlight(), httpx.MockTransport(server))
+
+    with httpx.Client(transport=transport, base_url="http://api.test") as client:
+      threads, results = _run_concurrently(
+        3, lambda: client.get("/v1/graphs", params={"a": 1}).json()
+      )
+      _wait_for(lambda: transport.flight.coalesced == 2)
+      server.release.set()
+      for t in threads:
+        t.join()
+
+      assert results == [{"data": {"n": 1}}] * 3
+      assert len(server.requests) == 1
+
+      client.get("/v1/graphs", params={"a": 2})
+      client.post("/v1/graphs", json={})
+      client.post("/v1/graphs", json={})
+    assert len(server.requests) == 4
+
+  def test_credentials_are_part_of_the_key(self):
+    server = BlockingServer()
+    flight = SingleFlight()
+    transport = SingleFlightTransport(flight, httpx.MockTransport(server))
+
+    with httpx.Client(transport=transport, base_url="http://api.test") as client:
+      threads, _ = _run_concurrently(
+        2,
+        lambda: client.get(
+          "/v1/graphs", headers={"X-API-Key": threading.current_thread().name}
+        ),
+      )
+      _wait_for(lambda: len(server.requests) == 2)
+      server.release.set()
+      for t in threads:
+        t.join()
+    assert flight.coalesced == 0
+
+  @pytest.mark.asyncio
+  async def test_async_transport(self):
+    requests = []
+
+    def handler(request):
+      requests.append(request)
+      return httpx.Response(200, json={"ok": True})
+
+    transport = AsyncSingleFlightTransport(
+      AsyncSingleFlight(), httpx.MockTransport(handler)
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+      responses = await asyncio.gather(
+        *[client.get("http://api.test/v1/graphs") for _ in range(4)]
+      )
+    assert [r.json() for r in responses] == [{"ok": True}] * 4
+    assert len(requests) == 1
+
+
+@pytest.mark.unit
+class TestGraphQLSingleFlight:
+  def test_sync_reads_coalesce_mutations_do_not(self):
+    server = BlockingServer()
+    server.release.set()
+    flight = SingleFlight()
+    real_client = httpx.Client
+    with patch(
+      "robosystems_client.graphql.client.httpx.Client",
+      side_effect=lambda **kw: real_client(transport=httpx.MockTransport(server)),
+    ):
+      client = GraphQLClient("http://api.test", token="rfs_key", single_flight=flight)
+      key = client._flight_key("kg_1", QUERY, {"b": 1, "a": 2}, None)
+      assert key == client._flight_key("kg_1", QUERY, {"a": 2, "b": 1}, None)
+      assert key != client._flight_key("kg_2", QUERY, {"a": 2, "b": 1}, None)
+      assert client._flight_key("kg_1", "mutation M { m }", None, None) is None
+      assert client.execute("kg_1", QUERY) == {"n": 1}
+
+  @pytest.mark.asyncio
+  async def test_async_reads_coalesce(self):
+    requests = []
+
+    def handler(request):
+      requests.append(request)
+      return httpx.Response(200, json={"data": {"fiscalCalendar": None}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+      client = AsyncGraphQLClient(
+        "http://api.test",
+        token="rfs_key",
+        http_client=http,
+        single_flight=AsyncSingleFlight(),
+      )
+      results = await asyncio.gather(
+        *[client.execute("kg_1", QUERY, {"x": 1}) for _ in range(5)],
+        client.execute("kg_1", QUERY, {"x": 2}),
+      )
+    assert results[0] is results[4]
+    assert len(requests) == 2
+
+  def test_config_shares_one_group(self):
+    clients = RoboSystemsClients(
+      RoboSystemsClientConfig(
+        base_url="http://api.test", headers={"X-API-Key": "rfs_key"}, single_flight=True
+      )
+    )
+    flight = clients.config["single_flight"]
+    assert isinstance(flight, SingleFlight)
+    assert clients.ledger._get_graphql_client().single_flight is flight
+    assert clients.library._get_graphql_client().single_flight is flight
+    rest = clients.ledger._get_client().get_httpx_client()
+    assert rest._transport.flight is flight
+    # One pooled transport per group, not one per client
+    again = clients.investor._get_client().get_httpx_client()
+    assert again._transport is rest._transport
+    with patch.object(rest._transport._transport, "close") as inner_close:
+      rest.close()  # closing one client leaves the shared pool open
+    inner_close.assert_not_called()
+    clients.close()
+    assert not flight._transports
+
+    default = RoboSystemsClients(RoboSystemsClientConfig())
+    assert default.config["single_flight"] is None
+
+  def test_tls_settings_reach_the_wrapped_transport(self):
+    flight = SingleFlight()
+    insecure = flight.transport(verify=False)
+    assert insecure is flight.transport(verify=False)
+    assert insecure is not flight.transport()
+    assert insecure._transport._pool._ssl_context.verify_mode == ssl.CERT_NONE
+    assert (
+      flight.transport()._transport._pool._ssl_context.verify_mode == ssl.CERT_REQUIRED
+    )
+    flight.close()
+
+  @pytest.mark.asyncio
+  async def test_async_client_tls_settings(self):
+    client = create_async_http_client(
+      {"base_url": "http://api.test", "single_flight": AsyncSingleFlight()},
+      verify=False,
+    )
+    inner = client._transport._transport
+    assert inner._pool._ssl_context.verify_mode == ssl.CERT_NONE
+    await client.aclose()
@@ -5,11 +5,14 @@ completion-event auto-close, and close/cleanup. Dataclass and listener
 tests already exist in extensions/tests/test_unit.py.
 """
 
+import socket
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from robosystems_client.clients.sse_client import (
   SSEClient,
   SSEConfig,
+  SSEParser,
 )
 
 
@@ -40,7 +43,7 @@ class TestProcessEvents:
     """Create an SSEClient with a fake response that yields lines."""
     client = SSEClient(sse_config)
     mock_response = Mock()
-    mock_response.iter_lines.return_value = iter(lines)
+    mock_response.iter_bytes.return_value = iter([("\n".join(lines) + "\n").encode()])
     client._response = mock_response
     client.closed = False
     return client
@@ -248,6 +251,123 @@ class TestProcessEvents:
     assert events[0] == ""  # Empty string, not JSON
 
 
+@pytest.mark.unit
+class TestSSEParser:
+  """Test the byte-level SSEParser directly."""
+
+  def _collect(self, parser, chunks):
+    events = []
+    for chunk in chunks:
+      for event in parser.feed(chunk):
+        events.append({**event, "data": list(event["data"])})
+    for event in parser.flush():
+      events.append({**event, "data": list(event["data"])})
+    return events
+
+  def test_crlf_split_across_chunks(self):
+    """A CRLF split between two chunks is one line terminator, not two."""
+    parser = SSEParser()
+    events = self._collect(
+      parser, [b"event: a\r", b"\ndata: 1\r\n\r", b"\nevent: b\rdata: 2\r\r"]
+    )
+    assert [(e["event"], e["data"]) for e in events] == [("a", [b"1"]), ("b", [b"2"])]
+
+  def test_line_split_across_chunks(self):
+    parser = SSEParser()
+    events = self._collect(parser, [b"eve", b"nt: progress\nda", b"ta: {}\n", b"\n"])
+    assert len(events) == 1
+    assert events[0]["event"] == "progress"
+    assert events[0]["data"] == [b"{}"]
+
+  def test_whitespace_in_data_preserved(self):
+    """Only the single space after the colon is stripped from values."""
+    parser = SSEParser()
+    events = self._collect(parser, [b"data:   indented  \ndata:\tx\n\n"])
+    assert events[0]["data"] == [b"  indented  ", b"\tx"]
+
+  def test_leading_bom_stripped(self):
+    parser = SSEParser()
+    events = self._collect(parser, [b"\xef\xbb", b"\xbfevent: a\ndata: 1\n\n"])
+    assert events[0]["event"] == "a"
+
+  def test_id_with_nul_ignored(self):
+    parser = SSEParser()
+    self._collect(parser, [b"id: 7\n\nid: bad\x00id\n\n"])
+    assert parser.last_event_id == "7"
+
+
+@pytest.mark.unit
+class TestDispatchOptimizations:
+  """Test lazy decoding and DATA_CHUNK coalescing."""
+
+  def _make_client(self, payload, chunk_size=None, **config):
+    client = SSEClient(SSEConfig(base_url="http://localhost:8000", **config))
+    mock_response = Mock()
+    if chunk_size:
+      chunks = [payload[i : i + chunk_size] for i in range(0, len(payload), chunk_size)]
+    else:
+      chunks = [payload]
+    mock_response.iter_bytes.return_value = iter(chunks)
+    client._response = mock_response
+    return client
+
+  def test_data_not_decoded_without_listener(self):
+    client = self._make_client(b'event: data_chunk\ndata: {"rows": []}\n\n')
+    with patch.object(SSEClient, "_decode_data") as mock_decode:
+      client._process_events()
+    mock_decode.assert_not_called()
+
+  def test_terminal_event_closes_without_listener(self):
+    client = self._make_client(b"event: operation_completed\ndata: {}\n\n")
+    client._process_events()
+    assert client.closed is True
+
+  def test_generic_event_listener_receives_sse_event(self):
+    client = self._make_client(b"event: operation_progress\nid: 3\ndata: {}\n\n")
+    events = []
+    client.on("event", lambda e: events.append(e))
+    client._process_events()
+    assert len(events) == 1
+    assert events[0].event == "operation_progress"
+    assert events[0].id == "3"
+
+  def test_data_chunks_coalesced(self):
+    payload = b"".join(
+      f'event: data_chunk\nid: {i}\ndata: {{"rows": [{i}], "chunk": {i}}}\n\n'.encode()
+      for i in range(5)
+    )
+    payload += b'event: operation_completed\ndata: {"result": {}}\n\n'
+    client = self._make_client(payload, coalesce_data_chunks=True)
+    chunks = []
+    client.on("data_chunk", lambda d: chunks.append(d))
+    client._process_events()
+
+    assert chunks == [{"rows": [0, 1, 2, 3, 4], "chunk": 4}]
+    assert client.last_event_id == "4"
+    assert client.closed is True
+
+  def test_coalesced_chunks_flushed_per_network_chunk(self):
+    """Held chunks are delivered at the end of each read, never delayed."""
+    event = b'event: data_chunk\ndata: {"rows": [1]}\n\n'
+    client = self._make_client(
+      event * 4, chunk_size=len(event) * 2, coalesce_data_chunks=True
+    )
+    chunks = []
+    client.on("data_chunk", lambda d: chunks.append(d))
+    client._process_events()
+
+    assert chunks == [{"rows": [1, 1]}, {"rows": [1, 1]}]
+
+  def test_data_chunks_not_coalesced_by_default(self):
+    event = b'event: data_chunk\ndata: {"rows": [1]}\n\n'
+    client = self._make_client(event * 3)
+    chunks = []
+    client.on("data_chunk", lambda d: chunks.append(d))
+    client._process_events()
+
+    assert len(chunks) == 3
+
+
 # ── Completion auto-close ────────────────────────────────────────────
 
 
@@ -383,12 +503,8 @@ class TestConnect:
     mock_context = MagicMock()
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.iter_lines.return_value = iter(
-      [
-        "event: operation_completed",
-        'data: {"result": {}}',
-        "",
-      ]
+    mock_response.iter_bytes.return_value = iter(
+      [b'event: operation_completed\ndata: {"result": {}}\n\n']
     )
     mock_context.__enter__ = Mock(return_value=mock_response)
     mock_http_client.stream.return_value = mock_context
@@ -408,7 +524,7 @@ class TestConnect:
     """A non-200 status must emit an error and not enter the event loop.
 
     Regression test: before this check, a 401 would cause connect() to fall
-    through to iter_lines() on an empty body, return silently, and leave any
+    through to iter_bytes() on an empty body, return silently, and leave any
     caller spinning in a wait-for-completion loop forever.
     """
     mock_http_client = MagicMock()
@@ -433,8 +549,8 @@ class TestConnect:
     # Error event surfaced with status and body.
     assert len(errors) == 1
     assert "HTTP 401" in str(errors[0])
-    # iter_lines was never called — we bailed before the read loop.
-    mock_response.iter_lines.assert_not_called()
+    # iter_bytes was never called — we bailed before the read loop.
+    mock_response.iter_bytes.assert_not_called()
     assert client.closed is True
 
   @patch("robosystems_client.clients.sse_client.httpx")
@@ -501,6 +617,20 @@ class TestClose:
 
     mock_ctx.__exit__.assert_called_once_with(None, None, None)
 
+  def test_close_shuts_down_the_stream_socket(self, sse_config):
+    """Test close ends a read blocked on another thread."""
+    client = SSEClient(sse_config)
+    ours, theirs = socket.socketpair()
+    stream = Mock()
+    stream.get_extra_info.return_value = ours
+    client._response = Mock(extensions={"network_stream": stream})
+
+    client.close()
+
+    assert ours.recv(1) == b""  # EOF rather than blocking
+    ours.close()
+    theirs.close()
+
   def test_is_connected(self, sse_config):
     """Test is_connected reflects state."""
     client = SSEClient(sse_config)
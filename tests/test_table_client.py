@@ -1,8 +1,14 @@
 """Unit tests for TableClient."""
 
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import Mock, patch
+from robosystems_client.clients.file_client import FileInfo
 from robosystems_client.clients.table_client import (
+  MAX_SQL_ROWS,
+  ColumnarResult,
   TableClient,
   TableInfo,
   QueryResult,
@@ -183,8 +189,9 @@ class TestTableQuery:
     client = TableClient(mock_config)
     client.query(graph_id, "SELECT name FROM Entity", limit=5)
 
-    call_kwargs = mock_query.call_args[1]
-    assert "LIMIT 5" in call_kwargs["body"].sql
+    body = mock_query.call_args[1]["body"]
+    assert body.sql == "SELECT name FROM Entity LIMIT ?"
+    assert body.parameters == [5]
 
   @patch("robosystems_client.clients.table_client.query_tables")
   def test_query_strips_trailing_semicolon(self, mock_query, mock_config, graph_id):
@@ -200,10 +207,9 @@ class TestTableQuery:
     client = TableClient(mock_config)
     client.query(graph_id, "SELECT name FROM Entity;", limit=10)
 
-    call_kwargs = mock_query.call_args[1]
-    sql = call_kwargs["body"].sql
-    assert not sql.endswith("; LIMIT 10")
-    assert sql.endswith("LIMIT 10")
+    body = mock_query.call_args[1]["body"]
+    assert body.sql == "SELECT name FROM Entity LIMIT ?"
+    assert body.parameters == [10]
 
   @patch("robosystems_client.clients.table_client.query_tables")
   def test_query_failure(self, mock_query, mock_config, graph_id):
@@ -238,3 +244,318 @@ class TestTableQuery:
 
     assert result.success is False
     assert "Network error" in result.error
+
+
+def _file(file_id: str, table_name: str = "Entity") -> FileInfo:
+  return FileInfo(
+    file_id=file_id,
+    file_name=f"{file_id}.parquet",
+    file_format="parquet",
+    size_bytes=100,
+    row_count=2,
+    upload_status="uploaded",
+    table_name=table_name,
+    created_at="2026-01-01T00:00:00Z",
+    uploaded_at="2026-01-01T00:00:00Z",
+  )
+
+
+def _pulled(columns, rows) -> QueryResult:
+  return QueryResult(
+    columns=columns, rows=rows, row_count=len(rows), execution_time_ms=1.0
+  )
+
+
+@pytest.mark.unit
+class TestTableMirror:
+  """Test suite for TableClient.mirror and local queries."""
+
+  @pytest.fixture
+  def client(self, mock_config, tmp_path):
+    pytest.importorskip("duckdb")
+    client = TableClient({**mock_config, "table_mirror_dir": tmp_path})
+    client._files = Mock()
+    client._files.list.side_effect = lambda graph_id, table_name: [_file("f1")]
+    yield client
+    client.close()
+
+  def test_mirror_then_query_locally(self, client, graph_id, tmp_path):
+    with patch.object(
+      TableClient, "query", return_value=_pulled(["name", "shares"], [["A", 1]])
+    ) as server:
+      result = client.mirror(graph_id, tables=["Entity"])
+
+    server.assert_called_once_with(graph_id, 'SELECT * FROM "Entity"')
+    assert result.refreshed == ["Entity"]
+    assert (tmp_path / graph_id / "Entity.parquet").exists()
+
+    local = client.query(
+      graph_id, "SELECT name, shares * 2 AS doubled FROM Entity", local=True
+    )
+    assert local.success is True
+    assert local.columns == ["name", "doubled"]
+    assert local.rows == [["A", 2]]
+
+  def test_package_import_does_not_load_duckdb(self):
+    code = "import sys, robosystems_client; print('duckdb' in sys.modules)"
+    out = subprocess.run(
+      [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+  def test_unchanged_file_set_is_not_pulled(self, client, graph_id):
+    with patch.object(
+      TableClient, "query", return_value=_pulled(["name"], [["A"]])
+    ) as server:
+      client.mirror(graph_id, tables=["Entity"])
+      result = client.mirror(graph_id, tables=["Entity"])
+
+    assert server.call_count == 1
+    assert result.unchanged == ["Entity"]
+    assert result.refreshed == []
+
+  def test_changed_file_set_refreshes(self, client, graph_id):
+    with patch.object(TableClient, "query", return_value=_pulled(["name"], [["A"]])):
+      client.mirror(graph_id, tables=["Entity"])
+    assert client.query(graph_id, "SELECT * FROM Entity", local=True).rows == [["A"]]
+
+    client._files.list.side_effect = lambda graph_id, table_name: [
+      _file("f1"),
+      _file("f2"),
+    ]
+    with patch.object(
+      TableClient, "query", return_value=_pulled(["name"], [["A"], ["B"]])
+    ):
+      result = client.mirror(graph_id, tables=["Entity"])
+
+    assert result.refreshed == ["Entity"]
+    local = client.query(graph_id, "SELECT * FROM Entity ORDER BY name", local=True)
+    assert local.rows == [["A"], ["B"]]
+
+  def test_full_mirror_removes_dropped_tables(self, client, graph_id):
+    tables = [TableInfo("Entity", "parquet", 1, 1, 100)]
+    with patch.object(TableClient, "query", return_value=_pulled(["name"], [["A"]])):
+      client.mirror(graph_id, tables=["Entity", "Fact"])
+      with patch.object(TableClient, "list", return_value=tables):
+        result = client.mirror(graph_id)
+
+    assert result.removed == ["Fact"]
+    assert client._mirror(graph_id).tables() == ["Entity"]
+    assert "Fact" not in client._mirror(graph_id).manifest()
+
+  def test_failed_pull_is_reported(self, client, graph_id):
+    failed = QueryResult([], [], 0, 0, success=False, error="denied")
+    with patch.object(TableClient, "query", return_value=failed):
+      result = client.mirror(graph_id, tables=["Entity"])
+
+    assert result.failed == {"Entity": "denied"}
+    assert client._mirror(graph_id).tables() == []
+
+  def test_unkeyed_pull_at_row_cap_is_not_recorded(self, client, graph_id):
+    capped = _pulled(["n"], [[i] for i in range(MAX_SQL_ROWS)])
+    with patch.object(TableClient, "query", return_value=capped):
+      result = client.mirror(graph_id, tables=["Entity"])
+
+    assert "row cap" in result.failed["Entity"]
+    assert result.refreshed == []
+    assert "Entity" not in client._mirror(graph_id).manifest()
+
+  def test_keyed_tables_are_pulled_in_pages(self, client, graph_id):
+    server = SqlServer(rows=MAX_SQL_ROWS + 3)
+    with patch("robosystems_client.clients.table_client.query_tables", server):
+      result = client.mirror(graph_id, tables=["Entity"], keys={"Entity": "id"})
+
+    assert result.refreshed == ["Entity"]
+    assert len(server.requests) == 2
+    local = client.query(
+      graph_id, "SELECT COUNT(*), MAX(id), MAX(name) FROM Entity", local=True
+    )
+    assert local.rows == [[MAX_SQL_ROWS + 3, MAX_SQL_ROWS + 2, "e9999"]]
+
+  def test_keyed_empty_table_and_failed_page(self, client, graph_id):
+    server = SqlServer(rows=0)
+    with patch("robosystems_client.clients.table_client.query_tables", server):
+      client.mirror(graph_id, tables=["Entity"], keys={"Entity": "id"})
+    assert client.query(graph_id, "SELECT * FROM Entity", local=True).columns == [
+      "grp",
+      "id",
+      "name",
+    ]
+
+    client._files.list.side_effect = lambda graph_id, table_name: [_file("f2")]
+    with patch(
+      "robosystems_client.clients.table_client.query_tables",
+      return_value=Mock(status_code=500),
+    ):
+      result = client.mirror(graph_id, tables=["Entity"], keys={"Entity": "id"})
+    assert "500" in result.failed["Entity"]
+    assert client._mirror(graph_id).manifest()["Entity"][0][0] == "f1"
+
+  def test_empty_table_keeps_columns(self, client, graph_id):
+    with patch.object(TableClient, "query", return_value=_pulled(["name"], [])):
+      client.mirror(graph_id, tables=["Entity"])
+
+    local = client.query(graph_id, "SELECT * FROM Entity", local=True)
+    assert local.columns == ["name"]
+    assert local.rows == []
+
+  def test_local_query_limit_and_errors(self, client, graph_id):
+    with patch.object(
+      TableClient, "query", return_value=_pulled(["n"], [[1], [2], [3]])
+    ):
+      client.mirror(graph_id, tables=["Entity"])
+
+    assert client.query(
+      graph_id, "SELECT * FROM Entity;", limit=2, local=True
+    ).rows == [
+      [1],
+      [2],
+    ]
+    missing = client.query(graph_id, "SELECT * FROM Missing", local=True)
+    assert missing.success is False
+    assert "Missing" in missing.error
+
+
+class SqlServer:
+  """query_tables stand-in that runs each request on a DuckDB table."""
+
+  def __init__(self, rows: int):
+    duckdb = pytest.importorskip("duckdb")
+    self.con = duckdb.connect()
+    self.con.execute(
+      "CREATE TABLE Entity AS SELECT i % 7 AS grp, i AS id, 'e' || i AS name "
+      "FROM range(?) r(i)",
+      [rows],
+    )
+    self.requests = []
+
+  def __call__(self, graph_id, client, body):
+    self.requests.append(body)
+    params = body.parameters if isinstance(body.parameters, list) else []
+    cursor = self.con.execute(body.sql, params)
+    response = Mock()
+    response.status_code = 200
+    response.parsed = Mock()
+    response.parsed.columns = [d[0] for d in cursor.description]
+    # The real endpoint truncates at its row cap
+    response.parsed.rows = [list(r) for r in cursor.fetchmany(MAX_SQL_ROWS)]
+    response.parsed.execution_time_ms = 1.0
+    return response
+
+
+@pytest.mark.unit
+class TestQueryBatches:
+  """Test suite for keyset-paginated columnar reads."""
+
+  def test_pages_cover_every_row_once(self, mock_config, graph_id):
+    server = SqlServer(rows=27)
+    with patch("robosystems_client.clients.table_client.query_tables", server):
+      batches = list(
+        TableClient(mock_config).query_batches(
+          graph_id,
+          "SELECT grp, id, name FROM Entity WHERE id >= ?;",
+          key=["grp", "id"],
+          batch_size=10,
+          parameters=[5],
+        )
+      )
+
+    assert [b.row_count for b in batches] == [10, 10, 2]
+    ids = [i for b in batches for i in b.column("id")]
+    assert sorted(ids) == list(range(5, 27))
+    assert len(server.requests) == 3
+    second = server.requests[1]
+    assert second.sql.endswith(
+      'WHERE ("grp", "id") > (?, ?) ORDER BY "grp", "id" LIMIT ?'
+    )
+    assert second.parameters == [
+      5,
+      *[batches[0].column(k)[-1] for k in ("grp", "id")],
+      10,
+    ]
+
+  def test_full_last_page_ends_with_empty_request(self, mock_config, graph_id):
+    server = SqlServer(rows=4)
+    with patch("robosystems_client.clients.table_client.query_tables", server):
+      batches = list(
+        TableClient(mock_config).query_batches(
+          graph_id, "SELECT * FROM Entity", key="id", batch_size=2
+        )
+      )
+
+    assert [b.column("id") for b in batches] == [[0, 1], [2, 3]]
+    assert len(server.requests) == 3
+
+  def test_batch_size_clamped_to_server_cap(self, mock_config, graph_id):
+    server = SqlServer(rows=MAX_SQL_ROWS + 5)
+    with patch("robosystems_client.clients.table_client.query_tables", server):
+      batches = list(
+        TableClient(mock_config).query_batches(
+          graph_id, "SELECT * FROM Entity", key="id", batch_size=50_000
+        )
+      )
+
+    assert [b.row_count for b in batches] == [MAX_SQL_ROWS, 5]
+    assert server.requests[0].parameters == [MAX_SQL_ROWS]
+    with pytest.raises(ValueError, match="positive"):
+      next(
+        TableClient(mock_config).query_batches(
+          graph_id, "SELECT * FROM Entity", key="id", batch_size=0
+        )
+      )
+
+  @patch("robosystems_client.clients.table_client.query_tables")
+  def test_key_must_be_a_result_column(self, mock_query, mock_config, graph_id):
+    mock_resp = Mock()
+    mock_resp.status_code = 200
+    mock_resp.parsed = Mock(columns=["ID"], rows=[[1]], execution_time_ms=1.0)
+    mock_query.return_value = mock_resp
+
+    with pytest.raises(ValueError, match="id"):
+      next(
+        TableClient(mock_config).query_batches(
+          graph_id, "SELECT * FROM Entity", key="id"
+        )
+      )
+
+  @patch("robosystems_client.clients.table_client.query_tables")
+  def test_failed_page_raises(self, mock_query, mock_config, graph_id):
+    mock_query.return_value = Mock(status_code=500)
+    with pytest.raises(RuntimeError, match="500"):
+      next(
+        TableClient(mock_config).query_batches(
+          graph_id, "SELECT * FROM Entity", key="id"
+        )
+      )
+
+  def test_columnar_result(self):
+    result = QueryResult(
+      columns=["name", "shares"],
+      rows=[["A", 1], ["B", 2]],
+      row_count=2,
+      execution_time_ms=1.0,
+    ).to_columnar()
+
+    assert result.column("name") == ["A", "B"]
+    assert result.column("shares") == [1, 2]
+    assert result.to_rows() == [["A", 1], ["B", 2]]
+    assert ColumnarResult.from_rows(["name"], []).column("name") == []
+
+    pytest.importorskip("pandas")
+    df = result.to_pandas()
+    assert list(df.columns) == ["name", "shares"]
+    assert df["shares"].sum() == 3
+
+  def test_columnar_result_is_arrow_backed(self):
+    pa = pytest.importorskip("pyarrow")
+    result = ColumnarResult.from_rows(["id", "name"], [[1, "a"], [2, "b"]])
+
+    assert isinstance(result.data["id"], pa.Array)
+    assert result.data["id"].type == pa.int64()
+    table = result.to_arrow()
+    assert table.column("id").chunk(0).equals(result.data["id"])
+    assert result.to_rows() == [[1, "a"], [2, "b"]]
+
+    mixed = ColumnarResult.from_rows(["value"], [["a"], [3]])
+    assert mixed.data["value"] == ["a", 3]  # no common Arrow type
+    assert mixed.column("value") == ["a", 3]
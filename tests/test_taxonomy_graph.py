@@ -0,0 +1,203 @@
+"""Unit tests for TaxonomyGraph and LibraryClient.get_taxonomy_graph."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from robosystems_client.clients.async_graphql_facade import create_async_http_client
+from robosystems_client.clients.async_library_client import AsyncLibraryClient
+from robosystems_client.clients.library_client import LibraryClient
+from robosystems_client.clients.taxonomy_graph import TaxonomyGraph
+from robosystems_client.graphql.generated.list_library_taxonomy_arcs import (
+  ListLibraryTaxonomyArcsLibraryTaxonomyArcs,
+)
+
+
+def _arc(n, source, target, association_type="presentation", **overrides):
+  payload = {
+    "id": f"arc_{n}",
+    "structureId": "str_bs",
+    "structureName": "Balance Sheet",
+    "fromElementId": f"el_{source}",
+    "fromElementQname": f"rs-gaap:{source}",
+    "fromElementName": source,
+    "fromElementTrait": None,
+    "fromElementIsAbstract": None,
+    "toElementId": f"el_{target}",
+    "toElementQname": f"rs-gaap:{target}",
+    "toElementName": target,
+    "toElementTrait": None,
+    "toElementIsAbstract": None,
+    "associationType": association_type,
+    "arcrole": None,
+    "orderValue": None,
+    "weight": None,
+  }
+  payload.update(overrides)
+  return payload
+
+
+# Assets ─┬─ CurrentAssets ─┬─ Cash            (presentation, str_bs)
+#         │                 └─ Receivables
+#         └─ NoncurrentAssets
+# Cash ── CashAndEquivalents ── us-gaap Cash   (equivalence)
+# Assets ── CurrentAssets                      (calculation, str_calc)
+ARCS = [
+  _arc(1, "Assets", "NoncurrentAssets", orderValue=2.0),
+  _arc(2, "Assets", "CurrentAssets", orderValue=1.0),
+  _arc(3, "CurrentAssets", "Receivables", orderValue=2.0),
+  _arc(4, "CurrentAssets", "Cash", orderValue=1.0),
+  _arc(5, "Cash", "CashAndEquivalents", "equivalence"),
+  _arc(6, "UsGaapCash", "CashAndEquivalents", "equivalence"),
+  _arc(7, "Assets", "CurrentAssets", "calculation", structureId="str_calc", weight=1),
+]
+
+
+@pytest.fixture
+def graph():
+  arcs = [ListLibraryTaxonomyArcsLibraryTaxonomyArcs.model_validate(a) for a in ARCS]
+  return TaxonomyGraph.from_arcs(arcs, "tax_rsgaap", "2026")
+
+
+@pytest.mark.unit
+class TestTaxonomyGraph:
+  def test_layout(self, graph):
+    assert len(graph) == 7
+    assert graph.arc_count == 7
+    assert graph.association_types == ["presentation", "equivalence", "calculation"]
+    assert "rs-gaap:Cash" in graph and "el_Cash" in graph
+    with pytest.raises(KeyError):
+      graph.position("el_nope")
+
+  def test_children_follow_order_value(self, graph):
+    assert graph.children("el_Assets", "presentation") == [
+      "el_CurrentAssets",
+      "el_NoncurrentAssets",
+    ]
+    assert graph.parents("rs-gaap:Cash", "presentation") == ["el_CurrentAssets"]
+
+  def test_descendants_are_preorder(self, graph):
+    assert graph.descendants("el_Assets", "presentation") == [
+      "el_CurrentAssets",
+      "el_Cash",
+      "el_Receivables",
+      "el_NoncurrentAssets",
+    ]
+    assert graph.ancestors("el_Receivables", "presentation") == [
+      "el_CurrentAssets",
+      "el_Assets",
+    ]
+
+  def test_structure_filter(self, graph):
+    assert graph.children("el_Assets", structure_id="str_calc") == ["el_CurrentAssets"]
+    assert graph.children("el_Assets", structure_id="str_missing") == []
+    (arc,) = graph.arcs_from("el_Assets", "calculation")
+    assert (arc.to_element_id, arc.weight) == ("el_CurrentAssets", 1)
+
+  def test_equivalence_closure(self, graph):
+    assert graph.closure("el_Cash") == ["el_CashAndEquivalents", "el_UsGaapCash"]
+    assert graph.closure("el_Assets") == []
+
+  def test_shortest_path(self, graph):
+    assert graph.shortest_path("el_Assets", "el_Cash") == [
+      "el_Assets",
+      "el_CurrentAssets",
+      "el_Cash",
+    ]
+    assert graph.shortest_path("el_Cash", "el_Assets") is None
+    assert graph.shortest_path("el_Cash", "el_UsGaapCash", "equivalence") is None
+    assert graph.shortest_path(
+      "el_Cash", "el_UsGaapCash", "equivalence", directed=False
+    ) == ["el_Cash", "el_CashAndEquivalents", "el_UsGaapCash"]
+
+  def test_save_and_load(self, graph, tmp_path):
+    graph.save(tmp_path / "graph.json")
+    loaded = TaxonomyGraph.load(tmp_path / "graph.json")
+    assert loaded.is_current(SimpleNamespace(id="tax_rsgaap", version="2026"))
+    assert not loaded.is_current(SimpleNamespace(id="tax_rsgaap", version="2027"))
+    assert loaded.descendants("el_Assets", "presentation") == graph.descendants(
+      "el_Assets", "presentation"
+    )
+
+
+def _taxonomy(version="2026"):
+  return {
+    "id": "tax_rsgaap",
+    "name": "RoboSystems GAAP",
+    "description": None,
+    "standard": "rs-gaap",
+    "version": version,
+    "namespaceUri": None,
+    "taxonomyType": "reporting",
+    "isShared": True,
+    "isActive": True,
+    "isLocked": True,
+    "elementCount": None,
+  }
+
+
+def _respond(query, variables):
+  if "libraryTaxonomyArcs" in query:
+    offset, limit = variables.get("offset", 0), variables["limit"]
+    return {
+      "libraryTaxonomyArcCount": len(ARCS),
+      "libraryTaxonomyArcs": ARCS[offset : offset + limit],
+    }
+  return {"libraryTaxonomy": _taxonomy()}
+
+
+@pytest.mark.unit
+class TestGetTaxonomyGraph:
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_pages_in_parallel_and_caches(self, mock_execute, mock_config, tmp_path):
+    mock_config["library_index_dir"] = str(tmp_path)
+    mock_execute.side_effect = lambda graph_id, query, variables: _respond(
+      query, variables
+    )
+    client = LibraryClient(mock_config)
+
+    graph = client.get_taxonomy_graph("tax_rsgaap", page_size=2, concurrency=3)
+    assert graph.arc_count == len(ARCS)
+    offsets = sorted(
+      call.args[2].get("offset", 0)
+      for call in mock_execute.call_args_list
+      if "libraryTaxonomyArcs" in call.args[1]
+    )
+    assert offsets == [0, 2, 4, 6]
+    assert (tmp_path / "library" / "tax_rsgaap.arcs.json").exists()
+
+    mock_execute.reset_mock()
+    cached = client.get_taxonomy_graph("tax_rsgaap")
+    assert mock_execute.call_count == 1
+    assert cached.closure("el_UsGaapCash") == ["el_CashAndEquivalents", "el_Cash"]
+
+  @patch("robosystems_client.graphql.client.GraphQLClient.execute")
+  def test_missing_taxonomy_raises(self, mock_execute, mock_config, tmp_path):
+    mock_config["library_index_dir"] = str(tmp_path)
+    mock_execute.return_value = {"libraryTaxonomy": None}
+    with pytest.raises(RuntimeError, match="not found"):
+      LibraryClient(mock_config).get_taxonomy_graph("tax_nope")
+
+  @pytest.mark.asyncio
+  async def test_async_facade_gathers_pages(self, mock_config, tmp_path):
+    def server(request: httpx.Request) -> httpx.Response:
+      body = json.loads(request.content)
+      data = _respond(body["query"], body.get("variables") or {})
+      return httpx.Response(200, json={"data": data})
+
+    config = {**mock_config, "library_index_dir": str(tmp_path)}
+    config["async_http_client"] = create_async_http_client(
+      config, transport=httpx.MockTransport(server)
+    )
+    client = AsyncLibraryClient(config)
+    graph = await client.get_taxonomy_graph("tax_rsgaap", page_size=3)
+    await config["async_http_client"].aclose()
+
+    assert graph.arc_count == len(ARCS)
+    assert graph.children("el_CurrentAssets", "presentation") == [
+      "el_Cash",
+      "el_Receivables",
+    ]